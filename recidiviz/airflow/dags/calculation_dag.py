@@ -123,6 +123,11 @@ def refresh_bq_dataset_operator(
     required_cloud_sql_connections = (
         [SchemaType.OPERATIONS] if schema_type == SchemaType.STATE else None
     )
+    additional_args = []
+    # The operations schema holds append-only status tables that can be refreshed with
+    # only the rows added since the last refresh.
+    if schema_type == SchemaType.OPERATIONS:
+        additional_args.append("--incremental=True")
     return build_kubernetes_pod_task(
         task_id=f"refresh_bq_dataset_{schema_type_str}",
         container_name=f"refresh_bq_dataset_{schema_type_str}",
@@ -131,6 +136,7 @@ def refresh_bq_dataset_operator(
             f"--schema_type={schema_type_str}",
             INGEST_INSTANCE_JINJA_ARG,
             SANDBOX_PREFIX_JINJA_ARG,
+            *additional_args,
         ],
         cloud_sql_connections=required_cloud_sql_connections,
     )
@@ -152,10 +152,10 @@ def _initialize_dataflow_pipeline(
     state_code: StateCode,
     instance: DirectIngestInstance,
     operations_cloud_sql_conn_id: str,
-) -> Tuple[TaskGroup, CloudSqlQueryOperator]:
+) -> Tuple[TaskGroup, CloudSqlQueryOperator, CloudSqlQueryOperator]:
     """
     Initializes the dataflow pipeline by getting the max update datetimes and watermarks and checking if the pipeline should run.
-    Returns the task group and the get_max_update_datetimes task for use in downstream tasks.
+    Returns the task group and the get_max_update_datetimes and get_watermarks tasks for use in downstream tasks.
     """
 
     with TaskGroup("initialize_dataflow_pipeline") as initialize_dataflow_pipeline:
@@ -195,7 +195,7 @@ def _initialize_dataflow_pipeline(
             >> _verify_raw_data_flashing_not_in_progress(state_code, instance)
         )
 
-    return initialize_dataflow_pipeline, get_max_update_datetimes
+    return initialize_dataflow_pipeline, get_max_update_datetimes, get_watermarks
 
 
 def _acquire_lock(
@@ -237,6 +237,7 @@ def _create_dataflow_pipeline(
     state_code: StateCode,
     ingest_instance: DirectIngestInstance,
     max_update_datetimes_operator: BaseOperator,
+    watermarks_operator: BaseOperator,
 ) -> Tuple[TaskGroup, BaseOperator]:
     """Builds a task Group that handles creating the flex template operator for a given
     pipeline parameters.
@@ -247,13 +248,14 @@ def _create_dataflow_pipeline(
 
         @task(task_id="create_flex_template")
         def create_flex_template(
-            max_update_datetimes: Dict[str, str]
+            max_update_datetimes: Dict[str, str], watermarks: Dict[str, str]
         ) -> Dict[str, Union[str, int, bool]]:
 
             parameters = IngestPipelineParameters(
                 project=get_project_id(),
                 ingest_instance=ingest_instance.value,
                 raw_data_upper_bound_dates_json=json.dumps(max_update_datetimes),
+                raw_data_watermarks_json=json.dumps(watermarks),
                 job_name=ingest_pipeline_name(state_code, ingest_instance),
                 pipeline=INGEST_PIPELINE_NAME,
                 state_code=state_code.value,
@@ -265,7 +267,10 @@ def _create_dataflow_pipeline(
         run_pipeline = RecidivizDataflowFlexTemplateOperator(
             task_id="run_pipeline",
             location=region,
-            body=create_flex_template(max_update_datetimes_operator.output),  # type: ignore[arg-type]
+            body=create_flex_template(
+                max_update_datetimes_operator.output,  # type: ignore[arg-type]
+                watermarks_operator.output,  # type: ignore[arg-type]
+            ),
             project_id=get_project_id(),
         )
 
@@ -289,6 +294,7 @@ def create_single_ingest_pipeline_group(
         (
             initialize_dataflow_pipeline,
             get_max_update_datetimes,
+            get_watermarks,
         ) = _initialize_dataflow_pipeline(
             state_code, instance, operations_cloud_sql_conn_id
         )
@@ -299,6 +305,7 @@ def create_single_ingest_pipeline_group(
             state_code=state_code,
             ingest_instance=instance,
             max_update_datetimes_operator=get_max_update_datetimes,
+            watermarks_operator=get_watermarks,
         )
 
         release_lock = _release_lock(state_code, instance)
@@ -420,6 +420,19 @@ class TestCalculationPipelineDag(AirflowIntegrationTest):
             self.entrypoint_args_fixture["test_refresh_bq_dataset_task_secondary"],
         )
 
+    def test_refresh_bq_dataset_task_operations(self) -> None:
+        """Tests that the OPERATIONS refresh_bq_dataset_task refreshes incrementally."""
+        from recidiviz.airflow.dags.calculation_dag import refresh_bq_dataset_operator
+
+        task = refresh_bq_dataset_operator(SchemaType.OPERATIONS)
+        task.render_template_fields({"dag_run": PRIMARY_DAG_RUN})
+
+        self.assertEqual(task.task_id, "refresh_bq_dataset_OPERATIONS")
+        self.assertEqual(
+            task.arguments[4:],
+            self.entrypoint_args_fixture["test_refresh_bq_dataset_task_operations"],
+        )
+
     def test_validations_task_exists(self) -> None:
         dag_bag = DagBag(dag_folder=DAG_FOLDER, include_examples=False)
         dag = dag_bag.dags[self.CALCULATION_DAG_ID]
@@ -291,8 +291,9 @@ class BigQueryClient:
         destination_table_schema: List[bigquery.SchemaField],
         write_disposition: bigquery.WriteDisposition,
         skip_leading_rows: int = 0,
+        source_format: str = bigquery.SourceFormat.CSV,
     ) -> bigquery.job.LoadJob:
-        """Loads a table from CSV data in GCS to BigQuery.
+        """Loads a table from CSV (or other |source_format|) data in GCS to BigQuery.
 
         Given a desired table name, source data URI(s) and destination schema, loads the
         table into BigQuery.
@@ -315,7 +316,9 @@ class BigQueryClient:
                 completely (WRITE_TRUNCATE) or adds to the table with new rows
                 (WRITE_APPEND). By default, WRITE_APPEND is used.
             skip_leading_rows: Optional number of leading rows to skip on each input
-                file. Defaults to zero
+                file. Defaults to zero. Only applies to CSV files.
+            source_format: The format of the files to load (a bigquery.SourceFormat
+                value). Defaults to CSV.
         Returns:
             The LoadJob object containing job details.
         """
@@ -1258,6 +1261,7 @@ class BigQueryClientImpl(BigQueryClient):
         destination_table_schema: List[bigquery.SchemaField],
         write_disposition: bigquery.WriteDisposition,
         skip_leading_rows: int = 0,
+        source_format: str = bigquery.SourceFormat.CSV,
     ) -> bigquery.job.LoadJob:
         """Triggers a load job, i.e. a job that will copy all of the data from the given
         Cloud Storage source into the given BigQuery destination. Returns once the job
@@ -1276,10 +1280,11 @@ class BigQueryClientImpl(BigQueryClient):
 
         job_config = bigquery.LoadJobConfig()
         job_config.schema = destination_table_schema
-        job_config.source_format = bigquery.SourceFormat.CSV
-        job_config.allow_quoted_newlines = True
+        job_config.source_format = source_format
+        if source_format == bigquery.SourceFormat.CSV:
+            job_config.allow_quoted_newlines = True
+            job_config.skip_leading_rows = skip_leading_rows
         job_config.write_disposition = write_disposition
-        job_config.skip_leading_rows = skip_leading_rows
 
         load_job = self.client.load_table_from_uri(
             source_uris, destination_table_ref, job_config=job_config
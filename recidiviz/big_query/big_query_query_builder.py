@@ -19,7 +19,8 @@ overrides to BigQuery queries.
 """
 
 import re
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 from recidiviz.big_query.address_overrides import BigQueryAddressOverrides
 from recidiviz.big_query.big_query_address import BigQueryAddress
@@ -32,6 +33,20 @@ REFERENCED_BQ_ADDRESS_REGEX = re.compile(
     r"`(?P<project_id_clause>[\w-]*)\.(?P<dataset_id>[\w-]*)\.(?P<table_id>[\w-]*)`"
 )
 
+# The max number of distinct queries to cache parsed table references for. This
+# comfortably fits all deployed views, along with a set of sandbox overrides for each.
+_MAX_CACHED_PARSED_QUERIES = 2**14
+
+
+@lru_cache(maxsize=_MAX_CACHED_PARSED_QUERIES)
+def parse_referenced_table_references(query: str) -> Tuple[Tuple[str, str, str], ...]:
+    """Returns a (project_id, dataset_id, table_id) tuple for every fully-qualified
+    table reference in the given query, in the order they appear. Results are cached
+    by query text since the same view queries are parsed many times over when
+    building view DAGs.
+    """
+    return tuple(re.findall(REFERENCED_BQ_ADDRESS_REGEX, query))
+
 
 # The project_id is usually, but not always, used in the query text. The
 # BigQueryQueryBuilder class does not know whether it will be used so it always
@@ -124,8 +139,8 @@ class BigQueryQueryBuilder:
         the same query string, but with overrides applied to all relevant addresses.
         """
         query_with_overrides = query
-        for ref_project_id, dataset_id, table_id in re.findall(
-            REFERENCED_BQ_ADDRESS_REGEX, query
+        for ref_project_id, dataset_id, table_id in parse_referenced_table_references(
+            query
         ):
             # We assume here that all overrides only apply to addresses within the
             # current project. If we have a view that explicitly references an address
@@ -16,7 +16,6 @@
 # =============================================================================
 """An implementation of bigquery.TableReference with extra functionality related to views."""
 import abc
-import re
 from typing import Any, Callable, Generic, List, Optional, Set, TypeVar
 
 from google.cloud import bigquery
@@ -24,8 +23,8 @@ from google.cloud import bigquery
 from recidiviz.big_query.address_overrides import BigQueryAddressOverrides
 from recidiviz.big_query.big_query_address import BigQueryAddress
 from recidiviz.big_query.big_query_query_builder import (
-    REFERENCED_BQ_ADDRESS_REGEX,
     BigQueryQueryBuilder,
+    parse_referenced_table_references,
 )
 from recidiviz.utils import metadata
 
@@ -83,6 +82,7 @@ class BigQueryView(bigquery.TableReference):
             dataset_id, default_project=project_id
         )
         super().__init__(dataset_ref, view_id)
+        self._address = BigQueryAddress(dataset_id=self.dataset_id, table_id=view_id)
         self.query_format_kwargs = query_format_kwargs
         self.query_builder = BigQueryQueryBuilder(address_overrides=address_overrides)
 
@@ -189,8 +189,8 @@ class BigQueryView(bigquery.TableReference):
         if self._parent_tables is None:
             self._parent_tables = {
                 BigQueryAddress(dataset_id=dataset_id, table_id=table_id)
-                for _project_id, dataset_id, table_id in re.findall(
-                    REFERENCED_BQ_ADDRESS_REGEX, self.view_query
+                for _project_id, dataset_id, table_id in parse_referenced_table_references(
+                    self.view_query
                 )
             }
         return self._parent_tables
@@ -213,7 +213,7 @@ class BigQueryView(bigquery.TableReference):
     @property
     def address(self) -> BigQueryAddress:
         """The (dataset_id, table_id) address for this view"""
-        return BigQueryAddress(dataset_id=self.dataset_id, table_id=self.view_id)
+        return self._address
 
     @property
     def materialized_address(self) -> Optional[BigQueryAddress]:
@@ -16,6 +16,7 @@
 # =============================================================================
 """Implements a class that allows us to walk across a DAG of BigQueryViews
 and perform actions on each of them in some order."""
+import functools
 import heapq
 import logging
 import os
@@ -83,6 +84,65 @@ DEFAULT_PROCESS_DAG_PERF_CONFIG = ProcessDagPerfConfig(
 )
 
 
+@attr.s(auto_attribs=True, kw_only=True)
+class ProcessDagSchedulingConfig:
+    """Configures critical-path-aware scheduling of nodes in process_dag().
+
+    When provided, nodes that are ready to process are prioritized by the length of
+    the longest (weighted) path from that node to the end of the DAG, rather than in
+    the order they were discovered. Since the total runtime of process_dag() is
+    bounded below by the runtime of the most expensive chain of nodes, starting nodes
+    on that chain as soon as possible brings the total runtime close to that bound.
+    """
+
+    # A mapping of BigQueryAddress to the expected time it takes to process the node
+    # with that address, e.g. derived from the view_processing_stats of a previous
+    # ProcessDagResult.
+    node_processing_time_estimates: Dict[BigQueryAddress, float] = attr.ib(factory=dict)
+
+    # The expected processing time for any node that does not have an entry in
+    # |node_processing_time_estimates|.
+    default_node_processing_time_seconds: float = 1.0
+
+    # The max number of nodes that may be processed at once. If null, the size of the
+    # thread pool determines how many nodes are processed concurrently. Only
+    # applicable to asynchronous processing.
+    max_concurrency: Optional[int] = None
+
+    def __attrs_post_init__(self) -> None:
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError(
+                f"Expected max_concurrency to be a positive number, found "
+                f"[{self.max_concurrency}]."
+            )
+
+    def estimated_processing_time(self, address: BigQueryAddress) -> float:
+        estimate = self.node_processing_time_estimates.get(address)
+        if estimate is None:
+            return self.default_node_processing_time_seconds
+        return estimate
+
+    @classmethod
+    def from_process_dag_result(
+        cls,
+        result: "ProcessDagResult",
+        *,
+        default_node_processing_time_seconds: float = 1.0,
+        max_concurrency: Optional[int] = None,
+    ) -> "ProcessDagSchedulingConfig":
+        """Builds a scheduling config that uses the per-node processing times from a
+        previous call to process_dag() as the processing time estimates.
+        """
+        return cls(
+            node_processing_time_estimates={
+                view.address: metadata.node_processing_runtime_seconds
+                for view, metadata in result.view_processing_stats.items()
+            },
+            default_node_processing_time_seconds=default_node_processing_time_seconds,
+            max_concurrency=max_concurrency,
+        )
+
+
 @attr.s(auto_attribs=True, kw_only=True)
 class ProcessDagResult(Generic[ViewResultT]):
     """Stores results and metadata about a single call to
@@ -164,8 +224,14 @@ class BigQueryViewDagNode:
         self.is_leaf = is_leaf
 
         self._ancestors_sub_dag: Optional[BigQueryViewDagWalker] = None
+        self._ancestors_sub_dag_builder: Optional[
+            Callable[[], BigQueryViewDagWalker]
+        ] = None
         self._ancestors_tree_num_edges: Optional[int] = None
         self._descendants_sub_dag: Optional[BigQueryViewDagWalker] = None
+        self._descendants_sub_dag_builder: Optional[
+            Callable[[], BigQueryViewDagWalker]
+        ] = None
         self._descendants_tree_num_edges: Optional[int] = None
 
     @property
@@ -185,11 +251,21 @@ class BigQueryViewDagNode:
     def set_ancestors_sub_dag(self, ancestor_sub_dag: "BigQueryViewDagWalker") -> None:
         self._ancestors_sub_dag = ancestor_sub_dag
 
+    def set_ancestors_sub_dag_builder(
+        self, builder: Callable[[], "BigQueryViewDagWalker"]
+    ) -> None:
+        """Sets a function that builds the ancestors_sub_dag the first time it is
+        accessed.
+        """
+        self._ancestors_sub_dag_builder = builder
+
     @property
     def ancestors_sub_dag(self) -> "BigQueryViewDagWalker":
         """A DAG that includes this node and all nodes that are an ancestor of this
         node.
         """
+        if not self._ancestors_sub_dag and self._ancestors_sub_dag_builder:
+            self._ancestors_sub_dag = self._ancestors_sub_dag_builder()
         if not self._ancestors_sub_dag:
             raise ValueError("Must set ancestors_sub_dag via set_ancestors_sub_dag().")
         return self._ancestors_sub_dag
@@ -199,11 +275,21 @@ class BigQueryViewDagNode:
     ) -> None:
         self._descendants_sub_dag = descendants_sub_dag
 
+    def set_descendants_sub_dag_builder(
+        self, builder: Callable[[], "BigQueryViewDagWalker"]
+    ) -> None:
+        """Sets a function that builds the descendants_sub_dag the first time it is
+        accessed.
+        """
+        self._descendants_sub_dag_builder = builder
+
     @property
     def descendants_sub_dag(self) -> "BigQueryViewDagWalker":
         """A DAG that includes this node and all nodes that are a descendant of this
         node.
         """
+        if not self._descendants_sub_dag and self._descendants_sub_dag_builder:
+            self._descendants_sub_dag = self._descendants_sub_dag_builder()
         if not self._descendants_sub_dag:
             raise ValueError(
                 "Must set descendants_sub_dag via set_descendants_sub_dag()."
@@ -291,19 +377,31 @@ class _AsyncProcessNodeQueue:
     def __init__(
         self,
         view_process_fn: Callable[[BigQueryView, ParentResultsT], ViewResultT],
+        node_priorities: Optional[Dict[BigQueryAddress, float]] = None,
+        max_concurrency: Optional[int] = None,
     ) -> None:
-        self.executor = futures.ThreadPoolExecutor(
-            # Conservatively allow only half as many workers as allowed connections.
-            # Lower this number if we see "urllib3.connectionpool:Connection pool is
-            # full, discarding connection" errors.
-            max_workers=int(BQ_CLIENT_MAX_POOL_SIZE / 2)
-        )
+        # Conservatively allow only half as many workers as allowed connections.
+        # Lower this number if we see "urllib3.connectionpool:Connection pool is
+        # full, discarding connection" errors.
+        max_workers = int(BQ_CLIENT_MAX_POOL_SIZE / 2)
+        if max_concurrency is not None:
+            max_workers = min(max_workers, max_concurrency)
+        self.executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        self.max_in_flight = max_workers
         self.future_to_context: Dict[
             Future[Tuple[float, ViewResultT]],
             Tuple[BigQueryViewDagNode, ParentResultsT, float],
         ] = {}
         self.view_process_fn = view_process_fn
 
+        # If priorities are provided, nodes are held in this heap until a worker is
+        # free rather than handed to the executor in the order they are enqueued.
+        self.node_priorities = node_priorities
+        self.ready_heap: List[
+            Tuple[float, int, Tuple[BigQueryViewDagNode, ParentResultsT, float]]
+        ] = []
+        self.enqueued_count = 0
+
     def __enter__(self) -> _ProcessNodeQueueT:
         self.executor.__enter__()
         return self
@@ -317,11 +415,35 @@ class _AsyncProcessNodeQueue:
         self.executor.__exit__(exc_type, exc_val, exc_tb)
 
     def __len__(self) -> int:
-        return len(self.future_to_context)
+        return len(self.future_to_context) + len(self.ready_heap)
 
     def enqueue(
         self,
         item: Tuple[BigQueryViewDagNode, Dict[BigQueryView, ViewResultT], float],
+    ) -> None:
+        if self.node_priorities is None:
+            self._submit(item)
+            return
+        node, _, _ = item
+        # Python heaps are min-heaps, so negate the priority to pop the highest
+        # priority node first. Ties are broken by the order nodes were enqueued.
+        heapq.heappush(
+            self.ready_heap,
+            (-self.node_priorities[node.view.address], self.enqueued_count, item),
+        )
+        self.enqueued_count += 1
+
+    def _submit_ready_nodes(self) -> None:
+        """Submits the highest priority ready nodes to the executor until all
+        workers are busy.
+        """
+        while self.ready_heap and len(self.future_to_context) < self.max_in_flight:
+            _, _, item = heapq.heappop(self.ready_heap)
+            self._submit(item)
+
+    def _submit(
+        self,
+        item: Tuple[BigQueryViewDagNode, Dict[BigQueryView, ViewResultT], float],
     ) -> None:
         adjacent_node, previous_level_results, entered_queue_time = item
         self.future_to_context[
@@ -341,6 +463,7 @@ class _AsyncProcessNodeQueue:
     def dequeue(
         self,
     ) -> Tuple[Callable, BigQueryViewDagNode, Dict[BigQueryView, ViewResultT], float,]:
+        self._submit_ready_nodes()
         completed, _not_completed = futures.wait(
             self.future_to_context.keys(), return_when=futures.FIRST_COMPLETED
         )
@@ -352,16 +475,22 @@ class _AsyncProcessNodeQueue:
 class _SyncProcessNodeQueue:
     """
     Internal queue implementation adapter for synchronous
-    processing with deque
+    processing with a heap
     """
 
     def __init__(
         self,
         view_process_fn: Callable[[BigQueryView, ParentResultsT], ViewResultT],
+        node_priorities: Optional[Dict[BigQueryAddress, float]] = None,
     ) -> None:
-        self.queue: Deque[
-            Tuple[BigQueryViewDagNode, Dict[BigQueryView, ViewResultT], float]
-        ] = deque()
+        # If priorities are provided, nodes are processed highest priority first.
+        # Otherwise (and to break ties), nodes are processed in the order they were
+        # enqueued.
+        self.node_priorities = node_priorities
+        self.heap: List[
+            Tuple[float, int, Tuple[BigQueryViewDagNode, ParentResultsT, float]]
+        ] = []
+        self.enqueued_count = 0
         self.view_process_fn = view_process_fn
 
     def __enter__(self) -> _ProcessNodeQueueT:
@@ -376,18 +505,25 @@ class _SyncProcessNodeQueue:
         return
 
     def __len__(self) -> int:
-        return len(self.queue)
+        return len(self.heap)
 
     def enqueue(
         self,
         item: Tuple[BigQueryViewDagNode, Dict[BigQueryView, ViewResultT], float],
     ) -> None:
-        self.queue.appendleft(item)
+        node, _, _ = item
+        # Python heaps are min-heaps, so negate the priority to pop the highest
+        # priority node first.
+        priority = (
+            -self.node_priorities[node.view.address] if self.node_priorities else 0.0
+        )
+        heapq.heappush(self.heap, (priority, self.enqueued_count, item))
+        self.enqueued_count += 1
 
     def dequeue(
         self,
     ) -> Tuple[Callable, BigQueryViewDagNode, Dict[BigQueryView, ViewResultT], float,]:
-        node, parent_results, entered_queue_time = self.queue.pop()
+        _, _, (node, parent_results, entered_queue_time) = heapq.heappop(self.heap)
         return (
             lambda: trace.time_and_trace(
                 structured_logging.with_context(self.view_process_fn)
@@ -398,6 +534,87 @@ class _SyncProcessNodeQueue:
         )
 
 
+class _DagReachabilityIndex:
+    """A compact index over the nodes of a BigQueryViewDagWalker that answers
+    ancestor / descendant reachability queries without walking the DAG.
+
+    Each node is assigned an integer id in topological order and the ancestors and
+    descendants of each node are stored as bitsets (Python ints) where bit i is set
+    if the node with id i is reachable. The bitsets for all nodes are built in a
+    single pass in each direction.
+    """
+
+    def __init__(
+        self,
+        topological_order: List[BigQueryAddress],
+        nodes_by_address: Dict[BigQueryAddress, BigQueryViewDagNode],
+    ) -> None:
+        self.addresses = topological_order
+        self.ids: Dict[BigQueryAddress, int] = {
+            address: i for i, address in enumerate(topological_order)
+        }
+        parent_ids: List[List[int]] = [
+            [self.ids[a] for a in nodes_by_address[address].parent_node_addresses]
+            for address in topological_order
+        ]
+        child_ids: List[List[int]] = [
+            [self.ids[a] for a in nodes_by_address[address].child_node_addresses]
+            for address in topological_order
+        ]
+
+        # Parents always have a lower id than their children, so the ancestors of
+        # every parent are known by the time we get to the child (and vice versa for
+        # descendants).
+        self.ancestors: List[int] = [0] * len(topological_order)
+        for node_id, node_parent_ids in enumerate(parent_ids):
+            bits = 0
+            for parent_id in node_parent_ids:
+                bits |= self.ancestors[parent_id] | (1 << parent_id)
+            self.ancestors[node_id] = bits
+
+        self.descendants: List[int] = [0] * len(topological_order)
+        for node_id in reversed(range(len(topological_order))):
+            bits = 0
+            for child_id in child_ids[node_id]:
+                bits |= self.descendants[child_id] | (1 << child_id)
+            self.descendants[node_id] = bits
+
+    def bits_for_addresses(self, addresses: Iterable[BigQueryAddress]) -> int:
+        bits = 0
+        for address in addresses:
+            bits |= 1 << self.ids[address]
+        return bits
+
+    def ancestor_bits(self, addresses: Iterable[BigQueryAddress]) -> int:
+        """Returns a bitset of all ancestors of the given addresses, including the
+        addresses themselves.
+        """
+        bits = 0
+        for address in addresses:
+            node_id = self.ids[address]
+            bits |= self.ancestors[node_id] | (1 << node_id)
+        return bits
+
+    def descendant_bits(self, addresses: Iterable[BigQueryAddress]) -> int:
+        """Returns a bitset of all descendants of the given addresses, including the
+        addresses themselves.
+        """
+        bits = 0
+        for address in addresses:
+            node_id = self.ids[address]
+            bits |= self.descendants[node_id] | (1 << node_id)
+        return bits
+
+    def addresses_for_bits(self, bits: int) -> List[BigQueryAddress]:
+        """Returns the addresses for all set bits, in topological order."""
+        addresses = []
+        while bits:
+            lowest_bit = bits & -bits
+            addresses.append(self.addresses[lowest_bit.bit_length() - 1])
+            bits ^= lowest_bit
+        return addresses
+
+
 class BigQueryViewDagWalker:
     """Class implementation that walks a DAG of BigQueryViews."""
 
@@ -416,6 +633,39 @@ class BigQueryViewDagWalker:
 
         self._check_for_cycles()
 
+        self._reachability_index: Optional[_DagReachabilityIndex] = None
+
+    @property
+    def reachability_index(self) -> _DagReachabilityIndex:
+        """An index that answers ancestor / descendant queries for this DAG. Built on
+        first access.
+        """
+        if self._reachability_index is None:
+            self._reachability_index = _DagReachabilityIndex(
+                self._topological_order(reverse=False), self.nodes_by_address
+            )
+        return self._reachability_index
+
+    def _ancestors_sub_dag_for_address(
+        self, address: BigQueryAddress
+    ) -> "BigQueryViewDagWalker":
+        return self._sub_dag_for_bits(self.reachability_index.ancestor_bits([address]))
+
+    def _descendants_sub_dag_for_address(
+        self, address: BigQueryAddress
+    ) -> "BigQueryViewDagWalker":
+        return self._sub_dag_for_bits(
+            self.reachability_index.descendant_bits([address])
+        )
+
+    def _sub_dag_for_bits(self, bits: int) -> "BigQueryViewDagWalker":
+        return BigQueryViewDagWalker(
+            [
+                self.nodes_by_address[address].view
+                for address in self.reachability_index.addresses_for_bits(bits)
+            ]
+        )
+
     def _prepare_dag(self) -> None:
         """
         Prepares for processing the full DAG by identifying root nodes and
@@ -669,12 +919,66 @@ class BigQueryViewDagWalker:
             graph_depth=graph_depth,
         )
 
+    def _topological_order(self, reverse: bool) -> List[BigQueryAddress]:
+        """Returns the addresses of all nodes in the DAG ordered such that every node
+        comes after all nodes that must be processed before it. If |reverse| is True,
+        children come before their parents.
+        """
+        remaining_upstream_counts: Dict[BigQueryAddress, int] = {}
+        for address, node in self.nodes_by_address.items():
+            upstream_addresses = (
+                node.child_node_addresses if reverse else node.parent_node_addresses
+            )
+            remaining_upstream_counts[address] = len(upstream_addresses)
+
+        ready: Deque[BigQueryAddress] = deque(
+            address
+            for address, count in remaining_upstream_counts.items()
+            if count == 0
+        )
+        ordered: List[BigQueryAddress] = []
+        while ready:
+            address = ready.popleft()
+            ordered.append(address)
+            node = self.nodes_by_address[address]
+            downstream_addresses = (
+                node.parent_node_addresses if reverse else node.child_node_addresses
+            )
+            for downstream_address in downstream_addresses:
+                remaining_upstream_counts[downstream_address] -= 1
+                if remaining_upstream_counts[downstream_address] == 0:
+                    ready.append(downstream_address)
+        return ordered
+
+    def critical_path_lengths(
+        self, scheduling_config: ProcessDagSchedulingConfig, reverse: bool = False
+    ) -> Dict[BigQueryAddress, float]:
+        """Returns a map of node address to the estimated time it will take to process
+        that node and the most expensive chain of nodes downstream of it (in the
+        direction of processing), given the processing time estimates in
+        |scheduling_config|.
+        """
+        path_lengths: Dict[BigQueryAddress, float] = {}
+        for address in reversed(self._topological_order(reverse=reverse)):
+            node = self.nodes_by_address[address]
+            downstream_addresses = (
+                node.parent_node_addresses if reverse else node.child_node_addresses
+            )
+            path_lengths[address] = scheduling_config.estimated_processing_time(
+                address
+            ) + max(
+                (path_lengths[a] for a in downstream_addresses),
+                default=0.0,
+            )
+        return path_lengths
+
     def process_dag(
         self,
         view_process_fn: Callable[[BigQueryView, ParentResultsT], ViewResultT],
         synchronous: bool,
         perf_config: Optional[ProcessDagPerfConfig] = DEFAULT_PROCESS_DAG_PERF_CONFIG,
         reverse: bool = False,
+        scheduling_config: Optional[ProcessDagSchedulingConfig] = None,
     ) -> ProcessDagResult[ViewResultT]:
         """
         This method provides a level-by-level "breadth-first" traversal of a DAG and
@@ -690,17 +994,41 @@ class BigQueryViewDagWalker:
 
         If a |perf_config| is provided, processing will fail if any node takes longer
         to process than is allowed by the config.
+
+        If a |scheduling_config| is provided, nodes that are ready to be processed are
+        started in order of their critical path length (see critical_path_lengths())
+        rather than in the order they became ready, and no more than
+        |max_concurrency| nodes will be processed at once. Setting |max_concurrency|
+        is only valid for asynchronous processing.
         """
+        if synchronous and scheduling_config and scheduling_config.max_concurrency:
+            raise ValueError(
+                "Cannot set max_concurrency on the scheduling_config for synchronous "
+                "DAG processing."
+            )
 
         top_level_set = set(self.leaves) if reverse else set(self.roots)
         processed: Set[BigQueryAddress] = set()
         view_results: Dict[BigQueryView, ViewResultT] = {}
         view_processing_stats: Dict[BigQueryView, ViewProcessingMetadata] = {}
+        node_priorities = (
+            self.critical_path_lengths(scheduling_config, reverse=reverse)
+            if scheduling_config
+            else None
+        )
         dag_processing_start = time.perf_counter()
         queue: _ProcessNodeQueueT = (
-            _SyncProcessNodeQueue(view_process_fn=view_process_fn)
+            _SyncProcessNodeQueue(
+                view_process_fn=view_process_fn, node_priorities=node_priorities
+            )
             if synchronous
-            else _AsyncProcessNodeQueue(view_process_fn=view_process_fn)
+            else _AsyncProcessNodeQueue(
+                view_process_fn=view_process_fn,
+                node_priorities=node_priorities,
+                max_concurrency=(
+                    scheduling_config.max_concurrency if scheduling_config else None
+                ),
+            )
         )
         with queue:
             for node in top_level_set:
@@ -767,16 +1095,6 @@ class BigQueryViewDagWalker:
         if missing_views:
             raise ValueError(f"Found input views not in source DAG: {missing_views}")
 
-    @staticmethod
-    def _check_sub_dag_views(
-        *, input_views: List[BigQueryView], sub_dag_views: Set[BigQueryView]
-    ) -> None:
-        missing_views = set(input_views).difference(sub_dag_views)
-        if missing_views:
-            raise ValueError(
-                f"Found input views not represented in the output DAG: {missing_views}"
-            )
-
     def get_descendants_sub_dag(
         self, views: List[BigQueryView]
     ) -> "BigQueryViewDagWalker":
@@ -784,28 +1102,9 @@ class BigQueryViewDagWalker:
         views. Includes the input views themselves.
         """
         self._check_sub_dag_input_views(input_views=views)
-
-        sub_dag_views: Set[BigQueryView] = set()
-
-        def collect_descendants(
-            v: BigQueryView, parent_results: Dict[BigQueryView, bool]
-        ) -> bool:
-            is_target_view_or_descendant = (
-                any(
-                    is_parent_target_view_or_descendant
-                    for is_parent_target_view_or_descendant in parent_results.values()
-                )
-                or v in views
-            )
-            if is_target_view_or_descendant:
-                sub_dag_views.add(v)
-
-            return is_target_view_or_descendant
-
-        self.process_dag(collect_descendants, synchronous=True)
-        self._check_sub_dag_views(input_views=views, sub_dag_views=sub_dag_views)
-        sub_dag = BigQueryViewDagWalker(list(sub_dag_views))
-        return sub_dag
+        return self._sub_dag_for_bits(
+            self.reachability_index.descendant_bits(v.address for v in views)
+        )
 
     def get_ancestors_sub_dag(
         self,
@@ -815,29 +1114,9 @@ class BigQueryViewDagWalker:
         views. Includes the input views themselves.
         """
         self._check_sub_dag_input_views(input_views=views)
-
-        sub_dag_views: Set[BigQueryView] = set()
-
-        def collect_ancestors(
-            v: BigQueryView, parent_results: Dict[BigQueryView, Set[BigQueryView]]
-        ) -> Set[BigQueryView]:
-            # Ancestors of this view are comprised of all ancestors of each parent...
-            all_ancestors: Set[BigQueryView] = set().union(*parent_results.values())
-
-            # ...plus the parents themselves
-            all_ancestors |= parent_results.keys()
-
-            if v in views:
-                sub_dag_views.add(v)
-                for ancestor in all_ancestors:
-                    sub_dag_views.add(ancestor)
-
-            return all_ancestors
-
-        self.process_dag(collect_ancestors, synchronous=True)
-        self._check_sub_dag_views(input_views=views, sub_dag_views=sub_dag_views)
-        sub_dag = BigQueryViewDagWalker(list(sub_dag_views))
-        return sub_dag
+        return self._sub_dag_for_bits(
+            self.reachability_index.ancestor_bits(v.address for v in views)
+        )
 
     @staticmethod
     def union_dags(*dags: "BigQueryViewDagWalker") -> "BigQueryViewDagWalker":
@@ -866,84 +1145,56 @@ class BigQueryViewDagWalker:
         If |get_descendants| is True, includes all views that are descendant from the
         |views|.
         """
-        sub_dag_walker = BigQueryViewDagWalker(views)
+        if not include_ancestors and not include_descendants:
+            return BigQueryViewDagWalker(views)
 
-        # If necessary, get descendants of views_in_sub_dag
+        self._check_sub_dag_input_views(input_views=views)
+        addresses = [v.address for v in views]
+        bits = self.reachability_index.bits_for_addresses(addresses)
         if include_descendants:
-            sub_dag_walker = BigQueryViewDagWalker.union_dags(
-                sub_dag_walker,
-                self.get_descendants_sub_dag(views),
-            )
-
-        # If necessary, get ancestor views of views_in_sub_dag
+            bits |= self.reachability_index.descendant_bits(addresses)
         if include_ancestors:
-            sub_dag_walker = BigQueryViewDagWalker.union_dags(
-                sub_dag_walker, self.get_ancestors_sub_dag(views)
-            )
-
-        return sub_dag_walker
+            bits |= self.reachability_index.ancestor_bits(addresses)
+        return self._sub_dag_for_bits(bits)
 
     def populate_ancestor_sub_dags(self) -> None:
-        """Builds and caches ancestor sub-DAGs on all nodes in this DAG."""
-
-        def populate_node_ancestors_sub_dag(
-            v: BigQueryView, parent_results: Dict[BigQueryView, None]
-        ) -> None:
-            """For a given view, calculates the ancestors sub-DAG by unioning together
-            the parent ancestor sub-DAGs."""
-            this_view_dag = BigQueryViewDagWalker([v])
-            parent_nodes = [
-                self.node_for_view(parent_view) for parent_view in parent_results
-            ]
-            ancestors_sub_dag = self.union_dags(
-                this_view_dag,
-                *[n.ancestors_sub_dag for n in parent_nodes],
+        """Caches ancestor sub-DAG builders and ancestor tree edge counts on all nodes
+        in this DAG. Each ancestor sub-DAG is only built if it is accessed.
+        """
+        for address in self._topological_order(reverse=False):
+            node = self.nodes_by_address[address]
+            node.set_ancestors_sub_dag_builder(
+                functools.partial(self._ancestors_sub_dag_for_address, address)
             )
 
-            node = self.node_for_view(view=v)
-            node.set_ancestors_sub_dag(ancestors_sub_dag)
-
             # Include source tables in parent count in addition to parent views
-            ancestors_tree_num_edges = (
+            node.set_ancestors_tree_num_edges(
                 len(node.source_addresses)
                 + len(node.parent_node_addresses)
-                + sum(p.ancestors_tree_num_edges for p in parent_nodes)
+                + sum(
+                    self.nodes_by_address[p].ancestors_tree_num_edges
+                    for p in node.parent_node_addresses
+                )
             )
-            node.set_ancestors_tree_num_edges(ancestors_tree_num_edges)
-
-        self.process_dag(populate_node_ancestors_sub_dag, synchronous=True)
 
     def populate_descendant_sub_dags(self) -> None:
-        """Builds and caches descendant sub-DAGs on all nodes in this DAG."""
-
-        def populate_node_descendants_sub_dag(
-            v: BigQueryView, child_results: Dict[BigQueryView, None]
-        ) -> None:
-            """For a given view, calculates the descendants sub-DAG by unioning together
-            the child descendant sub-DAGs."""
-            this_view_dag = BigQueryViewDagWalker([v])
-            child_nodes = [
-                self.node_for_view(child_view) for child_view in child_results
-            ]
-            descendants_sub_dag = self.union_dags(
-                this_view_dag,
-                *[n.descendants_sub_dag for n in child_nodes],
-            )
-
-            node = self.node_for_view(view=v)
-            node.set_descendants_sub_dag(descendants_sub_dag)
-
-            descendants_tree_num_edges = len(child_results) + sum(
-                c.descendants_tree_num_edges for c in child_nodes
-            )
-            node.set_descendants_tree_num_edges(descendants_tree_num_edges)
-
+        """Caches descendant sub-DAG builders and descendant tree edge counts on all
+        nodes in this DAG. Each descendant sub-DAG is only built if it is accessed.
+        """
         # Process the DAG in the leaves -> roots direction so we process children
         # first.
-
-        self.process_dag(
-            populate_node_descendants_sub_dag, synchronous=True, reverse=True
-        )
+        for address in self._topological_order(reverse=True):
+            node = self.nodes_by_address[address]
+            node.set_descendants_sub_dag_builder(
+                functools.partial(self._descendants_sub_dag_for_address, address)
+            )
+            node.set_descendants_tree_num_edges(
+                len(node.child_node_addresses)
+                + sum(
+                    self.nodes_by_address[c].descendants_tree_num_edges
+                    for c in node.child_node_addresses
+                )
+            )
 
     def ancestors_dfs_tree_str(
         self,
@@ -1086,9 +1337,10 @@ class BigQueryViewDagWalker:
         if terminating_datasets is None:
             terminating_datasets = set()
         related_addresses = set()
-        node = self.nodes_by_address[address]
-        ancestors = set(node.ancestors_sub_dag.nodes_by_address)
-        related_addresses |= ancestors
+        ancestors = self.reachability_index.addresses_for_bits(
+            self.reachability_index.ancestor_bits([address])
+        )
+        related_addresses |= set(ancestors)
         for ancestor in ancestors:
             if not ancestor.dataset_id in terminating_datasets:
                 node = self.nodes_by_address[ancestor]
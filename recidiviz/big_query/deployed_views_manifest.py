@@ -0,0 +1,177 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Defines a manifest of the view definitions that were deployed to BigQuery in the
+last successful view update, which allows us to determine locally (without any
+BigQuery metadata calls) which views have changed since that update.
+"""
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+import attr
+from google.cloud import bigquery
+
+from recidiviz.big_query.big_query_address import BigQueryAddress
+from recidiviz.big_query.big_query_view import BigQueryView
+from recidiviz.cloud_storage.gcs_file_system import GCSFileSystem
+from recidiviz.cloud_storage.gcsfs_path import GcsfsFilePath
+from recidiviz.utils import metadata
+
+
+def _hash_str(s: Optional[str]) -> Optional[str]:
+    if s is None:
+        return None
+    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+
+
+@attr.s(auto_attribs=True, frozen=True, kw_only=True)
+class DeployedViewManifestEntry:
+    """Information about a single view as it was last deployed to BigQuery."""
+
+    view_query_hash: str
+    description_hash: str
+    clustering_fields: Optional[List[str]]
+    materialized_address: Optional[BigQueryAddress]
+
+    # The schema of the view after it was deployed, in BigQuery API representation.
+    schema: List[Dict[str, Any]]
+
+    @classmethod
+    def for_deployed_view(
+        cls, view: BigQueryView, schema: List[bigquery.SchemaField]
+    ) -> "DeployedViewManifestEntry":
+        view_query_hash = _hash_str(view.view_query)
+        description_hash = _hash_str(view.description)
+        if view_query_hash is None or description_hash is None:
+            raise ValueError(f"Found view [{view.address}] with no query/description.")
+        return cls(
+            view_query_hash=view_query_hash,
+            description_hash=description_hash,
+            clustering_fields=view.clustering_fields,
+            materialized_address=view.materialized_address,
+            schema=[field.to_api_repr() for field in schema],
+        )
+
+    def matches_view_definition(self, view: BigQueryView) -> bool:
+        """Returns True if the provided view has the same definition as the view
+        that was deployed when this entry was recorded.
+        """
+        return (
+            self.view_query_hash == _hash_str(view.view_query)
+            and self.description_hash == _hash_str(view.description)
+            and self.clustering_fields == view.clustering_fields
+            and self.materialized_address == view.materialized_address
+        )
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        return {
+            "view_query_hash": self.view_query_hash,
+            "description_hash": self.description_hash,
+            "clustering_fields": self.clustering_fields,
+            "materialized_address": self.materialized_address.to_str()
+            if self.materialized_address
+            else None,
+            "schema": self.schema,
+        }
+
+    @classmethod
+    def from_json_dict(cls, json_dict: Dict[str, Any]) -> "DeployedViewManifestEntry":
+        materialized_address_str = json_dict["materialized_address"]
+        materialized_address = None
+        if materialized_address_str:
+            dataset_id, table_id = materialized_address_str.split(".")
+            materialized_address = BigQueryAddress(
+                dataset_id=dataset_id, table_id=table_id
+            )
+        return cls(
+            view_query_hash=json_dict["view_query_hash"],
+            description_hash=json_dict["description_hash"],
+            clustering_fields=json_dict["clustering_fields"],
+            materialized_address=materialized_address,
+            schema=json_dict["schema"],
+        )
+
+
+@attr.s(auto_attribs=True, frozen=True, kw_only=True)
+class DeployedViewsManifest:
+    """A record of the definitions of all views deployed in the last successful view
+    update, keyed by view address.
+
+    Note: the manifest only captures changes to the view definitions themselves. It
+    cannot detect a change to the schema of a source table that is not itself a view,
+    so deploys that must pick up source table changes should not use the manifest.
+    """
+
+    entries: Dict[BigQueryAddress, DeployedViewManifestEntry]
+
+    def view_has_changed(self, view: BigQueryView) -> bool:
+        """Returns True if this view was not deployed in the last successful update or
+        if its definition has changed since then.
+        """
+        entry = self.entries.get(view.address)
+        return entry is None or not entry.matches_view_definition(view)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                address.to_str(): entry.to_json_dict()
+                for address, entry in sorted(self.entries.items())
+            }
+        )
+
+    @classmethod
+    def from_json(cls, json_str: str) -> "DeployedViewsManifest":
+        entries = {}
+        for address_str, entry_dict in json.loads(json_str).items():
+            dataset_id, table_id = address_str.split(".")
+            entries[
+                BigQueryAddress(dataset_id=dataset_id, table_id=table_id)
+            ] = DeployedViewManifestEntry.from_json_dict(entry_dict)
+        return cls(entries=entries)
+
+
+def deployed_views_manifest_path(sandbox_prefix: Optional[str]) -> GcsfsFilePath:
+    """Returns the path to the manifest of views deployed to the datasets with the
+    given prefix (or to the standard deployed datasets if no prefix is provided).
+    """
+    file_name = (
+        f"{sandbox_prefix}_deployed_views_manifest.json"
+        if sandbox_prefix
+        else "deployed_views_manifest.json"
+    )
+    return GcsfsFilePath.from_absolute_path(
+        f"gs://{metadata.project_id()}-view-update-metadata/{file_name}"
+    )
+
+
+class DeployedViewsManifestStore:
+    """Reads and writes the DeployedViewsManifest stored in GCS."""
+
+    def __init__(self, fs: GCSFileSystem, path: GcsfsFilePath) -> None:
+        self.fs = fs
+        self.path = path
+
+    def read(self) -> Optional[DeployedViewsManifest]:
+        """Returns the stored manifest, or None if no manifest has been stored."""
+        if not self.fs.exists(self.path):
+            return None
+        return DeployedViewsManifest.from_json(self.fs.download_as_string(self.path))
+
+    def write(self, manifest: DeployedViewsManifest) -> None:
+        self.fs.upload_from_string(
+            self.path, manifest.to_json(), content_type="application/json"
+        )
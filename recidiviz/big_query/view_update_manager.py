@@ -20,9 +20,9 @@ import logging
 from concurrent import futures
 from concurrent.futures import Future
 from enum import Enum
-from typing import Dict, Iterable, List, Optional, Sequence, Set
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-from google.cloud import exceptions
+from google.cloud import bigquery, exceptions
 
 from recidiviz.big_query.address_overrides import BigQueryAddressOverrides
 from recidiviz.big_query.big_query_address import BigQueryAddress
@@ -37,6 +37,12 @@ from recidiviz.big_query.big_query_view_dag_walker import BigQueryViewDagWalker
 from recidiviz.big_query.big_query_view_sub_dag_collector import (
     BigQueryViewSubDagCollector,
 )
+from recidiviz.big_query.deployed_views_manifest import (
+    DeployedViewManifestEntry,
+    DeployedViewsManifest,
+    DeployedViewsManifestStore,
+    deployed_views_manifest_path,
+)
 from recidiviz.big_query.success_persister import AllViewsUpdateSuccessPersister
 from recidiviz.big_query.view_update_config import (
     get_deployed_view_dag_update_perf_config,
@@ -45,6 +51,7 @@ from recidiviz.big_query.view_update_manager_utils import (
     cleanup_datasets_and_delete_unmanaged_views,
     get_managed_view_and_materialized_table_addresses_by_dataset,
 )
+from recidiviz.cloud_storage.gcsfs_factory import GcsfsFactory
 from recidiviz.monitoring.instruments import get_monitoring_instrument
 from recidiviz.monitoring.keys import CounterInstrumentKey
 from recidiviz.utils import structured_logging
@@ -79,13 +86,34 @@ def execute_update_all_managed_views(
     dataset_ids_to_load: Optional[List[str]] = None,
     clean_managed_datasets: bool = True,
     allow_slow_views: bool = False,
+    incremental: bool = False,
 ) -> None:
     """
     Updates all views in the view registry. If dataset_ids_to_load is provided, only views in those datasets and
     their ancestors will be updated. If sandbox_prefix is provided, all views will be deployed to a sandbox dataset.
+
+    If incremental is True, uses the manifest of views deployed in the last
+    successful incremental update to only update and re-materialize views whose
+    definitions have changed since then, along with their descendants, and then
+    replaces that manifest with one describing the views deployed in this update.
+    Incremental updates do not pick up changes to source table schemas or data.
+    Non-incremental updates neither read nor write the manifest.
     """
     start = datetime.datetime.now()
 
+    manifest_store: Optional[DeployedViewsManifestStore] = None
+    previous_manifest: Optional[DeployedViewsManifest] = None
+    if incremental:
+        manifest_store = DeployedViewsManifestStore(
+            fs=GcsfsFactory.build(), path=deployed_views_manifest_path(sandbox_prefix)
+        )
+        previous_manifest = manifest_store.read()
+        if not previous_manifest:
+            logging.info(
+                "No deployed views manifest found - updating all views instead of "
+                "running an incremental update."
+            )
+
     all_view_builders_in_dag: List[BigQueryViewBuilder] = deployed_view_builders(
         project_id
     )
@@ -107,7 +135,7 @@ def execute_update_all_managed_views(
     else:
         view_builders = all_view_builders_in_dag
 
-    create_managed_dataset_and_deploy_views_for_view_builders(
+    deployed_views_manifest = create_managed_dataset_and_deploy_views_for_view_builders(
         view_source_table_datasets=VIEW_SOURCE_TABLE_DATASETS,
         view_builders_to_update=view_builders,
         historically_managed_datasets_to_clean=DEPLOYED_DATASETS_THAT_HAVE_EVER_BEEN_MANAGED
@@ -118,9 +146,15 @@ def execute_update_all_managed_views(
         )
         if sandbox_prefix
         else None,
-        force_materialize=True,
+        force_materialize=previous_manifest is None,
         allow_slow_views=allow_slow_views,
+        previously_deployed_views_manifest=previous_manifest,
     )
+    if manifest_store:
+        # The manifest only describes the views that were just deployed, so views
+        # that have been removed from the DAG (or were not deployed in this update)
+        # are treated as changed in the next incremental update.
+        manifest_store.write(deployed_views_manifest)
     end = datetime.datetime.now()
     runtime_sec = int((end - start).total_seconds())
 
@@ -143,12 +177,17 @@ def create_managed_dataset_and_deploy_views_for_view_builders(
     default_table_expiration_for_new_datasets: Optional[int] = None,
     views_might_exist: bool = True,
     allow_slow_views: bool = False,
-) -> None:
+    previously_deployed_views_manifest: Optional[DeployedViewsManifest] = None,
+) -> DeployedViewsManifest:
     """Creates or updates all the views in the provided list with the view query in the
     provided view builder list. If any materialized view has been updated (or if an
     ancestor view has been updated) or the force_materialize flag is set, the view
     will be re-materialized to ensure the schemas remain consistent.
 
+    If a `previously_deployed_views_manifest` is provided, views whose definitions
+    match the manifest and whose ancestors are all unchanged are not touched at all.
+    Returns a manifest describing all views deployed in this update.
+
     If a `historically_managed_datasets_to_clean` set is provided,
     then cleans up unmanaged views and datasets by deleting them from BigQuery.
 
@@ -173,7 +212,7 @@ def create_managed_dataset_and_deploy_views_for_view_builders(
             address_overrides=address_overrides,
         )
 
-        _create_managed_dataset_and_deploy_views(
+        return _create_managed_dataset_and_deploy_views(
             views_to_update,
             bq_region_override,
             force_materialize,
@@ -181,6 +220,7 @@ def create_managed_dataset_and_deploy_views_for_view_builders(
             default_table_expiration_for_new_datasets=default_table_expiration_for_new_datasets,
             views_might_exist=views_might_exist,
             allow_slow_views=allow_slow_views,
+            previously_deployed_views_manifest=previously_deployed_views_manifest,
         )
     except Exception as e:
         get_monitoring_instrument(CounterInstrumentKey.VIEW_UPDATE_FAILURE).add(
@@ -316,7 +356,8 @@ def _create_managed_dataset_and_deploy_views(
     default_table_expiration_for_new_datasets: Optional[int] = None,
     views_might_exist: bool = True,
     allow_slow_views: bool = False,
-) -> None:
+    previously_deployed_views_manifest: Optional[DeployedViewsManifest] = None,
+) -> DeployedViewsManifest:
     """Create and update the given views and their parent datasets. Cleans up unmanaged views and datasets
 
     For each dataset key in the given dictionary, creates  the dataset if it does not
@@ -341,7 +382,18 @@ def _create_managed_dataset_and_deploy_views(
             them, and fallback to creating the views if they do not exist.
         allow_slow_views: If set then we will not fail view update if a view
             takes longer to update than is typically allowed.
+        previously_deployed_views_manifest: If set, views whose definitions match
+            this manifest and which have no changed ancestors are skipped without
+            making any BigQuery calls. Cannot be combined with force_materialize.
+
+    Returns a manifest with entries for every view deployed (or skipped because it
+    was unchanged) in this update.
     """
+    if previously_deployed_views_manifest and force_materialize:
+        raise ValueError(
+            "Cannot skip unchanged views when force_materialize is set - all "
+            "materialized views must be re-materialized."
+        )
     bq_client = BigQueryClientImpl(region_override=bq_region_override)
     dag_walker = BigQueryViewDagWalker(views_to_update)
 
@@ -365,12 +417,31 @@ def _create_managed_dataset_and_deploy_views(
             dry_run=False,
         )
 
+    manifest_entries: Dict[BigQueryAddress, DeployedViewManifestEntry] = {}
+
     def process_fn(
         v: BigQueryView, parent_results: Dict[BigQueryView, CreateOrUpdateViewStatus]
     ) -> CreateOrUpdateViewStatus:
         """Returns True if this view or any of its parents were updated."""
+        if (
+            previously_deployed_views_manifest
+            and v.should_deploy()
+            and not previously_deployed_views_manifest.view_has_changed(v)
+            and all(
+                status == CreateOrUpdateViewStatus.SUCCESS_WITHOUT_CHANGES
+                for status in parent_results.values()
+            )
+        ):
+            logging.info(
+                "Skipping update of view [%s] which is unchanged since the last deploy.",
+                v.address.to_str(),
+            )
+            manifest_entries[v.address] = previously_deployed_views_manifest.entries[
+                v.address
+            ]
+            return CreateOrUpdateViewStatus.SUCCESS_WITHOUT_CHANGES
         try:
-            return _create_or_update_view_and_materialize_if_necessary(
+            status, schema = _create_or_update_view_and_materialize_if_necessary(
                 bq_client,
                 v,
                 parent_results,
@@ -379,6 +450,11 @@ def _create_managed_dataset_and_deploy_views(
             )
         except Exception as e:
             raise ValueError(f"Error creating or updating view [{v.address}]") from e
+        if schema is not None:
+            manifest_entries[v.address] = DeployedViewManifestEntry.for_deployed_view(
+                v, schema
+            )
+        return status
 
     perf_config = (
         None if allow_slow_views else get_deployed_view_dag_update_perf_config()
@@ -389,6 +465,7 @@ def _create_managed_dataset_and_deploy_views(
         perf_config=perf_config,
     )
     results.log_processing_stats(n_slowest=NUM_SLOW_VIEWS_TO_LOG)
+    return DeployedViewsManifest(entries=manifest_entries)
 
 
 def _create_or_update_view_and_materialize_if_necessary(
@@ -397,9 +474,10 @@ def _create_or_update_view_and_materialize_if_necessary(
     parent_results: Dict[BigQueryView, CreateOrUpdateViewStatus],
     force_materialize: bool,
     might_exist: bool,
-) -> CreateOrUpdateViewStatus:
+) -> Tuple[CreateOrUpdateViewStatus, Optional[List[bigquery.SchemaField]]]:
     """Creates or updates the provided view in BigQuery and materializes that view into
-    a table when appropriate. Returns:
+    a table when appropriate. Returns the schema of the deployed view (or None if the
+    view was not deployed), along with a status:
         - CreateOrUpdateViewStatus.SKIPPED if this view cannot be deployed
         - CreateOrUpdateViewStatus.SUCCESS_WITH_CHANGES if this view or any views in its
            parent chain have been updated from the version that was saved in BigQuery
@@ -413,7 +491,7 @@ def _create_or_update_view_and_materialize_if_necessary(
             view.dataset_id,
             view.view_id,
         )
-        return CreateOrUpdateViewStatus.SKIPPED
+        return CreateOrUpdateViewStatus.SKIPPED, None
     skipped_parents = [
         parent_view.address
         for parent_view, parent_status in parent_results.items()
@@ -483,4 +561,4 @@ def _create_or_update_view_and_materialize_if_necessary(
         CreateOrUpdateViewStatus.SUCCESS_WITH_CHANGES
         if has_changes
         else CreateOrUpdateViewStatus.SUCCESS_WITHOUT_CHANGES
-    )
+    ), updated_view.schema
@@ -0,0 +1,144 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Cache of fitted ARIMA models keyed by the series they were fit on"""
+import hashlib
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from numpy.linalg.linalg import LinAlgError
+from statsmodels.tsa.arima.model import ARIMA, ARIMAResults
+
+ORDER = (1, 1, 0)
+TREND = "t"
+
+# Fitted models shared by every ArimaFitCache in the process, so that simulations
+# built from the same historical admissions (e.g. policy scenarios) reuse fits
+_FITTED_MODELS: Dict[str, ARIMAResults] = {}
+
+
+def fit_arima(series: np.ndarray) -> Optional[ARIMAResults]:
+    """Fit the ARIMA model for `series`, or return None if the fit encounters a
+    singular matrix. Module-level so it can be run in a worker process."""
+    try:
+        return ARIMA(series, order=ORDER, trend=TREND).fit()
+    except LinAlgError:
+        return None
+
+
+class ArimaFitCache:
+    """Fits ARIMA models with the ORDER and TREND settings, reusing any model that
+    has already been fit on the same series.
+
+    Fits are kept in memory for the lifetime of the process and, if `cache_dir` is
+    set, written to disk so that later runs reuse them too. Fits that encounter a
+    singular matrix are not cached.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def get_key(series: np.ndarray) -> str:
+        """Hash of the series values and the model settings"""
+        series_hash = hashlib.sha256(
+            np.ascontiguousarray(series, dtype=float).tobytes()
+        )
+        series_hash.update(repr((ORDER, TREND, version("statsmodels"))).encode())
+        return series_hash.hexdigest()
+
+    @staticmethod
+    def clear() -> None:
+        """Clear the fits stored in memory"""
+        _FITTED_MODELS.clear()
+
+    def fit(self, series: np.ndarray) -> Optional[ARIMAResults]:
+        """Return the ARIMA model fit on `series`, or None if the fit encounters a
+        singular matrix"""
+        return self.fit_all([series])[0]
+
+    def fit_all(
+        self, series_list: List[np.ndarray], num_processes: Optional[int] = None
+    ) -> List[Optional[ARIMAResults]]:
+        """Return the ARIMA model fit on each series in `series_list`, in order. The
+        series that have not been fit before are fit in `num_processes` worker
+        processes if more than one is requested."""
+        keys = [self.get_key(series) for series in series_list]
+
+        series_to_fit: Dict[str, np.ndarray] = {}
+        for key, series in zip(keys, series_list):
+            if key in _FITTED_MODELS or key in series_to_fit:
+                continue
+            fitted_model = self._read_from_disk(key)
+            if fitted_model is not None:
+                _FITTED_MODELS[key] = fitted_model
+            else:
+                series_to_fit[key] = series
+
+        new_fits: List[Tuple[str, Optional[ARIMAResults]]]
+        if num_processes is not None and num_processes > 1 and len(series_to_fit) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(num_processes, len(series_to_fit))
+            ) as executor:
+                new_fits = list(
+                    zip(
+                        series_to_fit,
+                        executor.map(fit_arima, series_to_fit.values()),
+                    )
+                )
+        else:
+            new_fits = [
+                (key, fit_arima(series)) for key, series in series_to_fit.items()
+            ]
+
+        singular_keys = set()
+        for key, fitted_model in new_fits:
+            if fitted_model is None:
+                singular_keys.add(key)
+                continue
+            _FITTED_MODELS[key] = fitted_model
+            self._write_to_disk(key, fitted_model)
+
+        return [None if key in singular_keys else _FITTED_MODELS[key] for key in keys]
+
+    def _get_path(self, key: str) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _read_from_disk(self, key: str) -> Optional[ARIMAResults]:
+        path = self._get_path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def _write_to_disk(self, key: str, fitted_model: ARIMAResults) -> None:
+        path = self._get_path(key)
+        if path is None or self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a temporary file first so concurrent runs never read a partial fit
+        with tempfile.NamedTemporaryFile(
+            dir=self.cache_dir, suffix=".tmp", delete=False
+        ) as temp_file:
+            pickle.dump(fitted_model, temp_file)
+        os.replace(temp_file.name, path)
@@ -16,7 +16,7 @@
 # =============================================================================
 """SparkCompartment that tracks cohorts internally to determine population size and outflows"""
 
-from typing import Dict
+from typing import Dict, List
 
 import numpy as np
 import pandas as pd
@@ -149,14 +149,7 @@ class FullCompartment(SparkCompartment):
         outflow_dict = self._generate_outflow_dict()
 
         # If there is a new outflow compartment then create a new index in the outflows df
-        missing_keys = [
-            key for key in outflow_dict.keys() if key not in self.outflows.index
-        ]
-        if len(missing_keys) > 0:
-            new_rows = pd.DataFrame(
-                0, index=missing_keys, columns=self.outflows.columns
-            )
-            self.outflows = pd.concat([self.outflows, new_rows]).sort_index()
+        self._add_outflow_keys(list(outflow_dict.keys()))
 
         # if historical data available, use that instead
         if self.current_time_step in self.historical_outflows.columns:
@@ -183,11 +176,24 @@ class FullCompartment(SparkCompartment):
 
         # Store the outflows with the previous time step since transitions from the last
         # time step get us the total population for this time step
-        self.outflows.loc[:, self.current_time_step - 1] = outflow_dict
+        self._record_outflows(self.current_time_step - 1, outflow_dict)
 
         for edge in self.edges:
             edge.ingest_incoming_cohort(outflow_dict)
 
+    def _add_outflow_keys(self, outflow_keys: List[str]) -> None:
+        """Add a row to the outflows df for any outflow that is not already tracked"""
+        missing_keys = [key for key in outflow_keys if key not in self.outflows.index]
+        if len(missing_keys) > 0:
+            new_rows = pd.DataFrame(
+                0, index=missing_keys, columns=self.outflows.columns
+            )
+            self.outflows = pd.concat([self.outflows, new_rows]).sort_index()
+
+    def _record_outflows(self, time_step: int, outflow_dict: Dict[str, float]) -> None:
+        """Store the outflows to each compartment for the given time step"""
+        self.outflows.loc[:, time_step] = outflow_dict
+
     def create_new_cohort(self) -> None:
         """Create a new cohort from new admissions from other compartments"""
         self.cohorts.append_cohort(self.incoming_cohorts, self.current_time_step)
@@ -196,20 +202,28 @@ class FullCompartment(SparkCompartment):
     def prepare_for_next_step(self) -> None:
         """Clean up any data structures and move the time step 1 unit forward"""
         # move the incoming cohort into the cohorts list
-        if self.current_time_step in self.end_time_step_populations:
+        self._record_end_time_step_population(
+            self.current_time_step, self.get_current_population()
+        )
+
+        super().prepare_for_next_step()
+
+    def _record_end_time_step_population(
+        self, time_step: int, population: float
+    ) -> None:
+        """Store the compartment population at the end of the given time step"""
+        if time_step in self.end_time_step_populations:
             raise ValueError(
                 f"Cannot prepare_for_next_step() if population already recorded for this time step \n"
-                f"time step {self.current_time_step} already in end_time_step_populations"
+                f"time step {time_step} already in end_time_step_populations"
             )
         self.end_time_step_populations = pd.concat(
             [
                 self.end_time_step_populations,
-                pd.Series({self.current_time_step: self.get_current_population()}),
+                pd.Series({time_step: population}),
             ]
         )
 
-        super().prepare_for_next_step()
-
     def scale_cohorts(self, scale_factor: float) -> None:
         self.cohorts.scale_cohort_size(scale_factor)
 
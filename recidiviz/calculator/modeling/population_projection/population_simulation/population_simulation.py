@@ -18,10 +18,14 @@
 # pylint: disable=unused-argument
 
 from time import time
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from recidiviz.calculator.modeling.population_projection.population_simulation.sub_simulation_process_pool import (
+    SubSimulationCall,
+    SubSimulationProcessPool,
+)
 from recidiviz.calculator.modeling.population_projection.sub_simulation.sub_simulation import (
     SubSimulation,
 )
@@ -42,6 +46,8 @@ class PopulationSimulation:
         ],
         should_scale_populations: bool,
         validation_transitions_data: Optional[pd.DataFrame] = None,
+        skip_identity_cross_flow: bool = False,
+        num_processes: Optional[int] = None,
     ) -> None:
         self.sub_simulations = sub_simulations
         self.population_data = population_data
@@ -54,6 +60,12 @@ class PopulationSimulation:
                 self, cross_flow_function or "update_attributes_identity"
             )
         self.should_scale_populations = should_scale_populations
+        # The identity cross flow leaves every cohort in place, so skipping it avoids
+        # rebuilding every cohort table from a DataFrame at each time step
+        self.skip_identity_cross_flow = skip_identity_cross_flow
+        # Number of processes to spread the sub simulations across, or None to run them
+        # in this process
+        self.num_processes = num_processes
         self.validation_transition_data = validation_transitions_data or pd.DataFrame()
         self.population_projections = pd.DataFrame()
 
@@ -82,6 +94,10 @@ class PopulationSimulation:
 
     def step_forward(self, num_time_steps: int) -> None:
         """Steps forward in the projection by some number of steps."""
+        if self.num_processes is not None and self.num_processes > 1:
+            self._step_forward_in_process_pool(num_time_steps, self.num_processes)
+            return
+
         for _ in range(num_time_steps):
             for simulation_obj in self.sub_simulations.values():
                 simulation_obj.step_forward()
@@ -98,20 +114,84 @@ class PopulationSimulation:
 
             self.current_time_step += 1
 
-    def _collect_subsimulation_populations(self) -> pd.DataFrame:
-        """Helper function for step_forward(). Collects subgroup populations for total population scaling."""
-        populations_df = pd.DataFrame()
-        for simulation_tag, simulation_obj in self.sub_simulations.items():
-            sim_pops = simulation_obj.get_current_populations()
-            sim_pops["simulation_group"] = simulation_tag
-            populations_df = pd.concat([populations_df, sim_pops])
-        return populations_df
+    def _step_forward_in_process_pool(
+        self, num_time_steps: int, num_processes: int
+    ) -> None:
+        """Steps forward with the sub simulations spread across worker processes. The
+        workers only wait on each other for the cross flow and population scaling, all
+        other calls are batched until the next time the results are needed."""
+        with SubSimulationProcessPool(self.sub_simulations, num_processes) as pool:
+            pending_calls: List[SubSimulationCall] = []
+            for _ in range(num_time_steps):
+                pending_calls += [("step_forward", {}), ("create_new_cohort", {})]
+
+                if self._should_cross_flow():
+                    cohorts_by_simulation = pool.call(
+                        pending_calls + [("cross_flow", {})]
+                    )
+                    pending_calls = [
+                        (
+                            "ingest_cross_simulation_cohorts",
+                            {
+                                simulation_tag: (cohorts,)
+                                for simulation_tag, cohorts in self._get_cross_simulation_cohorts(
+                                    cohorts_by_simulation
+                                ).items()
+                            },
+                        )
+                    ]
+
+                if self.should_scale_populations:
+                    populations_by_simulation = pool.call(
+                        pending_calls + [("get_current_populations", {})]
+                    )
+                    pending_calls = [
+                        (
+                            "scale_cohorts",
+                            {
+                                simulation_tag: (scale_factors, self.current_time_step)
+                                for simulation_tag, scale_factors in self._get_scale_factors(
+                                    populations_by_simulation
+                                ).items()
+                            },
+                        )
+                    ]
+
+                pending_calls.append(("prepare_for_next_step", {}))
+                self.current_time_step += 1
+            pool.call(pending_calls)
+
+        self.sub_simulations = pool.sub_simulations
+
+    def _should_cross_flow(self) -> bool:
+        return not (
+            self.skip_identity_cross_flow
+            and self.cross_flow_function is self.update_attributes_identity
+        )
 
     def _cross_flow(self) -> None:
         """Helper function for step_forward. Transfer cohorts between SubSimulations"""
-        cross_simulation_flows = pd.DataFrame()
+        if not self._should_cross_flow():
+            return
+
+        cross_simulation_cohorts = self._get_cross_simulation_cohorts(
+            {
+                simulation_tag: simulation_obj.cross_flow()
+                for simulation_tag, simulation_obj in self.sub_simulations.items()
+            }
+        )
         for simulation_tag, simulation_obj in self.sub_simulations.items():
-            simulation_cohorts = simulation_obj.cross_flow()
+            simulation_obj.ingest_cross_simulation_cohorts(
+                cross_simulation_cohorts[simulation_tag]
+            )
+
+    def _get_cross_simulation_cohorts(
+        self, cohorts_by_simulation: Dict[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """Apply the cross flow function to the cohorts popped from each SubSimulation and
+        return the cohorts each SubSimulation should ingest"""
+        cross_simulation_flows = pd.DataFrame()
+        for simulation_tag, simulation_cohorts in cohorts_by_simulation.items():
             simulation_cohorts["simulation_group"] = simulation_tag
             cross_simulation_flows = pd.concat(
                 [cross_simulation_flows, simulation_cohorts], sort=True
@@ -141,14 +221,31 @@ class PopulationSimulation:
             .reset_index(["compartment", "simulation_group"])
         )
 
-        for simulation_tag, simulation_obj in self.sub_simulations.items():
-            sub_group_cohorts = cross_simulation_flows[
+        return {
+            simulation_tag: cross_simulation_flows[
                 cross_simulation_flows.simulation_group == simulation_tag
             ].drop("simulation_group", axis=1)
-            simulation_obj.ingest_cross_simulation_cohorts(sub_group_cohorts)
+            for simulation_tag in cohorts_by_simulation
+        }
 
     def _scale_populations(self) -> None:
         """Helper function for step_forward. Scale populations in each compartment to match historical data."""
+        scale_factors = self._get_scale_factors(
+            {
+                simulation_tag: simulation_obj.get_current_populations()
+                for simulation_tag, simulation_obj in self.sub_simulations.items()
+            }
+        )
+        for simulation_tag, simulation_obj in self.sub_simulations.items():
+            simulation_obj.scale_cohorts(
+                scale_factors[simulation_tag], self.current_time_step
+            )
+
+    def _get_scale_factors(
+        self, populations_by_simulation: Dict[str, pd.DataFrame]
+    ) -> Dict[str, pd.DataFrame]:
+        """Return the factors to scale the compartment populations in each SubSimulation
+        by so they match the historical population data for the current time step."""
 
         disaggregated_population_data = (
             "simulation_group" in self.population_data.columns
@@ -166,7 +263,10 @@ class PopulationSimulation:
             population_df_sort_indices
         ).compartment_population.sum()
 
-        subgroup_populations = self._collect_subsimulation_populations()
+        subgroup_populations = pd.DataFrame()
+        for simulation_tag, sim_pops in populations_by_simulation.items():
+            sim_pops["simulation_group"] = simulation_tag
+            subgroup_populations = pd.concat([subgroup_populations, sim_pops])
         subgroup_populations = subgroup_populations.groupby(
             population_df_sort_indices
         ).compartment_population.sum()
@@ -180,16 +280,15 @@ class PopulationSimulation:
             {"compartment_population": "scale_factor"}, axis=1
         )
 
-        for simulation_tag, simulation_obj in self.sub_simulations.items():
+        simulation_scale_factors = {}
+        for simulation_tag in populations_by_simulation:
             if disaggregated_population_data:
-                simulation_scale_factors = scale_factors[
+                simulation_scale_factors[simulation_tag] = scale_factors[
                     scale_factors["simulation_group"] == simulation_tag
                 ].drop("simulation_group", axis=1)
             else:
-                simulation_scale_factors = scale_factors
-            simulation_obj.scale_cohorts(
-                simulation_scale_factors, self.current_time_step
-            )
+                simulation_scale_factors[simulation_tag] = scale_factors
+        return simulation_scale_factors
 
     def get_outflows(self, collapse_compartments: bool = False) -> pd.DataFrame:
         """Return the projected outflows (transitions)"""
@@ -142,6 +142,8 @@ class PopulationSimulationFactory:
             cross_flow_function=user_inputs.cross_flow_function,
             override_cross_flow_function=data_inputs.override_cross_flow_function,
             should_scale_populations=data_inputs.should_scale_populations_after_step,
+            skip_identity_cross_flow=bool(user_inputs.vectorized_compartments),
+            num_processes=user_inputs.num_processes,
         )
 
         # run simulation up to the start_year
@@ -0,0 +1,148 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Runs the SubSimulations of a PopulationSimulation in a pool of worker processes"""
+import multiprocessing
+from multiprocessing.connection import Connection
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from recidiviz.calculator.modeling.population_projection.sub_simulation.sub_simulation import (
+    SubSimulation,
+)
+
+# A SubSimulation method name and the arguments to call it with for each simulation
+# group, groups without arguments are called with none
+SubSimulationCall = Tuple[str, Dict[str, Tuple[Any, ...]]]
+
+_CLOSE_COMMAND = "close"
+
+
+def _run_sub_simulations(
+    connection: Connection, sub_simulations: Dict[str, SubSimulation]
+) -> None:
+    """Worker loop: apply each batch of calls received to the worker's sub simulations
+    and send back the results of the last call, or the sub simulations once closed"""
+    while True:
+        calls = connection.recv()
+        if calls == _CLOSE_COMMAND:
+            connection.send(sub_simulations)
+            return
+        try:
+            results: Dict[str, Any] = {}
+            for method_name, args_by_tag in calls:
+                results = {
+                    simulation_tag: getattr(simulation_obj, method_name)(
+                        *args_by_tag.get(simulation_tag, ())
+                    )
+                    for simulation_tag, simulation_obj in sub_simulations.items()
+                }
+            connection.send(results)
+        except Exception as e:
+            connection.send(e)
+
+
+class SubSimulationProcessPool:
+    """Distributes SubSimulations across worker processes that each own their
+    sub simulations for the lifetime of the pool. Each call is applied to every sub
+    simulation and the results are returned in the order of the original sub simulations
+    dict, regardless of which process ran them.
+
+    Use as a context manager, the sub simulations with their final state are available
+    from `sub_simulations` once the pool has exited.
+    """
+
+    def __init__(
+        self, sub_simulations: Dict[str, SubSimulation], num_processes: int
+    ) -> None:
+        if num_processes < 1:
+            raise ValueError(f"num_processes must be positive, got {num_processes}")
+        self.sub_simulations = sub_simulations
+        self.num_processes = min(num_processes, len(sub_simulations))
+        self._connections: List[Connection] = []
+        self._processes: List[multiprocessing.Process] = []
+
+    def __enter__(self) -> "SubSimulationProcessPool":
+        simulation_tags = list(self.sub_simulations)
+        for worker_index in range(self.num_processes):
+            parent_connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_run_sub_simulations,
+                args=(
+                    child_connection,
+                    {
+                        simulation_tag: self.sub_simulations[simulation_tag]
+                        for simulation_tag in simulation_tags[
+                            worker_index :: self.num_processes
+                        ]
+                    },
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_connection.close()
+            self._connections.append(parent_connection)
+            self._processes.append(process)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            sub_simulations: Dict[str, SubSimulation] = {}
+            for connection in self._connections:
+                connection.send(_CLOSE_COMMAND)
+                sub_simulations.update(connection.recv())
+            self.sub_simulations = {
+                simulation_tag: sub_simulations[simulation_tag]
+                for simulation_tag in self.sub_simulations
+            }
+        for connection in self._connections:
+            connection.close()
+        for process in self._processes:
+            if exc_type is not None:
+                process.terminate()
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def call(self, calls: List[SubSimulationCall]) -> Dict[str, Any]:
+        """Make each call in order on every sub simulation and return the result of
+        the last call for each simulation group"""
+        if not self._connections:
+            raise ValueError("SubSimulationProcessPool must be entered before use")
+        for connection in self._connections:
+            connection.send(calls)
+
+        results: Dict[str, Any] = {}
+        error: Optional[Exception] = None
+        # Receive from every worker before raising so the workers stay in sync
+        for connection in self._connections:
+            worker_results = connection.recv()
+            if isinstance(worker_results, Exception):
+                error = error or worker_results
+            else:
+                results.update(worker_results)
+        if error is not None:
+            raise error
+
+        return {
+            simulation_tag: results[simulation_tag]
+            for simulation_tag in self.sub_simulations
+        }
@@ -16,14 +16,18 @@
 # =============================================================================
 """admission calculating object for ShellCompartments"""
 from enum import Enum, auto
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from numpy.linalg.linalg import LinAlgError
-from statsmodels.tsa.arima.model import ARIMA, ARIMAResults
+from statsmodels.tsa.arima.model import ARIMAResults
+
+from recidiviz.calculator.modeling.population_projection.arima_fit_cache import (
+    ArimaFitCache,
+    fit_arima,
+)
 
-ORDER = (1, 1, 0)
 MIN_NUM_DATA_POINTS = 4
 
 
@@ -39,6 +43,8 @@ class PredictedAdmissions:
         self,
         historical_data: pd.DataFrame,
         constant_admissions: bool,
+        arima_fit_cache: Optional[ArimaFitCache] = None,
+        num_processes: Optional[int] = None,
     ):
         """
         historical_data is a DataFrame with columns for each time step and rows for each admission_to type (jail,
@@ -48,7 +54,16 @@ class PredictedAdmissions:
 
         The input data will not necessarily be sorted in temporal order, so that step is done here. Additionally, an
         ARIMA model will fail if all data is 0, so any rows with no data will be dropped as well.
+
+        The ARIMA models are fit through `arima_fit_cache`, so models already fit on the same data are reused, and
+        models that still need to be fit are fit in `num_processes` processes.
         """
+        self.arima_fit_cache = arima_fit_cache or ArimaFitCache()
+        self.num_processes = num_processes
+
+        # add warnings attribute that prints at the end of shell_compartment initialization
+        self.warnings: list = []
+
         historical_data, constant_admissions = self._infer_missing_data(
             historical_data, constant_admissions
         )
@@ -70,9 +85,6 @@ class PredictedAdmissions:
         else:
             self.predict_constant_value = True
 
-        # add warnings attribute that prints at the end of shell_compartment initialization
-        self.warnings: list = []
-
     def get_time_step_estimate(self, time_step: int) -> Dict[str, float]:
         """
         Return the estimated admissions for the time_step provided as a dict of compartment -> predicted value.
@@ -109,9 +121,8 @@ class PredictedAdmissions:
         ).sort_index()
         return full_arima_output
 
-    @staticmethod
     def _infer_missing_data(
-        historical_data: pd.DataFrame, constant_admissions: bool
+        self, historical_data: pd.DataFrame, constant_admissions: bool
     ) -> Tuple[pd.DataFrame, bool]:
         """Fill in historical data so all admission_to cover the same time steps of data"""
 
@@ -119,6 +130,20 @@ class PredictedAdmissions:
         historical_data.replace({np.nan: None}, inplace=True)
         historical_data = historical_data.astype(float).sort_index(axis=1)
 
+        # Fit the backcast and forecast models for every row up front so they can be
+        # fit in parallel
+        series_to_fit: List[np.ndarray] = []
+        for _, row in historical_data.iterrows():
+            if len(row.dropna()) < MIN_NUM_DATA_POINTS:
+                continue
+            if row.isnull().iloc[0]:
+                series_to_fit.append(row.iloc[::-1].dropna().values.astype(float))
+            if row.isnull().iloc[-1]:
+                series_to_fit.append(row.dropna().values.astype(float))
+        fitted_models = iter(
+            self.arima_fit_cache.fit_all(series_to_fit, self.num_processes)
+        )
+
         for admission, row in historical_data.iterrows():
             missing_data = historical_data.columns[row.isnull()]
 
@@ -135,15 +160,9 @@ class PredictedAdmissions:
                         admission, missing_data_backward
                     ] = historical_data.loc[admission, min_data_time_step]
                 else:
-                    model_backcast = (
-                        ARIMA(
-                            row.iloc[::-1].dropna().values.astype(float),
-                            order=ORDER,
-                            trend="t",
-                        )
-                        .fit()
-                        .forecast(steps=len(missing_data_backward))
-                    )
+                    model_backcast = self._get_fitted_model(
+                        next(fitted_models)
+                    ).forecast(steps=len(missing_data_backward))
 
                     # flip the predictions back around so they're ordered correctly for the historical data indexing
                     historical_data.loc[
@@ -157,57 +176,58 @@ class PredictedAdmissions:
                         admission, missing_data_forward
                     ] = historical_data.loc[admission, max_data_time_step]
                 else:
-                    model_forecast = (
-                        ARIMA(row.dropna().values.astype(float), order=ORDER, trend="t")
-                        .fit()
-                        .forecast(steps=len(missing_data_forward))
-                    )
+                    model_forecast = self._get_fitted_model(
+                        next(fitted_models)
+                    ).forecast(steps=len(missing_data_forward))
 
                     historical_data.loc[
                         admission, missing_data_forward
                     ] = model_forecast
         return historical_data, constant_admissions
 
+    @staticmethod
+    def _get_fitted_model(fitted_model: Optional[ARIMAResults]) -> ARIMAResults:
+        if fitted_model is None:
+            raise LinAlgError("Singular matrix encountered fitting ARIMA model.")
+        return fitted_model
+
     def _train_arima_models(self) -> None:
         """
         Create a dictionary to store the forecasted and backcasted trained ARIMA model objects
         A dictionary is created for each admission type with both a forecasting model and a backcasting model
         """
+        series_to_fit: List[np.ndarray] = []
+        for _, row in self.historical_data.iterrows():
+            series_to_fit.extend([row.values, row.iloc[::-1].values])
+        fitted_models = self.arima_fit_cache.fit_all(series_to_fit, self.num_processes)
+
         trained_model_dict = {}
-        for admission_compartment, row in self.historical_data.iterrows():
-            model_forecast = ARIMA(row.values, order=ORDER, trend="t")
-            model_backcast = ARIMA(row.iloc[::-1].values, order=ORDER, trend="t")
-            try:
-                trained_model_dict[
-                    (admission_compartment, PredictionDirectionType.FORWARD)
-                ] = model_forecast.fit()
-                trained_model_dict[
-                    (admission_compartment, PredictionDirectionType.BACKWARD)
-                ] = model_backcast.fit()
-
-            except LinAlgError:
+        for i, (admission_compartment, row) in enumerate(
+            self.historical_data.iterrows()
+        ):
+            model_forecast, model_backcast = fitted_models[2 * i : 2 * i + 2]
+            if model_forecast is None or model_backcast is None:
                 # Add warnings
                 warn_text = "Singular matrix encountered fitting ARIMA model."
                 if warn_text not in self.warnings:
                     self.warnings.append(warn_text)
 
-                # adjust forecast and backcast
-                model_forecast = ARIMA(
-                    row.values + np.random.normal(0, 0.001, len(row.values)),
-                    order=ORDER,
-                    trend="t",
-                )
-                model_backcast = ARIMA(
-                    row.iloc[::-1].values + np.random.normal(0, 0.001, len(row.values)),
-                    order=ORDER,
-                    trend="t",
+                # adjust forecast and backcast, the noise makes these fits not worth caching
+                model_forecast, model_backcast = (
+                    self._get_fitted_model(fit_arima(series))
+                    for series in (
+                        row.values + np.random.normal(0, 0.001, len(row.values)),
+                        row.iloc[::-1].values
+                        + np.random.normal(0, 0.001, len(row.values)),
+                    )
                 )
-                trained_model_dict[
-                    (admission_compartment, PredictionDirectionType.FORWARD)
-                ] = model_forecast.fit()
-                trained_model_dict[
-                    (admission_compartment, PredictionDirectionType.BACKWARD)
-                ] = model_backcast.fit()
+
+            trained_model_dict[
+                (admission_compartment, PredictionDirectionType.FORWARD)
+            ] = model_forecast
+            trained_model_dict[
+                (admission_compartment, PredictionDirectionType.BACKWARD)
+            ] = model_backcast
 
         self.trained_model_dict = trained_model_dict
 
@@ -20,6 +20,9 @@ from typing import Dict, List, Optional
 
 import pandas as pd
 
+from recidiviz.calculator.modeling.population_projection.arima_fit_cache import (
+    ArimaFitCache,
+)
 from recidiviz.calculator.modeling.population_projection.predicted_admissions import (
     PredictedAdmissions,
 )
@@ -42,12 +45,18 @@ class ShellCompartment(SparkCompartment):
         tag: str,
         policy_list: List[SparkPolicy],
         constant_admissions: bool,
+        arima_fit_cache: Optional[ArimaFitCache] = None,
+        num_processes: Optional[int] = None,
     ) -> None:
 
         super().__init__(outflows_data, starting_time_step, tag)
 
         self.policy_list = policy_list
 
+        self.arima_fit_cache = arima_fit_cache
+
+        self.num_processes = num_processes
+
         self.admissions_predictors: Dict[int, PredictedAdmissions] = {}
 
         self.policy_data: Dict[int, pd.DataFrame] = {}
@@ -94,7 +103,10 @@ class ShellCompartment(SparkCompartment):
         # second pass creates admissions predictors from transformed outflows data
         for time_step, time_step_data in self.policy_data.items():
             self.admissions_predictors[time_step] = PredictedAdmissions(
-                time_step_data, constant_admissions
+                time_step_data,
+                constant_admissions,
+                arima_fit_cache=self.arima_fit_cache,
+                num_processes=self.num_processes,
             )
 
     def initialize_edges(self, edges: List[SparkCompartment]) -> None:
@@ -20,6 +20,9 @@ from typing import Dict, List, Tuple
 
 import pandas as pd
 
+from recidiviz.calculator.modeling.population_projection.arima_fit_cache import (
+    ArimaFitCache,
+)
 from recidiviz.calculator.modeling.population_projection.compartment_transitions import (
     CompartmentTransitions,
 )
@@ -39,6 +42,9 @@ from recidiviz.calculator.modeling.population_projection.sub_simulation.sub_simu
 from recidiviz.calculator.modeling.population_projection.super_simulation.initializer import (
     UserInputs,
 )
+from recidiviz.calculator.modeling.population_projection.vectorized_full_compartment import (
+    VectorizedFullCompartment,
+)
 
 
 class SubSimulationFactory:
@@ -225,6 +231,8 @@ class SubSimulationFactory:
                     else False,
                     tag=compartment,
                     policy_list=shell_policies[compartment],
+                    arima_fit_cache=ArimaFitCache(user_inputs.arima_cache_dir),
+                    num_processes=user_inputs.num_processes,
                 )
             # initialize full compartment
             elif compartment_type == "full":
@@ -234,7 +242,12 @@ class SubSimulationFactory:
                         f"no transitions data for compartment: {compartment}"
                     )
 
-                simulation_compartments[compartment] = FullCompartment(
+                full_compartment_class = (
+                    VectorizedFullCompartment
+                    if user_inputs.vectorized_compartments
+                    else FullCompartment
+                )
+                simulation_compartments[compartment] = full_compartment_class(
                     outflow_data=outflows_data,
                     compartment_transitions=transition_tables_by_compartment[
                         compartment
@@ -50,6 +50,15 @@ class UserInputs:
     speed_run: Optional[bool] = None
     # Optional alternative function to handle cross-flows between SubSimulations
     cross_flow_function: Optional[str] = None
+    # True if full compartments should track their cohorts and outflows in NumPy
+    # matrices instead of DataFrames, which produces the same results faster
+    vectorized_compartments: Optional[bool] = None
+    # Number of processes to spread independent simulations and sub-simulations
+    # across, simulations run in a single process if not set
+    num_processes: Optional[int] = None
+    # Directory to store fitted admissions ARIMA models in so that later runs on the
+    # same historical admissions can reuse them, fits are only kept in memory if not set
+    arima_cache_dir: Optional[str] = None
 
 
 @dataclasses.dataclass
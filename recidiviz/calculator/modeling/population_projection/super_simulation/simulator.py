@@ -15,9 +15,12 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """SuperSimulation composed object for initializing simulations."""
+import dataclasses
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -44,6 +47,11 @@ from recidiviz.calculator.modeling.population_projection.super_simulation.time_c
     TimeConverter,
 )
 
+# The arguments to build one PopulationSimulation with
+PopulationSimulationInputs = Tuple[
+    UserInputs, SimulationInputData, List[SparkPolicy], int
+]
+
 
 class Simulator:
     """Runs simulations for SuperSimulation."""
@@ -91,17 +99,19 @@ class Simulator:
 
         self._reset_pop_simulations()
 
-        self.pop_simulations["control"] = self._build_population_simulation(
-            user_inputs, data_inputs, [], first_relevant_time_step
+        self._simulate_population_simulations(
+            user_inputs,
+            {
+                "control": (user_inputs, data_inputs, [], first_relevant_time_step),
+                "policy": (
+                    user_inputs,
+                    data_inputs,
+                    policy_list,
+                    first_relevant_time_step,
+                ),
+            },
         )
 
-        self.pop_simulations["policy"] = self._build_population_simulation(
-            user_inputs, data_inputs, policy_list, first_relevant_time_step
-        )
-
-        self.pop_simulations["policy"].simulate_policies()
-        self.pop_simulations["control"].simulate_policies()
-
         self.super_sim_results = SuperSimulationResults()
 
         results = {
@@ -195,18 +205,19 @@ class Simulator:
         if projection_time_steps_override is not None:
             user_inputs.projection_time_steps = projection_time_steps_override
 
+        simulation_inputs: Dict[str, PopulationSimulationInputs] = {}
         for start_date, data_inputs in run_date_data_inputs.items():
             print(start_date)
             user_inputs.start_time_step = run_date_first_relevant_time_step[start_date]
             simulation_name = f"baseline_{start_date.date()}"
-            self.pop_simulations[simulation_name] = self._build_population_simulation(
-                user_inputs,
+            simulation_inputs[simulation_name] = (
+                copy(user_inputs),
                 data_inputs,
                 [],
                 run_date_first_relevant_time_step[start_date],
             )
 
-            self.pop_simulations[simulation_name].simulate_policies()
+        self._simulate_population_simulations(user_inputs, simulation_inputs)
 
         # log warnings from ARIMA model
         self._log_predicted_admissions_warnings()
@@ -224,18 +235,18 @@ class Simulator:
         """
         self._reset_pop_simulations()
 
-        for time_step in np.arange(range_start, range_end, step_size):
-            self.pop_simulations[
-                f"backfill_period_{time_step}_time_steps"
-            ] = self._build_population_simulation(
-                user_inputs,
-                data_inputs,
-                [],
-                first_relevant_time_step=user_inputs.start_time_step - time_step,
-            )
-            self.pop_simulations[
-                f"backfill_period_{time_step}_time_steps"
-            ].simulate_policies()
+        self._simulate_population_simulations(
+            user_inputs,
+            {
+                f"backfill_period_{time_step}_time_steps": (
+                    user_inputs,
+                    data_inputs,
+                    [],
+                    user_inputs.start_time_step - time_step,
+                )
+                for time_step in np.arange(range_start, range_end, step_size)
+            },
+        )
 
         # log warnings from ARIMA model
         self._log_predicted_admissions_warnings()
@@ -337,6 +348,45 @@ class Simulator:
     def _reset_pop_simulations(self) -> None:
         self.pop_simulations = {}
 
+    def _simulate_population_simulations(
+        self,
+        user_inputs: UserInputs,
+        simulation_inputs: Dict[str, PopulationSimulationInputs],
+    ) -> None:
+        """Build and run a PopulationSimulation for each set of inputs. If
+        `user_inputs.num_processes` allows, the simulations are independent so they are
+        run in a process pool, and each one runs its sub-simulations in its own process.
+        The simulations are stored in the order of `simulation_inputs` either way."""
+        num_processes = user_inputs.num_processes or 1
+        if num_processes <= 1 or len(simulation_inputs) <= 1:
+            for simulation_name, inputs in simulation_inputs.items():
+                self.pop_simulations[
+                    simulation_name
+                ] = _build_and_simulate_population_simulation(*inputs)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(num_processes, len(simulation_inputs))
+        ) as executor:
+            futures = {
+                simulation_name: executor.submit(
+                    _build_and_simulate_population_simulation,
+                    # Worker processes cannot start their own sub-simulation processes
+                    dataclasses.replace(simulation_user_inputs, num_processes=None),
+                    data_inputs,
+                    policy_list,
+                    first_relevant_time_step,
+                )
+                for simulation_name, (
+                    simulation_user_inputs,
+                    data_inputs,
+                    policy_list,
+                    first_relevant_time_step,
+                ) in simulation_inputs.items()
+            }
+            for simulation_name, future in futures.items():
+                self.pop_simulations[simulation_name] = future.result()
+
     def _log_predicted_admissions_warnings(self) -> None:
         """
         Checks if PredictedAdmissions objects have any warnings. If so, log them.
@@ -376,3 +426,17 @@ class Simulator:
             first_relevant_time_step=first_relevant_time_step,
             data_inputs=data_inputs,
         )
+
+
+def _build_and_simulate_population_simulation(
+    user_inputs: UserInputs,
+    data_inputs: SimulationInputData,
+    policy_list: List[SparkPolicy],
+    first_relevant_time_step: int,
+) -> PopulationSimulation:
+    """Module-level so it can be run in a worker process"""
+    population_simulation = Simulator._build_population_simulation(
+        user_inputs, data_inputs, policy_list, first_relevant_time_step
+    )
+    population_simulation.simulate_policies()
+    return population_simulation
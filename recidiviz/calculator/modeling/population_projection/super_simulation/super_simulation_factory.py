@@ -180,6 +180,11 @@ class SuperSimulationFactory:
         cross_flow_function = user_inputs_yaml_dict.pop_optional(
             "cross_flow_function", str
         )
+        vectorized_compartments = user_inputs_yaml_dict.pop_optional(
+            "vectorized_compartments", bool
+        )
+        num_processes = user_inputs_yaml_dict.pop_optional("num_processes", int)
+        arima_cache_dir = user_inputs_yaml_dict.pop_optional("arima_cache_dir", str)
 
         # Check for any remaining unused arguments
         if user_inputs_yaml_dict:
@@ -194,6 +199,9 @@ class SuperSimulationFactory:
             run_date=run_date,
             speed_run=speed_run,
             cross_flow_function=cross_flow_function,
+            vectorized_compartments=vectorized_compartments,
+            num_processes=num_processes,
+            arima_cache_dir=arima_cache_dir,
         )
 
     @staticmethod
@@ -0,0 +1,202 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Encapsulate the population data per cohort and time step in a preallocated NumPy matrix"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from recidiviz.calculator.modeling.population_projection.cohort_table import CohortTable
+from recidiviz.calculator.modeling.population_projection.utils.transitions_utils import (
+    SIG_FIGS,
+)
+
+# Number of cohorts and time steps the matrix has room for before it is first resized
+INITIAL_CAPACITY = 64
+
+
+class VectorizedCohortTable(CohortTable):
+    """CohortTable that stores the population counts in a NumPy matrix instead of a
+    DataFrame so that a time step and a cohort can be appended without copying the table.
+
+    Row i holds the cohort that started at `first_time_step + i` and column j holds the
+    population at the end of `first_time_step + j`. The matrix doubles in size whenever
+    it runs out of room. `cohort_df` is still available for callers that need the
+    DataFrame representation, but it is rebuilt from the matrix on each access.
+    """
+
+    def __init__(self, starting_time_step: int) -> None:
+        self.first_time_step = starting_time_step - 1
+        self._num_cohorts = 0
+        self._num_time_steps = 0
+        self._populations = np.zeros((INITIAL_CAPACITY, INITIAL_CAPACITY))
+        # Rows that hold a cohort, rows in between may be empty after a cross flow
+        self._has_cohort = np.zeros(INITIAL_CAPACITY, dtype=bool)
+        super().__init__(starting_time_step)
+
+    @property
+    def cohort_df(self) -> pd.DataFrame:
+        cohort_rows = self._cohort_rows()
+        return pd.DataFrame(
+            self._populations[cohort_rows, : self._num_time_steps],
+            index=pd.Index(cohort_rows + self.first_time_step, name="start_time_step"),
+            columns=pd.Index(self._time_steps(), name="simulation_time_step"),
+        )
+
+    @cohort_df.setter
+    def cohort_df(self, cohort_df: pd.DataFrame) -> None:
+        """Replace the contents of the table with the cohorts in `cohort_df`"""
+        start_time_steps = cohort_df.index.to_numpy(dtype=int)
+        time_steps = cohort_df.columns.to_numpy(dtype=int)
+        if (start_time_steps < self.first_time_step).any() or (
+            time_steps < self.first_time_step
+        ).any():
+            raise ValueError(
+                f"Cannot ingest cohorts before the start of the CohortTable timeline "
+                f"{self.first_time_step}"
+            )
+
+        self._populations[: self._num_cohorts, : self._num_time_steps] = 0
+        self._has_cohort[:] = False
+        self._num_cohorts = (
+            start_time_steps.max() - self.first_time_step + 1
+            if len(start_time_steps) > 0
+            else 0
+        )
+        self._num_time_steps = (
+            time_steps.max() - self.first_time_step + 1 if len(time_steps) > 0 else 0
+        )
+        self._ensure_capacity(self._num_cohorts, self._num_time_steps)
+
+        rows = start_time_steps - self.first_time_step
+        self._populations[
+            np.ix_(rows, time_steps - self.first_time_step)
+        ] = cohort_df.fillna(0).to_numpy(dtype=float)
+        self._has_cohort[rows] = True
+
+    def _cohort_rows(self) -> np.ndarray:
+        return np.flatnonzero(self._has_cohort[: self._num_cohorts])
+
+    def _time_steps(self) -> np.ndarray:
+        return np.arange(
+            self.first_time_step, self.first_time_step + self._num_time_steps
+        )
+
+    def _ensure_capacity(self, num_cohorts: int, num_time_steps: int) -> None:
+        """Grow the matrix, doubling each dimension that is too small"""
+        capacity_cohorts, capacity_time_steps = self._populations.shape
+        if num_cohorts <= capacity_cohorts and num_time_steps <= capacity_time_steps:
+            return
+        new_shape: Tuple[int, int] = (
+            max(num_cohorts, 2 * capacity_cohorts)
+            if num_cohorts > capacity_cohorts
+            else capacity_cohorts,
+            max(num_time_steps, 2 * capacity_time_steps)
+            if num_time_steps > capacity_time_steps
+            else capacity_time_steps,
+        )
+        populations = np.zeros(new_shape)
+        populations[:capacity_cohorts, :capacity_time_steps] = self._populations
+        self._populations = populations
+        has_cohort = np.zeros(new_shape[0], dtype=bool)
+        has_cohort[:capacity_cohorts] = self._has_cohort
+        self._has_cohort = has_cohort
+
+    def get_latest_population(self) -> pd.Series:
+        cohort_rows = self._cohort_rows()
+        return pd.Series(
+            self._populations[cohort_rows, self._num_time_steps - 1],
+            index=pd.Index(cohort_rows + self.first_time_step, name="start_time_step"),
+            name=self.first_time_step + self._num_time_steps - 1,
+        )
+
+    def get_latest_population_array(self) -> np.ndarray:
+        """Return the latest population of every row, indexed by start_time_step - first_time_step.
+        Rows without a cohort are 0."""
+        return self._populations[: self._num_cohorts, self._num_time_steps - 1]
+
+    def get_latest_total_population(self) -> float:
+        return self.get_latest_population_array().sum()
+
+    def get_per_time_step_population(self) -> pd.Series:
+        return pd.Series(
+            self._populations[: self._num_cohorts, : self._num_time_steps].sum(axis=0),
+            index=pd.Index(self._time_steps(), name="simulation_time_step"),
+        )
+
+    def append_time_step_end_count(
+        self, cohort_sizes: pd.Series, projection_time_step: int
+    ) -> None:
+        """Append the cohort sizes for the end of the projection time_step"""
+        cohort_start_time_steps = self._cohort_rows() + self.first_time_step
+        cohort_sizes_array = np.zeros(self._num_cohorts)
+        cohort_sizes_array[cohort_start_time_steps - self.first_time_step] = (
+            cohort_sizes.reindex(cohort_start_time_steps).fillna(0).to_numpy()
+        )
+        self.append_time_step_end_count_array(cohort_sizes_array, projection_time_step)
+
+    def append_time_step_end_count_array(
+        self, cohort_sizes: np.ndarray, projection_time_step: int
+    ) -> None:
+        """Append the cohort sizes for the end of the projection time_step, indexed like
+        get_latest_population_array()"""
+        latest_population = self.get_latest_population_array()
+        exceeds_latest_population = np.round(cohort_sizes, SIG_FIGS) > np.round(
+            latest_population, SIG_FIGS
+        )
+        if exceeds_latest_population.any():
+            raise ValueError(
+                "Cannot append cohort data that is larger than the latest population\n"
+                f"Latest population: {latest_population[exceeds_latest_population]}\n"
+                f"Attempting to append: {cohort_sizes[exceeds_latest_population]}"
+            )
+
+        column = projection_time_step - self.first_time_step
+        if column < self._num_time_steps:
+            raise ValueError(f"Cannot overwrite cohort for time {projection_time_step}")
+        if column > self._num_time_steps:
+            raise ValueError(
+                f"Cannot skip time steps when appending cohort data for time {projection_time_step}, "
+                f"latest time step is {self.first_time_step + self._num_time_steps - 1}"
+            )
+
+        self._ensure_capacity(self._num_cohorts, self._num_time_steps + 1)
+        self._populations[: self._num_cohorts, column] = cohort_sizes
+        self._num_time_steps += 1
+
+    def append_cohort(self, cohort_size: float, projection_time_step: int) -> None:
+        """Add a new cohort to the bottom of the cohort table"""
+        row = projection_time_step - self.first_time_step
+        if not 0 <= row < self._num_time_steps:
+            raise ValueError(
+                f"Cannot append cohort with start time {projection_time_step} outside of CohortTable timeline "
+                f"{self._time_steps()}"
+            )
+        if row < self._num_cohorts and self._has_cohort[row]:
+            raise ValueError(f"Cannot overwrite cohort for time {projection_time_step}")
+
+        self._ensure_capacity(row + 1, self._num_time_steps)
+        self._populations[row, :] = 0
+        self._populations[row, row] = cohort_size
+        self._has_cohort[row] = True
+        self._num_cohorts = max(self._num_cohorts, row + 1)
+
+    def scale_cohort_size(self, scalar: float) -> None:
+        if scalar < 0:
+            raise ValueError(f"Cannot scale cohort by a negative factor: {scalar}")
+        self._populations[: self._num_cohorts, : self._num_time_steps] *= scalar
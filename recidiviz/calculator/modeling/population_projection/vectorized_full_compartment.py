@@ -0,0 +1,240 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""FullCompartment that steps its cohorts forward with NumPy matrix operations"""
+
+from typing import Dict, List, Tuple
+
+import attr
+import numpy as np
+import pandas as pd
+
+from recidiviz.calculator.modeling.population_projection.compartment_transitions import (
+    CompartmentTransitions,
+)
+from recidiviz.calculator.modeling.population_projection.full_compartment import (
+    FullCompartment,
+)
+from recidiviz.calculator.modeling.population_projection.utils.transitions_utils import (
+    SIG_FIGS,
+)
+from recidiviz.calculator.modeling.population_projection.vectorized_cohort_table import (
+    INITIAL_CAPACITY,
+    VectorizedCohortTable,
+)
+
+
+@attr.s(frozen=True)
+class _TransitionMatrix:
+    """Per time step transition table converted to NumPy arrays"""
+
+    # Row of `probabilities` for each compartment duration, or -1 if there is no row
+    row_by_duration: np.ndarray = attr.ib()
+
+    # Transition probabilities with one column per outflow, the "remaining" column last
+    probabilities: np.ndarray = attr.ib()
+
+    outflows: List[str] = attr.ib()
+
+    # Number of rows in the table, cohorts in the compartment longer than this are
+    # not expected to outflow
+    max_duration: int = attr.ib()
+
+    @classmethod
+    def from_table(cls, table: pd.DataFrame) -> "_TransitionMatrix":
+        outflows = [column for column in table.columns if column != "remaining"]
+        durations = table.index.to_numpy(dtype=int)
+        row_by_duration = np.full(max(durations.max(initial=0), len(table)) + 1, -1)
+        row_by_duration[durations] = np.arange(len(durations))
+        return cls(
+            row_by_duration=row_by_duration,
+            probabilities=table[outflows + ["remaining"]].to_numpy(dtype=float),
+            outflows=outflows,
+            max_duration=len(table),
+        )
+
+
+class VectorizedFullCompartment(FullCompartment):
+    """FullCompartment that stores cohorts and outflows in preallocated NumPy matrices
+    and applies the transition tables as matrix operations. It produces the same
+    populations and outflows as FullCompartment.
+
+    The per time step transition table does not change once every table of the active
+    policy has been fully phased in, so the converted tables are cached and reused.
+    """
+
+    def __init__(
+        self,
+        outflow_data: pd.DataFrame,
+        compartment_transitions: CompartmentTransitions,
+        starting_time_step: int,
+        tag: str,
+    ) -> None:
+        super().__init__(outflow_data, compartment_transitions, starting_time_step, tag)
+
+        self.cohorts: VectorizedCohortTable = VectorizedCohortTable(starting_time_step)
+
+        self._transition_matrices: Dict[Tuple[int, int], _TransitionMatrix] = {}
+
+    @property
+    def outflows(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            self._outflow_values[:, : len(self._outflow_column_by_time_step)].copy(),
+            index=self._outflows_index,
+            columns=pd.Index(list(self._outflow_column_by_time_step)),
+        )
+
+    @outflows.setter
+    def outflows(self, outflows: pd.DataFrame) -> None:
+        self._outflows_index = outflows.index
+        self._outflow_row_by_key = {key: i for i, key in enumerate(outflows.index)}
+        self._outflow_column_by_time_step = {
+            time_step: i for i, time_step in enumerate(outflows.columns)
+        }
+        self._outflow_values = np.full(
+            (len(outflows.index), max(INITIAL_CAPACITY, len(outflows.columns))),
+            np.nan,
+        )
+        self._outflow_values[:, : len(outflows.columns)] = outflows.to_numpy(
+            dtype=float
+        )
+
+    @property
+    def end_time_step_populations(self) -> pd.Series:
+        return pd.Series(self._end_time_step_populations, dtype=float)
+
+    @end_time_step_populations.setter
+    def end_time_step_populations(self, end_time_step_populations: pd.Series) -> None:
+        self._end_time_step_populations: Dict[
+            int, float
+        ] = end_time_step_populations.to_dict()
+
+    def _get_transition_matrix(self) -> _TransitionMatrix:
+        """Return the per time step transition table for the current time step"""
+        policy_time_step = max(
+            ts
+            for ts in self.compartment_transitions.transition_tables
+            if ts <= self.current_time_step
+        )
+        transition_table = self.compartment_transitions.transition_tables[
+            policy_time_step
+        ]
+        # Once the current time step is past the longest table, every cohort uses the
+        # table of the latest policy and the collapsed table no longer changes
+        time_step_since_policy = min(
+            self.current_time_step - policy_time_step,
+            max(int(table.index.max()) for table in transition_table.tables.values())
+            + 1,
+        )
+        key = (policy_time_step, time_step_since_policy)
+        if key not in self._transition_matrices:
+            self._transition_matrices[key] = _TransitionMatrix.from_table(
+                transition_table.get_per_time_step_table(self.current_time_step)
+            )
+        return self._transition_matrices[key]
+
+    def _generate_outflow_dict(self) -> Dict[str, float]:
+        """step forward all cohorts one time step and generate outflow dict"""
+        transition_matrix = self._get_transition_matrix()
+
+        latest_time_step_pop = self.cohorts.get_latest_population_array()
+
+        # time steps in compartment for each row of the cohort table
+        durations = (
+            self.current_time_step
+            - self.cohorts.first_time_step
+            - np.arange(len(latest_time_step_pop))
+        )
+
+        # no cohort should start in cohort after current_ts
+        if (durations < 0).any():
+            raise ValueError(
+                "Cohort cannot start after current time step\n"
+                f"Current time step: {self.current_time_step}\n"
+                f"Cohort start times: {self.current_time_step - durations}"
+            )
+
+        # people on long/life-sentences are assumed to never outflow from the compartment
+        is_long = durations > transition_matrix.max_duration
+        if not np.isclose(latest_time_step_pop[is_long], 0, SIG_FIGS).all():
+            raise ValueError(
+                f"cohorts not empty after max sentence: {latest_time_step_pop[is_long]}"
+            )
+
+        short_rows = np.flatnonzero(~is_long)
+        table_rows = transition_matrix.row_by_duration[durations[short_rows]]
+        short_rows = short_rows[table_rows >= 0]
+        table_rows = table_rows[table_rows >= 0]
+
+        # broadcast latest cohort populations onto transition table
+        transitions = (
+            transition_matrix.probabilities[table_rows]
+            * latest_time_step_pop[short_rows, np.newaxis]
+        )
+
+        end_count = np.where(is_long, latest_time_step_pop, 0.0)
+        end_count[short_rows] = transitions[:, -1]
+        self.cohorts.append_time_step_end_count_array(end_count, self.current_time_step)
+
+        outflow_totals = np.nansum(transitions[:, :-1], axis=0)
+        return dict(zip(transition_matrix.outflows, outflow_totals))
+
+    def _add_outflow_keys(self, outflow_keys: List[str]) -> None:
+        missing_keys = [
+            key for key in outflow_keys if key not in self._outflow_row_by_key
+        ]
+        if len(missing_keys) == 0:
+            return
+        outflows_index = self._outflows_index.append(
+            pd.Index(missing_keys)
+        ).sort_values()
+        outflow_values = np.zeros((len(outflows_index), self._outflow_values.shape[1]))
+        outflow_values[:, len(self._outflow_column_by_time_step) :] = np.nan
+        for i, key in enumerate(outflows_index):
+            if key in self._outflow_row_by_key:
+                outflow_values[i] = self._outflow_values[self._outflow_row_by_key[key]]
+        self._outflows_index = outflows_index
+        self._outflow_row_by_key = {key: i for i, key in enumerate(outflows_index)}
+        self._outflow_values = outflow_values
+
+    def _record_outflows(self, time_step: int, outflow_dict: Dict[str, float]) -> None:
+        if time_step not in self._outflow_column_by_time_step:
+            column = len(self._outflow_column_by_time_step)
+            if column == self._outflow_values.shape[1]:
+                self._outflow_values = np.concatenate(
+                    [self._outflow_values, np.full(self._outflow_values.shape, np.nan)],
+                    axis=1,
+                )
+            self._outflow_column_by_time_step[time_step] = column
+        column = self._outflow_column_by_time_step[time_step]
+
+        self._outflow_values[:, column] = np.nan
+        for key, outflow in outflow_dict.items():
+            if key in self._outflow_row_by_key:
+                self._outflow_values[self._outflow_row_by_key[key], column] = outflow
+
+    def _record_end_time_step_population(
+        self, time_step: int, population: float
+    ) -> None:
+        if time_step in self._end_time_step_populations:
+            raise ValueError(
+                f"Cannot prepare_for_next_step() if population already recorded for this time step \n"
+                f"time step {time_step} already in end_time_step_populations"
+            )
+        self._end_time_step_populations[time_step] = population
+
+    def get_current_population(self) -> float:
+        return self.cohorts.get_latest_total_population()
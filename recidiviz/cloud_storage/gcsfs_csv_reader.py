@@ -27,6 +27,10 @@ from recidiviz.cloud_storage.gcsfs_path import GcsfsFilePath
 from recidiviz.cloud_storage.read_only_csv_normalizing_stream import (
     ReadOnlyCsvNormalizingStream,
 )
+from recidiviz.cloud_storage.read_only_encoding_detecting_stream import (
+    ReadOnlyEncodingDetectingStream,
+    is_ascii_compatible_encoding,
+)
 
 UTF_8_ENCODING = "UTF-8"
 
@@ -115,8 +119,15 @@ class GcsfsCsvReader:
             yield f
 
     def _get_preprocessed_file_stream(
-        self, fp: TextIO, encoding: str, kwargs: Dict[str, Any]
-    ) -> Tuple[Union[ReadOnlyCsvNormalizingStream, TextIO], str, Dict[str, Any]]:
+        self,
+        fp: Union[ReadOnlyEncodingDetectingStream, TextIO],
+        encoding: str,
+        kwargs: Dict[str, Any],
+    ) -> Tuple[
+        Union[ReadOnlyCsvNormalizingStream, ReadOnlyEncodingDetectingStream, TextIO],
+        str,
+        Dict[str, Any],
+    ]:
         """Returns a tuple of (readable stream, encoding, updated kwargs)
         to pass to pandas.read_csv(). The stream, encoding and kwargs may have been
         updated to handle certain configurations of arguments that pandas does not
@@ -131,7 +142,7 @@ class GcsfsCsvReader:
         delimiter = kwargs.get("sep")
         quoting = kwargs["quoting"]
         preprocessed_fp: Union[
-            ReadOnlyCsvNormalizingStream, TextIO
+            ReadOnlyCsvNormalizingStream, ReadOnlyEncodingDetectingStream, TextIO
         ] = ReadOnlyCsvNormalizingStream(
             fp,
             delimiter=delimiter or ",",
@@ -157,6 +168,19 @@ class GcsfsCsvReader:
 
         return preprocessed_fp, encoding, result_kwargs
 
+    @staticmethod
+    def _get_switchable_encodings(encodings: List[str]) -> List[str]:
+        """Returns the longest prefix of |encodings| that are all ASCII-compatible. If
+        the file can't be decoded by one of these encodings, but the text read so far is
+        all ASCII, then we can switch to the next encoding without restarting the read.
+        """
+        switchable_encodings = []
+        for encoding in encodings:
+            if not is_ascii_compatible_encoding(encoding):
+                break
+            switchable_encodings.append(encoding)
+        return switchable_encodings
+
     def streaming_read(
         self,
         path: GcsfsFilePath,
@@ -171,6 +195,10 @@ class GcsfsCsvReader:
         types. For large files, this allows us to read and process the whole file without ever storing the whole file in
         local memory/disk.
 
+        The starting encoding is picked by sampling the start of the file. If a later part of the file can't be decoded
+        but everything decoded so far is ASCII, we switch to the next encoding mid-stream. Only if non-ASCII text has
+        already been decoded do we restart the read from the beginning with the next encoding.
+
         Args:
             path: The GCS path to read.
             delegate: A delegate for handling read chunks one by one.
@@ -184,15 +212,39 @@ class GcsfsCsvReader:
         if not encodings_to_try:
             encodings_to_try = COMMON_RAW_FILE_ENCODINGS
 
-        for encoding in encodings_to_try:
-            delegate.on_start_read_with_encoding(encoding)
+        encoding_index = 0
+        while encoding_index < len(encodings_to_try):
+            encoding = encodings_to_try[encoding_index]
+            # Encodings we may switch between mid-stream without restarting the read
+            switchable_encodings = self._get_switchable_encodings(
+                encodings_to_try[encoding_index:]
+            )
+            detecting_fp: Optional[ReadOnlyEncodingDetectingStream] = None
             try:
                 with self._file_pointer_for_path(path, encoding=encoding) as fp:
+                    decoded_fp: Union[ReadOnlyEncodingDetectingStream, TextIO] = fp
+                    if len(switchable_encodings) > 1:
+                        try:
+                            # Decode directly from the underlying byte stream so that
+                            # we can switch encodings without re-reading the file.
+                            detecting_fp = ReadOnlyEncodingDetectingStream(
+                                fp.buffer, switchable_encodings
+                            )
+                        except UnicodeError as e:
+                            # None of these encodings could decode the start of the
+                            # file - skip past all of them.
+                            encoding = switchable_encodings[-1]
+                            delegate.on_start_read_with_encoding(encoding)
+                            raise e
+                        decoded_fp = detecting_fp
+                        encoding = detecting_fp.encoding
+                    delegate.on_start_read_with_encoding(encoding)
+
                     (
                         preprocessed_fp,
                         updated_encoding,
                         updated_kwargs,
-                    ) = self._get_preprocessed_file_stream(fp, encoding, kwargs)
+                    ) = self._get_preprocessed_file_stream(decoded_fp, encoding, kwargs)
 
                     if encoding != updated_encoding or kwargs != updated_kwargs:
                         delegate.on_file_stream_normalization(
@@ -200,8 +252,11 @@ class GcsfsCsvReader:
                         )
                         encoding = updated_encoding
                         kwargs_for_read = updated_kwargs
+                        # The normalized stream is always read as UTF-8
+                        reported_fp = None
                     else:
                         kwargs_for_read = kwargs
+                        reported_fp = detecting_fp
 
                     try:
                         reader: Iterator[pd.DataFrame] = pd.read_csv(
@@ -219,22 +274,36 @@ class GcsfsCsvReader:
 
                     for i, df in enumerate(reader):
                         continue_iteration = delegate.on_dataframe(
-                            encoding=encoding, chunk_num=i, df=df
+                            # The encoding may have switched mid-stream
+                            encoding=reported_fp.encoding if reported_fp else encoding,
+                            chunk_num=i,
+                            df=df,
                         )
                         if not continue_iteration:
                             break
 
-                    delegate.on_file_read_success(encoding)
+                    delegate.on_file_read_success(
+                        reported_fp.encoding if reported_fp else encoding
+                    )
                     return
             except UnicodeError as e:
+                if detecting_fp:
+                    encoding = detecting_fp.encoding
                 should_throw = delegate.on_unicode_decode_error(encoding, e)
                 if should_throw:
                     raise e
+                # Restart the read with the encoding after the one that failed
+                encoding_index = (
+                    encoding_index + switchable_encodings.index(encoding) + 1
+                    if encoding in switchable_encodings
+                    else encoding_index + 1
+                )
                 continue
             except Exception as e:
                 should_throw = delegate.on_exception(encoding, e)
                 if should_throw:
                     raise e
+                encoding_index += 1
 
         raise ValueError(
             f"Unable to read path [{path.abs_path()}] for any of these encodings: {encodings_to_try}"
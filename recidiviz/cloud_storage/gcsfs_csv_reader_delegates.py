@@ -19,7 +19,9 @@
 import abc
 import csv
 import logging
-from typing import List, Optional
+import threading
+from concurrent import futures
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -72,22 +74,56 @@ class ReadOneGcsfsCsvReaderDelegate(SimpleGcsfsCsvReaderDelegate):
 class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
     """An implementation of the GcsfsCsvReaderDelegate that uploads each CSV chunk to a separate Google Cloud Storage
     path.
+
+    If |max_in_flight_chunks| is set, chunks are transformed and uploaded on a pool of worker threads while the reader
+    continues to parse subsequent chunks. At most |max_in_flight_chunks| chunks will be held in memory waiting to be
+    uploaded at once - once that limit is reached, the reader blocks until a chunk upload completes. Uploaded chunks are
+    released (added to |output_paths| and passed to on_chunk_output_ready()) in chunk order, regardless of the order in
+    which the uploads finish.
     """
 
-    def __init__(self, path: GcsfsFilePath, fs: GCSFileSystem, include_header: bool):
+    def __init__(
+        self,
+        path: GcsfsFilePath,
+        fs: GCSFileSystem,
+        include_header: bool,
+        max_in_flight_chunks: Optional[int] = None,
+    ):
+        if max_in_flight_chunks is not None and max_in_flight_chunks < 1:
+            raise ValueError(
+                f"Expected max_in_flight_chunks to be a positive number, found "
+                f"[{max_in_flight_chunks}]."
+            )
         self.path = path
         self.fs = fs
         self.include_header = include_header
+        self.max_in_flight_chunks = max_in_flight_chunks
 
         self.output_paths: List[GcsfsFilePath] = []
         self.output_columns: Optional[List[str]] = None
 
+        # State used only when chunks are uploaded in parallel
+        self._executor: Optional[futures.ThreadPoolExecutor] = None
+        self._in_flight_chunk_futures: List[futures.Future] = []
+        self._in_flight_chunk_slots = threading.BoundedSemaphore(
+            max_in_flight_chunks or 1
+        )
+        self._completed_chunks_lock = threading.Lock()
+        self._completed_chunks: Dict[
+            int, Optional[Tuple[GcsfsFilePath, List[str]]]
+        ] = {}
+        self._next_chunk_num_to_release = 0
+
     def on_start_read_with_encoding(self, encoding: str) -> None:
         logging.info(
             "Attempting to do chunked upload of [%s] with encoding [%s]",
             self.path.abs_path(),
             encoding,
         )
+        if self.max_in_flight_chunks is not None:
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=self.max_in_flight_chunks
+            )
 
     def on_file_stream_normalization(
         self, old_encoding: str, new_encoding: str
@@ -103,6 +139,51 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
             "Loaded DataFrame chunk [%d] has [%d] rows", chunk_num, df.shape[0]
         )
 
+        if not self._executor:
+            self._release_chunk_output(
+                chunk_num, self._transform_and_upload_chunk(chunk_num, df)
+            )
+            return True
+
+        # Surface failures from earlier chunk uploads as soon as possible, rather
+        # than continuing to read the rest of the file.
+        self._raise_for_failed_chunk_uploads()
+
+        # Blocks if there are already max_in_flight_chunks chunks waiting to be
+        # uploaded, which keeps the reader from getting too far ahead of the uploads.
+        self._in_flight_chunk_slots.acquire()
+        try:
+            future = self._executor.submit(self._process_chunk, chunk_num, df)
+        except Exception:
+            self._in_flight_chunk_slots.release()
+            raise
+        self._in_flight_chunk_futures.append(future)
+        return True
+
+    def _process_chunk(self, chunk_num: int, df: pd.DataFrame) -> None:
+        """Transforms and uploads a single chunk on a worker thread, then releases any
+        chunk outputs that are now ready in chunk order.
+        """
+        try:
+            chunk_output = self._transform_and_upload_chunk(chunk_num, df)
+        finally:
+            self._in_flight_chunk_slots.release()
+
+        with self._completed_chunks_lock:
+            self._completed_chunks[chunk_num] = chunk_output
+            while self._next_chunk_num_to_release in self._completed_chunks:
+                self._release_chunk_output(
+                    self._next_chunk_num_to_release,
+                    self._completed_chunks.pop(self._next_chunk_num_to_release),
+                )
+                self._next_chunk_num_to_release += 1
+
+    def _transform_and_upload_chunk(
+        self, chunk_num: int, df: pd.DataFrame
+    ) -> Optional[Tuple[GcsfsFilePath, List[str]]]:
+        """Transforms the chunk and uploads it to its output path. Returns the output
+        path and the columns written, or None if there was no data to write.
+        """
         transformed_df = self.transform_dataframe(df)
 
         num_rows = transformed_df.shape[0]
@@ -113,7 +194,7 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
             logging.info(
                 "Skipping output for chunk [%s] - no data in chunk.", chunk_num
             )
-            return True
+            return None
 
         output_path = self.get_output_path(chunk_num=chunk_num)
 
@@ -123,19 +204,35 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
             output_path.abs_path(),
         )
 
+        self.upload_chunk(output_path, transformed_df)
+        logging.info("Done writing to output path")
+
+        return output_path, list(transformed_df.columns.values)
+
+    def upload_chunk(self, output_path: GcsfsFilePath, df: pd.DataFrame) -> None:
+        """Uploads the transformed chunk to the output path. By default, chunks are
+        written as CSV. Subclasses may override to write chunks in another format.
+        """
         # We cannot use QUOTE_ALL as it results in empty values being written as "" in our temp file csv.
         # When uploading the temp file to BQ this results in empty strings being uploaded instead of NULLs.
         quoting = csv.QUOTE_MINIMAL
         self.fs.upload_from_string(
             output_path,
-            transformed_df.to_csv(
-                header=self.include_header, index=False, quoting=quoting
-            ),
+            df.to_csv(header=self.include_header, index=False, quoting=quoting),
             "text/csv",
         )
-        logging.info("Done writing to output path")
 
-        columns_as_list = list(transformed_df.columns.values)
+    def _release_chunk_output(
+        self, chunk_num: int, chunk_output: Optional[Tuple[GcsfsFilePath, List[str]]]
+    ) -> None:
+        """Records the output of the given chunk. Must be called in chunk order."""
+        if chunk_output is None:
+            return
+        output_path, columns_as_list = chunk_output
+
+        # Record the path before validating so it gets cleaned up on failure
+        self.output_paths.append(output_path)
+
         if self.output_columns is None:
             self.output_columns = columns_as_list
 
@@ -146,8 +243,41 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
                 f"{self.output_columns}."
             )
 
-        self.output_paths.append(output_path)
-        return True
+        self.on_chunk_output_ready(chunk_num, output_path)
+
+    def on_chunk_output_ready(self, chunk_num: int, output_path: GcsfsFilePath) -> None:
+        """Called, in chunk order, once the chunk with the given number has been
+        uploaded to |output_path|. Subclasses may override to start downstream work on
+        the chunk before the rest of the file has been read.
+        """
+
+    def _raise_for_failed_chunk_uploads(self) -> None:
+        for future in self._in_flight_chunk_futures:
+            if future.done() and (exception := future.exception()):
+                raise exception
+
+    def _wait_for_in_flight_chunks(self) -> None:
+        """Waits for all in-flight chunk uploads to complete, then shuts down the
+        upload workers. Raises the first error encountered by any upload, if any.
+        """
+        if not self._executor:
+            return
+        try:
+            futures.wait(self._in_flight_chunk_futures)
+            for future in self._in_flight_chunk_futures:
+                if exception := future.exception():
+                    raise exception
+        finally:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._in_flight_chunk_futures = []
+            # Any chunks that could not be released in order (e.g. because an earlier
+            # chunk failed) still need to be tracked so they can be cleaned up.
+            for chunk_output in self._completed_chunks.values():
+                if chunk_output:
+                    self.output_paths.append(chunk_output[0])
+            self._completed_chunks = {}
+            self._next_chunk_num_to_release = 0
 
     def on_unicode_decode_error(self, encoding: str, e: UnicodeError) -> bool:
         logging.info(
@@ -156,21 +286,32 @@ class SplittingGcsfsCsvReaderDelegate(GcsfsCsvReaderDelegate):
             encoding,
         )
         logging.exception(e)
+        self._wait_for_in_flight_chunks_before_cleanup()
         self._delete_temp_output_paths()
         return False
 
     def on_exception(self, encoding: str, e: Exception) -> bool:
         logging.error("Failed to upload to GCS - cleaning up temp paths")
+        self._wait_for_in_flight_chunks_before_cleanup()
         self._delete_temp_output_paths()
         return True
 
     def on_file_read_success(self, encoding: str) -> None:
+        self._wait_for_in_flight_chunks()
         logging.info(
             "Successfully read file [%s] with encoding [%s]",
             self.path.abs_path(),
             encoding,
         )
 
+    def _wait_for_in_flight_chunks_before_cleanup(self) -> None:
+        try:
+            self._wait_for_in_flight_chunks()
+        except Exception as e:
+            # We are already handling a failure - the original error is the one that
+            # should be surfaced.
+            logging.error("Chunk upload also failed: [%s]", e)
+
     def _delete_temp_output_paths(self) -> None:
         for temp_output_path in self.output_paths:
             logging.info("Deleting temp file [%s].", temp_output_path.abs_path())
@@ -19,7 +19,11 @@ format with arbitrary delimiters and newline terminators to a standardized forma
 """
 import csv
 import logging
-from typing import Optional, TextIO
+from typing import Optional, TextIO, Union
+
+from recidiviz.cloud_storage.read_only_encoding_detecting_stream import (
+    ReadOnlyEncodingDetectingStream,
+)
 
 DOUBLE_QUOTE = '"'
 ESCAPED_DOUBLE_QUOTE = '""'
@@ -39,7 +43,11 @@ class ReadOnlyCsvNormalizingStream:
     """
 
     def __init__(
-        self, fp: TextIO, delimiter: str, line_terminator: str, quoting: int
+        self,
+        fp: Union[ReadOnlyEncodingDetectingStream, TextIO],
+        delimiter: str,
+        line_terminator: str,
+        quoting: int,
     ) -> None:
         if quoting != csv.QUOTE_NONE:
             raise ValueError("No support for files with quoted values.")
@@ -0,0 +1,172 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Wrapper around a binary stream that decodes it to text, picking the first of a list
+of candidate encodings that can decode the stream. The encoding is chosen by sampling
+the start of the stream and may be switched mid-stream, without re-reading anything,
+as long as the text decoded so far would be identical in the new encoding.
+"""
+import codecs
+import logging
+from typing import BinaryIO, List, Optional
+
+# The number of bytes read from the start of the stream to pick an initial encoding.
+ENCODING_SAMPLE_SIZE_BYTES = 1024 * 1024
+
+_ASCII_BYTES = bytes(range(128))
+
+
+def is_ascii_compatible_encoding(encoding: str) -> bool:
+    """Returns True if the encoding decodes all ASCII bytes to the equivalent ASCII
+    characters (e.g. UTF-8, ISO-8859-1, WINDOWS-1252 but not UTF-16).
+    """
+    try:
+        return _ASCII_BYTES.decode(encoding) == _ASCII_BYTES.decode("ascii")
+    except (LookupError, UnicodeError):
+        return False
+
+
+class ReadOnlyEncodingDetectingStream:
+    """Wrapper around a binary stream that decodes it to text using the first of the
+    provided encodings that can decode it.
+
+    All encodings must be ASCII-compatible. If a decode error is encountered and all of
+    the text decoded so far is ASCII, then decoding all of that text with the next
+    encoding would produce identical results, so we switch to the next encoding and
+    continue from the current position. Otherwise, the decode error is raised and the
+    caller must restart the read with the next encoding.
+    """
+
+    def __init__(
+        self,
+        fp: BinaryIO,
+        encodings: List[str],
+        sample_size_bytes: Optional[int] = None,
+    ) -> None:
+        if not encodings:
+            raise ValueError("Must provide at least one encoding.")
+        for encoding in encodings:
+            if not is_ascii_compatible_encoding(encoding):
+                raise ValueError(f"Encoding [{encoding}] is not ASCII-compatible.")
+
+        self.fp = fp
+        self.encodings = encodings
+
+        self._encoding_index = 0
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors="strict")
+
+        # Holds text that has been decoded but not yet read.
+        self._decoded_buffer = ""
+
+        # True as long as all text decoded so far is ASCII, which means we can still
+        # switch encodings without changing any text that has already been decoded.
+        self._only_ascii_decoded = True
+
+        # When True, indicates that we have reached the end of the binary stream. This
+        # may be set before all of the decoded text has been read.
+        self._eof = False
+
+        # Decode a sample from the start of the stream to pick the initial encoding.
+        # Raises a UnicodeDecodeError if none of the encodings can decode the sample.
+        self._decode_next_block(sample_size_bytes or ENCODING_SAMPLE_SIZE_BYTES)
+
+    @property
+    def encoding(self) -> str:
+        """The encoding currently being used to decode the stream."""
+        return self.encodings[self._encoding_index]
+
+    def _decode_next_block(self, block_size: int) -> None:
+        """Reads the next block of bytes and decodes it, switching encodings if the
+        current encoding cannot decode it and it is safe to do so.
+        """
+        if self._eof:
+            return
+        block = self.fp.read(block_size)
+        if not block:
+            self._eof = True
+
+        # Bytes from the end of the previous block that were not yet decoded, e.g. the
+        # start of a multi-byte character.
+        undecoded_bytes, _ = self._decoder.getstate()
+        while True:
+            try:
+                text = self._decoder.decode(block, final=self._eof)
+                break
+            except UnicodeDecodeError as e:
+                if not self._only_ascii_decoded or self._encoding_index + 1 >= len(
+                    self.encodings
+                ):
+                    raise e
+                logging.info(
+                    "Unable to decode stream with encoding [%s], switching to [%s]",
+                    self.encoding,
+                    self.encodings[self._encoding_index + 1],
+                )
+                self._encoding_index += 1
+                self._decoder = codecs.getincrementaldecoder(self.encoding)(
+                    errors="strict"
+                )
+                block = undecoded_bytes + block
+                undecoded_bytes = b""
+
+        if self._only_ascii_decoded and not text.isascii():
+            self._only_ascii_decoded = False
+        self._decoded_buffer += text
+
+    def read(self, __size: Optional[int] = None) -> str:
+        if __size is None or __size < 0:
+            while not self._eof:
+                self._decode_next_block(ENCODING_SAMPLE_SIZE_BYTES)
+            ret = self._decoded_buffer
+            self._decoded_buffer = ""
+            return ret
+
+        while not self._eof and len(self._decoded_buffer) < __size:
+            self._decode_next_block(__size - len(self._decoded_buffer))
+
+        ret = self._decoded_buffer[:__size]
+        self._decoded_buffer = self._decoded_buffer[__size:]
+        return ret
+
+    def readline(self, __size: Optional[int] = None) -> str:
+        """Read a single line from the stream, or up to __size characters, whichever is
+        shorter.
+        """
+        while True:
+            index = self._decoded_buffer.find("\n")
+            if (
+                index != -1
+                or self._eof
+                or (__size and len(self._decoded_buffer) >= __size)
+            ):
+                break
+            self._decode_next_block(ENCODING_SAMPLE_SIZE_BYTES)
+
+        read_length = index + 1 if index != -1 else len(self._decoded_buffer)
+        if __size:
+            read_length = min(__size, read_length)
+
+        ret = self._decoded_buffer[:read_length]
+        self._decoded_buffer = self._decoded_buffer[read_length:]
+        return ret
+
+    def write(self, __s: str) -> int:
+        # This function is required to pass the pandas "is file like" check
+        raise NotImplementedError("The write method is not yet implemented")
+
+    def __iter__(self) -> None:
+        # This function is required to pass the pandas "is file like" check
+        raise NotImplementedError("The __iter__ method is not yet implemented")
@@ -17,7 +17,7 @@
 """Logic for Attr objects that can be built with a Builder."""
 import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, Set, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar
 
 import attr
 from more_itertools import one
@@ -75,10 +75,16 @@ def _get_class_structure_reference() -> Dict[Type, Dict[str, CachedAttributeInfo
     return _class_structure_reference
 
 
+# Cached info for the attributes set when building a class from columns with the given
+# names, in column order. See BuildableAttr.build_from_columns.
+_column_build_plans: Dict[Tuple[Type, Tuple[str, ...]], List[CachedAttributeInfo]] = {}
+
+
 @environment.test_only
 def _clear_class_structure_reference() -> None:
     global _class_structure_reference
     _class_structure_reference = None
+    _column_build_plans.clear()
 
 
 def attribute_field_type_reference_for_class(
@@ -251,6 +257,58 @@ def _map_attr_to_type_for_class(
     return attr_field_types
 
 
+def _column_build_plan_for_class(
+    cls: Type, column_names: Tuple[str, ...]
+) -> List[CachedAttributeInfo]:
+    """Returns the info for each attribute on the |cls| that is set from one of the
+    columns with the given |column_names|, in column order. Columns that do not match
+    an attribute are ignored.
+
+    Raises if the |cls| can never be built from these columns, i.e. if any column is
+    a ForwardRef field or if any required field is missing from the columns.
+    """
+    plan_key = (cls, column_names)
+    plan = _column_build_plans.get(plan_key)
+    if plan is not None:
+        return plan
+
+    attributes_and_types = attribute_field_type_reference_for_class(cls)
+    plan = [
+        attributes_and_types[column_name]
+        for column_name in column_names
+        if column_name in attributes_and_types
+    ]
+
+    for cached_attribute_info in plan:
+        if cached_attribute_info.field_type == BuildableAttrFieldType.FORWARD_REF:
+            raise ValueError(
+                "columns should only contain flat values. Should not contain any "
+                f"ForwardRef fields: {cached_attribute_info.attribute.name}"
+            )
+        if (
+            cached_attribute_info.field_type == BuildableAttrFieldType.ENUM
+            and not cached_attribute_info.enum_cls
+        ):
+            raise ValueError(
+                "Expected Enum class for enum field "
+                f"{cached_attribute_info.attribute.name}."
+            )
+
+    required_fields = set(attributes_and_types.keys())
+    fields_with_value = {
+        cached_attribute_info.attribute.name for cached_attribute_info in plan
+    } | {
+        field
+        for field, cached_attribute_info in attributes_and_types.items()
+        if cached_attribute_info.attribute.default is not attr.NOTHING
+    }
+    if not required_fields == fields_with_value:
+        raise BuilderException(cls, required_fields, fields_with_value)
+
+    _column_build_plans[plan_key] = plan
+    return plan
+
+
 class DefaultableAttr:
     """Mixin to add method to attr class that creates default object"""
 
@@ -409,6 +467,78 @@ class BuildableAttr:
 
         return cls_builder.build()
 
+    @classmethod
+    def build_from_columns(
+        cls: Type[BuildableAttrType], columns: Dict[str, List[Any]]
+    ) -> List[BuildableAttrType]:
+        """Builds one BuildableAttr per row of the given columns, which map each field
+        name to the values of that field in every row.
+
+        Builds the same objects as calling build_from_dictionary on each row, but the
+        fields to set are only looked up and validated once for all rows, and each
+        distinct enum or date string in a column is only parsed once.
+        """
+        if not columns:
+            raise ValueError("columns cannot be empty")
+
+        row_counts = {len(values) for values in columns.values()}
+        if len(row_counts) != 1:
+            raise ValueError(
+                f"All columns must have the same number of values, found: {row_counts}"
+            )
+        row_count = one(row_counts)
+
+        plan = _column_build_plan_for_class(cls, tuple(columns))
+        if not plan:
+            return [cls() for _ in range(row_count)]
+
+        field_names = [
+            cached_attribute_info.attribute.name for cached_attribute_info in plan
+        ]
+        converted_columns = [
+            cls._convert_column(cached_attribute_info, columns[field_name])
+            for field_name, cached_attribute_info in zip(field_names, plan)
+        ]
+
+        return [
+            cls(**dict(zip(field_names, row_values)))
+            for row_values in zip(*converted_columns)
+        ]
+
+    @classmethod
+    def _convert_column(
+        cls, cached_attribute_info: CachedAttributeInfo, values: List[Any]
+    ) -> List[Any]:
+        """Converts the values of a column into values of the field described by the
+        |cached_attribute_info|, parsing each distinct string value only once."""
+        field_type = cached_attribute_info.field_type
+        if field_type == BuildableAttrFieldType.ENUM:
+            enum_cls = cached_attribute_info.enum_cls
+            if not enum_cls:
+                raise ValueError(
+                    "Expected Enum class for enum field "
+                    f"{cached_attribute_info.attribute.name}."
+                )
+
+            def convert(value: Any) -> Any:
+                return cls._parse_enum_value(enum_cls, value)
+
+        elif field_type == BuildableAttrFieldType.DATE:
+            convert = cls._parse_date_value
+        else:
+            return values
+
+        converted_strings: Dict[str, Any] = {}
+        converted_values = []
+        for value in values:
+            if isinstance(value, str):
+                if value not in converted_strings:
+                    converted_strings[value] = convert(value)
+                converted_values.append(converted_strings[value])
+            else:
+                converted_values.append(convert(value))
+        return converted_values
+
     @classmethod
     def extract_enum_value(
         cls,
@@ -416,8 +546,10 @@ class BuildableAttr:
         build_dict: Dict[str, str],
         field: str,
     ) -> Optional[Enum]:
-        value = build_dict.get(field)
+        return cls._parse_enum_value(enum_cls, build_dict.get(field))
 
+    @staticmethod
+    def _parse_enum_value(enum_cls: Type[Enum], value: Any) -> Optional[Enum]:
         if value is None:
             return None
 
@@ -430,8 +562,10 @@ class BuildableAttr:
     def extract_date_value(
         cls, build_dict: Dict[str, Any], field: str
     ) -> Optional[datetime.date]:
-        value = build_dict.get(field)
+        return cls._parse_date_value(build_dict.get(field))
 
+    @staticmethod
+    def _parse_date_value(value: Any) -> Optional[datetime.date]:
         if value is None:
             return None
 
@@ -25,7 +25,8 @@ import locale
 import re
 import string
 from distutils.util import strtobool  # pylint: disable=no-name-in-module
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Tuple
 
 import dateparser
 from dateutil.relativedelta import relativedelta
@@ -223,13 +224,114 @@ def _is_str_field_zeros(str_field: str) -> bool:
     return False
 
 
+# Maximum number of (date string, from_dt) pairs to remember parsed values for. Raw
+# data columns tend to repeat the same values many times.
+_PARSED_DATETIME_CACHE_SIZE = 2**16
+
+_MONTH_ABBREVIATIONS = {
+    month_abbreviation: month
+    for month, month_abbreviation in enumerate(
+        ["JAN", "FEB", "MAR", "APR", "MAY", "JUN"]
+        + ["JUL", "AUG", "SEP", "OCT", "NOV", "DEC"],
+        start=1,
+    )
+}
+
+# dateparser reads a trailing "-HHMM" as a UTC offset, so years before 1300 after a
+# dash are left to dateparser
+_DASH_SEPARATED_YEAR_REGEX = r"(?P<year>1[3-9]\d{2}|[2-9]\d{3})"
+
+# Fixed formats that dateparser would otherwise be used for, along with the regex
+# that matches them. Values that match one of these are parsed into the same datetime
+# that dateparser would return, without calling dateparser.
+_FIXED_DATETIME_FORMAT_REGEXES: Tuple[Pattern, ...] = tuple(
+    re.compile(regex)
+    for regex in (
+        # MM/DD/YYYY
+        r"(?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{4})",
+        # MM/DD/YYYY HH:MM:SS
+        r"(?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{4}) "
+        r"(?P<hour>\d{1,2}):(?P<minute>\d{2}):(?P<second>\d{2})",
+        # MM/DD/YY
+        r"(?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<two_digit_year>\d{2})",
+        # MM-DD-YYYY
+        r"(?P<month>\d{1,2})-(?P<day>\d{1,2})-" + _DASH_SEPARATED_YEAR_REGEX,
+        # YYYY/MM/DD
+        r"(?P<year>\d{4})/(?P<month>\d{1,2})/(?P<day>\d{1,2})",
+        # YYYY-M-D (zero-padded dates are already ISO dates)
+        r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})",
+        # DD-MON-YYYY
+        r"(?P<day>\d{1,2})-(?P<month_abbreviation>[A-Za-z]{3})-"
+        + _DASH_SEPARATED_YEAR_REGEX,
+        # DD-MON-YY
+        r"(?P<day>\d{1,2})-(?P<month_abbreviation>[A-Za-z]{3})-(?P<two_digit_year>\d{2})",
+    )
+)
+
+
+def _parse_fixed_format_datetime(date_string: str) -> Optional[datetime.datetime]:
+    """Parses |date_string| if it matches one of the fixed datetime formats, returning
+    None if it does not or is not a valid date.
+    """
+    for regex in _FIXED_DATETIME_FORMAT_REGEXES:
+        if not (match := regex.fullmatch(date_string)):
+            continue
+        parts = match.groupdict()
+
+        if (two_digit_year := parts.get("two_digit_year")) is not None:
+            # Matches the dateparser (and strptime %y) century for two digit years
+            year = int(two_digit_year)
+            year += 2000 if year < 69 else 1900
+        else:
+            year = int(parts["year"])
+
+        if (month_abbreviation := parts.get("month_abbreviation")) is not None:
+            if month_abbreviation.upper() not in _MONTH_ABBREVIATIONS:
+                return None
+            month = _MONTH_ABBREVIATIONS[month_abbreviation.upper()]
+        else:
+            month = int(parts["month"])
+
+        try:
+            return datetime.datetime(
+                year=year,
+                month=month,
+                day=int(parts["day"]),
+                hour=int(parts.get("hour") or 0),
+                minute=int(parts.get("minute") or 0),
+                second=int(parts.get("second") or 0),
+            )
+        except ValueError:
+            # Leave invalid dates (e.g. DD/MM/YYYY values) to dateparser
+            return None
+    return None
+
+
 def parse_datetime(
     date_string: str, from_dt: Optional[datetime.datetime] = None
 ) -> Optional[datetime.datetime]:
     """
     Parses a string into a datetime.datetime object, using |from_dt| as a base
     for any relative dates.
+
+    Parsed values are cached when |from_dt| is set. Without it, relative dates
+    depend on the current time and cannot be reused.
     """
+    if from_dt is None:
+        return _parse_datetime(date_string, from_dt=None)
+    return _parse_datetime_cached(date_string, from_dt)
+
+
+@lru_cache(maxsize=_PARSED_DATETIME_CACHE_SIZE)
+def _parse_datetime_cached(
+    date_string: str, from_dt: datetime.datetime
+) -> Optional[datetime.datetime]:
+    return _parse_datetime(date_string, from_dt=from_dt)
+
+
+def _parse_datetime(
+    date_string: str, from_dt: Optional[datetime.datetime]
+) -> Optional[datetime.datetime]:
     if (
         date_string == ""
         or date_string.isspace()
@@ -255,6 +357,10 @@ def parse_datetime(
         # correctly parsed. We add this in to preserve backwards-compatibility.
         return parsed_datetime
 
+    # dateparser is slow, so first check for common formats it would parse
+    if (parsed_datetime := _parse_fixed_format_datetime(date_string)) is not None:
+        return parsed_datetime
+
     settings: "dateparser._Settings" = {"PREFER_DAY_OF_MONTH": "first"}
     if from_dt:
         settings["RELATIVE_BASE"] = from_dt
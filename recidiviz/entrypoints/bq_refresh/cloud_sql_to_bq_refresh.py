@@ -23,6 +23,7 @@ from recidiviz.persistence.database.bq_refresh.cloud_sql_to_bq_refresh_control i
     execute_cloud_sql_to_bq_refresh,
 )
 from recidiviz.persistence.database.schema_type import SchemaType
+from recidiviz.utils.params import str_to_bool
 
 
 class BigQueryRefreshEntrypoint(EntrypointInterface):
@@ -52,6 +53,14 @@ class BigQueryRefreshEntrypoint(EntrypointInterface):
             help="The sandbox prefix for which the refresh needs to write to",
             type=str,
         )
+        parser.add_argument(
+            "--incremental",
+            help="If true, tables that support it are refreshed with only the rows "
+            "added since the last refresh. The calculation DAG sets this for the "
+            "OPERATIONS schema. Defaults to false.",
+            type=str_to_bool,
+            default=False,
+        )
 
         return parser
 
@@ -61,4 +70,5 @@ class BigQueryRefreshEntrypoint(EntrypointInterface):
             schema_type=args.schema_type,
             ingest_instance=args.ingest_instance,
             sandbox_prefix=args.sandbox_prefix,
+            incremental=args.incremental,
         )
@@ -54,6 +54,14 @@ class UpdateAllManagedViewsEntrypoint(EntrypointInterface):
             default=True,
         )
 
+        parser.add_argument(
+            "--incremental",
+            help="If true, only updates views whose definitions have changed since the "
+            "last successful update, along with their descendants. Defaults to false.",
+            type=str_to_bool,
+            default=False,
+        )
+
         return parser
 
     @staticmethod
@@ -65,4 +73,5 @@ class UpdateAllManagedViewsEntrypoint(EntrypointInterface):
             clean_managed_datasets=args.clean_managed_datasets,
             # Should allow slow views if not cleaning managed datasets and is updating is slow.
             allow_slow_views=not args.clean_managed_datasets,
+            incremental=args.incremental,
         )
@@ -44,6 +44,25 @@ def gcsfs_direct_ingest_temporary_output_directory_path(
     )
 
 
+def gcsfs_direct_ingest_raw_data_pruning_index_directory_path(
+    *,
+    region_code: str,
+    ingest_instance: DirectIngestInstance,
+    project_id: Optional[str] = None,
+) -> GcsfsDirectoryPath:
+    """Returns the directory where the indexes of the latest raw data row versions used
+    for raw data pruning are stored for the given region and instance.
+    """
+    return GcsfsDirectoryPath.from_dir_and_subdir(
+        gcsfs_direct_ingest_temporary_output_directory_path(project_id),
+        os.path.join(
+            "raw_data_pruning_index",
+            region_code.lower(),
+            ingest_instance.value.lower(),
+        ),
+    )
+
+
 def _bucket_suffix_for_ingest_instance(ingest_instance: DirectIngestInstance) -> str:
     if ingest_instance == DirectIngestInstance.PRIMARY:
         return INGEST_PRIMARY_BUCKET_SUFFIX
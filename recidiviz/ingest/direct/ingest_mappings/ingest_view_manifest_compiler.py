@@ -17,7 +17,11 @@
 """Class that parses the results of an ingest view query into entities based on the
 manifest file for this ingest view.
 """
+import hashlib
+import logging
 import os
+import pickle
+import tempfile
 from typing import Callable, Dict, Iterator, List, Optional, Set, Type, Union
 
 import attr
@@ -46,6 +50,10 @@ from recidiviz.utils.yaml_dict import YAMLDict
 # allowing us to gate any breaking changes in the file syntax etc.
 MANIFEST_LANGUAGE_VERSION_KEY = "manifest_language"
 
+# Compiled manifests shared by every IngestViewManifestCompiler in the process, keyed
+# by a hash of the manifest file contents and the compiler delegate cache key.
+_COMPILED_MANIFESTS: Dict[str, "IngestViewManifest"] = {}
+
 
 @attr.define(kw_only=True, frozen=True)
 class IngestViewManifest:
@@ -81,17 +89,41 @@ class IngestViewManifest:
         ] = None,
     ) -> List[Entity]:
         """Parses query results from this manifest's ingest view into a list of
-        entities.
+        entities. Use iter_contents() instead to avoid holding every entity tree in
+        memory at once.
+        """
+        return list(
+            self.iter_contents(
+                contents_iterator=contents_iterator,
+                context=context,
+                result_callable=result_callable,
+            )
+        )
+
+    def iter_contents(
+        self,
+        *,
+        contents_iterator: Iterator[Dict[str, str]],
+        context: IngestViewContentsContext,
+        result_callable: Optional[
+            Callable[[int, Dict[str, str], Union[Entity, Exception]], None]
+        ] = None,
+    ) -> Iterator[Entity]:
+        """Lazily parses query results from this manifest's ingest view, yielding the
+        entity tree for each row as it is read from |contents_iterator|.
         """
-        result = []
         if not self.should_launch(context):
             raise ValueError(
                 f"Cannot parse results for ingest view [{self.ingest_view_name}] "
                 f"because should_launch is false."
             )
 
+        expected_columns = set(self.input_columns)
         for i, row in enumerate(contents_iterator):
-            self._validate_row_columns(i, row, set(self.input_columns))
+            # Rows almost always share the same columns, so only compute which
+            # columns differ when the row does not match.
+            if row.keys() != expected_columns:
+                self._validate_row_columns(i, row, expected_columns)
 
             try:
                 output_tree = self.output.build_from_row(row, context)
@@ -108,8 +140,7 @@ class IngestViewManifest:
             if result_callable:
                 result_callable(i, row, output_tree)
 
-            result.append(output_tree)
-        return result
+            yield output_tree
 
     @staticmethod
     def _validate_row_columns(
@@ -139,8 +170,24 @@ class IngestViewManifestCompiler:
     provided ingest view into a manifest object.
     """
 
-    def __init__(self, delegate: IngestViewManifestCompilerDelegate):
+    def __init__(
+        self,
+        delegate: IngestViewManifestCompilerDelegate,
+        cache_dir: Optional[str] = None,
+    ):
+        """If the delegate provides a compiled manifest cache key, compiled manifests
+        are reused for the lifetime of the process until the manifest file changes.
+        If |cache_dir| is also set, compiled manifests are read from and written to
+        that directory so that other processes (e.g. pipeline workers built from a
+        package that includes the directory) reuse them too.
+        """
         self.delegate = delegate
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the compiled manifests stored in memory."""
+        _COMPILED_MANIFESTS.clear()
 
     def compile_manifest(self, *, ingest_view_name: str) -> IngestViewManifest:
         """Compiles the YAML mappings manifest file for the provided ingest view into
@@ -149,6 +196,71 @@ class IngestViewManifestCompiler:
         into entities.
         """
         manifest_path = self.delegate.get_ingest_view_manifest_path(ingest_view_name)
+        cache_key = self._get_cache_key(ingest_view_name, manifest_path)
+        if cache_key is None:
+            return self._compile_manifest(ingest_view_name, manifest_path)
+
+        if cache_key in _COMPILED_MANIFESTS:
+            return _COMPILED_MANIFESTS[cache_key]
+
+        manifest = self._read_from_disk(cache_key)
+        if manifest is None:
+            manifest = self._compile_manifest(ingest_view_name, manifest_path)
+            self._write_to_disk(cache_key, manifest)
+        _COMPILED_MANIFESTS[cache_key] = manifest
+        return manifest
+
+    def _get_cache_key(
+        self, ingest_view_name: str, manifest_path: str
+    ) -> Optional[str]:
+        """Returns a hash of the manifest file contents and everything else the
+        compiled manifest depends on, or None if manifests compiled with this delegate
+        should not be cached.
+        """
+        delegate_cache_key = self.delegate.get_compiled_manifest_cache_key()
+        if delegate_cache_key is None:
+            return None
+        manifest_hash = hashlib.sha256(
+            repr((delegate_cache_key, ingest_view_name)).encode()
+        )
+        with open(manifest_path, "rb") as manifest_file:
+            manifest_hash.update(manifest_file.read())
+        return manifest_hash.hexdigest()
+
+    def _get_cache_path(self, cache_key: str) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"{cache_key}.pickle")
+
+    def _read_from_disk(self, cache_key: str) -> Optional[IngestViewManifest]:
+        path = self._get_cache_path(cache_key)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logging.warning(
+                "Could not read compiled manifest [%s], recompiling: %s", path, e
+            )
+            return None
+
+    def _write_to_disk(self, cache_key: str, manifest: IngestViewManifest) -> None:
+        path = self._get_cache_path(cache_key)
+        if path is None or self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a temporary file first so concurrent processes never read a
+        # partially written manifest
+        with tempfile.NamedTemporaryFile(
+            dir=self.cache_dir, suffix=".tmp", delete=False
+        ) as temp_file:
+            pickle.dump(manifest, temp_file)
+        os.replace(temp_file.name, path)
+
+    def _compile_manifest(
+        self, ingest_view_name: str, manifest_path: str
+    ) -> IngestViewManifest:
         manifest_dict = YAMLDict.from_path(manifest_path)
 
         version = manifest_dict.pop(MANIFEST_LANGUAGE_VERSION_KEY, str)
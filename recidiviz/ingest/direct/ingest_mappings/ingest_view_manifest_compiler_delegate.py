@@ -100,6 +100,13 @@ class IngestViewManifestCompilerDelegate:
         delegate, this function should be updated to return True for that field.
         """
 
+    def get_compiled_manifest_cache_key(self) -> Optional[str]:
+        """Returns a key that identifies everything besides the manifest file contents
+        that manifests compiled with this delegate depend on, or None if compiled
+        manifests should not be cached for this delegate.
+        """
+        return None
+
 
 _INGEST_VIEW_MANIFESTS_SUBDIR = "ingest_mappings"
 
@@ -147,6 +154,12 @@ class IngestViewManifestCompilerDelegateImpl(
     def get_ingest_view_manifest_path(self, ingest_view_name: str) -> str:
         return yaml_mappings_filepath(self.region, ingest_view_name)
 
+    def get_compiled_manifest_cache_key(self) -> Optional[str]:
+        return (
+            f"{self.schema_type.value}:{self.region.region_module.__name__}:"
+            f"{self.region.region_code.lower()}"
+        )
+
     def get_env_property_type(self, property_name: str) -> Type:
         if property_name in (
             IS_DATAFLOW_PIPELINE_PROPERTY_NAME,
@@ -19,10 +19,13 @@ import csv
 import datetime
 import logging
 import os
+from enum import Enum
 from types import ModuleType
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytz
 from google.api_core import retry
 from google.cloud import bigquery
@@ -34,6 +37,7 @@ from recidiviz.big_query.big_query_client import (
     BigQueryClient,
 )
 from recidiviz.big_query.big_query_utils import normalize_column_name_for_bq
+from recidiviz.cloud_storage.gcs_file_system_impl import generate_random_temp_path
 from recidiviz.cloud_storage.gcsfs_csv_reader import (
     UTF_8_ENCODING,
     GcsfsCsvReader,
@@ -45,6 +49,7 @@ from recidiviz.cloud_storage.gcsfs_csv_reader_delegates import (
 )
 from recidiviz.cloud_storage.gcsfs_path import GcsfsDirectoryPath, GcsfsFilePath
 from recidiviz.common.constants.states import StateCode
+from recidiviz.common.io.local_file_contents_handle import LocalFileContentsHandle
 from recidiviz.common.retry_predicate import google_api_retry_predicate
 from recidiviz.ingest.direct import regions
 from recidiviz.ingest.direct.dataset_config import (
@@ -63,6 +68,11 @@ from recidiviz.ingest.direct.gcs.filename_parts import filename_parts_from_path
 from recidiviz.ingest.direct.raw_data.direct_ingest_raw_table_migration_collector import (
     DirectIngestRawTableMigrationCollector,
 )
+from recidiviz.ingest.direct.raw_data.raw_data_pruning_index import (
+    RawDataPruningDiffer,
+    RawDataPruningIndex,
+    RawDataPruningIndexStore,
+)
 from recidiviz.ingest.direct.raw_data.raw_file_configs import (
     DirectIngestRawFileConfig,
     DirectIngestRegionRawFileConfig,
@@ -77,12 +87,37 @@ from recidiviz.ingest.direct.types.direct_ingest_constants import (
 )
 from recidiviz.ingest.direct.types.direct_ingest_instance import DirectIngestInstance
 from recidiviz.ingest.direct.views.raw_data_diff_query_builder import (
+    RawDataDeletedRowsQueryBuilder,
     RawDataDiffQueryBuilder,
 )
 from recidiviz.persistence.entity.operations.entities import DirectIngestRawFileMetadata
 from recidiviz.utils import metadata
 
 
+class RawDataStagingFormat(Enum):
+    """The file format raw data chunks are written in when staged in GCS before being
+    loaded into BigQuery.
+    """
+
+    CSV = "CSV"
+
+    # Snappy-compressed Parquet, written with the raw data table schema. Parquet files
+    # are smaller than the equivalent CSV and are faster for BigQuery to load.
+    PARQUET = "PARQUET"
+
+    @property
+    def file_extension(self) -> str:
+        return self.value.lower()
+
+    @property
+    def big_query_source_format(self) -> str:
+        if self is RawDataStagingFormat.CSV:
+            return bigquery.SourceFormat.CSV
+        if self is RawDataStagingFormat.PARQUET:
+            return bigquery.SourceFormat.PARQUET
+        raise ValueError(f"Unexpected staging format [{self}]")
+
+
 class DirectIngestRawFileReader:
     """Reads a raw CSV using the defined file config."""
 
@@ -235,6 +270,124 @@ class DirectIngestRawFileReader:
         return kwargs
 
 
+# When importing a raw file in pipelined mode, the number of uploaded chunks that are
+# loaded into BigQuery by a single load job. Batching chunks keeps us well below the
+# daily limit on load jobs per table, even for files with thousands of chunks.
+PIPELINED_IMPORT_CHUNKS_PER_LOAD_JOB = 10
+
+
+class PipelinedRawDataChunkLoader:
+    """Loads raw data chunks into BigQuery as they are uploaded to GCS, so that load
+    jobs for earlier chunks run while later chunks are still being read and uploaded.
+    Chunks are loaded in batches, in the order they are added.
+    """
+
+    def __init__(
+        self,
+        *,
+        big_query_client: BigQueryClient,
+        raw_file_config: DirectIngestRawFileConfig,
+        destination_address: BigQueryAddress,
+        discard_loaded_rows_fn: Callable[[], None],
+        staging_format: RawDataStagingFormat = RawDataStagingFormat.CSV,
+        chunks_per_load_job: int = PIPELINED_IMPORT_CHUNKS_PER_LOAD_JOB,
+    ) -> None:
+        self.big_query_client = big_query_client
+        self.staging_format = staging_format
+        self.raw_file_config = raw_file_config
+        self.destination_address = destination_address
+        self.discard_loaded_rows_fn = discard_loaded_rows_fn
+        self.chunks_per_load_job = chunks_per_load_job
+
+        self._pending_paths: List[GcsfsFilePath] = []
+        self._columns: Optional[List[str]] = None
+        self._load_jobs: List[bigquery.job.LoadJob] = []
+
+    @property
+    def has_loaded_chunks(self) -> bool:
+        return bool(self._load_jobs)
+
+    def add_chunk(self, path: GcsfsFilePath, columns: List[str]) -> None:
+        """Adds an uploaded chunk to be loaded, starting a load job if a full batch of
+        chunks is ready. Must be called in chunk order.
+        """
+        self._columns = columns
+        self._pending_paths.append(path)
+        if len(self._pending_paths) >= self.chunks_per_load_job:
+            self._start_load_job_for_pending_paths()
+
+    def finish(self) -> None:
+        """Loads any remaining chunks and waits for all load jobs to complete."""
+        if self._pending_paths:
+            self._start_load_job_for_pending_paths()
+
+        for load_job in self._load_jobs:
+            try:
+                load_job.result()
+            except Exception as e:
+                logging.error(
+                    "Insert job [%s] failed with errors: [%s]",
+                    load_job.job_id,
+                    load_job.errors,
+                )
+                raise e
+        logging.info(
+            "[%s] BigQuery load of [%s] jobs into [%s] complete",
+            datetime.datetime.now().isoformat(),
+            len(self._load_jobs),
+            self.destination_address.to_str(),
+        )
+
+    def discard_loaded_rows(self) -> None:
+        """Waits for any started load jobs to finish, then removes all rows loaded so
+        far so that the file can be re-read from the beginning.
+        """
+        if not self._load_jobs:
+            self._pending_paths = []
+            return
+        for load_job in self._load_jobs:
+            try:
+                load_job.result()
+            except Exception as e:
+                logging.error("Insert job [%s] failed: [%s]", load_job.job_id, e)
+        self._pending_paths = []
+        self._load_jobs = []
+        self.discard_loaded_rows_fn()
+
+    @retry.Retry(predicate=google_api_retry_predicate)
+    def _start_load_job(
+        self, paths: List[GcsfsFilePath], columns: List[str]
+    ) -> bigquery.job.LoadJob:
+        return self.big_query_client.load_table_from_cloud_storage_async(
+            source_uris=[p.uri() for p in paths],
+            destination_dataset_ref=self.big_query_client.dataset_ref_for_id(
+                self.destination_address.dataset_id
+            ),
+            destination_table_id=self.destination_address.table_id,
+            destination_table_schema=(
+                DirectIngestRawFileImportManager.create_raw_table_schema_from_columns(
+                    raw_file_config=self.raw_file_config,
+                    columns=columns,
+                )
+            ),
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            source_format=self.staging_format.big_query_source_format,
+        )
+
+    def _start_load_job_for_pending_paths(self) -> None:
+        if self._columns is None:
+            raise ValueError("Found unexpectedly None columns for pending chunks.")
+        load_job = self._start_load_job(self._pending_paths, self._columns)
+        logging.info(
+            "[%s] Started load of [%s] paths into [%s]",
+            datetime.datetime.now().isoformat(),
+            len(self._pending_paths),
+            load_job.destination,
+        )
+        self._load_jobs.append(load_job)
+        self._pending_paths = []
+
+
 class DirectIngestRawFileImportManager:
     """Class that stores raw data import configs for a region, with functionality for
     executing an import of a specific file.
@@ -252,7 +405,20 @@ class DirectIngestRawFileImportManager:
         region_raw_file_config: Optional[DirectIngestRegionRawFileConfig] = None,
         sandbox_dataset_prefix: Optional[str] = None,
         allow_incomplete_configs: bool = False,
+        max_in_flight_import_chunks: Optional[int] = None,
+        staging_format: RawDataStagingFormat = RawDataStagingFormat.CSV,
+        raw_data_pruning_index_store: Optional[RawDataPruningIndexStore] = None,
     ):
+        """If |max_in_flight_import_chunks| is set, raw files are imported in pipelined
+        mode: up to that many chunks are transformed and uploaded to GCS in parallel,
+        and chunks are loaded into BigQuery while the rest of the file is still being
+        read. The |staging_format| determines the format chunks are written to GCS in
+        before they are loaded into BigQuery.
+
+        If |raw_data_pruning_index_store| is set, files that are pruned are diffed
+        against the stored index of the latest row versions while they are read, and
+        only added, updated and deleted rows are loaded into BigQuery.
+        """
         self.region = region
         self.state_code = StateCode(self.region.region_code.upper())
         self.fs = fs
@@ -282,6 +448,9 @@ class DirectIngestRawFileImportManager:
             instance=instance,
             sandbox_dataset_prefix=sandbox_dataset_prefix,
         )
+        self.max_in_flight_import_chunks = max_in_flight_import_chunks
+        self.staging_format = staging_format
+        self.raw_data_pruning_index_store = raw_data_pruning_index_store
 
     def import_raw_file_to_big_query(
         self,
@@ -299,6 +468,57 @@ class DirectIngestRawFileImportManager:
         logging.info("Beginning BigQuery upload of raw file [%s]", path.abs_path())
 
         self._delete_conflicting_contents_from_bigquery(path, file_metadata.file_id)
+        raw_data_destination_address = BigQueryAddress(
+            dataset_id=self.raw_tables_dataset,
+            table_id=parts.file_tag,
+        )
+        if self._should_prune_new_data(
+            parts.file_tag
+        ) and self._should_use_raw_data_pruning_index(parts.file_tag):
+            self._import_contents_with_pruning_index(
+                path, file_metadata, raw_data_destination_address
+            )
+        elif self.max_in_flight_import_chunks is not None:
+            self._import_contents_pipelined(
+                path, file_metadata, raw_data_destination_address
+            )
+        else:
+            self._import_contents(path, file_metadata, raw_data_destination_address)
+
+        migration_queries = self.raw_table_migrations.get(parts.file_tag, [])
+
+        logging.info(
+            "Running [%s] migration queries for table [%s]",
+            len(migration_queries),
+            parts.file_tag,
+        )
+        for migration_query in migration_queries:
+            query_job = self.big_query_client.run_query_async(
+                query_str=migration_query, use_query_cache=False
+            )
+            try:
+                # Wait for the migration query to complete before running the next one
+                query_job.result()
+            except Exception as e:
+                logging.error(
+                    "Migration query job [%s] failed with errors: [%s]",
+                    query_job.job_id,
+                    query_job.errors,
+                )
+                raise e
+
+        logging.info("Completed BigQuery import of [%s]", path.abs_path())
+
+    def _import_contents(
+        self,
+        path: GcsfsFilePath,
+        file_metadata: DirectIngestRawFileMetadata,
+        raw_data_destination_address: BigQueryAddress,
+    ) -> None:
+        """Uploads all chunks of the raw file to temporary GCS paths, then loads them
+        into BigQuery.
+        """
+        parts = filename_parts_from_path(path)
         # If we are going to be pruning redundant raw data after we upload contents to GCS, we
         # do not need to augment this data with the metadata columns to GCS now (as we will eventually augment the
         # pruned raw data when we upload to BQ). Otherwise, if we are directly loading the file contents to BigQuery,
@@ -310,10 +530,6 @@ class DirectIngestRawFileImportManager:
         if temp_file_paths:
             if not columns:
                 raise ValueError("Found delegate output_columns is unexpectedly None.")
-            raw_data_destination_address = BigQueryAddress(
-                dataset_id=self.raw_tables_dataset,
-                table_id=parts.file_tag,
-            )
             if self._should_prune_new_data(parts.file_tag):
                 self._load_pruned_contents_to_bigquery(
                     file_tag=parts.file_tag,
@@ -331,35 +547,298 @@ class DirectIngestRawFileImportManager:
                     columns=columns,
                 )
 
-        migration_queries = self.raw_table_migrations.get(parts.file_tag, [])
+    def _import_contents_pipelined(
+        self,
+        path: GcsfsFilePath,
+        file_metadata: DirectIngestRawFileMetadata,
+        raw_data_destination_address: BigQueryAddress,
+    ) -> None:
+        """Imports the raw file with parsing, chunk upload and BigQuery loads all
+        overlapping. Chunks are loaded into a temporary table, which is then pruned or
+        copied into the raw data table once every chunk has loaded, so that a failed
+        import never leaves partial contents in the raw data table.
+        """
+        parts = filename_parts_from_path(path)
+        should_prune = self._should_prune_new_data(parts.file_tag)
+        load_destination_address = self._temp_new_raw_data_address(
+            parts.file_tag, file_metadata.file_id
+        )
 
-        logging.info(
-            "Running [%s] migration queries for table [%s]",
-            len(migration_queries),
-            parts.file_tag,
+        def discard_loaded_rows() -> None:
+            self.big_query_client.delete_table(
+                load_destination_address.dataset_id,
+                load_destination_address.table_id,
+                not_found_ok=True,
+            )
+
+        loader = PipelinedRawDataChunkLoader(
+            big_query_client=self.big_query_client,
+            raw_file_config=self.region_raw_file_config.raw_file_configs[
+                parts.file_tag
+            ],
+            destination_address=load_destination_address,
+            discard_loaded_rows_fn=discard_loaded_rows,
+            staging_format=self.staging_format,
         )
-        for migration_query in migration_queries:
-            query_job = self.big_query_client.run_query_async(
-                query_str=migration_query, use_query_cache=False
+        delegate = DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
+            path,
+            self.fs,
+            file_metadata,
+            self.temp_output_directory_path,
+            augment_with_metadata_columns=not should_prune,
+            max_in_flight_chunks=self.max_in_flight_import_chunks,
+            chunk_loader=loader,
+            staging_format=self.staging_format,
+            raw_file_config=self.region_raw_file_config.raw_file_configs[
+                parts.file_tag
+            ],
+        )
+
+        logging.info("Starting pipelined upload and load of contents to BigQuery")
+        try:
+            self.raw_file_reader.read_raw_file_from_gcs(path, delegate)
+            loader.finish()
+        except Exception as e:
+            logging.error("Pipelined import failed - discarding loaded rows")
+            loader.discard_loaded_rows()
+            raise e
+        finally:
+            self._delete_temporary_file_paths(delegate.output_paths)
+
+        if not loader.has_loaded_chunks:
+            return
+        if should_prune:
+            self._append_pruned_contents_to_bigquery(
+                file_tag=parts.file_tag,
+                file_id=file_metadata.file_id,
+                update_datetime=file_metadata.update_datetime,
+                temp_new_raw_data_address=load_destination_address,
+                final_destination_address=raw_data_destination_address,
             )
-            try:
-                # Wait for the migration query to complete before running the next one
-                query_job.result()
-            except Exception as e:
-                logging.error(
-                    "Migration query job [%s] failed with errors: [%s]",
-                    query_job.job_id,
-                    query_job.errors,
+        else:
+            self._append_new_raw_data_to_bigquery(
+                temp_new_raw_data_address=load_destination_address,
+                final_destination_address=raw_data_destination_address,
+            )
+
+    def _import_contents_with_pruning_index(
+        self,
+        path: GcsfsFilePath,
+        file_metadata: DirectIngestRawFileMetadata,
+        raw_data_destination_address: BigQueryAddress,
+    ) -> None:
+        """Imports a file that will be pruned, computing the diff against the stored
+        index of the latest row versions while the file is read so that only the rows
+        in the diff need to be loaded into BigQuery. If there is no usable index, the
+        file is pruned in BigQuery and the index is built for the next file.
+        """
+        if not self.raw_data_pruning_index_store:
+            raise ValueError("Expected raw_data_pruning_index_store to be set.")
+        parts = filename_parts_from_path(path)
+        raw_file_config = self.region_raw_file_config.raw_file_configs[parts.file_tag]
+
+        previous_index = self.raw_data_pruning_index_store.read(parts.file_tag)
+        if previous_index and not previous_index.can_prune_file(
+            raw_file_config, file_metadata.update_datetime
+        ):
+            logging.info(
+                "Stored raw data pruning index for [%s] built from file_id [%s] cannot "
+                "be used to prune file_id [%s]",
+                parts.file_tag,
+                previous_index.file_id,
+                file_metadata.file_id,
+            )
+            previous_index = None
+        if previous_index and not self._is_latest_imported_file(
+            raw_data_destination_address, previous_index, file_metadata.file_id
+        ):
+            logging.warning(
+                "Stored raw data pruning index for [%s] built from file_id [%s] does "
+                "not match the latest file imported into [%s]",
+                parts.file_tag,
+                previous_index.file_id,
+                raw_data_destination_address.to_str(),
+            )
+            previous_index = None
+
+        # The stored index will no longer match the raw data table once new rows are
+        # loaded, so it must not be used again if this import fails part way through.
+        self.raw_data_pruning_index_store.delete(parts.file_tag)
+
+        differ = RawDataPruningDiffer(
+            raw_file_config=raw_file_config, previous_index=previous_index
+        )
+        temp_file_paths, columns = self._upload_contents_to_temp_gcs_paths(
+            path,
+            file_metadata,
+            augment_with_metadata_columns=differ.has_previous_index,
+            pruning_differ=differ,
+        )
+        if temp_file_paths:
+            if not columns:
+                raise ValueError("Found delegate output_columns is unexpectedly None.")
+            if differ.has_previous_index:
+                logging.info(
+                    "Loading raw data diff computed with pruning index directly into "
+                    "[%s]",
+                    raw_data_destination_address.to_str(),
                 )
-                raise e
+                self._load_file_contents_to_bigquery(
+                    file_tag=parts.file_tag,
+                    destination_address=raw_data_destination_address,
+                    file_paths=temp_file_paths,
+                    columns=columns,
+                )
+            else:
+                self._load_pruned_contents_to_bigquery(
+                    file_tag=parts.file_tag,
+                    file_id=file_metadata.file_id,
+                    update_datetime=file_metadata.update_datetime,
+                    temp_file_paths=temp_file_paths,
+                    columns=columns,
+                    final_destination_address=raw_data_destination_address,
+                )
+        if differ.has_previous_index:
+            self._append_deleted_rows_to_bigquery(
+                file_tag=parts.file_tag,
+                file_id=file_metadata.file_id,
+                update_datetime=file_metadata.update_datetime,
+                deleted_primary_keys_df=differ.deleted_primary_keys_df(),
+                final_destination_address=raw_data_destination_address,
+            )
 
-        logging.info("Completed BigQuery import of [%s]", path.abs_path())
+        next_index = differ.build_index(
+            file_id=file_metadata.file_id,
+            update_datetime=file_metadata.update_datetime,
+        )
+        if next_index:
+            self.raw_data_pruning_index_store.write(parts.file_tag, next_index)
+        else:
+            logging.warning(
+                "Could not build raw data pruning index for [%s] from file_id [%s]",
+                parts.file_tag,
+                file_metadata.file_id,
+            )
+
+    def _is_latest_imported_file(
+        self,
+        raw_data_destination_address: BigQueryAddress,
+        index: RawDataPruningIndex,
+        file_id_to_import: int,
+    ) -> bool:
+        """Returns True if no file newer than the one the |index| was built from has
+        been imported into the raw data table, e.g. by an import that ran without the
+        index store. Files whose rows were all pruned do not appear in the table, so
+        the latest file_id in the table may be older than the index file_id.
+        """
+        if not self.big_query_client.table_exists(
+            self.big_query_client.dataset_ref_for_id(
+                raw_data_destination_address.dataset_id
+            ),
+            raw_data_destination_address.table_id,
+        ):
+            return False
+        query_job = self.big_query_client.run_query_async(
+            query_str=(
+                f"SELECT MAX({FILE_ID_COL_NAME}) AS max_file_id "
+                f"FROM `{metadata.project_id()}.{raw_data_destination_address.to_str()}` "
+                f"WHERE {FILE_ID_COL_NAME} != {file_id_to_import}"
+            ),
+            use_query_cache=False,
+        )
+        max_file_id = one(query_job)["max_file_id"]
+        return max_file_id is not None and max_file_id <= index.file_id
+
+    def _append_deleted_rows_to_bigquery(
+        self,
+        file_tag: str,
+        file_id: int,
+        update_datetime: datetime.datetime,
+        deleted_primary_keys_df: pd.DataFrame,
+        final_destination_address: BigQueryAddress,
+    ) -> None:
+        """Appends the latest version of each row deleted since the previous file to
+        the original table on BQ, marked as deleted. The pruning index only stores row
+        hashes, so the primary keys of deleted rows are loaded into a temporary table
+        and joined against the latest rows on BQ to get their values."""
+        logging.info(
+            "Found [%d] rows deleted since previous file", len(deleted_primary_keys_df)
+        )
+        if deleted_primary_keys_df.empty:
+            return
+
+        raw_file_config = self.region_raw_file_config.raw_file_configs[file_tag]
+        columns = list(deleted_primary_keys_df.columns)
+        deleted_primary_keys_path = GcsfsFilePath.from_directory_and_file_name(
+            self.temp_output_directory_path,
+            f"temp_{file_tag}_{file_id}_deleted_primary_keys.parquet",
+        )
+        local_path = generate_random_temp_path()
+        pq.write_table(
+            raw_data_df_to_arrow_table(
+                deleted_primary_keys_df,
+                self.create_raw_table_schema_from_columns(
+                    raw_file_config=raw_file_config, columns=columns
+                ),
+            ),
+            local_path,
+            compression="snappy",
+        )
+        self.fs.upload_from_contents_handle_stream(
+            deleted_primary_keys_path,
+            LocalFileContentsHandle(local_path, cleanup_file=True),
+            content_type="application/octet-stream",
+        )
+
+        deleted_primary_keys_address = BigQueryAddress(
+            dataset_id=raw_data_pruning_new_raw_data_dataset(
+                self.state_code, self.instance
+            ),
+            table_id=f"{file_tag}__{file_id}__deleted_primary_keys",
+        )
+        # Clear out any table left behind by a previous import of this file that
+        # failed part way through, since the load below appends to it.
+        self.big_query_client.delete_table(
+            deleted_primary_keys_address.dataset_id,
+            deleted_primary_keys_address.table_id,
+            not_found_ok=True,
+        )
+        self._load_file_contents_to_bigquery(
+            file_tag=file_tag,
+            destination_address=deleted_primary_keys_address,
+            file_paths=[deleted_primary_keys_path],
+            columns=columns,
+            staging_format=RawDataStagingFormat.PARQUET,
+        )
+
+        append_job = self.big_query_client.insert_into_table_from_query_async(
+            destination_dataset_id=final_destination_address.dataset_id,
+            destination_table_id=final_destination_address.table_id,
+            query=RawDataDeletedRowsQueryBuilder(
+                project_id=metadata.project_id(),
+                state_code=self.state_code,
+                file_id=file_id,
+                update_datetime=update_datetime,
+                raw_data_instance=self.instance,
+                raw_file_config=raw_file_config,
+                deleted_primary_keys_table_id=deleted_primary_keys_address.table_id,
+                deleted_primary_keys_dataset=deleted_primary_keys_address.dataset_id,
+            ).build_query(),
+            use_query_cache=False,
+        )
+        append_job.result()
+
+        self.big_query_client.delete_table(
+            deleted_primary_keys_address.dataset_id,
+            deleted_primary_keys_address.table_id,
+        )
 
     def _upload_contents_to_temp_gcs_paths(
         self,
         path: GcsfsFilePath,
         file_metadata: DirectIngestRawFileMetadata,
         augment_with_metadata_columns: bool,
+        pruning_differ: Optional[RawDataPruningDiffer] = None,
     ) -> Tuple[List[GcsfsFilePath], Optional[List[str]]]:
         """Uploads the contents of the file at the provided path to one or more GCS files, with whitespace stripped and
         additional metadata columns added.
@@ -374,6 +853,12 @@ class DirectIngestRawFileImportManager:
             file_metadata,
             self.temp_output_directory_path,
             augment_with_metadata_columns,
+            max_in_flight_chunks=self.max_in_flight_import_chunks,
+            staging_format=self.staging_format,
+            raw_file_config=self.region_raw_file_config.raw_file_configs[
+                filename_parts_from_path(path).file_tag
+            ],
+            pruning_differ=pruning_differ,
         )
 
         self.raw_file_reader.read_raw_file_from_gcs(path, delegate)
@@ -415,8 +900,12 @@ class DirectIngestRawFileImportManager:
         destination_address: BigQueryAddress,
         file_paths: List[GcsfsFilePath],
         columns: List[str],
+        staging_format: Optional[RawDataStagingFormat] = None,
     ) -> None:
-        """Loads the contents in the given handle to the appropriate table in BigQuery."""
+        """Loads the contents in the given handle to the appropriate table in BigQuery.
+        The files must be in |staging_format| if set, otherwise in the staging format
+        of this import manager.
+        """
         logging.info("Starting chunked load of contents to BigQuery")
 
         try:
@@ -433,6 +922,9 @@ class DirectIngestRawFileImportManager:
                     columns=columns,
                 ),
                 write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+                source_format=(
+                    staging_format or self.staging_format
+                ).big_query_source_format,
             )
         except Exception as e:
             logging.error("Failed to start load job - cleaning up temp paths")
@@ -481,6 +973,16 @@ class DirectIngestRawFileImportManager:
         is_exempt_from_raw_data_pruning = file_config.is_exempt_from_raw_data_pruning()
         return not is_exempt_from_raw_data_pruning
 
+    def _should_use_raw_data_pruning_index(self, file_tag: str) -> bool:
+        """Returns whether files with this tag that are pruned should be diffed against
+        the stored index of the latest row versions, rather than in BigQuery.
+        """
+        if not self.raw_data_pruning_index_store:
+            return False
+        # Migrations update rows in BigQuery after they are imported, so the contents
+        # of the raw data table will no longer match the index.
+        return not self.raw_table_migrations.get(file_tag)
+
     def _build_raw_data_pruning_query(
         self,
         temp_new_raw_data_address: BigQueryAddress,
@@ -512,14 +1014,70 @@ class DirectIngestRawFileImportManager:
     ) -> None:
         """Conduct raw data pruning on a file by determining the diff between it and what is currently on BQ,
         and append the results to the original table on BQ."""
-        # Fetch the temporary datasets on BQ used for raw data pruning
-        temp_new_raw_data_address = BigQueryAddress(
+        # Fetch the temporary dataset on BQ used for raw data pruning
+        temp_new_raw_data_address = self._temp_new_raw_data_address(file_tag, file_id)
+
+        # Load new GCS file into a temporary table in BQ
+        self._load_file_contents_to_bigquery(
+            file_tag=file_tag,
+            destination_address=temp_new_raw_data_address,
+            file_paths=temp_file_paths,
+            columns=columns,
+        )
+
+        self._append_pruned_contents_to_bigquery(
+            file_tag=file_tag,
+            file_id=file_id,
+            update_datetime=update_datetime,
+            temp_new_raw_data_address=temp_new_raw_data_address,
+            final_destination_address=final_destination_address,
+        )
+
+    def _temp_new_raw_data_address(
+        self, file_tag: str, file_id: int
+    ) -> BigQueryAddress:
+        """Returns the address of the temporary table new raw data is loaded into
+        before it is pruned or appended to the raw data table.
+        """
+        return BigQueryAddress(
             dataset_id=raw_data_pruning_new_raw_data_dataset(
                 self.state_code, self.instance
             ),
             table_id=f"{file_tag}__{file_id}",
         )
 
+    def _append_new_raw_data_to_bigquery(
+        self,
+        temp_new_raw_data_address: BigQueryAddress,
+        final_destination_address: BigQueryAddress,
+    ) -> None:
+        """Appends the new raw data already loaded into the temporary table to the
+        original table on BQ, then deletes the temporary table."""
+        append_job = self.big_query_client.insert_into_table_from_table_async(
+            source_dataset_id=temp_new_raw_data_address.dataset_id,
+            source_table_id=temp_new_raw_data_address.table_id,
+            destination_dataset_id=final_destination_address.dataset_id,
+            destination_table_id=final_destination_address.table_id,
+            use_query_cache=False,
+        )
+        append_job.result()
+
+        self.big_query_client.delete_table(
+            temp_new_raw_data_address.dataset_id,
+            temp_new_raw_data_address.table_id,
+        )
+
+    def _append_pruned_contents_to_bigquery(
+        self,
+        file_tag: str,
+        file_id: int,
+        update_datetime: datetime.datetime,
+        temp_new_raw_data_address: BigQueryAddress,
+        final_destination_address: BigQueryAddress,
+    ) -> None:
+        """Determines the diff between the new raw data already loaded into the
+        temporary table and what is currently on BQ, and appends the results to the
+        original table on BQ."""
         temp_raw_data_diff_table_address = BigQueryAddress(
             dataset_id=raw_data_pruning_raw_data_diff_results_dataset(
                 self.state_code, self.instance
@@ -527,14 +1085,6 @@ class DirectIngestRawFileImportManager:
             table_id=f"{file_tag}__{file_id}",
         )
 
-        # Load new GCS file into a temporary table in BQ
-        self._load_file_contents_to_bigquery(
-            file_tag=file_tag,
-            destination_address=temp_new_raw_data_address,
-            file_paths=temp_file_paths,
-            columns=columns,
-        )
-
         # Create and run raw data diff query between contents of new temporary table on BQ and the latest version
         # of the raw data table on BQ, then save the results of diff query to a temporary table
         raw_data_diff_query = self._build_raw_data_pruning_query(
@@ -641,11 +1191,50 @@ class DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
         file_metadata: DirectIngestRawFileMetadata,
         temp_output_directory_path: GcsfsDirectoryPath,
         augment_with_metadata_columns: bool,
+        max_in_flight_chunks: Optional[int] = None,
+        chunk_loader: Optional[PipelinedRawDataChunkLoader] = None,
+        staging_format: RawDataStagingFormat = RawDataStagingFormat.CSV,
+        raw_file_config: Optional[DirectIngestRawFileConfig] = None,
+        pruning_differ: Optional[RawDataPruningDiffer] = None,
     ):
-        super().__init__(path, fs, include_header=False)
+        """If |pruning_differ| is set, every chunk is passed through it. If the differ
+        has a previous index, only added or updated rows are written.
+        """
+        super().__init__(
+            path, fs, include_header=False, max_in_flight_chunks=max_in_flight_chunks
+        )
+        if staging_format is RawDataStagingFormat.PARQUET and not raw_file_config:
+            raise ValueError(
+                "Must provide a raw_file_config to stage raw data chunks as Parquet."
+            )
         self.file_metadata = file_metadata
         self.temp_output_directory_path = temp_output_directory_path
         self.augment_with_metadata_columns = augment_with_metadata_columns
+        self.chunk_loader = chunk_loader
+        self.staging_format = staging_format
+        self.raw_file_config = raw_file_config
+        self.pruning_differ = pruning_differ
+
+    def on_start_read_with_encoding(self, encoding: str) -> None:
+        super().on_start_read_with_encoding(encoding)
+        if self.pruning_differ:
+            self.pruning_differ.reset()
+
+    def on_chunk_output_ready(self, chunk_num: int, output_path: GcsfsFilePath) -> None:
+        if self.chunk_loader:
+            if self.output_columns is None:
+                raise ValueError("Found output_columns is unexpectedly None.")
+            self.chunk_loader.add_chunk(output_path, self.output_columns)
+
+    def on_unicode_decode_error(self, encoding: str, e: UnicodeError) -> bool:
+        if self.chunk_loader:
+            # Chunks read with the failed encoding may already have been loaded - they
+            # must be removed before we re-read the file with the next encoding. This
+            # has to happen before the temp chunk paths are cleaned up, so that no
+            # load job is still reading from them when they are deleted.
+            self._wait_for_in_flight_chunks_before_cleanup()
+            self.chunk_loader.discard_loaded_rows()
+        return super().on_unicode_decode_error(encoding, e)
 
     def transform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         # Stripping white space from all fields
@@ -664,6 +1253,9 @@ class DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
                 num_rows_before_filter - num_rows_after_filter,
             )
 
+        if self.pruning_differ:
+            df = self.pruning_differ.diff_chunk(df)
+
         if self.augment_with_metadata_columns:
             return self._augment_raw_data_with_metadata_columns(
                 path=self.path, file_metadata=self.file_metadata, raw_data_df=df
@@ -674,7 +1266,28 @@ class DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
         name, _extension = os.path.splitext(self.path.file_name)
 
         return GcsfsFilePath.from_directory_and_file_name(
-            self.temp_output_directory_path, f"temp_{name}_{chunk_num}.csv"
+            self.temp_output_directory_path,
+            f"temp_{name}_{chunk_num}.{self.staging_format.file_extension}",
+        )
+
+    def upload_chunk(self, output_path: GcsfsFilePath, df: pd.DataFrame) -> None:
+        if self.staging_format is RawDataStagingFormat.CSV:
+            super().upload_chunk(output_path, df)
+            return
+
+        if not self.raw_file_config:
+            raise ValueError("Expected raw_file_config to be set.")
+        schema = DirectIngestRawFileImportManager.create_raw_table_schema_from_columns(
+            raw_file_config=self.raw_file_config, columns=df.columns
+        )
+        local_path = generate_random_temp_path()
+        pq.write_table(
+            raw_data_df_to_arrow_table(df, schema), local_path, compression="snappy"
+        )
+        self.fs.upload_from_contents_handle_stream(
+            output_path,
+            LocalFileContentsHandle(local_path, cleanup_file=True),
+            content_type="application/octet-stream",
         )
 
     @staticmethod
@@ -694,6 +1307,45 @@ class DirectIngestRawDataSplittingGcsfsCsvReaderDelegate(
         )
 
 
+_ARROW_TYPES_BY_BQ_TYPE = {
+    bigquery.enums.SqlTypeNames.STRING.value: pa.string(),
+    bigquery.enums.SqlTypeNames.INTEGER.value: pa.int64(),
+    bigquery.enums.SqlTypeNames.BOOLEAN.value: pa.bool_(),
+    # BigQuery loads Parquet timestamps that are not adjusted to UTC as DATETIME
+    bigquery.enums.SqlTypeNames.DATETIME.value: pa.timestamp("us"),
+}
+
+
+def raw_data_df_to_arrow_table(
+    raw_data_df: pd.DataFrame, schema: List[bigquery.SchemaField]
+) -> pa.Table:
+    """Converts a raw data chunk to an Arrow table with the given raw data table
+    schema. Empty string values are converted to nulls, which matches how BigQuery
+    loads empty values in the equivalent CSV.
+    """
+    columns = {}
+    for field in schema:
+        values = raw_data_df[field.name]
+        if field.field_type == bigquery.enums.SqlTypeNames.STRING.value:
+            values = values.where(values != "", None)
+        columns[field.name] = pa.array(
+            values, type=_ARROW_TYPES_BY_BQ_TYPE[field.field_type], from_pandas=True
+        )
+    return pa.Table.from_pydict(
+        columns,
+        schema=pa.schema(
+            [
+                pa.field(
+                    field.name,
+                    _ARROW_TYPES_BY_BQ_TYPE[field.field_type],
+                    nullable=field.mode != "REQUIRED",
+                )
+                for field in schema
+            ]
+        ),
+    )
+
+
 def check_found_columns_are_subset_of_config(
     raw_file_config: DirectIngestRawFileConfig, found_columns: Iterable[str]
 ) -> None:
@@ -0,0 +1,343 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Defines an index of a hash of the latest version of each row in a raw data table,
+keyed by primary key, which allows the raw data pruning diff for a new raw file to be computed
+locally while the file is streamed, rather than with BigQuery queries against the full
+raw data table.
+"""
+import datetime
+import hashlib
+import json
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+import attr
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from recidiviz.cloud_storage.gcs_file_system import GCSFileSystem
+from recidiviz.cloud_storage.gcs_file_system_impl import generate_random_temp_path
+from recidiviz.cloud_storage.gcsfs_path import GcsfsDirectoryPath, GcsfsFilePath
+from recidiviz.common.io.local_file_contents_handle import LocalFileContentsHandle
+from recidiviz.ingest.direct.raw_data.raw_file_configs import DirectIngestRawFileConfig
+
+# The values of a single raw data row, or of the primary key columns of that row.
+# Empty values are represented as None, matching how they are loaded into BigQuery.
+RowValues = Tuple[Optional[str], ...]
+
+_FILE_ID_METADATA_KEY = b"file_id"
+_UPDATE_DATETIME_METADATA_KEY = b"update_datetime"
+_PRIMARY_KEY_COLS_METADATA_KEY = b"primary_key_cols"
+_COLUMNS_METADATA_KEY = b"columns"
+
+_ROW_HASH_COLUMN = "__row_hash"
+
+
+def _lower(columns: List[str]) -> List[str]:
+    return [c.lower() for c in columns]
+
+
+def _hash_row(row: RowValues) -> str:
+    return hashlib.sha256(json.dumps(row).encode("utf-8")).hexdigest()
+
+
+@attr.s(auto_attribs=True, frozen=True, kw_only=True)
+class RawDataPruningIndex:
+    """A hash of the latest version of every row in a raw data table as of the import
+    of the file with |file_id|, keyed by primary key.
+
+    Because pruning is only done on files that are always historical exports, the
+    latest version of every row after a file is imported is exactly the contents of
+    that file. Only a hash of each row is stored, which is enough to tell whether a row
+    has changed. The values of rows that are deleted by a new file are read from the
+    raw data table in BigQuery.
+    """
+
+    file_id: int
+    update_datetime: datetime.datetime
+
+    # The columns of the raw file config, in config order. Values in each row are
+    # hashed in this order.
+    columns: List[str]
+    primary_key_cols: List[str]
+    row_hashes_by_primary_key: Dict[RowValues, str]
+
+    def can_prune_file(
+        self,
+        raw_file_config: DirectIngestRawFileConfig,
+        update_datetime: datetime.datetime,
+    ) -> bool:
+        """Returns True if this index may be used to prune a file with the given
+        config and update_datetime. The index is only valid for files that are newer
+        than the file it was built from, and only if the columns and primary keys of
+        the raw file config have not changed since then.
+        """
+        return (
+            self.update_datetime < update_datetime
+            and self.columns == [c.name for c in raw_file_config.columns]
+            and _lower(self.primary_key_cols)
+            == _lower(raw_file_config.primary_key_cols)
+        )
+
+    def to_arrow_table(self) -> pa.Table:
+        primary_keys = list(self.row_hashes_by_primary_key.keys())
+        values_by_column = {
+            column: pa.array([key[i] for key in primary_keys], type=pa.string())
+            for i, column in enumerate(self.primary_key_cols)
+        }
+        values_by_column[_ROW_HASH_COLUMN] = pa.array(
+            list(self.row_hashes_by_primary_key.values()), type=pa.string()
+        )
+        return pa.Table.from_pydict(
+            values_by_column,
+            metadata={
+                _FILE_ID_METADATA_KEY: str(self.file_id),
+                _UPDATE_DATETIME_METADATA_KEY: self.update_datetime.isoformat(),
+                _COLUMNS_METADATA_KEY: json.dumps(self.columns),
+                _PRIMARY_KEY_COLS_METADATA_KEY: json.dumps(self.primary_key_cols),
+            },
+        )
+
+    @classmethod
+    def from_arrow_table(cls, table: pa.Table) -> "RawDataPruningIndex":
+        metadata = table.schema.metadata
+        primary_key_cols = json.loads(metadata[_PRIMARY_KEY_COLS_METADATA_KEY])
+        values_by_column = table.to_pydict()
+        return cls(
+            file_id=int(metadata[_FILE_ID_METADATA_KEY]),
+            update_datetime=datetime.datetime.fromisoformat(
+                metadata[_UPDATE_DATETIME_METADATA_KEY].decode("utf-8")
+            ),
+            columns=json.loads(metadata[_COLUMNS_METADATA_KEY]),
+            primary_key_cols=primary_key_cols,
+            row_hashes_by_primary_key=dict(
+                zip(
+                    zip(*(values_by_column[c] for c in primary_key_cols)),
+                    values_by_column[_ROW_HASH_COLUMN],
+                )
+            ),
+        )
+
+
+def _column_indices(columns: List[str], selected_columns: List[str]) -> List[int]:
+    """Returns the index in |columns| of each of the |selected_columns|, matching
+    column names case-insensitively, as BigQuery does.
+    """
+    columns_lower = _lower(columns)
+    return [columns_lower.index(c.lower()) for c in selected_columns]
+
+
+class RawDataPruningDiffer:
+    """Computes the raw data pruning diff for a new raw file chunk by chunk while the
+    file is streamed, and builds the RawDataPruningIndex for the new file.
+
+    The diff matches the one produced by the RawDataDiffQueryBuilder query: rows that
+    are not identical to the latest version of a row are added / updated, and rows whose
+    primary key no longer appears in the file are deleted. If there is no
+    |previous_index|, no diff is computed and chunks are returned unchanged, but the
+    index for the new file is still built.
+
+    Chunks may be diffed concurrently from multiple threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        raw_file_config: DirectIngestRawFileConfig,
+        previous_index: Optional[RawDataPruningIndex],
+    ) -> None:
+        self.raw_file_config = raw_file_config
+        self.previous_index = previous_index
+        self._columns = [c.name for c in raw_file_config.columns]
+        self._primary_key_indices = _column_indices(
+            self._columns, raw_file_config.primary_key_cols
+        )
+        self._lock = threading.Lock()
+        self._file_columns: Optional[List[str]] = None
+        self._row_hashes_by_primary_key: Dict[RowValues, str] = {}
+        self._added_or_updated_row_hashes: Set[str] = set()
+        self._has_conflicting_primary_keys = False
+
+    @property
+    def has_previous_index(self) -> bool:
+        return self.previous_index is not None
+
+    def reset(self) -> None:
+        """Clears all state recorded from chunks read so far, e.g. before the file is
+        re-read with a different encoding.
+        """
+        with self._lock:
+            self._file_columns = None
+            self._row_hashes_by_primary_key = {}
+            self._added_or_updated_row_hashes = set()
+            self._has_conflicting_primary_keys = False
+
+    def diff_chunk(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Records the rows in this chunk of the new file and returns the subset of
+        rows that have been added or updated since the previous file. Values must
+        already be stripped of whitespace.
+        """
+        file_columns = list(df.columns)
+        column_indices_in_file = self._column_indices_in_file(file_columns)
+        rows: List[RowValues] = [
+            tuple(
+                None if i is None or row[i] == "" else row[i]
+                for i in column_indices_in_file
+            )
+            for row in df.itertuples(index=False, name=None)
+        ]
+        primary_keys_and_hashes = [
+            (tuple(row[i] for i in self._primary_key_indices), _hash_row(row))
+            for row in rows
+        ]
+
+        is_added_or_updated = []
+        with self._lock:
+            if self._file_columns is None:
+                self._file_columns = file_columns
+            for primary_key, row_hash in primary_keys_and_hashes:
+                existing_row_hash = self._row_hashes_by_primary_key.setdefault(
+                    primary_key, row_hash
+                )
+                if existing_row_hash != row_hash:
+                    # The next version of this row is ambiguous, so the index for this
+                    # file cannot be built.
+                    self._has_conflicting_primary_keys = True
+
+                if not self.previous_index:
+                    is_added_or_updated.append(True)
+                    continue
+                if (
+                    self.previous_index.row_hashes_by_primary_key.get(primary_key)
+                    == row_hash
+                    or row_hash in self._added_or_updated_row_hashes
+                ):
+                    is_added_or_updated.append(False)
+                    continue
+                self._added_or_updated_row_hashes.add(row_hash)
+                is_added_or_updated.append(True)
+
+        if all(is_added_or_updated):
+            return df
+        return df[is_added_or_updated]
+
+    def _column_indices_in_file(self, file_columns: List[str]) -> List[Optional[int]]:
+        """Returns the index in |file_columns| of each config column, or None if the
+        column does not appear in the file.
+        """
+        file_columns_lower = _lower(file_columns)
+        indices = [
+            file_columns_lower.index(c.lower())
+            if c.lower() in file_columns_lower
+            else None
+            for c in self._columns
+        ]
+        if self.previous_index and None in indices:
+            # The raw data diff query has the same requirement, as it compares all
+            # columns of the new and existing rows.
+            raise ValueError(
+                f"Found columns missing from file with tag "
+                f"[{self.raw_file_config.file_tag}]: "
+                f"{[c for c, i in zip(self._columns, indices) if i is None]}. "
+                f"All configured columns must be present to prune a file."
+            )
+        return indices
+
+    def deleted_primary_keys_df(self) -> pd.DataFrame:
+        """Returns the primary key values of each row in the previous index whose
+        primary key does not appear in the new file, with the primary key columns of
+        the raw file config. Must only be called once the whole file has been diffed.
+        """
+        if not self.previous_index:
+            raise ValueError("Cannot compute deleted rows without a previous index.")
+        deleted_primary_keys: List[RowValues] = []
+        if self._file_columns is not None:
+            # As with the raw data diff query, we do not record deletions for a file
+            # without any rows.
+            deleted_primary_keys = [
+                primary_key
+                for primary_key in self.previous_index.row_hashes_by_primary_key
+                if primary_key not in self._row_hashes_by_primary_key
+            ]
+        return pd.DataFrame(
+            deleted_primary_keys,
+            columns=self.raw_file_config.primary_key_cols,
+            dtype=object,
+        )
+
+    def build_index(
+        self, *, file_id: int, update_datetime: datetime.datetime
+    ) -> Optional[RawDataPruningIndex]:
+        """Returns the index of the latest row versions once the file with the given
+        file_id and update_datetime has been imported, or None if it cannot be
+        determined without querying BigQuery. Must only be called once the whole file
+        has been diffed.
+        """
+        if self._has_conflicting_primary_keys:
+            return None
+        if self._file_columns is None:
+            # Files without any rows are not imported, so the latest version of each
+            # row has not changed.
+            return self.previous_index
+        return RawDataPruningIndex(
+            file_id=file_id,
+            update_datetime=update_datetime,
+            columns=self._columns,
+            primary_key_cols=self.raw_file_config.primary_key_cols,
+            row_hashes_by_primary_key=self._row_hashes_by_primary_key,
+        )
+
+
+class RawDataPruningIndexStore:
+    """Reads and writes the RawDataPruningIndex for each file tag, stored as Parquet
+    files in GCS.
+    """
+
+    def __init__(self, fs: GCSFileSystem, directory: GcsfsDirectoryPath) -> None:
+        self.fs = fs
+        self.directory = directory
+
+    def _path(self, file_tag: str) -> GcsfsFilePath:
+        return GcsfsFilePath.from_directory_and_file_name(
+            self.directory, f"{file_tag}.parquet"
+        )
+
+    def read(self, file_tag: str) -> Optional[RawDataPruningIndex]:
+        """Returns the stored index for the file tag, or None if no index has been
+        stored.
+        """
+        path = self._path(file_tag)
+        if not self.fs.exists(path):
+            return None
+        return RawDataPruningIndex.from_arrow_table(
+            pq.read_table(pa.BufferReader(self.fs.download_as_bytes(path)))
+        )
+
+    def write(self, file_tag: str, index: RawDataPruningIndex) -> None:
+        local_path = generate_random_temp_path()
+        pq.write_table(index.to_arrow_table(), local_path, compression="snappy")
+        self.fs.upload_from_contents_handle_stream(
+            self._path(file_tag),
+            LocalFileContentsHandle(local_path, cleanup_file=True),
+            content_type="application/octet-stream",
+        )
+
+    def delete(self, file_tag: str) -> None:
+        path = self._path(file_tag)
+        if self.fs.exists(path):
+            self.fs.delete(path)
@@ -15,11 +15,12 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #  =============================================================================
 """Contains all classes related to raw file configs."""
+import logging
 import os
 import re
 from enum import Enum
 from types import ModuleType
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 import attr
 from more_itertools import one
@@ -34,6 +35,20 @@ from recidiviz.utils.yaml_dict import YAMLDict
 
 _DEFAULT_BQ_UPLOAD_CHUNK_SIZE = 250000
 
+# The name, modification time and size of every YAML file in a raw data YAML directory
+RawFileConfigYAMLStats = FrozenSet[Tuple[str, int, int]]
+
+# Parsed and validated raw file configs shared by every DirectIngestRegionRawFileConfig
+# in the process, keyed by region code and YAML directory. The configs are reparsed
+# if any YAML in the directory has been added, removed or modified since they were
+# parsed. The DirectIngestRawFileConfig and RawTableColumnInfo objects in the cache
+# are shared by every region config for that region and must never be mutated - use
+# attr.evolve() to build a modified copy instead.
+_RAW_FILE_CONFIGS_BY_REGION: Dict[
+    Tuple[str, str],
+    Tuple[RawFileConfigYAMLStats, Dict[str, "DirectIngestRawFileConfig"]],
+] = {}
+
 DATETIME_SQL_REGEX = re.compile(
     r"SAFE.PARSE_(TIMESTAMP|DATE|DATETIME)\(.*{col_name}.*\)"
 )
@@ -759,7 +774,36 @@ class DirectIngestRegionRawFileConfig:
 
     @raw_file_configs.default
     def _raw_data_file_configs(self) -> Dict[str, DirectIngestRawFileConfig]:
-        return self._generate_raw_data_file_configs()
+        yaml_stats = self._get_yaml_stats()
+        if (
+            yaml_stats is None
+            # Subclasses that do not read the configs from the YAMLs are not cached
+            or type(self)._read_configs_from_disk
+            is not DirectIngestRegionRawFileConfig._read_configs_from_disk
+        ):
+            return self._generate_raw_data_file_configs()
+
+        cache_key = (self.region_code.lower(), self.yaml_config_file_dir)
+        cached = _RAW_FILE_CONFIGS_BY_REGION.get(cache_key)
+        if cached is None or cached[0] != yaml_stats:
+            cached = (yaml_stats, self._generate_raw_data_file_configs())
+            _RAW_FILE_CONFIGS_BY_REGION[cache_key] = cached
+
+        # Each region config gets its own dict, so file tags can be added or removed,
+        # but the configs in it are shared with the cache and must not be mutated.
+        return dict(cached[1])
+
+    def _get_yaml_stats(self) -> Optional[RawFileConfigYAMLStats]:
+        """Returns the name, modification time and size of every YAML file in the
+        raw data YAML directory, or None if the directory does not exist."""
+        if not os.path.isdir(self.yaml_config_file_dir):
+            return None
+        with os.scandir(self.yaml_config_file_dir) as entries:
+            return frozenset(
+                (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                for entry in entries
+                if entry.name.endswith(".yaml") and entry.is_file()
+            )
 
     def get_raw_data_file_config_paths(self) -> List[str]:
         if not os.path.isdir(self.yaml_config_file_dir):
@@ -338,6 +338,11 @@ class DirectIngestViewQueryBuilder:
         """
         return self._order_by_cols
 
+    @property
+    def view_query_template(self) -> str:
+        """The template for this view's query, before raw table views are hydrated."""
+        return self._view_query_template
+
     @property
     def materialize_raw_data_table_views(self) -> bool:
         """If True, this query will always materialize raw table views into temporary tables."""
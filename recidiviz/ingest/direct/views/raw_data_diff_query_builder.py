@@ -84,6 +84,35 @@ SELECT
 FROM deleted_diff
 """
 
+DELETED_ROWS_JOIN_CLAUSE_TEMPLATE = """
+    (
+        (current_table_rows.{column_name} IS NULL AND deleted_primary_keys.{column_name} IS NULL) OR 
+        (current_table_rows.{column_name} = deleted_primary_keys.{column_name})
+    )"""
+
+DELETED_ROWS_QUERY_TEMPLATE = """
+WITH current_table_rows AS 
+( 
+ {latest_current_raw_data_query}
+), 
+deleted_primary_keys AS ( 
+    SELECT 
+      * 
+    FROM `{project_id}.{deleted_primary_keys_dataset}.{deleted_primary_keys_table_id}`
+)
+SELECT 
+  current_table_rows.*, 
+  {file_id} AS file_id,
+  CAST('{update_datetime}' AS DATETIME) AS update_datetime,
+  true AS is_deleted 
+FROM 
+  current_table_rows
+JOIN
+  deleted_primary_keys
+ON 
+  {deleted_rows_join_clause}
+"""
+
 
 class RawDataDiffQueryBuilder:
     """Class for building SQL queries to compute the diffs between existing data in a raw data table and updated
@@ -176,3 +205,72 @@ class RawDataDiffQueryBuilder:
                 )
             )
         return " AND".join(where_statements)
+
+
+class RawDataDeletedRowsQueryBuilder:
+    """Class for building SQL queries that select the latest version of each row in a
+    raw data table whose primary key is in a table of primary keys deleted by a new
+    file, marked as deleted by that file."""
+
+    def __init__(
+        self,
+        project_id: str,
+        state_code: StateCode,
+        file_id: int,
+        update_datetime: datetime.datetime,
+        raw_data_instance: DirectIngestInstance,
+        raw_file_config: DirectIngestRawFileConfig,
+        deleted_primary_keys_table_id: str,
+        deleted_primary_keys_dataset: str,
+    ):
+        self._query_builder = BigQueryQueryBuilder(address_overrides=None)
+        self.project_id = project_id
+        self.state_code = state_code
+        self.file_id = file_id
+        self.update_datetime = update_datetime
+        self.raw_data_instance = raw_data_instance
+        self.raw_file_config = raw_file_config
+        self.deleted_primary_keys_table_id = deleted_primary_keys_table_id
+        self.deleted_primary_keys_dataset = deleted_primary_keys_dataset
+
+        self.latest_current_raw_data_query = RawTableQueryBuilder(
+            project_id=self.project_id,
+            region_code=self.state_code.value,
+            raw_data_source_instance=self.raw_data_instance,
+        ).build_query(
+            raw_file_config=raw_file_config,
+            address_overrides=None,
+            normalized_column_values=False,
+            raw_data_datetime_upper_bound=None,
+            filter_to_latest=True,
+            filter_to_only_documented_columns=False,
+        )
+
+    def build_query(self) -> str:
+        if not raw_data_pruning_enabled_in_state_and_instance(
+            self.state_code, self.raw_data_instance
+        ):
+            raise ValueError(
+                f"Raw data pruning is not yet enabled for state_code={self.state_code.value}, "
+                f"instance={self.raw_data_instance.value}"
+            )
+
+        query_kwargs = {
+            "project_id": self.project_id,
+            "file_id": str(self.file_id),
+            "update_datetime": self.update_datetime.strftime("%Y-%m-%dT%H:%M:%S.%f"),
+            "latest_current_raw_data_query": self.latest_current_raw_data_query,
+            "deleted_primary_keys_table_id": self.deleted_primary_keys_table_id,
+            "deleted_primary_keys_dataset": self.deleted_primary_keys_dataset,
+            "deleted_rows_join_clause": " AND".join(
+                StrictStringFormatter().format(
+                    DELETED_ROWS_JOIN_CLAUSE_TEMPLATE, column_name=col
+                )
+                for col in self.raw_file_config.primary_key_cols
+            ),
+        }
+        return self._query_builder.build_query(
+            project_id=self.project_id,
+            query_template=DELETED_ROWS_QUERY_TEMPLATE,
+            query_format_kwargs=query_kwargs,
+        )
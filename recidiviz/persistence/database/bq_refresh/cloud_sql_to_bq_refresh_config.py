@@ -27,7 +27,8 @@ The yaml file format for cloud_sql_to_bq_config.yaml is:
 region_codes_to_exclude:
   - <list of state region codes>
 """
-from typing import Dict, List, Optional, Tuple
+import datetime
+from typing import Dict, List, Optional, Tuple, Union
 
 import yaml
 from sqlalchemy import Table
@@ -69,6 +70,28 @@ from recidiviz.persistence.database.sqlalchemy_engine_manager import (
 )
 from recidiviz.utils import metadata
 
+# For each schema, the tables that can be refreshed incrementally, mapped to a column
+# whose value increases with every row added to the table and a safety window for that
+# column. Rows in these tables are never updated or deleted once written. Values in the
+# watermark column are assigned when a row is inserted, not when its transaction
+# commits, so a row can become visible after a row with a larger value has already been
+# exported. To capture those rows, each incremental refresh re-exports every row whose
+# watermark column value falls within the safety window below the largest one already
+# in BigQuery; re-exported rows are merged on primary key, so this is idempotent.
+# Tables whose rows are updated in place or deleted (e.g. the case triage roster
+# tables, which are cleared on roster upload) must always be refreshed in full.
+_INCREMENTAL_REFRESH_WATERMARK_COLUMNS: Dict[
+    SchemaType, Dict[str, Tuple[str, Union[int, datetime.timedelta]]]
+] = {
+    SchemaType.OPERATIONS: {
+        "direct_ingest_instance_status": (
+            "status_timestamp",
+            datetime.timedelta(hours=1),
+        ),
+        "direct_ingest_dataflow_raw_table_upper_bounds": ("watermark_id", 1000),
+    },
+}
+
 
 class CloudSqlToBQConfig:
     """Configuration class for exporting tables from Cloud SQL to BigQuery
@@ -252,14 +275,74 @@ class CloudSqlToBQConfig:
         """Return a List of column objects to export for a given table"""
         return list(column.name for column in table.columns)
 
+    def get_incremental_refresh_watermark_column(self, table: Table) -> Optional[str]:
+        """Returns the column used to find the rows added to a table since its last
+        refresh, or None if the table must always be refreshed in full.
+        """
+        watermark_column_and_safety_window = _INCREMENTAL_REFRESH_WATERMARK_COLUMNS.get(
+            self.schema_type, {}
+        ).get(table.name)
+        if watermark_column_and_safety_window is None:
+            return None
+        return watermark_column_and_safety_window[0]
+
+    def get_incremental_refresh_lower_bound(
+        self, table: Table, watermark: Union[int, datetime.datetime]
+    ) -> Union[int, datetime.datetime]:
+        """Returns the value above which rows in |table| are re-exported on an
+        incremental refresh, given the largest |watermark| column value already in
+        BigQuery. This is the |watermark| less the table's safety window, so that rows
+        whose transactions committed after a row with a larger watermark column value
+        was exported are still picked up.
+        """
+        watermark_column_and_safety_window = _INCREMENTAL_REFRESH_WATERMARK_COLUMNS.get(
+            self.schema_type, {}
+        ).get(table.name)
+        if watermark_column_and_safety_window is None:
+            raise ValueError(
+                f"Table [{table.name}] in schema [{self.schema_type.value}] cannot be "
+                f"refreshed incrementally."
+            )
+        _, safety_window = watermark_column_and_safety_window
+        if isinstance(watermark, datetime.datetime):
+            if not isinstance(safety_window, datetime.timedelta):
+                raise ValueError(
+                    f"Expected a timedelta safety window for table [{table.name}], "
+                    f"found [{safety_window}]."
+                )
+            return watermark - safety_window
+        if not isinstance(safety_window, int):
+            raise ValueError(
+                f"Expected an integer safety window for table [{table.name}], "
+                f"found [{safety_window}]."
+            )
+        return watermark - safety_window
+
+    def _get_watermark_column_for_export(
+        self, table: Table, watermark: Optional[Union[int, datetime.datetime]]
+    ) -> Optional[str]:
+        if watermark is None:
+            return None
+        watermark_column = self.get_incremental_refresh_watermark_column(table)
+        if watermark_column is None:
+            raise ValueError(
+                f"Table [{table.name}] in schema [{self.schema_type.value}] cannot be "
+                f"refreshed incrementally."
+            )
+        return watermark_column
+
     def get_single_state_table_federated_export_query(
-        self, table: Table, state_code: StateCode
+        self,
+        table: Table,
+        state_code: StateCode,
+        watermark: Optional[Union[int, datetime.datetime]] = None,
     ) -> str:
         """Return a formatted SQL query for a given CloudSQL schema table that can be
         used to export data for a given state to BigQuery via a federated query.
 
         For association tables, it adds a region code column to the select statement
-        through a join.
+        through a join. If a |watermark| is provided, only exports the rows added
+        since that watermark.
 
         Throws if the provided state_code is in the list of region_codes_to_exclude.
         """
@@ -275,15 +358,22 @@ class CloudSqlToBQConfig:
             table=table,
             columns_to_include=columns,
             region_code=state_code.value,
+            watermark_column=self._get_watermark_column_for_export(table, watermark),
+            watermark=watermark,
         )
         return query_builder.full_query()
 
-    def get_table_federated_export_query(self, table_name: str) -> str:
+    def get_table_federated_export_query(
+        self,
+        table_name: str,
+        watermark: Optional[Union[int, datetime.datetime]] = None,
+    ) -> str:
         """Return a formatted SQL query for a given CloudSQL schema table that can be
         used to export data for a given state to BigQuery via a federated query.
 
         For association tables, it adds a region code column to the select statement
-        through a join.
+        through a join. If a |watermark| is provided, only exports the rows added
+        since that watermark.
 
         Throws if the provided state_code is in the list of region_codes_to_exclude.
         """
@@ -300,6 +390,8 @@ class CloudSqlToBQConfig:
             table=table,
             columns_to_include=columns,
             region_code=None,
+            watermark_column=self._get_watermark_column_for_export(table, watermark),
+            watermark=watermark,
         )
         return query_builder.full_query()
 
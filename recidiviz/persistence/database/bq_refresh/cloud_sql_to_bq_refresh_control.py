@@ -98,9 +98,11 @@ def execute_cloud_sql_to_bq_refresh(
     schema_type: SchemaType,
     ingest_instance: DirectIngestInstance,
     sandbox_prefix: Optional[str] = None,
+    incremental: bool = False,
 ) -> None:
     """Executes the Cloud SQL to BQ refresh for a given schema_type, ingest instance and
-    sandbox_prefix."""
+    sandbox_prefix. If |incremental| is set, tables that support it are refreshed
+    with only the rows added since the last refresh."""
     if not CloudSqlToBQConfig.is_valid_schema_type(schema_type):
         raise ValueError(f"Unsupported schema type: [{schema_type}]")
 
@@ -126,6 +128,7 @@ def execute_cloud_sql_to_bq_refresh(
             if schema_type == SchemaType.STATE
             else None,
             dataset_override_prefix=sandbox_prefix,
+            incremental=incremental,
         )
         if schema_type == SchemaType.STATE:
             # TODO(#20930): Separate this out into its own endpoint that runs in
@@ -25,6 +25,7 @@ from sqlalchemy import Table
 from recidiviz.big_query.address_overrides import BigQueryAddressOverrides
 from recidiviz.big_query.big_query_address import BigQueryAddress
 from recidiviz.big_query.big_query_view import BigQueryView, BigQueryViewBuilder
+from recidiviz.common.constants.states import StateCode
 from recidiviz.persistence.database.schema_type import SchemaType
 from recidiviz.persistence.database.sqlalchemy_database_key import SQLAlchemyDatabaseKey
 from recidiviz.utils.string import StrictStringFormatter
@@ -89,7 +90,8 @@ class FederatedCloudSQLTableBigQueryView(BigQueryView):
 class FederatedCloudSQLTableBigQueryViewBuilder(
     BigQueryViewBuilder[FederatedCloudSQLTableBigQueryView]
 ):
-    """View builder for FederatedCloudSQLTableBigQueryView"""
+    """View builder for FederatedCloudSQLTableBigQueryView. The |state_code| is set
+    for views that query a single state segment of a state-segmented schema."""
 
     def __init__(
         self,
@@ -99,9 +101,11 @@ class FederatedCloudSQLTableBigQueryViewBuilder(
         database_key: SQLAlchemyDatabaseKey,
         cloud_sql_query: str,
         materialized_address_override: BigQueryAddress,
+        state_code: Optional[StateCode] = None,
     ):
         self.connection_region = connection_region
         self.table = table
+        self.state_code = state_code
         self.view_id = view_id
         self.database_key = database_key
         self.connection_name = self._connection_name_for_database(self.database_key)
@@ -87,6 +87,7 @@ class StateSegmentedSchemaFederatedBigQueryViewCollector(
                         database_key=database_key,
                         materialized_address_override=materialized_address,
                         cloud_sql_query=cloud_sql_query,
+                        state_code=state_code,
                     )
                 )
         return views
@@ -17,15 +17,21 @@
 """Export data from Cloud SQL and load it into BigQuery."""
 import logging
 import uuid
+from concurrent import futures
 from datetime import datetime
 from typing import List, Optional
 
 import pytz
+from more_itertools import one
 from sqlalchemy import Table
 
 from recidiviz.big_query.address_overrides import BigQueryAddressOverrides
 from recidiviz.big_query.big_query_address import BigQueryAddress
-from recidiviz.big_query.big_query_client import BigQueryClientImpl
+from recidiviz.big_query.big_query_client import (
+    BQ_CLIENT_MAX_POOL_SIZE,
+    BigQueryClient,
+    BigQueryClientImpl,
+)
 from recidiviz.big_query.big_query_view import BigQueryView, BigQueryViewBuilder
 from recidiviz.big_query.big_query_view_collector import BigQueryViewCollector
 from recidiviz.big_query.view_update_manager import (
@@ -55,6 +61,8 @@ from recidiviz.persistence.database.schema_type import SchemaType
 from recidiviz.persistence.database.sqlalchemy_engine_manager import (
     SQLAlchemyEngineManager,
 )
+from recidiviz.utils import structured_logging
+from recidiviz.utils.string import StrictStringFormatter
 from recidiviz.view_registry.address_overrides_factory import (
     address_overrides_for_view_builders,
 )
@@ -63,14 +71,29 @@ from recidiviz.view_registry.deployed_views import (
     CLOUDSQL_UNIONED_REGIONAL_REFRESH_DATASETS_THAT_HAVE_EVER_BEEN_MANAGED_BY_SCHEMA,
 )
 
+MERGE_ADDED_ROWS_QUERY_TEMPLATE = """
+MERGE {materialized_table} materialized
+USING (
+{added_rows_query}
+) added_rows
+ON {key_columns_match_clause}{update_clause}
+WHEN NOT MATCHED THEN
+  INSERT ({columns_clause}) VALUES ({columns_clause})"""
+
 
 def federated_bq_schema_refresh(
     schema_type: SchemaType,
     direct_ingest_instance: Optional[DirectIngestInstance] = None,
     dataset_override_prefix: Optional[str] = None,
+    incremental: bool = False,
 ) -> List[Table]:
-    """Performs a full refresh of BigQuery data for a given schema, pulling data from
+    """Performs a refresh of BigQuery data for a given schema, pulling data from
     the appropriate CloudSQL Postgres instance.
+
+    If |incremental| is set, tables that support incremental refresh (see
+    CloudSqlToBQConfig.get_incremental_refresh_watermark_column) only have the rows
+    added since the last refresh exported from CloudSQL. All other tables are always
+    refreshed in full.
     """
     if (
         direct_ingest_instance == DirectIngestInstance.SECONDARY
@@ -84,7 +107,7 @@ def federated_bq_schema_refresh(
     # Query CloudSQL and export data into datasets with regions that match the instance
     # region (e.g. us-east1)
     refreshed_states = _federated_bq_regional_dataset_refresh(
-        config, dataset_override_prefix
+        config, dataset_override_prefix, incremental
     )
 
     # Copy the regional datasets to their final resting place in multi-region datasets
@@ -133,12 +156,14 @@ def _save_status_in_bq(
 def _federated_bq_regional_dataset_refresh(
     config: CloudSqlToBQConfig,
     dataset_override_prefix: Optional[str] = None,
+    incremental: bool = False,
 ) -> Optional[List[StateCode]]:
     """Queries data in the appropriate CloudSQL instance for the given schema / config
     and loads it into a single, unified dataset **in the same** region as the CloudSQL
     instance. In the process, creates / updates views that provide direct federated
     connections to the CloudSQL instance and intermediate state-segmented datasets
-    (where appropriate).
+    (where appropriate). If |incremental| is set, tables that support incremental
+    refresh are only updated with the rows added since the last refresh.
 
     Returns the list of states that the data was refreshed for if this is a
     state-segmented schema, or None if it is not.
@@ -200,15 +225,28 @@ def _federated_bq_regional_dataset_refresh(
             view_builders=view_builders,
         )
 
+    refresh_incrementally = incremental and any(
+        config.get_incremental_refresh_watermark_column(view_builder.table)
+        for view_builder in view_builders
+    )
+
     create_managed_dataset_and_deploy_views_for_view_builders(
         view_source_table_datasets=set(),
         view_builders_to_update=view_builders,
         address_overrides=address_overrides,
         bq_region_override=bq_region_override,
-        force_materialize=True,
+        # When refreshing incrementally, only views that are new or have changed are
+        # materialized on deploy so that every table exists before it is refreshed
+        # below.
+        force_materialize=not refresh_incrementally,
         historically_managed_datasets_to_clean=historically_managed_datasets_for_schema,
     )
 
+    if refresh_incrementally:
+        _refresh_materialized_tables_incrementally(
+            config, view_builders, bq_region_override, address_overrides
+        )
+
     if config.is_state_segmented_refresh_schema():
         _hydrate_unioned_regional_dataset_for_schema(
             config,
@@ -219,6 +257,144 @@ def _federated_bq_regional_dataset_refresh(
     return states_that_will_be_refreshed
 
 
+def _refresh_materialized_tables_incrementally(
+    config: CloudSqlToBQConfig,
+    view_builders: List[FederatedCloudSQLTableBigQueryViewBuilder],
+    bq_region_override: Optional[str],
+    address_overrides: Optional[BigQueryAddressOverrides],
+) -> None:
+    """Refreshes the materialized table for each of the federated views. Tables that
+    support incremental refresh have the rows added since their last refresh merged
+    in, all other tables are re-materialized in full.
+    """
+    bq_client = BigQueryClientImpl(region_override=bq_region_override)
+
+    def refresh_table(view_builder: FederatedCloudSQLTableBigQueryViewBuilder) -> None:
+        watermark_column = config.get_incremental_refresh_watermark_column(
+            view_builder.table
+        )
+        if watermark_column is None:
+            bq_client.materialize_view_to_table(
+                view=view_builder.build(address_overrides=address_overrides),
+                use_query_cache=False,
+            )
+            return
+        _merge_rows_added_since_last_refresh(
+            bq_client, config, view_builder, watermark_column, address_overrides
+        )
+
+    with futures.ThreadPoolExecutor(
+        # Conservatively allow only half as many workers as allowed connections.
+        # Lower this number if we see "urllib3.connectionpool:Connection pool is
+        # full, discarding connection" errors.
+        max_workers=int(BQ_CLIENT_MAX_POOL_SIZE / 2)
+    ) as executor:
+        refresh_futures = {
+            executor.submit(
+                structured_logging.with_context(refresh_table), view_builder
+            )
+            for view_builder in view_builders
+        }
+        for future in futures.as_completed(refresh_futures):
+            future.result()
+
+
+def _merge_rows_added_since_last_refresh(
+    bq_client: BigQueryClient,
+    config: CloudSqlToBQConfig,
+    view_builder: FederatedCloudSQLTableBigQueryViewBuilder,
+    watermark_column: str,
+    address_overrides: Optional[BigQueryAddressOverrides],
+) -> None:
+    """Exports the rows added to a CloudSQL table since the largest |watermark_column|
+    value in its materialized table and merges them into that table. Rows within the
+    table's safety window below that value are re-exported too, so that rows whose
+    transactions committed late are not skipped; merging on primary key makes this
+    idempotent.
+    """
+    if view_builder.materialized_address is None:
+        raise ValueError(
+            f"Expected view [{view_builder.view_id}] to have a materialized address."
+        )
+    view = view_builder.build(address_overrides=address_overrides)
+    if view.materialized_address is None:
+        raise ValueError(f"Expected view [{view.address}] to be materialized.")
+    materialized_table = view.materialized_address.to_project_specific_address(
+        view.project
+    ).format_address_for_query()
+
+    watermark_query_job = bq_client.run_query_async(
+        query_str=f"SELECT MAX({watermark_column}) AS watermark FROM {materialized_table}",
+        use_query_cache=False,
+    )
+    watermark = one(watermark_query_job)["watermark"]
+    table = view_builder.table
+    if watermark is not None:
+        watermark = config.get_incremental_refresh_lower_bound(table, watermark)
+    logging.info(
+        "Merging rows added to [%s] since [%s] into [%s]",
+        view.address.to_str(),
+        watermark,
+        view.materialized_address.to_str(),
+    )
+
+    if view_builder.state_code:
+        added_rows_cloud_sql_query = (
+            config.get_single_state_table_federated_export_query(
+                table, view_builder.state_code, watermark=watermark
+            )
+        )
+    else:
+        added_rows_cloud_sql_query = config.get_table_federated_export_query(
+            table.name, watermark=watermark
+        )
+    added_rows_view = FederatedCloudSQLTableBigQueryViewBuilder(
+        connection_region=view_builder.connection_region,
+        table=table,
+        view_id=view_builder.view_id,
+        database_key=view_builder.database_key,
+        cloud_sql_query=added_rows_cloud_sql_query,
+        materialized_address_override=view_builder.materialized_address,
+        state_code=view_builder.state_code,
+    ).build(address_overrides=address_overrides)
+
+    bq_client.run_query_async(
+        query_str=_get_merge_added_rows_query(
+            table, materialized_table, added_rows_view.view_query
+        ),
+        use_query_cache=False,
+    ).result()
+
+
+def _get_merge_added_rows_query(
+    table: Table, materialized_table: str, added_rows_query: str
+) -> str:
+    """Returns a MERGE statement that inserts the rows returned by |added_rows_query|
+    into the |materialized_table|, overwriting any rows with the same primary key.
+    """
+    columns = [column.name for column in table.columns]
+    key_columns = [column.name for column in table.primary_key.columns]
+    non_key_columns = [column for column in columns if column not in key_columns]
+
+    update_clause = ""
+    if non_key_columns:
+        update_columns = ", ".join(
+            f"{column} = added_rows.{column}" for column in non_key_columns
+        )
+        update_clause = f"\nWHEN MATCHED THEN\n  UPDATE SET {update_columns}"
+
+    return StrictStringFormatter().format(
+        MERGE_ADDED_ROWS_QUERY_TEMPLATE,
+        materialized_table=materialized_table,
+        added_rows_query=added_rows_query,
+        key_columns_match_clause=" AND ".join(
+            f"materialized.{column} = added_rows.{column}" for column in key_columns
+        ),
+        update_clause=update_clause,
+        columns_clause=", ".join(columns),
+    )
+
+
 def _copy_regional_dataset_to_multi_region(
     config: CloudSqlToBQConfig, dataset_override_prefix: Optional[str]
 ) -> None:
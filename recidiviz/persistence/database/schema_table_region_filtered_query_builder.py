@@ -19,8 +19,9 @@
     BigQuery tables. For association tables, a join clause is added to filter for region codes via their associated
     table.
 """
+import datetime
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Union
 
 import sqlalchemy
 from more_itertools import one
@@ -263,6 +264,9 @@ class FederatedSchemaTableRegionFilteredQueryBuilder(
     restrictions on the output columns that we must handle when doing this type of
     query. This query also handles primary/foreign key translation in the case where
     we're querying a multi-DB schema.
+
+    If a |watermark| is provided, only rows whose |watermark_column| value is greater
+    than the watermark are returned.
     """
 
     def __init__(
@@ -272,6 +276,8 @@ class FederatedSchemaTableRegionFilteredQueryBuilder(
         table: Table,
         columns_to_include: List[str],
         region_code: Optional[str],
+        watermark_column: Optional[str] = None,
+        watermark: Optional[Union[int, datetime.datetime]] = None,
     ):
         super().__init__(
             schema_type=schema_type,
@@ -288,6 +294,14 @@ class FederatedSchemaTableRegionFilteredQueryBuilder(
         self.should_translate_key_columns = should_translate_key_columns
         self.region_code = region_code
 
+        if watermark is not None and watermark_column is None:
+            raise ValueError(
+                f"Must provide a watermark_column to filter [{self.table_name}] by "
+                f"watermark [{watermark}]."
+            )
+        self.watermark_column = watermark_column
+        self.watermark = watermark
+
     def _key_columns_to_translate(self) -> Set[str]:
         """Returns a list of column names corresponding to columns in this table that
         are primary/foreign keys and should have a region mask applied to prevent
@@ -345,6 +359,29 @@ class FederatedSchemaTableRegionFilteredQueryBuilder(
         mask = self._get_translated_key_column_mask()
         return f"({mask} + {qualified_column_name}) AS {column_name}"
 
+    def filter_clause(self) -> Optional[str]:
+        region_filter_clause = super().filter_clause()
+        if self.watermark is None:
+            return region_filter_clause
+
+        watermark_filter = (
+            f"{self.table_name}.{self.watermark_column} > "
+            f"{self._format_watermark_for_sql(self.watermark)}"
+        )
+        if region_filter_clause is None:
+            return f"WHERE {watermark_filter}"
+        return f"{region_filter_clause} AND {watermark_filter}"
+
+    @staticmethod
+    def _format_watermark_for_sql(watermark: Union[int, datetime.datetime]) -> str:
+        """Format a watermark value to use in a SQL string
+        _format_watermark_for_sql(123) --> "123"
+        _format_watermark_for_sql(datetime(2023, 1, 2, 3, 4, 5)) --> "'2023-01-02T03:04:05'"
+        """
+        if isinstance(watermark, datetime.datetime):
+            return f"'{watermark.isoformat()}'"
+        return str(int(watermark))
+
     def _formatted_columns_for_select_clause(self) -> str:
         qualified_names_map = self.qualified_column_names_map(
             self.columns_to_include, table_prefix=self.table_name
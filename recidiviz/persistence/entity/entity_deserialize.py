@@ -18,7 +18,7 @@
 import datetime
 from abc import abstractmethod
 from enum import Enum
-from typing import Any, Callable, Dict, Generic, Optional, Type, Union
+from typing import Any, Callable, Dict, FrozenSet, Generic, Optional, Tuple, Type, Union
 
 import attr
 
@@ -68,6 +68,114 @@ class EntityFieldConverter(Generic[T]):
         return self.conversion_function(field_value)
 
 
+# Pick an arbitrary from_dt so parsing is deterministic (used for parsing strings like
+# 10Y 1D into dates).
+_PARSE_FROM_DT = datetime.datetime(2020, 1, 1)
+
+FieldValueConverter = Callable[[DeserializableEntityFieldValue], Any]
+
+
+def _parse_datetime_field(field_value: str) -> Optional[datetime.datetime]:
+    return parse_datetime(field_value, from_dt=_PARSE_FROM_DT)
+
+
+def _parse_date_field(field_value: str) -> Optional[datetime.date]:
+    return parse_date(field_value, from_dt=_PARSE_FROM_DT)
+
+
+def _build_field_value_converter(field: attr.Attribute) -> FieldValueConverter:
+    """Returns a function that converts a non-null field value for this field into the
+    normalized value passed to the entity constructor. The attribute type checks are
+    done once here rather than for every value.
+    """
+    field_is_str = is_str(field)
+
+    # How a string value is parsed for this field type, if at all
+    str_parser: Optional[Callable[[str], Any]] = None
+    if field_is_str:
+        str_parser = normalize
+    elif is_datetime(field):
+        str_parser = _parse_datetime_field
+    elif is_date(field):
+        str_parser = _parse_date_field
+    elif is_int(field):
+        str_parser = parse_int
+    elif is_bool(field):
+        str_parser = parse_bool
+
+    # Non-string values of these types are passed through as-is
+    passthrough_types: Tuple[type, ...] = tuple(
+        field_type
+        for field_type, matches_field in (
+            (Enum, is_enum(field)),
+            (datetime.datetime, is_datetime(field)),
+            (datetime.date, is_date(field)),
+            (int, is_int(field)),
+            (bool, is_bool(field)),
+        )
+        if matches_field
+    )
+    passthrough_all = is_forward_ref(field) or is_list(field)
+
+    def convert_field_value(field_value: DeserializableEntityFieldValue) -> Any:
+        if isinstance(field_value, str) and str_parser is not None:
+            return str_parser(field_value)
+
+        if isinstance(field_value, NormalizedJSON) and field_is_str:
+            return field_value.normalized_value
+
+        if isinstance(field_value, passthrough_types):
+            return field_value
+
+        if passthrough_all:
+            return field_value
+
+        raise ValueError(
+            f"Unsupported field {field.name} with value: "
+            f"{field_value} ({type(field_value)})."
+        )
+
+    return convert_field_value
+
+
+@attr.s(frozen=True)
+class _EntityDeserializePlan:
+    """The field conversions for an Entity class, compiled once per class."""
+
+    field_names: FrozenSet[str] = attr.ib()
+    field_converters: Dict[str, FieldValueConverter] = attr.ib()
+
+
+# Compiled deserialize plans, by Entity class
+_ENTITY_DESERIALIZE_PLANS: Dict[Type[Entity], _EntityDeserializePlan] = {}
+
+
+def _get_entity_deserialize_plan(cls: Type[EntityT]) -> _EntityDeserializePlan:
+    if cls in _ENTITY_DESERIALIZE_PLANS:
+        return _ENTITY_DESERIALIZE_PLANS[cls]
+
+    if not is_attr_decorated(cls):
+        raise ValueError(
+            f"Can only deserialize attrs classes with entity_deserialize() - found class [{cls}]."
+        )
+
+    if not issubclass(cls, Entity):
+        raise ValueError(
+            f"Can only deserialize Entity classes with entity_deserialize() - found class [{cls}]."
+        )
+
+    field_converters = tuple(
+        (field_name, _build_field_value_converter(field_))
+        for field_name, field_ in attr.fields_dict(cls).items()
+    )
+    plan = _EntityDeserializePlan(
+        field_names=frozenset(field_name for field_name, _ in field_converters),
+        field_converters=dict(field_converters),
+    )
+    _ENTITY_DESERIALIZE_PLANS[cls] = plan
+    return plan
+
+
 def entity_deserialize(
     cls: Type[EntityT],
     converter_overrides: Dict[str, EntityFieldConverter],
@@ -85,106 +193,39 @@ def entity_deserialize(
     default value that will override any null field value, pass in the default via the
     |defaults| map.
     """
+    plan = _get_entity_deserialize_plan(cls)
 
-    if not is_attr_decorated(cls):
-        raise ValueError(
-            f"Can only deserialize attrs classes with entity_deserialize() - found class [{cls}]."
-        )
-
-    if not issubclass(cls, Entity):
+    unexpected_kwargs = kwargs.keys() - plan.field_names
+    if unexpected_kwargs:
+        # Throw if there are unexpected args. NOTE: if there are missing required args,
+        # that will be caught by the object construction itself.
         raise ValueError(
-            f"Can only deserialize Entity classes with entity_deserialize() - found class [{cls}]."
+            f"Unexpected kwargs for class [{cls.__name__}]: {unexpected_kwargs}"
         )
 
-    def convert_field_value(
-        field: attr.Attribute, field_value: DeserializableEntityFieldValue
-    ) -> Any:
-        if field_value is None:
-            return None
-
-        if isinstance(field_value, str):
-            if not field_value or not field_value.strip():
-                return None
-
-        if field.name in converter_overrides:
-            converter = converter_overrides[field.name]
+    converted_args: Dict[str, Any] = {}
+    for field_name, field_value in kwargs.items():
+        if field_value is None or (
+            isinstance(field_value, str) and not field_value.strip()
+        ):
+            converted_args[field_name] = None
+        elif field_name in converter_overrides:
+            converter = converter_overrides[field_name]
             if not isinstance(field_value, converter.field_type):
                 raise ValueError(
-                    f"Found converter for field [{field.name}] in the converter_overrides, but expected "
+                    f"Found converter for field [{field_name}] in the converter_overrides, but expected "
                     f"field type [{converter.field_type}] does not match actual field type "
                     f"[{type(field_value)}]"
                 )
-            return converter.convert(field_value)
-
-        if isinstance(field_value, NormalizedJSON):
-            if is_str(field):
-                return field_value.normalized_value
-
-        if isinstance(field_value, str):
-            if is_str(field):
-                return normalize(field_value)
-            if is_datetime(field):
-                # Pick an arbitrary from_dt so parsing is deterministic (used for
-                # parsing strings like 10Y 1D into dates).
-                return parse_datetime(
-                    field_value, from_dt=datetime.datetime(2020, 1, 1)
-                )
-            if is_date(field):
-                # Pick an arbitrary from_dt so parsing is deterministic (used for
-                # parsing strings like 10Y 1D into dates).
-                return parse_date(field_value, from_dt=datetime.datetime(2020, 1, 1))
-            if is_int(field):
-                return parse_int(field_value)
-            if is_bool(field):
-                return parse_bool(field_value)
-
-        if isinstance(field_value, Enum):
-            if is_enum(field):
-                return field_value
-
-        if isinstance(field_value, datetime.datetime):
-            if is_datetime(field):
-                return field_value
-
-        if isinstance(field_value, datetime.date):
-            if is_date(field):
-                return field_value
-
-        if isinstance(field_value, int):
-            if is_int(field):
-                return field_value
-
-        if isinstance(field_value, bool):
-            if is_bool(field):
-                return field_value
-
-        if is_forward_ref(field) or is_list(field):
-            return field_value
+            converted_args[field_name] = converter.convert(field_value)
+        else:
+            converted_args[field_name] = plan.field_converters[field_name](field_value)
 
-        raise ValueError(
-            f"Unsupported field {field.name} with value: "
-            f"{field_value} ({type(field_value)})."
-        )
-
-    converted_args = {}
-    fields = set()
-    for field_name, field_ in attr.fields_dict(cls).items():
-        if field_name in kwargs:
-            converted_args[field_name] = convert_field_value(field_, kwargs[field_name])
-        if field_name in defaults:
-            if converted_args.get(field_name, None) is None:
-                converted_args[field_name] = defaults[field_name]
-        fields.add(field_name)
-
-    unexpected_kwargs = set(kwargs.keys()).difference(fields)
-    if unexpected_kwargs:
-        # Throw if there are unexpected args. NOTE: if there are missing required args,
-        # that will be caught by the object construction itself.
-        raise ValueError(
-            f"Unexpected kwargs for class [{cls.__name__}]: {unexpected_kwargs}"
-        )
+    for field_name, default in defaults.items():
+        if field_name in plan.field_names and converted_args.get(field_name) is None:
+            converted_args[field_name] = default
 
-    return cls(**converted_args)  # type: ignore[call-arg]
+    return cls(**converted_args)
 
 
 class EntityFactory(Generic[EntityT]):
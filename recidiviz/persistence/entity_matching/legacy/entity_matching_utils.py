@@ -16,7 +16,19 @@
 # =============================================================================
 """Contains utils for match database entities with ingested entities."""
 
-from typing import Callable, List, Optional, Sequence, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 from recidiviz.persistence.entity.core_entity import CoreEntity
 from recidiviz.persistence.entity.entity_utils import CoreEntityFieldIndex
@@ -88,3 +100,51 @@ def get_all_matches(
             field_index=field_index,
         )
     ]
+
+
+# A key for a match object, where the first two values are the class and state code of
+# the entity and the rest are the values of the fields it is matched on.
+MatchKey = Tuple[Any, ...]
+
+
+class MatchCandidateIndex(Generic[MatchObject]):
+    """Index of |db_entities| by match key, so that the candidates that can match an
+    ingested entity are found with one lookup instead of by comparing against every
+    DB entity.
+
+    The |key_fn| must return keys such that two objects with the same class and
+    state code match exactly when their keys are equal, or None if the object can
+    only be matched by comparing it with each candidate. If any DB entity has no key,
+    or the DB entities do not all share the ingested entity's class and state code,
+    all DB entities are returned as candidates.
+    """
+
+    def __init__(
+        self,
+        db_entities: Sequence[MatchObject],
+        key_fn: Callable[[MatchObject], Optional[MatchKey]],
+    ) -> None:
+        self._db_entities: Sequence[MatchObject] = db_entities
+        self._key_fn: Callable[[MatchObject], Optional[MatchKey]] = key_fn
+        self._db_entities_by_key: Optional[Dict[MatchKey, List[MatchObject]]] = {}
+        self._class_and_state_codes: Set[MatchKey] = set()
+
+        for db_entity in db_entities:
+            key = key_fn(db_entity)
+            if key is None:
+                self._db_entities_by_key = None
+                break
+            self._class_and_state_codes.add(key[:2])
+            self._db_entities_by_key.setdefault(key, []).append(db_entity)
+
+    def get_candidates(self, ingested_entity: MatchObject) -> Sequence[MatchObject]:
+        """Returns the DB entities that may match the |ingested_entity|, in their
+        original order."""
+        if self._db_entities_by_key is None or not self._db_entities:
+            return self._db_entities
+
+        key = self._key_fn(ingested_entity)
+        if key is None or self._class_and_state_codes != {key[:2]}:
+            return self._db_entities
+
+        return self._db_entities_by_key.get(key, [])
@@ -21,7 +21,7 @@ ingested entities.
 import datetime
 import logging
 from collections import defaultdict
-from typing import Dict, Generic, List, Optional, Set, Tuple, Type
+from typing import Dict, Generic, List, Optional, Sequence, Set, Tuple, Type
 
 from more_itertools import one
 
@@ -60,6 +60,7 @@ from recidiviz.persistence.entity_matching.legacy.state.state_matching_utils imp
     db_id_or_object_id,
     generate_child_entity_trees,
     get_all_root_entity_external_ids,
+    get_match_key,
     get_multiparent_classes,
     get_root_entity_external_ids,
     is_match,
@@ -514,11 +515,15 @@ class StateEntityMatcher(Generic[RootEntityT, SchemaRootEntityT]):
         individual_match_results: List[IndividualMatchResult] = []
         matched_entities_by_db_id: Dict[int, List[DatabaseEntity]] = {}
         error_count = 0
+        db_entity_tree_index = entity_matching_utils.MatchCandidateIndex(
+            db_entity_trees, get_match_key
+        )
         for ingested_entity_tree in ingested_entity_trees:
             try:
                 match_result = self._match_entity_tree(
                     ingested_entity_tree=ingested_entity_tree,
                     db_entity_trees=db_entity_trees,
+                    db_entity_tree_index=db_entity_tree_index,
                     matched_entities_by_db_ids=matched_entities_by_db_id,
                     root_entity_cls=root_entity_cls,
                 )
@@ -574,13 +579,15 @@ class StateEntityMatcher(Generic[RootEntityT, SchemaRootEntityT]):
         *,
         ingested_entity_tree: EntityTree,
         db_entity_trees: List[EntityTree],
+        db_entity_tree_index: entity_matching_utils.MatchCandidateIndex[EntityTree],
         matched_entities_by_db_ids: Dict[int, List[DatabaseEntity]],
         root_entity_cls: Type,
     ) -> IndividualMatchResult:
         """Attempts to match the provided |ingested_entity_tree| to one of the
-        provided |db_entity_trees|. If a successful match is found, merges the
-        ingested entity onto the matching database entity and performs entity
-        matching on all children of the matched entities.
+        provided |db_entity_trees|, which are indexed in |db_entity_tree_index|. If
+        a successful match is found, merges the ingested entity onto the matching
+        database entity and performs entity matching on all children of the matched
+        entities.
         Returns the results of matching as an IndividualMatchResult.
         """
 
@@ -592,7 +599,7 @@ class StateEntityMatcher(Generic[RootEntityT, SchemaRootEntityT]):
                 root_entity_cls=root_entity_cls,
             )
 
-        db_match_tree = self._get_match(ingested_entity_tree, db_entity_trees)
+        db_match_tree = self._get_match(ingested_entity_tree, db_entity_tree_index)
 
         if not db_match_tree:
             return self._match_unmatched_tree(
@@ -1048,18 +1055,26 @@ class StateEntityMatcher(Generic[RootEntityT, SchemaRootEntityT]):
         return cached_matches
 
     def _get_match(
-        self, ingested_entity_tree: EntityTree, db_entity_trees: List[EntityTree]
+        self,
+        ingested_entity_tree: EntityTree,
+        db_entity_tree_index: entity_matching_utils.MatchCandidateIndex[EntityTree],
     ) -> Optional[EntityTree]:
         """With the provided |ingested_entity_tree|, this attempts to find a
-        match among the provided |db_entity_trees|. If a match is found, it is
-        returned.
+        match among the DB entity trees in the provided |db_entity_tree_index|. If a
+        match is found, it is returned.
         """
-        db_match_candidates = db_entity_trees
+        db_match_candidates: Sequence[EntityTree]
         if isinstance(
             ingested_entity_tree.entity,
             self.schema_root_entity_cls,
         ):
             db_match_candidates = self.get_cached_matches(ingested_entity_tree.entity)
+        else:
+            # Only compare against the DB trees that can match, which are looked up
+            # by the identifying fields of the ingested entity when possible.
+            db_match_candidates = db_entity_tree_index.get_candidates(
+                ingested_entity_tree
+            )
 
         # Entities that can have multiple external IDs need special casing to
         # handle the fact that multiple DB entities could match the provided
@@ -1085,7 +1100,7 @@ class StateEntityMatcher(Generic[RootEntityT, SchemaRootEntityT]):
         return exact_match
 
     def _get_only_match_for_multiple_id_entity(
-        self, ingested_entity_tree: EntityTree, db_entity_trees: List[EntityTree]
+        self, ingested_entity_tree: EntityTree, db_entity_trees: Sequence[EntityTree]
     ) -> Optional[EntityTree]:
         """Returns the DB EntityTree from |db_entity_trees| that matches
         the provided |ingested_entity_tree|, if one exists.
@@ -16,7 +16,7 @@
 # ============================================================================
 """State specific utils for entity matching. Utils in this file are generic to any DatabaseEntity."""
 from enum import Enum
-from typing import List, Set, Type, cast
+from typing import Dict, List, Optional, Set, Tuple, Type, cast
 
 from recidiviz.persistence.database.database_entity import DatabaseEntity
 from recidiviz.persistence.database.schema.state import schema
@@ -40,6 +40,7 @@ from recidiviz.persistence.entity.state import entities
 from recidiviz.persistence.entity_matching.legacy.entity_matching_types import (
     EntityTree,
 )
+from recidiviz.persistence.entity_matching.legacy.entity_matching_utils import MatchKey
 from recidiviz.persistence.errors import EntityMatchingError
 from recidiviz.persistence.persistence_utils import SchemaRootEntityT
 
@@ -139,6 +140,67 @@ def _is_match(
     return ingested_entity.get_external_id() == db_entity.get_external_id()
 
 
+# Cached names of the fields that _is_match compares for each class, or None if the
+# class is not matched on a fixed set of fields.
+_match_key_field_names_by_cls: Dict[
+    Type[DatabaseEntity], Optional[Tuple[str, ...]]
+] = {}
+
+
+def get_match_key(entity_tree: EntityTree) -> Optional[MatchKey]:
+    """Returns a key for the entity in the |entity_tree| such that two entities of
+    the same class and state are an is_match exactly when their keys are equal.
+
+    Returns None for entities matched on multiple external ids or on all of their flat
+    fields, which can only be matched by comparing them. The keyed fields are never
+    changed by merging an entity onto its match, so keys of DB entities stay valid
+    while the entities at one level are matched.
+    """
+    entity = entity_tree.entity
+    if not isinstance(entity, DatabaseEntity):
+        return None
+
+    entity_cls = entity.__class__
+    if entity_cls not in _match_key_field_names_by_cls:
+        _match_key_field_names_by_cls[entity_cls] = _get_match_key_field_names(
+            entity_cls
+        )
+    field_names = _match_key_field_names_by_cls[entity_cls]
+    if field_names is None:
+        return None
+
+    return (
+        entity_cls,
+        entity.get_field("state_code"),
+        *(entity.get_field(field_name) for field_name in field_names),
+    )
+
+
+def _get_match_key_field_names(
+    entity_cls: Type[DatabaseEntity],
+) -> Optional[Tuple[str, ...]]:
+    """Returns the names of the fields compared by _is_match for entities of the
+    |entity_cls|, or None if _is_match compares more than a fixed set of fields."""
+    class_mapper = SchemaToEntityClassMapper.get(
+        schema_module=schema, entities_module=entities
+    )
+    cls = class_mapper.entity_cls_for_schema_cls(entity_cls)
+
+    if issubclass(cls, HasMultipleExternalIdsEntity):
+        return None
+    if issubclass(cls, ExternalIdEntity):
+        return ("external_id", "id_type")
+    if issubclass(entity_cls, schema.StatePersonAlias):
+        return ("full_name",)
+    if issubclass(entity_cls, schema.StatePersonRace):
+        return ("race",)
+    if issubclass(entity_cls, schema.StatePersonEthnicity):
+        return ("ethnicity",)
+    if not issubclass(cls, HasExternalIdEntity):
+        return None
+    return ("external_id",)
+
+
 def nonnull_fields_entity_match(
     ingested_entity: EntityTree,
     db_entity: EntityTree,
@@ -83,6 +83,10 @@ from recidiviz.pipelines.dataflow_orchestration_utils import (
 from recidiviz.pipelines.ingest.state.generate_ingest_view_results import (
     ADDITIONAL_SCHEMA_COLUMNS,
 )
+from recidiviz.pipelines.ingest.state.incremental_ingest_state import (
+    INCREMENTAL_INGEST_STATE_SCHEMA,
+    INCREMENTAL_INGEST_STATE_TABLE_ID,
+)
 from recidiviz.pipelines.normalization.utils.entity_normalization_manager_utils import (
     NORMALIZATION_MANAGERS,
 )
@@ -462,6 +466,21 @@ def update_state_specific_ingest_view_result_schema(
                     schema_fields=final_schema,
                 )
 
+    if bq_client.table_exists(
+        ingest_view_dataset_ref, INCREMENTAL_INGEST_STATE_TABLE_ID
+    ):
+        bq_client.update_schema(
+            dataset_id=ingest_view_dataset_ref.dataset_id,
+            table_id=INCREMENTAL_INGEST_STATE_TABLE_ID,
+            desired_schema_fields=INCREMENTAL_INGEST_STATE_SCHEMA,
+        )
+    else:
+        bq_client.create_table_with_schema(
+            dataset_id=ingest_view_dataset_ref.dataset_id,
+            table_id=INCREMENTAL_INGEST_STATE_TABLE_ID,
+            schema_fields=INCREMENTAL_INGEST_STATE_SCHEMA,
+        )
+
 
 def update_state_specific_ingest_view_results_schemas(
     sandbox_dataset_prefix: Optional[str] = None,
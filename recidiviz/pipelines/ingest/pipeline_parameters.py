@@ -86,10 +86,33 @@ class IngestPipelineParameters(PipelineParameters):
         raw_json = json.loads(self.raw_data_upper_bound_dates_json)
         return dict(raw_json.items())
 
+    # The raw data upper bound dates used by the last successful run of the pipeline,
+    # i.e. the watermarks that the ingest view results and entities written by that
+    # run are up to date with.
+    raw_data_watermarks_json: Optional[str] = attr.ib(
+        default=None, validator=attr_validators.is_opt_str
+    )
+
+    @property
+    def raw_data_watermarks(self) -> Optional[Dict[str, str]]:
+        if self.raw_data_watermarks_json is None:
+            return None
+        raw_json = json.loads(self.raw_data_watermarks_json)
+        return dict(raw_json.items())
+
     ingest_views_to_run: Optional[str] = attr.ib(
         default=None, validator=attr_validators.is_opt_str
     )
 
+    # If set, only materializes ingest view results newer than the raw data watermarks
+    # of the last successful run and only re-processes the root entities with new
+    # results, if the state stored by that run is still valid.
+    incremental: bool = attr.ib(
+        default=False,
+        validator=attr_validators.is_bool,
+        converter=attr.converters.to_bool,
+    )
+
     @property
     def flex_template_name(self) -> str:
         return "ingest"
@@ -121,6 +144,24 @@ class IngestPipelineParameters(PipelineParameters):
                 "Invalid pipeline parameters for ingest_views_to_run. Cannot run a subset"
                 " of ingest views without specifying a sandbox dataset."
             )
+        if self.incremental and self.ingest_views_to_run:
+            raise ValueError(
+                "Invalid pipeline parameters for incremental. Cannot run a subset of "
+                "ingest views incrementally."
+            )
+        if self.incremental and self.ingest_view_results_only:
+            raise ValueError(
+                "Invalid pipeline parameters for incremental. Cannot only output "
+                "ingest view results incrementally."
+            )
+        if (
+            self.incremental
+            and self.materialization_method != MaterializationMethod.ORIGINAL.value
+        ):
+            raise ValueError(
+                "Invalid pipeline parameters for incremental. Incremental runs require "
+                f"the {MaterializationMethod.ORIGINAL.value} materialization method."
+            )
 
     @classmethod
     def get_sandboxable_dataset_param_names(cls) -> List[str]:
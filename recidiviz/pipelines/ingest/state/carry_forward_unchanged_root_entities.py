@@ -0,0 +1,206 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""PTransforms used by incremental ingest pipeline runs, which only re-process the root
+entities that have new ingest view results and carry forward the output of every other
+root entity from the previous run."""
+from typing import Any, Dict, Iterable, Iterator, Set, Tuple, Union, cast
+
+import apache_beam as beam
+
+from recidiviz.persistence.database.schema.state import schema as state_schema
+from recidiviz.persistence.database.schema_utils import (
+    get_database_entities_by_association_table,
+    get_state_table_classes,
+    is_association_table,
+)
+from recidiviz.persistence.entity.generate_primary_key import PrimaryKey
+from recidiviz.persistence.entity.state.entities import StatePerson, StateStaff
+from recidiviz.pipelines.ingest.state.associate_with_primary_keys import PRIMARY_KEYS
+from recidiviz.pipelines.ingest.state.constants import ExternalIdKey
+from recidiviz.pipelines.utils.beam_utils.bigquery_io_utils import ReadFromBigQuery
+
+CHANGED_EXTERNAL_IDS = "changed_external_ids"
+PRIMARY_KEY_CHANGES = "primary_key_changes"
+ROOT_ENTITIES_BY_PRIMARY_KEY = "root_entities_by_primary_key"
+PREVIOUS_ROWS = "previous_rows"
+CARRIED_FORWARD_IDS = "carried_forward_ids"
+
+
+class GetPrimaryKeyChanges(beam.PTransform):
+    """A PTransform that determines which root entity primary keys have new ingest view
+    results.
+
+    The input to this PTransform is a Dict[str, beam.PCollection] where the keys are
+        {
+            "primary_keys": beam.PCollection[Tuple[ExternalIdKey, PrimaryKey]],
+            "changed_external_ids": beam.PCollection[ExternalIdKey]
+        }
+    The output is a PCollection[Tuple[PrimaryKey, bool]] with one element per primary key,
+    which is True if any external id in that primary key's cluster has new results.
+    """
+
+    def expand(
+        self, input_or_inputs: Dict[str, beam.PCollection]
+    ) -> beam.PCollection[Tuple[PrimaryKey, bool]]:
+        return (
+            {
+                PRIMARY_KEYS: input_or_inputs[PRIMARY_KEYS],
+                CHANGED_EXTERNAL_IDS: input_or_inputs[CHANGED_EXTERNAL_IDS]
+                | "Key changed external ids" >> beam.Map(lambda key: (key, True)),
+            }
+            | "CoGroup primary keys and changed external ids by external id"
+            >> beam.CoGroupByKey()
+            | "Mark primary keys of changed external ids"
+            >> beam.FlatMap(self.mark_primary_key_changes)
+            | "Combine changes by primary key" >> beam.CombinePerKey(any)
+        )
+
+    @staticmethod
+    def mark_primary_key_changes(
+        element: Tuple[
+            ExternalIdKey, Dict[str, Union[Iterable[PrimaryKey], Iterable[bool]]]
+        ]
+    ) -> Iterator[Tuple[PrimaryKey, bool]]:
+        _, values = element
+        is_changed = any(values[CHANGED_EXTERNAL_IDS])
+        for primary_key in cast(Iterable[PrimaryKey], values[PRIMARY_KEYS]):
+            yield primary_key, is_changed
+
+
+class FilterToChangedRootEntities(beam.PTransform):
+    """A PTransform that keeps only the root entities whose primary key has new ingest
+    view results.
+
+    The input to this PTransform is a Dict[str, beam.PCollection] where the keys are
+        {
+            "primary_key_changes": beam.PCollection[Tuple[PrimaryKey, bool]],
+            "root_entities_by_primary_key": beam.PCollection[Tuple[PrimaryKey, Any]]
+        }
+    The output is the PCollection[Tuple[PrimaryKey, Any]] of elements whose primary
+    key is changed.
+    """
+
+    def expand(
+        self, input_or_inputs: Dict[str, beam.PCollection]
+    ) -> beam.PCollection[Tuple[PrimaryKey, Any]]:
+        return (
+            input_or_inputs
+            | "CoGroup root entities with primary key changes" >> beam.CoGroupByKey()
+            | "Keep root entities with changes" >> beam.FlatMap(self.changed_elements)
+        )
+
+    @staticmethod
+    def changed_elements(
+        element: Tuple[PrimaryKey, Dict[str, Iterable[Any]]]
+    ) -> Iterator[Tuple[PrimaryKey, Any]]:
+        primary_key, values = element
+        if not any(values[PRIMARY_KEY_CHANGES]):
+            return
+        for value in values[ROOT_ENTITIES_BY_PRIMARY_KEY]:
+            yield primary_key, value
+
+
+class CarryForwardUnchangedRows(beam.PTransform):
+    """A PTransform that reads the rows written to each of |output_tables| in
+    |output_dataset| by the last successful pipeline run and returns the rows that belong to
+    root entities that still exist and have no new ingest view results.
+
+    The input to this PTransform is the PCollection[Tuple[PrimaryKey, bool]] output by
+    GetPrimaryKeyChanges. The output is a Dict[str, beam.PCollection[Dict[str, Any]]]
+    of rows to carry forward, keyed by table name.
+    """
+
+    def __init__(
+        self, project_id: str, output_dataset: str, output_tables: Set[str]
+    ) -> None:
+        super().__init__()
+        self.project_id = project_id
+        self.output_dataset = output_dataset
+        self.output_tables = output_tables
+
+    def expand(
+        self, input_or_inputs: beam.PCollection[Tuple[PrimaryKey, bool]]
+    ) -> Dict[str, beam.PCollection[Dict[str, Any]]]:
+        tables_by_name = {table.name: table for table in get_state_table_classes()}
+
+        carried_forward_rows: Dict[str, beam.PCollection[Dict[str, Any]]] = {}
+        # Association tables are handled last since they are carried forward based on
+        # the rows carried forward for one of the tables they associate.
+        for table_name in sorted(self.output_tables, key=is_association_table):
+            previous_rows = self._read_previous_rows(input_or_inputs, table_name)
+
+            if is_association_table(table_name):
+                _, child_member = get_database_entities_by_association_table(
+                    state_schema, table_name
+                )
+                id_column = child_member.get_primary_key_column_name()
+                carried_forward_ids = carried_forward_rows[
+                    child_member.get_entity_name()
+                ] | f"Get carried forward {table_name} ids" >> beam.Map(
+                    lambda row, id_column=id_column: (row[id_column], True)
+                )
+            else:
+                id_column = self._root_entity_id_column(
+                    table_name, tables_by_name[table_name].columns.keys()
+                )
+                carried_forward_ids = input_or_inputs | (
+                    f"Get unchanged primary keys for {table_name}"
+                    >> beam.Map(lambda element: (element[0], not element[1]))
+                )
+
+            carried_forward_rows[table_name] = (
+                {
+                    CARRIED_FORWARD_IDS: carried_forward_ids,
+                    PREVIOUS_ROWS: previous_rows
+                    | f"Key previous {table_name} rows"
+                    >> beam.Map(lambda row, id_column=id_column: (row[id_column], row)),
+                }
+                | f"CoGroup previous {table_name} rows" >> beam.CoGroupByKey()
+                | f"Keep {table_name} rows to carry forward"
+                >> beam.FlatMap(self.rows_to_carry_forward)
+            )
+        return carried_forward_rows
+
+    def _read_previous_rows(
+        self, input_or_inputs: beam.PCollection, table_name: str
+    ) -> beam.PCollection[Dict[str, Any]]:
+        return (
+            input_or_inputs.pipeline
+            | f"Read previous {table_name} rows"
+            >> ReadFromBigQuery(
+                query=f"SELECT * FROM `{self.project_id}.{self.output_dataset}.{table_name}`"
+            )
+        )
+
+    @staticmethod
+    def _root_entity_id_column(table_name: str, column_names: Iterable[str]) -> str:
+        for root_entity_cls in (StatePerson, StateStaff):
+            id_column = root_entity_cls.get_class_id_name()
+            if id_column in column_names:
+                return id_column
+        raise ValueError(f"Found no root entity id column in table [{table_name}]")
+
+    @staticmethod
+    def rows_to_carry_forward(
+        element: Tuple[Any, Dict[str, Iterable[Any]]]
+    ) -> Iterator[Dict[str, Any]]:
+        _, values = element
+        # An id that has no carried forward value belongs to a root entity that has
+        # changed or no longer exists.
+        if not any(values[CARRIED_FORWARD_IDS]):
+            return
+        yield from values[PREVIOUS_ROWS]
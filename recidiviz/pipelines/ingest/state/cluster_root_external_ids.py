@@ -15,7 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """A PTransform to cluster root entity IDs together."""
-from collections import defaultdict
 from typing import Dict, Generator, List, Set
 
 import apache_beam as beam
@@ -112,48 +111,115 @@ class ClusterRootExternalIds(beam.PTransform):
             yield (external_id, external_ids_in_cluster)
 
 
+class ExternalIdDisjointSet:
+    """A disjoint-set (union-find) forest of external ids, where each tree is a cluster
+    of external ids that are linked to each other directly or transitively.
+
+    Unioning two clusters only relinks the root of the smaller cluster, so the cost of
+    building a cluster grows almost linearly with its size rather than quadratically.
+    """
+
+    def __init__(self) -> None:
+        self._parents: Dict[ExternalIdKey, ExternalIdKey] = {}
+        self._sizes: Dict[ExternalIdKey, int] = {}
+
+    def find(self, external_id: ExternalIdKey) -> ExternalIdKey:
+        """Returns the root external id of the cluster containing |external_id|,
+        adding it as its own cluster if it has not been seen before."""
+        if external_id not in self._parents:
+            self._parents[external_id] = external_id
+            self._sizes[external_id] = 1
+            return external_id
+
+        root = external_id
+        while self._parents[root] != root:
+            root = self._parents[root]
+
+        # Path compression, so that later finds on this path are constant time
+        while self._parents[external_id] != root:
+            self._parents[external_id], external_id = root, self._parents[external_id]
+
+        return root
+
+    def union(
+        self, external_id: ExternalIdKey, other_external_id: ExternalIdKey
+    ) -> None:
+        """Merges the clusters containing the two external ids."""
+        root = self.find(external_id)
+        other_root = self.find(other_external_id)
+        if root == other_root:
+            return
+        if self._sizes[root] < self._sizes[other_root]:
+            root, other_root = other_root, root
+        self._parents[other_root] = root
+        self._sizes[root] += self._sizes.pop(other_root)
+
+    def union_all(self, other: "ExternalIdDisjointSet") -> None:
+        """Merges every cluster in |other| into this disjoint set."""
+        for external_id, parent in other._parents.items():
+            self.union(external_id, parent)
+
+    def clusters(self) -> Dict[ExternalIdKey, Set[ExternalIdKey]]:
+        """Returns a dictionary mapping every external id to the set of external ids in
+        its cluster. All members of a cluster share the same set."""
+        clusters_by_root: Dict[ExternalIdKey, Set[ExternalIdKey]] = {}
+        for external_id in self._parents:
+            clusters_by_root.setdefault(self.find(external_id), set()).add(external_id)
+        return {
+            external_id: clusters_by_root[self.find(external_id)]
+            for external_id in self._parents
+        }
+
+    def __getstate__(self) -> Dict[str, Dict[ExternalIdKey, ExternalIdKey]]:
+        # Serialize every external id with its root only, the sizes can be rebuilt.
+        # The state is wrapped so that it is never empty, otherwise __setstate__ would
+        # not be called when unpickling an empty disjoint set.
+        return {
+            "roots": {
+                external_id: self.find(external_id) for external_id in self._parents
+            }
+        }
+
+    def __setstate__(
+        self, state: Dict[str, Dict[ExternalIdKey, ExternalIdKey]]
+    ) -> None:
+        self._parents = dict(state["roots"])
+        self._sizes = {}
+        for root in self._parents.values():
+            self._sizes[root] = self._sizes.get(root, 0) + 1
+
+
 class CombineExternalIdClusters(beam.CombineFn):
     """A CombineFn that combines clusters of external IDs together."""
 
     # pylint: disable=arguments-differ,abstract-method
 
-    def create_accumulator(self) -> Dict[ExternalIdKey, Set[ExternalIdKey]]:
-        return defaultdict(set)
+    def create_accumulator(self) -> ExternalIdDisjointSet:
+        return ExternalIdDisjointSet()
 
     def add_input(
         self,
-        mutable_accumulator: Dict[ExternalIdKey, Set[ExternalIdKey]],
+        mutable_accumulator: ExternalIdDisjointSet,
         element: ExternalIdCluster,
-    ) -> Dict[ExternalIdKey, Set[ExternalIdKey]]:
+    ) -> ExternalIdDisjointSet:
         external_id, external_ids_in_element_cluster = element
         if external_id not in external_ids_in_element_cluster:
             raise ValueError("Require that the external_id itself be in the cluster.")
-        external_ids_already_in_cluster: Set[ExternalIdKey] = mutable_accumulator[
-            external_id
-        ]
-        final_cluster = (
-            external_ids_already_in_cluster | external_ids_in_element_cluster
-        )
-        for cluster_member_external_id in final_cluster:
-            mutable_accumulator[cluster_member_external_id] = final_cluster
+        for cluster_member_external_id in external_ids_in_element_cluster:
+            mutable_accumulator.union(external_id, cluster_member_external_id)
         return mutable_accumulator
 
     def merge_accumulators(
         self,
-        accumulators: List[Dict[ExternalIdKey, Set[ExternalIdKey]]],
-    ) -> Dict[ExternalIdKey, Set[ExternalIdKey]]:
-        final_accumulator: Dict[ExternalIdKey, Set[ExternalIdKey]] = defaultdict(set)
-
-        for accumulator in accumulators:
-            for external_id_key, external_ids_in_cluster in accumulator.items():
-                self.add_input(
-                    final_accumulator, (external_id_key, external_ids_in_cluster)
-                )
-
+        accumulators: List[ExternalIdDisjointSet],
+    ) -> ExternalIdDisjointSet:
+        final_accumulator, *other_accumulators = accumulators
+        for accumulator in other_accumulators:
+            final_accumulator.union_all(accumulator)
         return final_accumulator
 
     def extract_output(
         self,
-        accumulator: Dict[ExternalIdKey, Set[ExternalIdKey]],
+        accumulator: ExternalIdDisjointSet,
     ) -> Dict[ExternalIdKey, Set[ExternalIdKey]]:
-        return accumulator
+        return accumulator.clusters()
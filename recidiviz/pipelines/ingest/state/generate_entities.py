@@ -90,7 +90,7 @@ class GenerateEntities(beam.PTransform):
         self, upperbound_date: UpperBoundDate, row: Dict[str, str]
     ) -> Tuple[UpperBoundDate, RootEntity]:
         entity = one(
-            self._ingest_view_manifest.parse_contents(
+            self._ingest_view_manifest.iter_contents(
                 contents_iterator=iter([row]),
                 context=IngestViewContentsContextImpl(
                     ingest_instance=self._ingest_instance,
@@ -15,6 +15,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """A PTransform that generates ingest view results for a given ingest view."""
+import datetime
 from typing import Any, Dict, Generator, Optional
 
 import apache_beam as beam
@@ -62,6 +63,34 @@ FROM (
 )
 ORDER BY 1;"""
 
+# Only keeps the date pairs with an upper bound on or after the new results lower bound.
+# The lower bound of the first kept pair is the upper bound of the last pair before it.
+INGEST_VIEW_NEW_DATE_BOUND_TUPLES_QUERY_TEMPLATE = f"""
+SELECT *
+FROM (
+    SELECT
+        LAG(max_dt_on_date) OVER (
+            ORDER BY update_date
+        ) AS {LOWER_BOUND_DATETIME_COL_NAME},
+        max_dt_on_date AS {UPPER_BOUND_DATETIME_COL_NAME},
+    FROM (
+        SELECT
+            update_date AS update_date,
+            MAX(update_datetime) AS max_dt_on_date
+        FROM (
+            {{raw_data_tables}}
+        )
+        GROUP BY update_date
+    )
+)
+WHERE {UPPER_BOUND_DATETIME_COL_NAME} >= DATETIME "{{new_results_lower_bound}}"
+ORDER BY 1;"""
+
+PREVIOUS_INGEST_VIEW_RESULTS_QUERY_TEMPLATE = f"""
+SELECT *
+FROM `{{previous_results_table}}`
+WHERE {UPPER_BOUND_DATETIME_COL_NAME} {{comparison}} DATETIME "{{new_results_lower_bound}}";"""
+
 INGEST_VIEW_LATEST_DATE_QUERY_TEMPLATE = f"""
 SELECT
     MAX(update_datetime) AS {UPPER_BOUND_DATETIME_COL_NAME},
@@ -111,7 +140,11 @@ class GenerateIngestViewResults(beam.PTransform):
         raw_data_tables_to_upperbound_dates: Dict[str, Optional[str]],
         ingest_instance: DirectIngestInstance,
         materialization_method: MaterializationMethod,
+        new_results_lower_bound: Optional[datetime.datetime] = None,
     ) -> None:
+        """If |new_results_lower_bound| is set, only the date pairs with an upper bound
+        on or after that datetime are materialized.
+        """
         super().__init__()
 
         self.project_id = project_id
@@ -120,6 +153,7 @@ class GenerateIngestViewResults(beam.PTransform):
         self.raw_data_tables_to_upperbound_dates = raw_data_tables_to_upperbound_dates
         self.ingest_instance = ingest_instance
         self.materialization_method = materialization_method
+        self.new_results_lower_bound = new_results_lower_bound
 
     def expand(self, input_or_inputs: PBegin) -> beam.PCollection[Dict[str, Any]]:
         return (
@@ -132,6 +166,7 @@ class GenerateIngestViewResults(beam.PTransform):
                     ingest_instance=self.ingest_instance,
                     raw_data_tables_to_upperbound_dates=self.raw_data_tables_to_upperbound_dates,
                     materialization_method=self.materialization_method,
+                    new_results_lower_bound=self.new_results_lower_bound,
                 )
             )
             | f"Generate date diff queries for {self.ingest_view_name} based on date pairs."
@@ -152,9 +187,20 @@ class GenerateIngestViewResults(beam.PTransform):
         ingest_instance: DirectIngestInstance,
         raw_data_tables_to_upperbound_dates: Dict[str, Optional[str]],
         materialization_method: MaterializationMethod = MaterializationMethod.ORIGINAL,
+        new_results_lower_bound: Optional[datetime.datetime] = None,
     ) -> str:
         """Returns a SQL query that will return a list of upper and lower bound date tuples
-        which can each be used to generate an individual ingest view query."""
+        which can each be used to generate an individual ingest view query. If
+        |new_results_lower_bound| is set, only returns the date tuples with an upper
+        bound on or after that datetime."""
+        if (
+            new_results_lower_bound
+            and materialization_method != MaterializationMethod.ORIGINAL
+        ):
+            raise ValueError(
+                f"Cannot materialize only new date pairs with the "
+                f"[{materialization_method.value}] materialization method."
+            )
         raw_data_dataset = raw_tables_dataset_for_region(
             state_code=state_code, instance=ingest_instance
         )
@@ -180,6 +226,12 @@ class GenerateIngestViewResults(beam.PTransform):
         raw_data_tables_sql = "\nUNION ALL\n        ".join(
             raw_data_table_sql_statements
         )
+        if new_results_lower_bound:
+            return StrictStringFormatter().format(
+                INGEST_VIEW_NEW_DATE_BOUND_TUPLES_QUERY_TEMPLATE,
+                raw_data_tables=raw_data_tables_sql,
+                new_results_lower_bound=new_results_lower_bound.isoformat(),
+            )
         raw_date_pairs_query = StrictStringFormatter().format(
             INGEST_VIEW_DATE_BOUND_TUPLES_QUERY_TEMPLATE
             if materialization_method == MaterializationMethod.ORIGINAL
@@ -188,6 +240,33 @@ class GenerateIngestViewResults(beam.PTransform):
         )
         return raw_date_pairs_query
 
+    @staticmethod
+    def kept_previous_results_query(
+        previous_results_table: str, new_results_lower_bound: datetime.datetime
+    ) -> str:
+        """Returns a SQL query that reads the rows of |previous_results_table| with an
+        upper bound before |new_results_lower_bound|, which are not re-materialized."""
+        return StrictStringFormatter().format(
+            PREVIOUS_INGEST_VIEW_RESULTS_QUERY_TEMPLATE,
+            previous_results_table=previous_results_table,
+            comparison="<",
+            new_results_lower_bound=new_results_lower_bound.isoformat(),
+        )
+
+    @staticmethod
+    def replaced_previous_results_query(
+        previous_results_table: str, new_results_lower_bound: datetime.datetime
+    ) -> str:
+        """Returns a SQL query that reads the rows of |previous_results_table| with an
+        upper bound on or after |new_results_lower_bound|, which are replaced by newly
+        materialized results."""
+        return StrictStringFormatter().format(
+            PREVIOUS_INGEST_VIEW_RESULTS_QUERY_TEMPLATE,
+            previous_results_table=previous_results_table,
+            comparison=">=",
+            new_results_lower_bound=new_results_lower_bound.isoformat(),
+        )
+
     @staticmethod
     def get_ingest_view_date_diff_query(
         date_pair: Dict[str, Any],
@@ -0,0 +1,278 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Helpers for tracking the state written by ingest pipeline runs with the incremental
+flag set, which determines whether the ingest view results and entities written by the
+last successful run can be built on incrementally.
+
+Each run writes one row per table it outputs to, keyed by a state key that combines a
+fingerprint of the ingest mappings, ingest view queries and state schema with a summary
+of the raw data up to the run's raw data upper bound dates. A later run can only build
+on that output if the state key computed from its raw data watermarks (the upper bound
+dates of the last successful run) matches, i.e. if no code changed and no raw data
+below the watermarks was re-imported, invalidated or backfilled since, and if every
+table still holds the number of rows that run wrote.
+"""
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List
+
+import apache_beam as beam
+from dateutil import parser
+from google.cloud import bigquery
+
+from recidiviz.big_query.big_query_address import BigQueryAddress
+from recidiviz.big_query.big_query_client import BigQueryClient
+from recidiviz.ingest.direct.direct_ingest_regions import DirectIngestRegion
+from recidiviz.ingest.direct.ingest_mappings.ingest_view_manifest_compiler_delegate import (
+    yaml_mappings_filepath,
+)
+from recidiviz.ingest.direct.views.direct_ingest_view_query_builder import (
+    DirectIngestViewQueryBuilder,
+)
+from recidiviz.persistence.database.schema_utils import get_state_table_classes
+from recidiviz.utils.string import StrictStringFormatter
+
+INCREMENTAL_INGEST_STATE_TABLE_ID = "incremental_ingest_state"
+
+STATE_KEY_COL = "state_key"
+DATASET_ID_COL = "dataset_id"
+TABLE_ID_COL = "table_id"
+ROW_COUNT_COL = "row_count"
+
+INCREMENTAL_INGEST_STATE_SCHEMA = [
+    bigquery.SchemaField(
+        STATE_KEY_COL,
+        field_type=bigquery.enums.SqlTypeNames.STRING.value,
+        mode="REQUIRED",
+    ),
+    bigquery.SchemaField(
+        DATASET_ID_COL,
+        field_type=bigquery.enums.SqlTypeNames.STRING.value,
+        mode="REQUIRED",
+    ),
+    bigquery.SchemaField(
+        TABLE_ID_COL,
+        field_type=bigquery.enums.SqlTypeNames.STRING.value,
+        mode="REQUIRED",
+    ),
+    bigquery.SchemaField(
+        ROW_COUNT_COL,
+        field_type=bigquery.enums.SqlTypeNames.INTEGER.value,
+        mode="REQUIRED",
+    ),
+]
+
+RAW_DATA_SUMMARY_QUERY_TEMPLATE = """SELECT
+    "{file_tag}" AS file_tag,
+    COUNT(*) AS row_count,
+    BIT_XOR(DISTINCT file_id) AS file_id_checksum
+FROM `{project_id}.{raw_data_dataset}.{file_tag}`
+WHERE update_datetime <= '{upper_bound_date}'"""
+
+STORED_STATE_QUERY_TEMPLATE = f"""
+SELECT {DATASET_ID_COL}, {TABLE_ID_COL}, {ROW_COUNT_COL}
+FROM `{{project_id}}.{{dataset_id}}.{INCREMENTAL_INGEST_STATE_TABLE_ID}`
+WHERE {STATE_KEY_COL} = @state_key;"""
+
+TABLE_ROW_COUNT_QUERY_TEMPLATE = f"""SELECT
+    "{{dataset_id}}" AS {DATASET_ID_COL},
+    "{{table_id}}" AS {TABLE_ID_COL},
+    COUNT(*) AS {ROW_COUNT_COL}
+FROM `{{project_id}}.{{dataset_id}}.{{table_id}}`"""
+
+
+def ingest_code_fingerprint(
+    region: DirectIngestRegion, view_builders: List[DirectIngestViewQueryBuilder]
+) -> str:
+    """Returns a fingerprint of the ingest mappings and queries of the provided ingest
+    views and of the state schema, which changes whenever any of the code that
+    determines the output of those ingest views changes."""
+    fingerprint = hashlib.sha256()
+    for view_builder in sorted(view_builders, key=lambda b: b.ingest_view_name):
+        with open(
+            yaml_mappings_filepath(region, view_builder.ingest_view_name),
+            mode="r",
+            encoding="utf-8",
+        ) as manifest_file:
+            manifest_contents = manifest_file.read()
+        fingerprint.update(
+            json.dumps(
+                [
+                    view_builder.ingest_view_name,
+                    view_builder.view_query_template,
+                    view_builder.order_by_cols,
+                    manifest_contents,
+                ]
+            ).encode()
+        )
+    for table in sorted(get_state_table_classes(), key=lambda t: t.name):
+        fingerprint.update(
+            json.dumps(
+                [table.name, [[c.name, str(c.type)] for c in table.columns]]
+            ).encode()
+        )
+    return fingerprint.hexdigest()
+
+
+def incremental_ingest_state_key(
+    bq_client: BigQueryClient,
+    raw_data_dataset: str,
+    code_fingerprint: str,
+    raw_data_upper_bound_dates: Dict[str, str],
+) -> str:
+    """Returns the state key for the output of an ingest pipeline run with the provided
+    |code_fingerprint| that read the raw data in |raw_data_dataset| up to the provided
+    upper bound dates."""
+    raw_data_summary: List[Dict[str, Any]] = []
+    if raw_data_upper_bound_dates:
+        query = "\nUNION ALL\n".join(
+            StrictStringFormatter().format(
+                RAW_DATA_SUMMARY_QUERY_TEMPLATE,
+                project_id=bq_client.project_id,
+                raw_data_dataset=raw_data_dataset,
+                file_tag=file_tag,
+                upper_bound_date=upper_bound_date,
+            )
+            for file_tag, upper_bound_date in sorted(raw_data_upper_bound_dates.items())
+        )
+        raw_data_summary = sorted(
+            (
+                dict(row.items())
+                for row in bq_client.run_query_async(
+                    query_str=query, use_query_cache=False
+                ).result()
+            ),
+            key=lambda row: row["file_tag"],
+        )
+    return hashlib.sha256(
+        json.dumps(
+            {
+                "code_fingerprint": code_fingerprint,
+                # Upper bound dates can be formatted differently by different callers
+                "raw_data_upper_bound_dates": {
+                    file_tag: parser.isoparse(upper_bound_date).isoformat()
+                    for file_tag, upper_bound_date in raw_data_upper_bound_dates.items()
+                },
+                "raw_data_summary": raw_data_summary,
+            },
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()
+
+
+def can_build_on_stored_state(
+    bq_client: BigQueryClient,
+    state_dataset: str,
+    state_key: str,
+    table_addresses: List[BigQueryAddress],
+) -> bool:
+    """Returns True if the incremental ingest state table in |state_dataset| holds a
+    row with the provided |state_key| for every table in |table_addresses| and each
+    of those tables still holds the number of rows recorded in the state table."""
+    for address in [
+        BigQueryAddress(
+            dataset_id=state_dataset, table_id=INCREMENTAL_INGEST_STATE_TABLE_ID
+        ),
+        *table_addresses,
+    ]:
+        if not bq_client.table_exists(
+            bq_client.dataset_ref_for_id(address.dataset_id), address.table_id
+        ):
+            logging.info("Table [%s] does not exist.", address.to_str())
+            return False
+
+    stored_row_counts = {
+        BigQueryAddress(
+            dataset_id=row[DATASET_ID_COL], table_id=row[TABLE_ID_COL]
+        ): row[ROW_COUNT_COL]
+        for row in bq_client.run_query_async(
+            query_str=StrictStringFormatter().format(
+                STORED_STATE_QUERY_TEMPLATE,
+                project_id=bq_client.project_id,
+                dataset_id=state_dataset,
+            ),
+            query_parameters=[
+                bigquery.ScalarQueryParameter("state_key", "STRING", state_key)
+            ],
+            use_query_cache=False,
+        ).result()
+    }
+    if set(stored_row_counts) != set(table_addresses):
+        logging.info(
+            "Found no stored state with key [%s] for tables [%s].",
+            state_key,
+            sorted(a.to_str() for a in set(table_addresses) - set(stored_row_counts)),
+        )
+        return False
+
+    row_counts = {
+        BigQueryAddress(
+            dataset_id=row[DATASET_ID_COL], table_id=row[TABLE_ID_COL]
+        ): row[ROW_COUNT_COL]
+        for row in bq_client.run_query_async(
+            query_str="\nUNION ALL\n".join(
+                StrictStringFormatter().format(
+                    TABLE_ROW_COUNT_QUERY_TEMPLATE,
+                    project_id=bq_client.project_id,
+                    dataset_id=address.dataset_id,
+                    table_id=address.table_id,
+                )
+                for address in sorted(table_addresses)
+            ),
+            use_query_cache=False,
+        ).result()
+    }
+    if row_counts != stored_row_counts:
+        logging.info(
+            "Row counts [%s] do not match stored row counts [%s].",
+            row_counts,
+            stored_row_counts,
+        )
+        return False
+    return True
+
+
+class GetIncrementalIngestStateRow(beam.PTransform):
+    """A PTransform that counts the rows written to the table at |address| and outputs
+    the incremental ingest state row recording that count under |state_key|."""
+
+    def __init__(self, state_key: str, address: BigQueryAddress) -> None:
+        super().__init__()
+        self.state_key = state_key
+        self.address = address
+
+    def expand(
+        self, input_or_inputs: beam.PCollection[Dict[str, Any]]
+    ) -> beam.PCollection[Dict[str, Any]]:
+        return (
+            input_or_inputs
+            | f"Count {self.address.to_str()} rows" >> beam.combiners.Count.Globally()
+            | f"Build {self.address.to_str()} state row"
+            >> beam.Map(self.state_row, state_key=self.state_key, address=self.address)
+        )
+
+    @staticmethod
+    def state_row(
+        row_count: int, state_key: str, address: BigQueryAddress
+    ) -> Dict[str, Any]:
+        return {
+            STATE_KEY_COL: state_key,
+            DATASET_ID_COL: address.dataset_id,
+            TABLE_ID_COL: address.table_id,
+            ROW_COUNT_COL: row_count,
+        }
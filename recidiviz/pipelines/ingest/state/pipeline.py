@@ -16,13 +16,20 @@
 # =============================================================================
 """The ingest pipeline. See recidiviz/tools/calculator/run_sandbox_calculation_pipeline.py for details
 on how to launch a local run."""
-from typing import Any, Dict, List, Optional, Set, Tuple, Type
+import datetime
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
 
 import apache_beam as beam
 from apache_beam import Pipeline
+from dateutil import parser
 
+from recidiviz.big_query.big_query_address import BigQueryAddress
+from recidiviz.big_query.big_query_client import BigQueryClientImpl
 from recidiviz.common.constants.states import StateCode
 from recidiviz.ingest.direct import direct_ingest_regions
+from recidiviz.ingest.direct.dataset_config import raw_tables_dataset_for_region
+from recidiviz.ingest.direct.direct_ingest_regions import DirectIngestRegion
 from recidiviz.ingest.direct.ingest_mappings.ingest_view_manifest_collector import (
     IngestViewManifestCollector,
 )
@@ -60,6 +67,14 @@ from recidiviz.pipelines.ingest.state.associate_with_primary_keys import (
     PRIMARY_KEYS,
     AssociateRootEntitiesWithPrimaryKeys,
 )
+from recidiviz.pipelines.ingest.state.carry_forward_unchanged_root_entities import (
+    CHANGED_EXTERNAL_IDS,
+    PRIMARY_KEY_CHANGES,
+    ROOT_ENTITIES_BY_PRIMARY_KEY,
+    CarryForwardUnchangedRows,
+    FilterToChangedRootEntities,
+    GetPrimaryKeyChanges,
+)
 from recidiviz.pipelines.ingest.state.cluster_root_external_ids import (
     ClusterRootExternalIds,
 )
@@ -76,6 +91,13 @@ from recidiviz.pipelines.ingest.state.generate_primary_keys import string_repres
 from recidiviz.pipelines.ingest.state.get_root_external_ids import (
     GetRootExternalIdClusterEdges,
 )
+from recidiviz.pipelines.ingest.state.incremental_ingest_state import (
+    INCREMENTAL_INGEST_STATE_TABLE_ID,
+    GetIncrementalIngestStateRow,
+    can_build_on_stored_state,
+    incremental_ingest_state_key,
+    ingest_code_fingerprint,
+)
 from recidiviz.pipelines.ingest.state.merge_ingest_view_root_entity_trees import (
     MergeIngestViewRootEntityTrees,
 )
@@ -84,7 +106,10 @@ from recidiviz.pipelines.ingest.state.merge_root_entities_across_dates import (
 )
 from recidiviz.pipelines.ingest.state.run_validations import RunValidations
 from recidiviz.pipelines.ingest.state.serialize_entities import SerializeEntities
-from recidiviz.pipelines.utils.beam_utils.bigquery_io_utils import WriteToBigQuery
+from recidiviz.pipelines.utils.beam_utils.bigquery_io_utils import (
+    ReadFromBigQuery,
+    WriteToBigQuery,
+)
 
 
 def materialization_method_for_ingest_view(
@@ -99,6 +124,30 @@ def materialization_method_for_ingest_view(
     )
 
 
+def new_results_lower_bound(
+    raw_data_tables_to_upperbound_dates: Dict[str, Optional[str]],
+    raw_data_watermarks: Dict[str, str],
+) -> datetime.datetime:
+    """Returns the earliest upper bound datetime of the ingest view results that need
+    to be re-materialized on top of the results of the run with the provided raw data
+    watermarks. All raw data received since that run has an update_datetime on or
+    after the date of the earliest watermark, so the date pairs with an earlier upper
+    bound date are unchanged. If any raw data table with data has no watermark, all
+    results need to be re-materialized."""
+    file_tags = [
+        file_tag
+        for file_tag, upper_bound_date in raw_data_tables_to_upperbound_dates.items()
+        if upper_bound_date
+    ]
+    if any(file_tag not in raw_data_watermarks for file_tag in file_tags):
+        return datetime.datetime.min
+    earliest_watermark = min(
+        (parser.isoparse(raw_data_watermarks[file_tag]) for file_tag in file_tags),
+        default=datetime.datetime.min,
+    )
+    return datetime.datetime.combine(earliest_watermark.date(), datetime.time())
+
+
 def get_pipeline_output_tables(expected_output_entities: Set[str]) -> Set[str]:
     """Returns the set of tables that the pipeline will output to."""
     expected_output_tables: Set[str] = set()
@@ -177,10 +226,36 @@ class StateIngestPipeline(BasePipeline[IngestPipelineParameters]):
         if not expected_output_entities:
             raise ValueError("Pipeline has no expected output")
 
+        output_state_tables = get_pipeline_output_tables(expected_output_entities)
+
+        # Only set for incremental runs
+        incremental_state_key: Optional[str] = None
+        # Only set for incremental runs that build on the output of the last successful
+        # run
+        raw_data_watermarks: Optional[Dict[str, str]] = None
+        if self.pipeline_parameters.incremental:
+            (
+                incremental_state_key,
+                raw_data_watermarks,
+            ) = self._get_incremental_ingest_state(
+                region=region,
+                state_code=state_code,
+                ingest_instance=ingest_instance,
+                view_collector=view_collector,
+                ingest_views_to_run=ingest_views_to_run,
+                output_state_tables=output_state_tables,
+            )
+
         merged_root_entities_with_dates_per_ingest_view: Dict[
             IngestViewName,
             beam.PCollection[Tuple[ExternalIdKey, Tuple[UpperBoundDate, RootEntity]]],
         ] = {}
+        # Root entities from new and replaced previous ingest view results, only
+        # populated when building on the output of the last successful run
+        changed_root_entities_per_ingest_view: Dict[
+            IngestViewName, beam.PCollection[RootEntity]
+        ] = {}
+        incremental_state_rows: List[beam.PCollection[Dict[str, Any]]] = []
         for ingest_view in ingest_views_to_run:
             if ingest_view not in all_launchable_views:
                 raise ValueError(
@@ -202,6 +277,14 @@ class StateIngestPipeline(BasePipeline[IngestPipelineParameters]):
                 default_materialization_method=default_materialization_method,
             )
 
+            results_lower_bound = (
+                new_results_lower_bound(
+                    raw_data_tables_to_upperbound_dates, raw_data_watermarks
+                )
+                if raw_data_watermarks is not None
+                else None
+            )
+
             ingest_view_results: beam.PCollection[
                 Dict[str, Any]
             ] = p | f"Materialize {ingest_view} results" >> GenerateIngestViewResults(
@@ -211,10 +294,60 @@ class StateIngestPipeline(BasePipeline[IngestPipelineParameters]):
                 raw_data_tables_to_upperbound_dates=raw_data_tables_to_upperbound_dates,
                 ingest_instance=ingest_instance,
                 materialization_method=materialization_method,
+                new_results_lower_bound=results_lower_bound,
             )
 
+            all_ingest_view_results = ingest_view_results
+            if results_lower_bound:
+                previous_results_table = (
+                    f"{self.pipeline_parameters.project}."
+                    f"{self.pipeline_parameters.ingest_view_results_output}.{ingest_view}"
+                )
+                # New results never share an upper bound date with kept previous
+                # results, so they can be combined without being re-merged.
+                all_ingest_view_results = (
+                    (
+                        ingest_view_results,
+                        p
+                        | f"Read kept previous {ingest_view} results"
+                        >> ReadFromBigQuery(
+                            query=GenerateIngestViewResults.kept_previous_results_query(
+                                previous_results_table=previous_results_table,
+                                new_results_lower_bound=results_lower_bound,
+                            )
+                        ),
+                    )
+                    | f"Flatten new and kept previous {ingest_view} results"
+                    >> beam.Flatten()
+                )
+                changed_root_entities_per_ingest_view[ingest_view] = (
+                    (
+                        ingest_view_results,
+                        p
+                        | f"Read replaced previous {ingest_view} results"
+                        >> ReadFromBigQuery(
+                            query=GenerateIngestViewResults.replaced_previous_results_query(
+                                previous_results_table=previous_results_table,
+                                new_results_lower_bound=results_lower_bound,
+                            )
+                        ),
+                    )
+                    | f"Flatten new and replaced previous {ingest_view} results"
+                    >> beam.Flatten()
+                    | f"Generate changed {ingest_view} entities."
+                    >> GenerateEntities(
+                        state_code=state_code,
+                        ingest_instance=ingest_instance,
+                        ingest_view_manifest=ingest_manifest_collector.ingest_view_to_manifest[
+                            ingest_view
+                        ],
+                    )
+                    | f"Remove the dates of changed {ingest_view} entities"
+                    >> beam.Values()
+                )
+
             _ = (
-                ingest_view_results
+                all_ingest_view_results
                 | f"Write {ingest_view} results to table."
                 >> WriteToBigQuery(
                     output_dataset=self.pipeline_parameters.ingest_view_results_output,
@@ -222,11 +355,23 @@ class StateIngestPipeline(BasePipeline[IngestPipelineParameters]):
                     write_disposition=beam.io.BigQueryDisposition.WRITE_TRUNCATE,
                 )
             )
+            if incremental_state_key:
+                incremental_state_rows.append(
+                    all_ingest_view_results
+                    | f"Get {ingest_view} results incremental ingest state"
+                    >> GetIncrementalIngestStateRow(
+                        state_key=incremental_state_key,
+                        address=BigQueryAddress(
+                            dataset_id=self.pipeline_parameters.ingest_view_results_output,
+                            table_id=ingest_view,
+                        ),
+                    )
+                )
             if self.pipeline_parameters.ingest_view_results_only:
                 continue
 
             merged_root_entities_with_dates_per_ingest_view[ingest_view] = (
-                ingest_view_results
+                all_ingest_view_results
                 | f"Generate {ingest_view} entities."
                 >> GenerateEntities(
                     state_code=state_code,
@@ -277,13 +422,42 @@ class StateIngestPipeline(BasePipeline[IngestPipelineParameters]):
             )
         )
 
-        output_state_tables = get_pipeline_output_tables(expected_output_entities)
-        final_entities: beam.PCollection[Dict[str, Any]] = (
-            {
+        root_entities_with_dates_by_primary_key: beam.PCollection[
+            Tuple[
+                PrimaryKey,
+                Dict[Tuple[UpperBoundDate, IngestViewName], Iterable[RootEntity]],
+            ]
+        ] = {
+            PRIMARY_KEYS: root_entity_external_ids_to_primary_keys,
+            MERGED_ROOT_ENTITIES_WITH_DATES: merged_root_entities_with_dates,
+        } | AssociateRootEntitiesWithPrimaryKeys()
+
+        carried_forward_rows: Dict[str, beam.PCollection[Dict[str, Any]]] = {}
+        if raw_data_watermarks is not None:
+            primary_key_changes: beam.PCollection[Tuple[PrimaryKey, bool]] = {
                 PRIMARY_KEYS: root_entity_external_ids_to_primary_keys,
-                MERGED_ROOT_ENTITIES_WITH_DATES: merged_root_entities_with_dates,
-            }
-            | AssociateRootEntitiesWithPrimaryKeys()
+                # Every external id of a changed root entity is marked as changed so
+                # that the clusters it previously belonged to are re-processed.
+                CHANGED_EXTERNAL_IDS: (
+                    changed_root_entities_per_ingest_view.values()
+                    | "Flatten changed root entities" >> beam.Flatten()
+                    | "Get changed root entity external id edges"
+                    >> beam.ParDo(GetRootExternalIdClusterEdges())
+                    | "Get changed external ids" >> beam.Keys()
+                ),
+            } | GetPrimaryKeyChanges()
+            root_entities_with_dates_by_primary_key = {
+                PRIMARY_KEY_CHANGES: primary_key_changes,
+                ROOT_ENTITIES_BY_PRIMARY_KEY: root_entities_with_dates_by_primary_key,
+            } | FilterToChangedRootEntities()
+            carried_forward_rows = primary_key_changes | CarryForwardUnchangedRows(
+                project_id=self.pipeline_parameters.project,
+                output_dataset=self.pipeline_parameters.output,
+                output_tables=output_state_tables,
+            )
+
+        final_entities: beam.PCollection[Dict[str, Any]] = (
+            root_entities_with_dates_by_primary_key
             | MergeRootEntitiesAcrossDates(
                 state_code=state_code, field_index=field_index
             )
@@ -298,10 +472,124 @@ class StateIngestPipeline(BasePipeline[IngestPipelineParameters]):
         )
 
         for table_name in output_state_tables:
-            _ = getattr(
-                final_entities, table_name
-            ) | f"Write {table_name} to BigQuery" >> WriteToBigQuery(
+            table_rows = getattr(final_entities, table_name)
+            if table_name in carried_forward_rows:
+                table_rows = (
+                    (
+                        table_rows,
+                        carried_forward_rows[table_name],
+                    )
+                    | f"Flatten new and carried forward {table_name} rows"
+                    >> beam.Flatten()
+                )
+            _ = table_rows | f"Write {table_name} to BigQuery" >> WriteToBigQuery(
                 output_dataset=self.pipeline_parameters.output,
                 output_table=table_name,
                 write_disposition=beam.io.BigQueryDisposition.WRITE_TRUNCATE,
             )
+            if incremental_state_key:
+                incremental_state_rows.append(
+                    table_rows
+                    | f"Get {table_name} incremental ingest state"
+                    >> GetIncrementalIngestStateRow(
+                        state_key=incremental_state_key,
+                        address=BigQueryAddress(
+                            dataset_id=self.pipeline_parameters.output,
+                            table_id=table_name,
+                        ),
+                    )
+                )
+
+        if incremental_state_key:
+            _ = (
+                incremental_state_rows
+                | "Flatten incremental ingest state rows" >> beam.Flatten()
+                | "Write incremental ingest state to BigQuery"
+                >> WriteToBigQuery(
+                    output_dataset=self.pipeline_parameters.ingest_view_results_output,
+                    output_table=INCREMENTAL_INGEST_STATE_TABLE_ID,
+                    write_disposition=beam.io.BigQueryDisposition.WRITE_TRUNCATE,
+                )
+            )
+
+    def _get_incremental_ingest_state(
+        self,
+        region: DirectIngestRegion,
+        state_code: StateCode,
+        ingest_instance: DirectIngestInstance,
+        view_collector: DirectIngestViewQueryBuilderCollector,
+        ingest_views_to_run: List[str],
+        output_state_tables: Set[str],
+    ) -> Tuple[str, Optional[Dict[str, str]]]:
+        """Returns the state key for the output of this incremental run and, if this run
+        can build on the output of the last successful run, the raw data watermarks of
+        that run. Otherwise, this run processes all ingest view results in full."""
+        view_builders = [
+            view_collector.get_query_builder_by_view_name(ingest_view)
+            for ingest_view in ingest_views_to_run
+        ]
+        file_tags = {
+            raw_data_dependency.raw_file_config.file_tag
+            for view_builder in view_builders
+            for raw_data_dependency in view_builder.raw_table_dependency_configs
+        }
+        bq_client = BigQueryClientImpl(project_id=self.pipeline_parameters.project)
+        raw_data_dataset = raw_tables_dataset_for_region(
+            state_code=state_code, instance=ingest_instance
+        )
+        code_fingerprint = ingest_code_fingerprint(region, view_builders)
+
+        state_key = incremental_ingest_state_key(
+            bq_client,
+            raw_data_dataset=raw_data_dataset,
+            code_fingerprint=code_fingerprint,
+            raw_data_upper_bound_dates={
+                file_tag: upper_bound_date
+                for file_tag, upper_bound_date in self.pipeline_parameters.raw_data_upper_bound_dates.items()
+                if file_tag in file_tags
+            },
+        )
+
+        raw_data_watermarks = self.pipeline_parameters.raw_data_watermarks
+        if raw_data_watermarks is None:
+            logging.info(
+                "Found no raw data watermarks, processing all ingest view results."
+            )
+            return state_key, None
+
+        previous_state_key = incremental_ingest_state_key(
+            bq_client,
+            raw_data_dataset=raw_data_dataset,
+            code_fingerprint=code_fingerprint,
+            raw_data_upper_bound_dates={
+                file_tag: watermark
+                for file_tag, watermark in raw_data_watermarks.items()
+                if file_tag in file_tags
+            },
+        )
+        if not can_build_on_stored_state(
+            bq_client,
+            state_dataset=self.pipeline_parameters.ingest_view_results_output,
+            state_key=previous_state_key,
+            table_addresses=[
+                *(
+                    BigQueryAddress(
+                        dataset_id=self.pipeline_parameters.ingest_view_results_output,
+                        table_id=ingest_view,
+                    )
+                    for ingest_view in ingest_views_to_run
+                ),
+                *(
+                    BigQueryAddress(
+                        dataset_id=self.pipeline_parameters.output, table_id=table_name
+                    )
+                    for table_name in output_state_tables
+                ),
+            ],
+        ):
+            logging.info(
+                "Cannot build on the output of the last successful run, processing all "
+                "ingest view results."
+            )
+            return state_key, None
+        return state_key, raw_data_watermarks
@@ -209,6 +209,7 @@ class MetricPipeline(
             required_state_based_reference_tables=required_state_based_reference_tables,
             unifying_class=entities.StatePerson,
             unifying_id_field_filter_set=person_id_filter_set,
+            use_storage_read_api=self.pipeline_parameters.use_storage_read_api,
         )
 
         state_race_ethnicity_population_counts = (
@@ -219,6 +220,7 @@ class MetricPipeline(
                 dataset_id=self.pipeline_parameters.static_reference_input,
                 table_id=STATE_RACE_ETHNICITY_POPULATION_TABLE_NAME,
                 state_code_filter=self.pipeline_parameters.state_code,
+                use_storage_read_api=self.pipeline_parameters.use_storage_read_api,
             )
         )
 
@@ -58,6 +58,14 @@ class MetricsPipelineParameters(PipelineParameters):
         default=-1, validator=attr_validators.is_int, converter=int
     )
 
+    # If set, reads entities and reference tables through the BigQuery Storage Read
+    # API instead of exporting them to GCS first.
+    use_storage_read_api: bool = attr.ib(
+        default=False,
+        validator=attr_validators.is_bool,
+        converter=attr.converters.to_bool,
+    )
+
     @property
     def flex_template_name(self) -> str:
         return "metrics"
@@ -73,13 +73,14 @@ from recidiviz.pipelines.metrics.utils.supervision_utils import (
 )
 from recidiviz.pipelines.metrics.utils.violation_utils import (
     VIOLATION_HISTORY_WINDOW_MONTHS,
+    ViolationHistory,
     filter_violation_responses_for_violation_history,
     get_violation_and_response_history,
 )
 from recidiviz.pipelines.normalization.utils.normalization_managers.assessment_normalization_manager import (
     DEFAULT_ASSESSMENT_SCORE_BUCKET,
 )
-from recidiviz.pipelines.utils import assessment_utils
+from recidiviz.pipelines.utils.assessment_utils import AssessmentIndex
 from recidiviz.pipelines.utils.entity_normalization.normalized_incarceration_period_index import (
     NormalizedIncarcerationPeriodIndex,
 )
@@ -105,6 +106,7 @@ from recidiviz.pipelines.utils.supervision_period_utils import (
 from recidiviz.pipelines.utils.supervision_type_identification import (
     sentence_supervision_type_to_supervision_periods_supervision_type,
 )
+from recidiviz.pipelines.utils.violation_response_utils import ViolationResponseIndex
 
 
 class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
@@ -201,6 +203,11 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
             )
         )
 
+        assessment_index = AssessmentIndex(assessments)
+        violation_response_index = ViolationResponseIndex(
+            violation_responses_for_history
+        )
+
         supervision_events: List[SupervisionEvent] = []
 
         projected_supervision_completion_events = self._classify_supervision_success(
@@ -220,8 +227,8 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
                     supervision_period=supervision_period,
                     supervision_period_index=supervision_period_index,
                     incarceration_period_index=incarceration_period_index,
-                    assessments=assessments,
-                    violation_responses_for_history=violation_responses_for_history,
+                    assessment_index=assessment_index,
+                    violation_response_index=violation_response_index,
                     supervision_contacts=supervision_contacts,
                     violation_delegate=violation_delegate,
                     supervision_delegate=supervision_delegate,
@@ -267,8 +274,8 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
         supervision_period: NormalizedStateSupervisionPeriod,
         supervision_period_index: NormalizedSupervisionPeriodIndex,
         incarceration_period_index: NormalizedIncarcerationPeriodIndex,
-        assessments: List[NormalizedStateAssessment],
-        violation_responses_for_history: List[
+        assessment_index: AssessmentIndex,
+        violation_response_index: ViolationResponseIndex[
             NormalizedStateSupervisionViolationResponse
         ],
         supervision_contacts: List[StateSupervisionContact],
@@ -285,10 +292,10 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
             - supervision_period: The supervision period the person was on
             - supervision_period_index: Class containing information about this person's supervision periods
             - incarceration_period_index: Class containing information about this person's incarceration periods
-            - assessments: List of StateAssessment for a person
-            - violation_responses_for_history: List of
-                StateSupervisionViolationResponse for a person, sorted by response_date and
-                filtered to those that are applicable when analyzing violation history
+            - assessment_index: Class containing information about this person's assessments
+            - violation_response_index: Class containing information about the
+                StateSupervisionViolationResponses for a person that are applicable
+                when analyzing violation history
             - violation_delegate: the state-specific violation delegate
         Returns
             - A set of unique SupervisionPopulationEvents for the person for the given
@@ -342,9 +349,9 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
                 supervision_period,
                 case_type,
                 start_of_supervision,
-                assessments,
+                assessment_index.assessments,
                 supervision_contacts,
-                violation_responses_for_history,
+                violation_response_index.violation_responses,
                 incarceration_period_index,
                 supervision_delegate,
             )
@@ -356,6 +363,34 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
             else date.today() + relativedelta(days=1)
         )
 
+        # These attributes are the same for every day of the period
+        supervision_type = (
+            supervision_period.supervision_type
+            if supervision_period.supervision_type
+            else StateSupervisionPeriodSupervisionType.INTERNAL_UNKNOWN
+        )
+        deprecated_supervising_district_external_id = (
+            supervision_delegate.get_deprecated_supervising_district_external_id(
+                level_1_supervision_location_external_id,
+                level_2_supervision_location_external_id,
+            )
+        )
+        projected_end_date = supervision_delegate.get_projected_completion_date(
+            supervision_period=supervision_period,
+            incarceration_sentences=incarceration_sentences,
+            supervision_sentences=supervision_sentences,
+        )
+        supervision_out_of_state = is_supervision_out_of_state(
+            supervision_period.custodial_authority,
+            deprecated_supervising_district_external_id,
+            supervision_delegate,
+        )
+
+        # The violation history only changes on the dates that a violation response
+        # enters or leaves the window it is drawn from, so it is computed once per
+        # set of responses in the window rather than for every day.
+        violation_history_by_window: Dict[Tuple[int, int], ViolationHistory] = {}
+
         while event_date < end_date:
             if self._in_supervision_population_for_period_on_date(
                 event_date,
@@ -363,10 +398,12 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
                 incarceration_period_index,
                 supervision_delegate,
             ):
-                supervision_type = (
-                    supervision_period.supervision_type
-                    if supervision_period.supervision_type
-                    else StateSupervisionPeriodSupervisionType.INTERNAL_UNKNOWN
+                most_recent_assessment = (
+                    assessment_index.most_recent_applicable_assessment_of_class(
+                        event_date,
+                        assessment_class=StateAssessmentClass.RISK,
+                        supervision_delegate=supervision_delegate,
+                    )
                 )
 
                 assessment_score = None
@@ -374,13 +411,6 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
                 assessment_type = None
                 assessment_score_bucket = DEFAULT_ASSESSMENT_SCORE_BUCKET
 
-                most_recent_assessment = assessment_utils.find_most_recent_applicable_assessment_of_class_for_state(
-                    event_date,
-                    assessments,
-                    assessment_class=StateAssessmentClass.RISK,
-                    supervision_delegate=supervision_delegate,
-                )
-
                 if most_recent_assessment:
                     assessment_score = most_recent_assessment.assessment_score
                     assessment_level = most_recent_assessment.assessment_level
@@ -390,11 +420,25 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
                         or DEFAULT_ASSESSMENT_SCORE_BUCKET
                     )
 
-                violation_history = get_violation_and_response_history(
-                    upper_bound_exclusive_date=(event_date + relativedelta(days=1)),
-                    violation_responses_for_history=violation_responses_for_history,
-                    violation_delegate=violation_delegate,
+                violation_history_upper_bound_exclusive = event_date + relativedelta(
+                    days=1
                 )
+                violation_history_window = violation_response_index.window_bounds(
+                    upper_bound_exclusive=violation_history_upper_bound_exclusive,
+                    lower_bound_inclusive=violation_history_upper_bound_exclusive
+                    - relativedelta(months=VIOLATION_HISTORY_WINDOW_MONTHS),
+                )
+                if violation_history_window not in violation_history_by_window:
+                    violation_history_by_window[
+                        violation_history_window
+                    ] = get_violation_and_response_history(
+                        upper_bound_exclusive_date=violation_history_upper_bound_exclusive,
+                        violation_responses_for_history=violation_response_index,
+                        violation_delegate=violation_delegate,
+                    )
+                violation_history = violation_history_by_window[
+                    violation_history_window
+                ]
 
                 case_compliance: Optional[SupervisionCaseCompliance] = None
 
@@ -403,11 +447,6 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
                         event_date
                     )
 
-                deprecated_supervising_district_external_id = supervision_delegate.get_deprecated_supervising_district_external_id(
-                    level_1_supervision_location_external_id,
-                    level_2_supervision_location_external_id,
-                )
-
                 supervision_level_downgrade_occurred = False
                 previous_supervision_level = None
                 if event_date == supervision_period.start_date:
@@ -418,17 +457,6 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
                         supervision_period_index, supervision_period
                     )
 
-                projected_end_date = supervision_delegate.get_projected_completion_date(
-                    supervision_period=supervision_period,
-                    incarceration_sentences=incarceration_sentences,
-                    supervision_sentences=supervision_sentences,
-                )
-
-                supervision_out_of_state = is_supervision_out_of_state(
-                    supervision_period.custodial_authority,
-                    deprecated_supervising_district_external_id,
-                    supervision_delegate,
-                )
                 event = SupervisionPopulationEvent(
                     state_code=supervision_period.state_code,
                     year=event_date.year,
@@ -462,7 +490,7 @@ class SupervisionIdentifier(BaseIdentifier[List[SupervisionEvent]]):
 
                 supervision_population_events.append(event)
 
-            event_date = event_date + relativedelta(days=1)
+            event_date = event_date + datetime.timedelta(days=1)
 
         return supervision_population_events
 
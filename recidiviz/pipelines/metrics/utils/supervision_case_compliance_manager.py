@@ -48,9 +48,7 @@ from recidiviz.persistence.entity.state.normalized_entities import (
 from recidiviz.pipelines.metrics.supervision.supervision_case_compliance import (
     SupervisionCaseCompliance,
 )
-from recidiviz.pipelines.utils.assessment_utils import (
-    find_most_recent_applicable_assessment_of_class_for_state,
-)
+from recidiviz.pipelines.utils.assessment_utils import AssessmentIndex
 from recidiviz.pipelines.utils.entity_normalization.normalized_incarceration_period_index import (
     NormalizedIncarcerationPeriodIndex,
 )
@@ -80,6 +78,9 @@ class StateSupervisionCaseComplianceManager:
         self.case_type = case_type
         self.start_of_supervision = start_of_supervision
         self.assessments = assessments
+        # Compliance is evaluated for every day of the period, so the assessments are
+        # indexed by date once rather than scanned on each day
+        self.assessment_index = AssessmentIndex(assessments)
         self.supervision_contacts = supervision_contacts
         self.violation_responses = violation_responses
         self.incarceration_period_index = incarceration_period_index
@@ -114,9 +115,8 @@ class StateSupervisionCaseComplianceManager:
         home_visit_count = self._home_visits_on_date(compliance_evaluation_date)
 
         most_recent_assessment = (
-            find_most_recent_applicable_assessment_of_class_for_state(
+            self.assessment_index.most_recent_applicable_assessment_of_class(
                 compliance_evaluation_date,
-                self.assessments,
                 assessment_class=StateAssessmentClass.RISK,
                 supervision_delegate=self.supervision_delegate,
             )
@@ -342,9 +342,8 @@ class StateSupervisionCaseComplianceManager:
             return None
 
         most_recent_assessment = (
-            find_most_recent_applicable_assessment_of_class_for_state(
+            self.assessment_index.most_recent_applicable_assessment_of_class(
                 evaluation_date,
-                self.assessments,
                 assessment_class=StateAssessmentClass.RISK,
                 supervision_delegate=self.supervision_delegate,
             )
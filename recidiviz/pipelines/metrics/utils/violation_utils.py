@@ -20,7 +20,7 @@ import datetime
 import sys
 from collections import OrderedDict, defaultdict
 from datetime import date
-from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 
 from dateutil.relativedelta import relativedelta
 
@@ -40,6 +40,7 @@ from recidiviz.pipelines.utils.state_utils.state_specific_violations_delegate im
 )
 from recidiviz.pipelines.utils.violation_response_utils import (
     StateSupervisionViolationResponseT,
+    ViolationResponseIndex,
     get_most_severe_response_decision,
     violation_responses_in_window,
 )
@@ -246,7 +247,10 @@ ViolationHistory = NamedTuple(
 
 def get_violation_and_response_history(
     upper_bound_exclusive_date: date,
-    violation_responses_for_history: List[NormalizedStateSupervisionViolationResponse],
+    violation_responses_for_history: Union[
+        List[NormalizedStateSupervisionViolationResponse],
+        ViolationResponseIndex[NormalizedStateSupervisionViolationResponse],
+    ],
     violation_delegate: StateSpecificViolationDelegate,
     lower_bound_inclusive_date_override: Optional[date] = None,
 ) -> ViolationHistory:
@@ -258,6 +262,9 @@ def get_violation_and_response_history(
 
     If lower_bound_inclusive_date_override is null, uses the period of time
     VIOLATION_HISTORY_WINDOW_MONTHS preceding the |end_date|.
+
+    Callers that look up the history for many dates should pass a
+    ViolationResponseIndex of the responses rather than the list.
     """
 
     lower_bound_inclusive_date = (
@@ -266,11 +273,17 @@ def get_violation_and_response_history(
         - relativedelta(months=VIOLATION_HISTORY_WINDOW_MONTHS)
     )
 
-    responses_in_window = violation_responses_in_window(
-        violation_responses=violation_responses_for_history,
-        upper_bound_exclusive=upper_bound_exclusive_date,
-        lower_bound_inclusive=lower_bound_inclusive_date,
-    )
+    if isinstance(violation_responses_for_history, ViolationResponseIndex):
+        responses_in_window = violation_responses_for_history.responses_in_window(
+            upper_bound_exclusive=upper_bound_exclusive_date,
+            lower_bound_inclusive=lower_bound_inclusive_date,
+        )
+    else:
+        responses_in_window = violation_responses_in_window(
+            violation_responses=violation_responses_for_history,
+            upper_bound_exclusive=upper_bound_exclusive_date,
+            lower_bound_inclusive=lower_bound_inclusive_date,
+        )
 
     violations_in_window: List[NormalizedStateSupervisionViolation] = []
     violation_ids_in_window: Set[int] = set()
@@ -320,6 +320,7 @@ class ComprehensiveNormalizationPipeline(BasePipeline[NormalizationPipelineParam
                     required_state_based_reference_tables=required_state_based_reference_tables,
                     unifying_class=root_entity_type,
                     unifying_id_field_filter_set=person_id_filter_set,
+                    use_storage_read_api=self.pipeline_parameters.use_storage_read_api,
                 )
                 | f"Normalize entities for {root_entity_type.__name__}"
                 >> beam.ParDo(
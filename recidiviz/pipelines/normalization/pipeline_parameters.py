@@ -48,6 +48,14 @@ class NormalizationPipelineParameters(PipelineParameters):
         default=None, validator=attr_validators.is_opt_str
     )
 
+    # If set, reads entities and reference tables through the BigQuery Storage Read
+    # API instead of exporting them to GCS first.
+    use_storage_read_api: bool = attr.ib(
+        default=False,
+        validator=attr_validators.is_bool,
+        converter=attr.converters.to_bool,
+    )
+
     @property
     def flex_template_name(self) -> str:
         return "normalization"
@@ -15,11 +15,17 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """Utils for dealing with assessment data in the calculation pipelines."""
+import bisect
 import sys
 from datetime import date
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
-from recidiviz.common.constants.state.state_assessment import StateAssessmentClass
+import attr
+
+from recidiviz.common.constants.state.state_assessment import (
+    StateAssessmentClass,
+    StateAssessmentType,
+)
 from recidiviz.persistence.entity.state.normalized_entities import (
     NormalizedStateAssessment,
 )
@@ -28,6 +34,14 @@ from recidiviz.pipelines.utils.state_utils.state_specific_supervision_delegate i
 )
 
 
+def _assessment_sequence_num_sort_key(assessment: NormalizedStateAssessment) -> int:
+    return (
+        assessment.sequence_num
+        if assessment and assessment.sequence_num
+        else -sys.maxsize
+    )
+
+
 def find_most_recent_applicable_assessment_of_class_for_state(
     cutoff_date: date,
     assessments: List[NormalizedStateAssessment],
@@ -57,6 +71,84 @@ def find_most_recent_applicable_assessment_of_class_for_state(
 
     return max(
         applicable_assessments_before_date,
-        key=lambda a: (a.sequence_num if a and a.sequence_num else -sys.maxsize),
+        key=_assessment_sequence_num_sort_key,
         default=None,
     )
+
+
+@attr.s
+class AssessmentIndex:
+    """A class for caching a person's assessments sorted by assessment_date, so that
+    the most recent applicable assessment on any date can be found with a binary
+    search rather than a scan of every assessment.
+    """
+
+    assessments: List[NormalizedStateAssessment] = attr.ib()
+
+    # Maps a set of applicable assessment types to the sorted dates of the
+    # applicable assessments and, for each of those dates, the most recent
+    # applicable assessment on or before that date
+    _most_recent_assessments_by_types: Dict[
+        FrozenSet[StateAssessmentType],
+        Tuple[List[date], List[NormalizedStateAssessment]],
+    ] = attr.ib(factory=dict, init=False)
+
+    def most_recent_applicable_assessment_of_class(
+        self,
+        cutoff_date: date,
+        assessment_class: StateAssessmentClass,
+        supervision_delegate: StateSpecificSupervisionDelegate,
+    ) -> Optional[NormalizedStateAssessment]:
+        """Returns the same assessment as
+        find_most_recent_applicable_assessment_of_class_for_state for the
+        assessments in this index."""
+        assessment_types_to_include = (
+            supervision_delegate.assessment_types_to_include_for_class(assessment_class)
+        )
+
+        if not assessment_types_to_include:
+            return None
+
+        assessment_dates, most_recent_assessments = self._most_recent_assessments(
+            frozenset(assessment_types_to_include)
+        )
+        index = bisect.bisect_right(assessment_dates, cutoff_date)
+        return most_recent_assessments[index - 1] if index else None
+
+    def _most_recent_assessments(
+        self, assessment_types_to_include: FrozenSet[StateAssessmentType]
+    ) -> Tuple[List[date], List[NormalizedStateAssessment]]:
+        """Returns the sorted dates of the applicable assessments and the most recent
+        applicable assessment on or before each of those dates."""
+        if assessment_types_to_include not in self._most_recent_assessments_by_types:
+            applicable_assessments = sorted(
+                (
+                    (assessment.assessment_date, position, assessment)
+                    for position, assessment in enumerate(self.assessments)
+                    if assessment.assessment_type in assessment_types_to_include
+                    and assessment.assessment_score is not None
+                    and assessment.assessment_date is not None
+                ),
+                key=lambda applicable_assessment: applicable_assessment[:2],
+            )
+
+            assessment_dates: List[date] = []
+            most_recent_assessments: List[NormalizedStateAssessment] = []
+            most_recent: Optional[NormalizedStateAssessment] = None
+            most_recent_key: Tuple[int, int] = (-sys.maxsize, 0)
+            for assessment_date, position, assessment in applicable_assessments:
+                # Ties on sequence_num keep the assessment that comes first in the
+                # original list, matching max()
+                key = (_assessment_sequence_num_sort_key(assessment), -position)
+                if most_recent is None or key > most_recent_key:
+                    most_recent = assessment
+                    most_recent_key = key
+                assessment_dates.append(assessment_date)
+                most_recent_assessments.append(most_recent)
+
+            self._most_recent_assessments_by_types[assessment_types_to_include] = (
+                assessment_dates,
+                most_recent_assessments,
+            )
+
+        return self._most_recent_assessments_by_types[assessment_types_to_include]
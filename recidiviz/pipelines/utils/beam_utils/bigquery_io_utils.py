@@ -16,7 +16,7 @@
 # =============================================================================
 """Utils for beam calculations."""
 # pylint: disable=abstract-method,redefined-builtin
-from typing import Any, Dict, Iterable, Optional, TypeVar
+from typing import Any, Dict, Iterable, List, Optional, TypeVar
 
 import apache_beam as beam
 from apache_beam.io.gcp.internal.clients import bigquery
@@ -69,21 +69,71 @@ class LiftToPCollectionElement(beam.DoFn):
 
 
 class ReadFromBigQuery(beam.PTransform):
-    """Reads query results from BigQuery."""
+    """Reads query results from BigQuery. By default the results are exported to GCS as
+    JSON and read from there. If |use_storage_read_api| is set, the results are instead
+    read through the BigQuery Storage Read API."""
 
-    def __init__(self, query: str):
+    def __init__(self, query: str, use_storage_read_api: bool = False):
         super().__init__()
         self._query = query
+        self._use_storage_read_api = use_storage_read_api
 
     def expand(self, input_or_inputs: PBegin):
-        return (
-            input_or_inputs
-            | "Read from BigQuery"
-            >> beam.io.Read(
+        if self._use_storage_read_api:
+            rows = (
+                input_or_inputs
+                | "Read from BigQuery Storage Read API"
+                >> beam.io.ReadFromBigQuery(
+                    query=self._query,
+                    use_standard_sql=True,
+                    validate=True,
+                    method=beam.io.ReadFromBigQuery.Method.DIRECT_READ,
+                )
+            )
+        else:
+            rows = input_or_inputs | "Read from BigQuery" >> beam.io.Read(
                 beam.io.ReadFromBigQuery(
                     query=self._query, use_standard_sql=True, validate=True
                 )
             )
+        return rows | "Process table rows as elements" >> beam.ParDo(
+            LiftToPCollectionElement()
+        )
+
+
+class ReadFromBigQueryTable(beam.PTransform):
+    """Reads rows from a BigQuery table through the BigQuery Storage Read API, without
+    running a query. Only the |selected_fields| columns (or all columns if not set) of
+    the rows that match the |row_restriction| SQL filter are read, since both are
+    applied by the Storage Read API itself."""
+
+    def __init__(
+        self,
+        project_id: str,
+        dataset_id: str,
+        table_id: str,
+        selected_fields: Optional[List[str]] = None,
+        row_restriction: Optional[str] = None,
+    ):
+        super().__init__()
+        self._project_id = project_id
+        self._dataset_id = dataset_id
+        self._table_id = table_id
+        self._selected_fields = selected_fields
+        self._row_restriction = row_restriction
+
+    def expand(self, input_or_inputs: PBegin):
+        return (
+            input_or_inputs
+            | "Read from BigQuery Storage Read API"
+            >> beam.io.ReadFromBigQuery(
+                project=self._project_id,
+                dataset=self._dataset_id,
+                table=self._table_id,
+                selected_fields=self._selected_fields,
+                row_restriction=self._row_restriction,
+                method=beam.io.ReadFromBigQuery.Method.DIRECT_READ,
+            )
             | "Process table rows as elements" >> beam.ParDo(LiftToPCollectionElement())
         )
 
@@ -22,6 +22,7 @@ from typing import (
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
     NamedTuple,
     Optional,
@@ -50,6 +51,7 @@ from recidiviz.persistence.entity.state.normalized_entities import NormalizedSta
 from recidiviz.pipelines.utils.beam_utils.bigquery_io_utils import (
     ConvertDictToKVTuple,
     ReadFromBigQuery,
+    ReadFromBigQueryTable,
 )
 from recidiviz.pipelines.utils.execution_utils import (
     EntityAssociation,
@@ -59,6 +61,7 @@ from recidiviz.pipelines.utils.execution_utils import (
     TableRow,
     UnifyingId,
     select_query,
+    select_query_row_filter,
 )
 
 UNIFYING_ID_KEY = "unifying_id"
@@ -97,6 +100,7 @@ class ExtractDataForPipeline(beam.PTransform):
         required_state_based_reference_tables: Optional[List[str]],
         unifying_class: Type[Entity],
         unifying_id_field_filter_set: Optional[Set[UnifyingId]] = None,
+        use_storage_read_api: bool = False,
     ):
         """Initializes the PTransform with the required arguments.
 
@@ -117,6 +121,9 @@ class ExtractDataForPipeline(beam.PTransform):
             unifying_id_field_filter_set: When non-empty, we will only build entity
                 objects that can be connected to root entities with one of these
                 unifying ids.
+            use_storage_read_api: If True, all entities and reference tables are
+                read through the BigQuery Storage Read API instead of being exported
+                to GCS first.
         """
         super().__init__()
 
@@ -162,6 +169,7 @@ class ExtractDataForPipeline(beam.PTransform):
         self._unifying_class = unifying_class
         self._unifying_id_field = unifying_class.get_class_id_name()
         self._unifying_id_field_filter_set = unifying_id_field_filter_set
+        self._use_storage_read_api = use_storage_read_api
 
     def _get_relationships_to_hydrate(
         self,
@@ -337,6 +345,7 @@ class ExtractDataForPipeline(beam.PTransform):
                     related_id_field=relationship_property.association_table_entity_id_field,
                     unifying_id_field_filter_set=self._unifying_id_field_filter_set,
                     state_code=self._state_code,
+                    use_storage_read_api=self._use_storage_read_api,
                 )
             )
 
@@ -361,6 +370,7 @@ class ExtractDataForPipeline(beam.PTransform):
                 unifying_id_field=self._unifying_id_field,
                 unifying_id_field_filter_set=self._unifying_id_field_filter_set,
                 state_code=self._state_code,
+                use_storage_read_api=self._use_storage_read_api,
             )
         )
 
@@ -437,6 +447,7 @@ class ExtractDataForPipeline(beam.PTransform):
                 state_code_filter=self._state_code,
                 unifying_id_field=self._unifying_id_field,
                 unifying_id_filter_set=self._unifying_id_field_filter_set,
+                use_storage_read_api=self._use_storage_read_api,
             )
 
         state_based_reference_data: Dict[TableName, PCollection[TableRow]] = {}
@@ -448,6 +459,7 @@ class ExtractDataForPipeline(beam.PTransform):
                 dataset_id=self._reference_dataset,
                 table_id=table_id,
                 state_code_filter=self._state_code,
+                use_storage_read_api=self._use_storage_read_api,
             )
 
         entities_and_associations: Dict[
@@ -794,6 +806,7 @@ class _ExtractValuesFromEntityBase(beam.PTransform):
         unifying_id_field: str,
         unifying_id_field_filter_set: Optional[Set[int]],
         state_code: str,
+        use_storage_read_api: bool = False,
     ):
         super().__init__()
         self._project_id = project_id
@@ -821,6 +834,7 @@ class _ExtractValuesFromEntityBase(beam.PTransform):
         self._base_entity_table_name = self._base_schema_class.__tablename__
         self._entity_id_field = self._base_entity_class.get_class_id_name()
         self._state_code = state_code
+        self._use_storage_read_api = use_storage_read_api
 
     def _entity_has_unifying_id_field(self) -> bool:
         return hasattr(self._base_schema_class, self._unifying_id_field)
@@ -853,6 +867,37 @@ class _ExtractValuesFromEntityBase(beam.PTransform):
 
         return entity_query
 
+    def _read_entities_table(
+        self, input_or_inputs: PBegin, selected_fields: Optional[List[str]] = None
+    ) -> PCollection[Dict[str, Any]]:
+        """Reads the |selected_fields| columns (or all columns if not set) of the
+        entity table rows for this state and unifying id filter set directly through
+        the BigQuery Storage Read API, without running a query."""
+        if not self._entity_has_unifying_id_field():
+            raise ValueError(
+                f"Shouldn't be reading table for entity {self._base_entity_class} that doesn't have field "
+                f"{self._unifying_id_field} - these values will never get grouped with results, so it's "
+                f"a waste to read them."
+            )
+
+        return (
+            input_or_inputs
+            | f"Read {self._base_entity_table_name} from BigQuery"
+            >> ReadFromBigQueryTable(
+                project_id=self._project_id,
+                dataset_id=self._dataset,
+                table_id=self._base_entity_table_name,
+                selected_fields=selected_fields,
+                row_restriction=select_query_row_filter(
+                    dataset=self._dataset,
+                    table=self._base_entity_table_name,
+                    state_code_filter=self._state_code,
+                    unifying_id_field=self._unifying_id_field,
+                    unifying_id_field_filter_set=self._unifying_id_field_filter_set,
+                ),
+            )
+        )
+
     @abc.abstractmethod
     def expand(self, input_or_inputs):
         pass
@@ -872,6 +917,7 @@ class _ExtractAllEntitiesOfType(_ExtractValuesFromEntityBase):
         unifying_id_field: str,
         unifying_id_field_filter_set: Optional[Set[int]],
         state_code: str,
+        use_storage_read_api: bool = False,
     ):
         super().__init__(
             project_id,
@@ -881,6 +927,7 @@ class _ExtractAllEntitiesOfType(_ExtractValuesFromEntityBase):
             unifying_id_field,
             unifying_id_field_filter_set,
             state_code,
+            use_storage_read_api,
         )
 
     def _get_entities_raw_pcollection(self, input_or_inputs: PBegin):
@@ -892,6 +939,9 @@ class _ExtractAllEntitiesOfType(_ExtractValuesFromEntityBase):
             )
             return empty_output
 
+        if self._use_storage_read_api:
+            return self._read_entities_table(input_or_inputs)
+
         entity_query = self._get_entities_table_sql_query()
 
         # Read entities from BQ
@@ -932,6 +982,7 @@ class ImportTable(beam.PTransform):
         state_code_filter: str,
         unifying_id_field: Optional[str] = None,
         unifying_id_filter_set: Optional[Set[int]] = None,
+        use_storage_read_api: bool = False,
     ):
         super().__init__()
         self.project_id = project_id
@@ -940,6 +991,7 @@ class ImportTable(beam.PTransform):
         self.state_code_filter = state_code_filter
         self.unifying_id_field = unifying_id_field
         self.unifying_id_filter_set = unifying_id_filter_set
+        self.use_storage_read_api = use_storage_read_api
 
     # pylint: disable=arguments-renamed
     def expand(self, pipeline: Pipeline):
@@ -953,10 +1005,14 @@ class ImportTable(beam.PTransform):
             unifying_id_field_filter_set=self.unifying_id_filter_set,
         )
 
+        # Reference tables may be views, which the Storage Read API can only read
+        # through a query
         table_contents = (
             pipeline
             | f"Read {self.dataset_id}.{self.table_id} table from BigQuery"
-            >> ReadFromBigQuery(query=table_query)
+            >> ReadFromBigQuery(
+                query=table_query, use_storage_read_api=self.use_storage_read_api
+            )
         )
 
         return table_contents
@@ -978,6 +1034,7 @@ class ImportTableAsKVTuples(beam.PTransform):
         state_code_filter: str,
         unifying_id_field: Optional[str] = None,
         unifying_id_filter_set: Optional[Set[int]] = None,
+        use_storage_read_api: bool = False,
     ):
         super().__init__()
         self.project_id = project_id
@@ -987,6 +1044,7 @@ class ImportTableAsKVTuples(beam.PTransform):
         self.state_code_filter = state_code_filter
         self.unifying_id_field = unifying_id_field
         self.unifying_id_filter_set = unifying_id_filter_set
+        self.use_storage_read_api = use_storage_read_api
 
     # pylint: disable=arguments-renamed
     def expand(self, pipeline: Pipeline):
@@ -1001,6 +1059,7 @@ class ImportTableAsKVTuples(beam.PTransform):
                 state_code_filter=self.state_code_filter,
                 unifying_id_field=self.unifying_id_field,
                 unifying_id_filter_set=self.unifying_id_filter_set,
+                use_storage_read_api=self.use_storage_read_api,
             )
         )
 
@@ -1030,6 +1089,7 @@ class _ExtractAssociationValues(_ExtractValuesFromEntityBase):
         unifying_id_field: str,
         unifying_id_field_filter_set: Optional[Set[int]],
         state_code: str,
+        use_storage_read_api: bool = False,
     ):
         self._root_entity_class = root_entity_class
         self._root_entity_base_class = state_base_entity_class_for_entity_class(
@@ -1070,6 +1130,7 @@ class _ExtractAssociationValues(_ExtractValuesFromEntityBase):
             unifying_id_field,
             unifying_id_field_filter_set,
             state_code,
+            use_storage_read_api,
         )
 
     def _entity_has_all_fields_for_association(self) -> bool:
@@ -1100,6 +1161,9 @@ class _ExtractAssociationValues(_ExtractValuesFromEntityBase):
                     f"association table. association_table: {self._association_table}"
                 )
 
+            if self._use_storage_read_api:
+                return self._read_association_values_from_entities_table(pipeline)
+
             columns_to_include = [
                 f"{self._unifying_id_field} as {UNIFYING_ID_KEY}",
                 self._root_id_field,
@@ -1135,15 +1199,44 @@ class _ExtractAssociationValues(_ExtractValuesFromEntityBase):
                 f"{self._association_table}.{self._root_id_field}"
             )
 
-        # Read association view from BQ
+        # Read association view from BQ. The join can't be pushed down to the Storage
+        # Read API, so the Storage Read API reads the results of the query
         association_values_raw = (
             pipeline
             | f"Read {self._association_table} from BigQuery"
-            >> ReadFromBigQuery(query=association_view_query)
+            >> ReadFromBigQuery(
+                query=association_view_query,
+                use_storage_read_api=self._use_storage_read_api,
+            )
         )
 
         return association_values_raw
 
+    def _read_association_values_from_entities_table(
+        self, pipeline: PBegin
+    ) -> PCollection[Dict[str, Any]]:
+        """Reads the three association values directly from the entity table through
+        the BigQuery Storage Read API. The unifying id is renamed to UNIFYING_ID_KEY
+        after the read, since the Storage Read API can't alias columns."""
+        selected_fields = list(
+            dict.fromkeys(
+                [self._unifying_id_field, self._root_id_field, self._related_id_field]
+            )
+        )
+        unifying_id_field = self._unifying_id_field
+        root_id_field = self._root_id_field
+        related_id_field = self._related_id_field
+
+        return self._read_entities_table(
+            pipeline, selected_fields=selected_fields
+        ) | f"Select association values from {self._association_table}" >> beam.Map(
+            lambda row: {
+                UNIFYING_ID_KEY: row[unifying_id_field],
+                root_id_field: row[root_id_field],
+                related_id_field: row[related_id_field],
+            }
+        )
+
     def expand(
         self, input_or_inputs: PBegin
     ) -> PCollection[Tuple[UnifyingId, EntityAssociation]]:
@@ -1171,41 +1264,56 @@ class _ExtractAssociationValues(_ExtractValuesFromEntityBase):
 )
 @with_output_types(beam.typehints.Tuple[int, Entity])
 class _ShallowHydrateEntity(beam.DoFn):
-    """Hydrates an Entity."""
+    """Hydrates Entities from batches of table rows."""
 
-    # Silence `Method 'process_batch' is abstract in class 'DoFn' but is not overridden (abstract-method)`
-    # pylint: disable=W0223
+    def process_batch(
+        self, batch: List[TableRow], *_args, **kwargs
+    ) -> Iterator[List[Tuple[int, Entity]]]:
+        """Builds entities from a batch of key-value pairs.
 
-    def process(self, element: TableRow, *_args, **kwargs):
-        """Builds an entity from key-value pairs.
+        The rows are converted into columns, so that the entity fields to set from
+        each column are only looked up once per batch rather than once per row.
 
         Args:
-            element: A dictionary containing Entity information.
+            batch: A list of dictionaries containing Entity information.
             **kwargs: This should be a dictionary with values for the
                     following keys:
                         - entity_class: Entity class to be built. Classes must also
                           be subclasses of BuildableAttr.
-                        - unifying_id_field: Field in |element| corresponding
+                        - unifying_id_field: Field in each row corresponding
                             to an id that is needed to unify this root entity
                             with other related root entities.
 
         Yields:
-            A tuple in the form of (int, Entity).
+            A list of tuples in the form of (int, Entity).
         """
-        # Build the entity from the values in the element
         entity_class = kwargs["entity_class"]
         unifying_id_field = kwargs["unifying_id_field"]
 
-        hydrated_entity = entity_class.build_from_dictionary(element)
-        if not isinstance(hydrated_entity, Entity):
-            raise ValueError(f"Found unexpected entity type [{type(hydrated_entity)}]")
+        if not issubclass(entity_class, Entity):
+            raise ValueError(f"Found unexpected entity type [{entity_class}]")
+
+        # Rows only share a set of columns if they have the same keys
+        rows_by_column_names: Dict[Tuple[str, ...], List[TableRow]] = defaultdict(list)
+        for row in batch:
+            rows_by_column_names[tuple(row)].append(row)
+
+        hydrated_entities: List[Tuple[int, Entity]] = []
+        for column_names, rows in rows_by_column_names.items():
+            columns = {
+                column_name: [row[column_name] for row in rows]
+                for column_name in column_names
+            }
 
-        unifying_id = _get_value_from_table_row(element, unifying_id_field)
+            unifying_ids = columns.get(unifying_id_field)
+            if not unifying_ids or not all(unifying_ids):
+                raise ValueError(f"Invalid unifying_id_field: {unifying_id_field}")
 
-        if not unifying_id:
-            raise ValueError(f"Invalid unifying_id_field: {unifying_id_field}")
+            hydrated_entities.extend(
+                zip(unifying_ids, entity_class.build_from_columns(columns))
+            )
 
-        yield (unifying_id, hydrated_entity)
+        yield hydrated_entities
 
     def to_runner_api_parameter(self, unused_context):
         pass
@@ -1264,9 +1372,3 @@ class _AttachStateBasedReferenceDataToEntities(beam.DoFn):
 
     def to_runner_api_parameter(self, _):
         pass  # Passing unused abstract method.
-
-
-def _get_value_from_table_row(table_row: TableRow, field: str) -> Any:
-    value = table_row.get(field)
-
-    return value
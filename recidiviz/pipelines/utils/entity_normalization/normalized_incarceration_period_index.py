@@ -16,7 +16,7 @@
 # =============================================================================
 """A class for caching information about a set of incarceration periods that are ready
 for use in the metric calculation pipelines."""
-
+import bisect
 from collections import defaultdict
 from datetime import date
 from typing import Dict, List, Optional, Set, Tuple
@@ -53,6 +53,53 @@ def _incarceration_periods_sorter(
     return sort_normalized_entities_by_sequence_num(incarceration_periods)
 
 
+def _merge_date_ranges(date_ranges: List[DateRange]) -> List[DateRange]:
+    """Returns the sorted, non-overlapping and non-adjacent date ranges that cover
+    exactly the days covered by the given |date_ranges|."""
+    merged_ranges: List[DateRange] = []
+    for date_range in sorted(
+        (
+            date_range
+            for date_range in date_ranges
+            if date_range.lower_bound_inclusive_date
+            < date_range.upper_bound_exclusive_date
+        ),
+        key=lambda date_range: date_range.lower_bound_inclusive_date,
+    ):
+        if (
+            merged_ranges
+            and date_range.lower_bound_inclusive_date
+            <= merged_ranges[-1].upper_bound_exclusive_date
+        ):
+            if (
+                date_range.upper_bound_exclusive_date
+                > merged_ranges[-1].upper_bound_exclusive_date
+            ):
+                merged_ranges[-1] = DateRange(
+                    lower_bound_inclusive_date=merged_ranges[
+                        -1
+                    ].lower_bound_inclusive_date,
+                    upper_bound_exclusive_date=date_range.upper_bound_exclusive_date,
+                )
+        else:
+            merged_ranges.append(date_range)
+    return merged_ranges
+
+
+def _merged_range_containing(
+    merged_ranges: List[DateRange],
+    merged_range_starts: List[date],
+    evaluation_date: date,
+) -> Optional[DateRange]:
+    """Returns the range in the output of _merge_date_ranges that contains the
+    |evaluation_date|, if there is one. The |merged_range_starts| are the
+    lower_bound_inclusive_date values of the |merged_ranges|."""
+    index = bisect.bisect_right(merged_range_starts, evaluation_date) - 1
+    if index < 0 or merged_ranges[index].upper_bound_exclusive_date <= evaluation_date:
+        return None
+    return merged_ranges[index]
+
+
 @attr.s
 class NormalizedIncarcerationPeriodIndex:
     """A class for caching information about a set of normalized incarceration
@@ -94,6 +141,54 @@ class NormalizedIncarcerationPeriodIndex:
             )
         ]
 
+    # The sorted, non-overlapping date ranges during which this person was in an
+    # incarceration period that excludes them from the supervision population
+    supervision_population_exclusion_ranges: List[DateRange] = attr.ib()
+
+    @supervision_population_exclusion_ranges.default
+    def _supervision_population_exclusion_ranges(self) -> List[DateRange]:
+        return _merge_date_ranges(
+            [
+                ip.duration
+                for ip in self.incarceration_periods_that_exclude_person_from_supervision_population
+            ]
+        )
+
+    # The sorted, non-overlapping date ranges during which this person was counted in
+    # the incarcerated population
+    incarceration_population_ranges: List[DateRange] = attr.ib()
+
+    @incarceration_population_ranges.default
+    def _incarceration_population_ranges(self) -> List[DateRange]:
+        return _merge_date_ranges(
+            [
+                ip.duration
+                for ip in self.sorted_incarceration_periods
+                if self.incarceration_delegate.is_period_included_in_state_population(
+                    ip
+                )
+            ]
+        )
+
+    # The lower_bound_inclusive_date of each of the ranges above, for binary search
+    _supervision_population_exclusion_range_starts: List[date] = attr.ib(init=False)
+
+    @_supervision_population_exclusion_range_starts.default
+    def _supervision_population_exclusion_range_starts_default(self) -> List[date]:
+        return [
+            date_range.lower_bound_inclusive_date
+            for date_range in self.supervision_population_exclusion_ranges
+        ]
+
+    _incarceration_population_range_starts: List[date] = attr.ib(init=False)
+
+    @_incarceration_population_range_starts.default
+    def _incarceration_population_range_starts_default(self) -> List[date]:
+        return [
+            date_range.lower_bound_inclusive_date
+            for date_range in self.incarceration_population_ranges
+        ]
+
     # A set of tuples in the format (year, month) for each month of which this person has been incarcerated for any
     # portion of the month, where the incarceration prevents the person from being counted simultaneously in the
     # supervision population.
@@ -187,58 +282,35 @@ class NormalizedIncarcerationPeriodIndex:
         self, range_to_cover: DateRange
     ) -> bool:
         """Returns True if this person is incarcerated for the full duration of the date range."""
-
-        months_range_overlaps = range_to_cover.get_months_range_overlaps_at_all()
-
-        if not months_range_overlaps:
+        if (
+            range_to_cover.lower_bound_inclusive_date
+            >= range_to_cover.upper_bound_exclusive_date
+        ):
             return False
 
-        months_without_exclusion_from_supervision = []
-        for year, month in months_range_overlaps:
-            was_incarcerated_all_month = (
-                year,
-                month,
-            ) in self.months_excluded_from_supervision_population
-            if not was_incarcerated_all_month:
-                months_without_exclusion_from_supervision.append((year, month))
+        exclusion_range = _merged_range_containing(
+            self.supervision_population_exclusion_ranges,
+            self._supervision_population_exclusion_range_starts,
+            range_to_cover.lower_bound_inclusive_date,
+        )
 
-        for year, month in months_without_exclusion_from_supervision:
-            overlapping_periods = (
-                self.month_to_overlapping_ips_not_under_supervision_authority[year][
-                    month
-                ]
-            )
-
-            range_portion_overlapping_month = (
-                range_to_cover.portion_overlapping_with_month(year, month)
-            )
-            if not range_portion_overlapping_month:
-                raise ValueError(
-                    f"Expecting only months that overlap with the range, month ({year}, {month}) does not."
-                )
-
-            remaining_ranges_to_cover = (
-                self._get_portions_of_range_not_covered_by_periods_subset(
-                    range_portion_overlapping_month, overlapping_periods
-                )
-            )
-            if remaining_ranges_to_cover:
-                return False
-
-        return True
+        return (
+            exclusion_range is not None
+            and exclusion_range.upper_bound_exclusive_date
+            >= range_to_cover.upper_bound_exclusive_date
+        )
 
     def was_in_incarceration_population_on_date(self, evaluation_date: date) -> bool:
         """Returns True if this person was counted in the incarcerated population
         on the given date."""
-        for period in self.sorted_incarceration_periods:
-            if period.duration.contains_day(
-                evaluation_date
-            ) and self.incarceration_delegate.is_period_included_in_state_population(
-                period
-            ):
-                return True
-
-        return False
+        return (
+            _merged_range_containing(
+                self.incarceration_population_ranges,
+                self._incarceration_population_range_starts,
+                evaluation_date,
+            )
+            is not None
+        )
 
     @staticmethod
     def _get_portions_of_range_not_covered_by_periods_subset(
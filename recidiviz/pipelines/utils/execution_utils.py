@@ -260,18 +260,38 @@ def select_query(
     """Returns a query string formatted to select all contents of the table in the given dataset, filtering by the
     provided state code and unifying id filter sets, if necessary."""
 
-    if not state_code_filter:
-        raise ValueError(f"State code filter unexpectedly empty for table [{table}]")
-
     if not columns_to_include:
         columns_to_include = ["*"]
 
-    entity_query = (
+    row_filter = select_query_row_filter(
+        dataset,
+        table,
+        state_code_filter,
+        unifying_id_field,
+        unifying_id_field_filter_set,
+    )
+    return (
         f"SELECT {', '.join(columns_to_include)} FROM "
-        f"`{project_id}.{dataset}.{table}` WHERE "
-        f"state_code IN ('{state_code_filter}')"
+        f"`{project_id}.{dataset}.{table}` WHERE {row_filter}"
     )
 
+
+def select_query_row_filter(
+    dataset: str,
+    table: str,
+    state_code_filter: str,
+    unifying_id_field: Optional[str],
+    unifying_id_field_filter_set: Optional[Set[int]],
+) -> str:
+    """Returns the SQL condition used by select_query to filter the rows of the table in
+    the given dataset by the provided state code and unifying id filter sets, e.g. for
+    use as a BigQuery Storage Read API row restriction."""
+
+    if not state_code_filter:
+        raise ValueError(f"State code filter unexpectedly empty for table [{table}]")
+
+    row_filter = f"state_code IN ('{state_code_filter}')"
+
     if unifying_id_field_filter_set:
         if not unifying_id_field:
             raise ValueError(
@@ -285,12 +305,12 @@ def select_query(
             if str(unifying_id)
         }
 
-        entity_query = (
-            entity_query
+        row_filter = (
+            row_filter
             + f" AND {unifying_id_field} IN ({', '.join(sorted(id_str_set))})"
         )
 
-    return entity_query
+    return row_filter
 
 
 def list_of_dicts_to_dict_with_keys(
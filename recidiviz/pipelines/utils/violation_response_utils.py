@@ -15,10 +15,13 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """Various utils functions for working with StateSupervisionViolationResponses in calculations."""
+import bisect
 import datetime
 from collections import defaultdict
 from datetime import date
-from typing import Dict, List, Optional, Sequence, TypeVar
+from typing import Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+import attr
 
 from recidiviz.common.constants.state.state_supervision_violation_response import (
     StateSupervisionViolationResponseDecision,
@@ -122,6 +125,75 @@ def violation_responses_in_window(
     return responses_in_window
 
 
+def _sorted_response_positions(
+    violation_responses: List[StateSupervisionViolationResponseT],
+) -> List[int]:
+    return sorted(
+        (
+            position
+            for position, response in enumerate(violation_responses)
+            if response.response_date is not None
+        ),
+        key=lambda position: (violation_responses[position].response_date, position),
+    )
+
+
+@attr.s
+class ViolationResponseIndex(Generic[StateSupervisionViolationResponseT]):
+    """A class for caching a person's violation responses sorted by response_date, so
+    that the responses in a date window can be found with a binary search rather than
+    a scan of every response.
+    """
+
+    violation_responses: List[StateSupervisionViolationResponseT] = attr.ib()
+
+    # Positions in |violation_responses| of the responses with a set response_date,
+    # sorted by response_date and then position
+    _sorted_positions: List[int] = attr.ib(init=False)
+
+    @_sorted_positions.default
+    def _sorted_positions_default(self) -> List[int]:
+        return _sorted_response_positions(self.violation_responses)
+
+    # The response_date of each response in |_sorted_positions|
+    _sorted_response_dates: List[date] = attr.ib(init=False)
+
+    @_sorted_response_dates.default
+    def _sorted_response_dates_default(self) -> List[date]:
+        sorted_response_dates: List[date] = []
+        for position in self._sorted_positions:
+            response_date = self.violation_responses[position].response_date
+            if response_date is None:
+                raise ValueError(f"Unexpected null response_date at {position}.")
+            sorted_response_dates.append(response_date)
+        return sorted_response_dates
+
+    def window_bounds(
+        self, upper_bound_exclusive: date, lower_bound_inclusive: Optional[date]
+    ) -> Tuple[int, int]:
+        """Returns the start and end of the slice of the date-sorted responses that
+        have a response_date before the |upper_bound_exclusive| date and on or after
+        the |lower_bound_inclusive|, if set. Two windows with the same bounds contain
+        the same responses."""
+        return (
+            bisect.bisect_left(self._sorted_response_dates, lower_bound_inclusive)
+            if lower_bound_inclusive is not None
+            else 0,
+            bisect.bisect_left(self._sorted_response_dates, upper_bound_exclusive),
+        )
+
+    def responses_in_window(
+        self, upper_bound_exclusive: date, lower_bound_inclusive: Optional[date]
+    ) -> List[StateSupervisionViolationResponseT]:
+        """Returns the same responses, in the same order, as
+        violation_responses_in_window for the responses in this index."""
+        start, end = self.window_bounds(upper_bound_exclusive, lower_bound_inclusive)
+        return [
+            self.violation_responses[position]
+            for position in sorted(self._sorted_positions[start:end])
+        ]
+
+
 def identify_most_severe_response_decision(
     decisions: List[StateSupervisionViolationResponseDecision],
 ) -> Optional[StateSupervisionViolationResponseDecision]:
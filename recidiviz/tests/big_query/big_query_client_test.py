@@ -750,6 +750,24 @@ class BigQueryClientImplTest(unittest.TestCase):
         self.mock_client.create_dataset.assert_called()
         self.mock_client.load_table_from_uri.assert_called()
 
+    def test_load_into_table_from_cloud_storage_async_parquet(self) -> None:
+        self.bq_client.load_table_from_cloud_storage_async(
+            destination_dataset_ref=self.mock_dataset_ref,
+            destination_table_id=self.mock_table_id,
+            destination_table_schema=[
+                SchemaField("my_column", "STRING", "NULLABLE", None, ())
+            ],
+            source_uris=["gs://bucket/export-uri.parquet"],
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            source_format=bigquery.SourceFormat.PARQUET,
+        )
+
+        self.mock_client.load_table_from_uri.assert_called()
+        job_config = self.mock_client.load_table_from_uri.call_args.kwargs["job_config"]
+        self.assertEqual(bigquery.SourceFormat.PARQUET, job_config.source_format)
+        self.assertIsNone(job_config.allow_quoted_newlines)
+        self.assertIsNone(job_config.skip_leading_rows)
+
     def test_stream_into_table(self) -> None:
         self.mock_client.insert_rows.return_value = None
 
@@ -19,7 +19,10 @@ import unittest
 
 from recidiviz.big_query.address_overrides import BigQueryAddressOverrides
 from recidiviz.big_query.big_query_address import BigQueryAddress
-from recidiviz.big_query.big_query_query_builder import BigQueryQueryBuilder
+from recidiviz.big_query.big_query_query_builder import (
+    BigQueryQueryBuilder,
+    parse_referenced_table_references,
+)
 
 _DATASET_1 = "dataset_1"
 _DATASET_2 = "dataset_2"
@@ -233,3 +236,34 @@ class BigQueryQueryBuilderTest(unittest.TestCase):
                 "ON my_column;"
             ),
         )
+
+
+class ParseReferencedTableReferencesTest(unittest.TestCase):
+    """Tests for parse_referenced_table_references()."""
+
+    def test_parse_referenced_table_references(self) -> None:
+        query = (
+            "SELECT * FROM `recidiviz-456.dataset_1.table_1` "
+            "JOIN `recidiviz-other.dataset_2.table_2` USING (col)"
+        )
+        self.assertEqual(
+            (
+                ("recidiviz-456", "dataset_1", "table_1"),
+                ("recidiviz-other", "dataset_2", "table_2"),
+            ),
+            parse_referenced_table_references(query),
+        )
+        self.assertEqual(
+            tuple(), parse_referenced_table_references("SELECT * FROM UNNEST([1]);")
+        )
+
+    def test_parse_referenced_table_references_cached(self) -> None:
+        query = "SELECT * FROM `recidiviz-456.dataset_1.table_cached`"
+        parse_referenced_table_references.cache_clear()
+        first_result = parse_referenced_table_references(query)
+        second_result = parse_referenced_table_references(query)
+
+        self.assertIs(first_result, second_result)
+        cache_info = parse_referenced_table_references.cache_info()
+        self.assertEqual(1, cache_info.misses)
+        self.assertEqual(1, cache_info.hits)
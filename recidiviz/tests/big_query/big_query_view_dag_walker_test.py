@@ -32,6 +32,7 @@ from recidiviz.big_query.big_query_view_dag_walker import (
     BigQueryViewDagNode,
     BigQueryViewDagWalker,
     ProcessDagPerfConfig,
+    ProcessDagSchedulingConfig,
 )
 from recidiviz.ingest.direct.raw_data.raw_file_configs import (
     DirectIngestRegionRawFileConfig,
@@ -1313,6 +1314,92 @@ class TestBigQueryViewDagWalkerBase(unittest.TestCase):
 
         self.assertEqual(set(walker.views), set(result.view_results))
 
+    def test_dag_scheduling_config_processes_all_views(self) -> None:
+        walker = BigQueryViewDagWalker(self.diamond_shaped_dag_views_list)
+
+        def process_check_parents(
+            view: BigQueryView, parent_results: Dict[BigQueryView, BigQueryAddress]
+        ) -> BigQueryAddress:
+            node = walker.node_for_view(view)
+            self.assertEqual(
+                node.parent_node_addresses, {p.address for p in parent_results}
+            )
+            return view.address
+
+        result = walker.process_dag(
+            process_check_parents,
+            synchronous=self.synchronous,
+            scheduling_config=ProcessDagSchedulingConfig(
+                max_concurrency=None if self.synchronous else 2
+            ),
+        )
+        self.assertEqual(set(walker.views), set(result.view_results))
+
+    def test_dag_scheduling_config_prioritizes_critical_path(self) -> None:
+        # View 2 is a leaf view, view 1 starts a long chain of views.
+        chain_builders = [
+            SimpleBigQueryViewBuilder(
+                dataset_id="dataset_1",
+                view_id="table_1",
+                description="table_1 description",
+                view_query_template="SELECT * FROM `{project_id}.source_dataset.source_table`",
+            ),
+            SimpleBigQueryViewBuilder(
+                dataset_id="dataset_2",
+                view_id="table_2",
+                description="table_2 description",
+                view_query_template="SELECT * FROM `{project_id}.source_dataset.source_table`",
+            ),
+            SimpleBigQueryViewBuilder(
+                dataset_id="dataset_3",
+                view_id="table_3",
+                description="table_3 description",
+                view_query_template="SELECT * FROM `{project_id}.dataset_1.table_1`",
+            ),
+            SimpleBigQueryViewBuilder(
+                dataset_id="dataset_4",
+                view_id="table_4",
+                description="table_4 description",
+                view_query_template="SELECT * FROM `{project_id}.dataset_3.table_3`",
+            ),
+        ]
+        walker = BigQueryViewDagWalker([b.build() for b in chain_builders])
+
+        processed_order: List[str] = []
+        mutex = threading.Lock()
+
+        def process_simple(
+            view: BigQueryView, _parent_results: Dict[BigQueryView, None]
+        ) -> None:
+            with mutex:
+                processed_order.append(view.view_id)
+
+        walker.process_dag(
+            process_simple,
+            synchronous=self.synchronous,
+            scheduling_config=ProcessDagSchedulingConfig(
+                max_concurrency=None if self.synchronous else 1
+            ),
+        )
+        # The leaf view is deferred while views with a longer chain of views
+        # downstream of them are ready. Once its path length ties with table_4, it
+        # goes first because it was enqueued first.
+        self.assertEqual(["table_1", "table_3", "table_2", "table_4"], processed_order)
+
+        # If the leaf view is known to be expensive, it is processed first.
+        processed_order.clear()
+        walker.process_dag(
+            process_simple,
+            synchronous=self.synchronous,
+            scheduling_config=ProcessDagSchedulingConfig(
+                node_processing_time_estimates={
+                    BigQueryAddress(dataset_id="dataset_2", table_id="table_2"): 10.0
+                },
+                max_concurrency=None if self.synchronous else 1,
+            ),
+        )
+        self.assertEqual(["table_2", "table_1", "table_3", "table_4"], processed_order)
+
     def assertIsValidEmptyParentsView(self, node: BigQueryViewDagNode) -> None:
         """Fails the test if a view that has no parents is an expected view with no
         parents. Failures could be indicative of poorly formed view queries.
@@ -1625,6 +1712,160 @@ class AsynchronousBigQueryViewDagWalkerTest(TestBigQueryViewDagWalkerBase):
         self.assertCountEqual([view_builder_1.build()], unioned_dag.views)
 
 
+class TestProcessDagSchedulingConfig(unittest.TestCase):
+    """Tests for ProcessDagSchedulingConfig and critical path computation."""
+
+    def setUp(self) -> None:
+        self.project_id_patcher = patch("recidiviz.utils.metadata.project_id")
+        self.project_id_patcher.start().return_value = "recidiviz-456"
+        self.diamond_shaped_dag_views_list = [
+            b.build() for b in DIAMOND_SHAPED_DAG_VIEW_BUILDERS_LIST
+        ]
+
+    def tearDown(self) -> None:
+        self.project_id_patcher.stop()
+
+    def test_critical_path_lengths(self) -> None:
+        walker = BigQueryViewDagWalker(self.diamond_shaped_dag_views_list)
+        addresses = [v.address for v in self.diamond_shaped_dag_views_list]
+        scheduling_config = ProcessDagSchedulingConfig(
+            node_processing_time_estimates={addresses[3]: 5.0},
+            default_node_processing_time_seconds=1.0,
+        )
+
+        self.assertEqual(
+            {
+                addresses[0]: 8.0,
+                addresses[1]: 8.0,
+                addresses[2]: 7.0,
+                addresses[3]: 6.0,
+                addresses[4]: 2.0,
+                addresses[5]: 1.0,
+            },
+            walker.critical_path_lengths(scheduling_config),
+        )
+        self.assertEqual(
+            {
+                addresses[0]: 1.0,
+                addresses[1]: 1.0,
+                addresses[2]: 2.0,
+                addresses[3]: 7.0,
+                addresses[4]: 3.0,
+                addresses[5]: 8.0,
+            },
+            walker.critical_path_lengths(scheduling_config, reverse=True),
+        )
+
+    def test_from_process_dag_result(self) -> None:
+        walker = BigQueryViewDagWalker(self.diamond_shaped_dag_views_list)
+
+        result = walker.process_dag(
+            lambda v, _: None, synchronous=True, perf_config=None
+        )
+        scheduling_config = ProcessDagSchedulingConfig.from_process_dag_result(
+            result, default_node_processing_time_seconds=2.5, max_concurrency=3
+        )
+        self.assertEqual(3, scheduling_config.max_concurrency)
+        self.assertEqual(2.5, scheduling_config.default_node_processing_time_seconds)
+        self.assertEqual(
+            {
+                view.address: metadata.node_processing_runtime_seconds
+                for view, metadata in result.view_processing_stats.items()
+            },
+            scheduling_config.node_processing_time_estimates,
+        )
+        self.assertEqual(
+            {v.address for v in self.diamond_shaped_dag_views_list},
+            set(scheduling_config.node_processing_time_estimates),
+        )
+
+        # Nodes without an estimate fall back to the default
+        self.assertEqual(
+            2.5,
+            scheduling_config.estimated_processing_time(
+                BigQueryAddress(dataset_id="other_dataset", table_id="other_table")
+            ),
+        )
+
+    def test_invalid_max_concurrency(self) -> None:
+        with self.assertRaisesRegex(
+            ValueError, r"Expected max_concurrency to be a positive number"
+        ):
+            _ = ProcessDagSchedulingConfig(max_concurrency=0)
+
+    def test_max_concurrency_synchronous_raises(self) -> None:
+        walker = BigQueryViewDagWalker(self.diamond_shaped_dag_views_list)
+        with self.assertRaisesRegex(
+            ValueError, r"Cannot set max_concurrency on the scheduling_config"
+        ):
+            walker.process_dag(
+                lambda v, _: None,
+                synchronous=True,
+                scheduling_config=ProcessDagSchedulingConfig(max_concurrency=1),
+            )
+
+
+class TestDagReachabilityIndex(unittest.TestCase):
+    """Tests for the reachability index used to compute sub-DAGs."""
+
+    def setUp(self) -> None:
+        self.project_id_patcher = patch("recidiviz.utils.metadata.project_id")
+        self.project_id_patcher.start().return_value = "recidiviz-456"
+        self.diamond_shaped_dag_views_list = [
+            b.build() for b in DIAMOND_SHAPED_DAG_VIEW_BUILDERS_LIST
+        ]
+
+    def tearDown(self) -> None:
+        self.project_id_patcher.stop()
+
+    def test_reachability_index(self) -> None:
+        walker = BigQueryViewDagWalker(self.diamond_shaped_dag_views_list)
+        addresses = [v.address for v in self.diamond_shaped_dag_views_list]
+        index = walker.reachability_index
+
+        self.assertCountEqual(
+            [addresses[0], addresses[1], addresses[2], addresses[4]],
+            index.addresses_for_bits(index.ancestor_bits([addresses[4]])),
+        )
+        self.assertCountEqual(
+            [addresses[2], addresses[3], addresses[4], addresses[5]],
+            index.addresses_for_bits(index.descendant_bits([addresses[2]])),
+        )
+        self.assertCountEqual(
+            [addresses[0], addresses[3]],
+            index.addresses_for_bits(
+                index.bits_for_addresses([addresses[0], addresses[3]])
+            ),
+        )
+
+        # Addresses are returned in topological order
+        all_addresses = index.addresses_for_bits(index.ancestor_bits([addresses[5]]))
+        for i, address in enumerate(all_addresses):
+            parents = walker.nodes_by_address[address].parent_node_addresses
+            self.assertTrue(parents.issubset(set(all_addresses[:i])))
+
+    def test_populated_sub_dags_built_lazily(self) -> None:
+        walker = BigQueryViewDagWalker(self.diamond_shaped_dag_views_list)
+        walker.populate_ancestor_sub_dags()
+        walker.populate_descendant_sub_dags()
+
+        with patch.object(
+            BigQueryViewDagWalker, "_sub_dag_for_bits", autospec=True
+        ) as mock_sub_dag_for_bits:
+            walker.populate_ancestor_sub_dags()
+            walker.populate_descendant_sub_dags()
+            mock_sub_dag_for_bits.assert_not_called()
+
+        node = walker.node_for_view(self.diamond_shaped_dag_views_list[2])
+        self.assertIs(node.ancestors_sub_dag, node.ancestors_sub_dag)
+        self.assertCountEqual(
+            self.diamond_shaped_dag_views_list[0:3], node.ancestors_sub_dag.views
+        )
+        self.assertCountEqual(
+            self.diamond_shaped_dag_views_list[2:6], node.descendants_sub_dag.views
+        )
+
+
 class TestBigQueryViewDagNode(unittest.TestCase):
     """Tests for BigQueryViewDagNode"""
 
@@ -0,0 +1,108 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for deployed_views_manifest.py."""
+import unittest
+from unittest import mock
+
+from google.cloud import bigquery
+
+from recidiviz.big_query.big_query_view import SimpleBigQueryViewBuilder
+from recidiviz.big_query.deployed_views_manifest import (
+    DeployedViewManifestEntry,
+    DeployedViewsManifest,
+    DeployedViewsManifestStore,
+    deployed_views_manifest_path,
+)
+from recidiviz.fakes.fake_gcs_file_system import FakeGCSFileSystem
+
+
+class DeployedViewsManifestTest(unittest.TestCase):
+    """Tests for DeployedViewsManifest."""
+
+    def setUp(self) -> None:
+        self.metadata_patcher = mock.patch(
+            "recidiviz.utils.metadata.project_id", return_value="recidiviz-456"
+        )
+        self.metadata_patcher.start()
+        self.view_builder = SimpleBigQueryViewBuilder(
+            dataset_id="dataset",
+            view_id="my_view",
+            description="my_view description",
+            view_query_template="SELECT * FROM `{project_id}.source.table`",
+            should_materialize=True,
+            clustering_fields=["col"],
+        )
+        self.schema = [bigquery.SchemaField("col", "STRING", "NULLABLE")]
+
+    def tearDown(self) -> None:
+        self.metadata_patcher.stop()
+
+    def test_view_has_changed(self) -> None:
+        view = self.view_builder.build()
+        manifest = DeployedViewsManifest(
+            entries={
+                view.address: DeployedViewManifestEntry.for_deployed_view(
+                    view, self.schema
+                )
+            }
+        )
+        self.assertFalse(manifest.view_has_changed(view))
+
+        changed_query_view = SimpleBigQueryViewBuilder(
+            dataset_id="dataset",
+            view_id="my_view",
+            description="my_view description",
+            view_query_template="SELECT col FROM `{project_id}.source.table`",
+            should_materialize=True,
+            clustering_fields=["col"],
+        ).build()
+        self.assertTrue(manifest.view_has_changed(changed_query_view))
+
+        changed_clustering_view = SimpleBigQueryViewBuilder(
+            dataset_id="dataset",
+            view_id="my_view",
+            description="my_view description",
+            view_query_template="SELECT * FROM `{project_id}.source.table`",
+            should_materialize=True,
+            clustering_fields=None,
+        ).build()
+        self.assertTrue(manifest.view_has_changed(changed_clustering_view))
+
+        new_view = SimpleBigQueryViewBuilder(
+            dataset_id="dataset",
+            view_id="my_new_view",
+            description="my_new_view description",
+            view_query_template="SELECT * FROM `{project_id}.source.table`",
+        ).build()
+        self.assertTrue(manifest.view_has_changed(new_view))
+
+    def test_store_round_trip(self) -> None:
+        view = self.view_builder.build()
+        manifest = DeployedViewsManifest(
+            entries={
+                view.address: DeployedViewManifestEntry.for_deployed_view(
+                    view, self.schema
+                )
+            }
+        )
+        store = DeployedViewsManifestStore(
+            fs=FakeGCSFileSystem(), path=deployed_views_manifest_path("my_prefix")
+        )
+        self.assertIsNone(store.read())
+
+        store.write(manifest)
+        self.assertEqual(manifest, store.read())
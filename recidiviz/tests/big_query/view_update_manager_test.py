@@ -21,13 +21,19 @@ from typing import Iterator, Set, Tuple
 from unittest import mock
 from unittest.mock import MagicMock, call, create_autospec, patch
 
-from google.cloud import bigquery
+from google.cloud import bigquery, exceptions
 
 from recidiviz.big_query import view_update_manager
 from recidiviz.big_query.big_query_address import BigQueryAddress
 from recidiviz.big_query.big_query_table_checker import BigQueryTableChecker
 from recidiviz.big_query.big_query_view import BigQueryView, SimpleBigQueryViewBuilder
+from recidiviz.big_query.deployed_views_manifest import (
+    DeployedViewManifestEntry,
+    DeployedViewsManifest,
+    deployed_views_manifest_path,
+)
 from recidiviz.big_query.view_update_manager import execute_update_all_managed_views
+from recidiviz.fakes.fake_gcs_file_system import FakeGCSFileSystem
 from recidiviz.utils.environment import (
     GCP_PROJECT_PRODUCTION,
     GCP_PROJECT_STAGING,
@@ -568,6 +574,105 @@ class ViewManagerTest(unittest.TestCase):
         self.mock_client.delete_dataset.assert_not_called()
         self.assertEqual(self.mock_client.delete_table.call_count, 3)
 
+    def test_create_managed_dataset_and_deploy_views_for_view_builders_incremental(
+        self,
+    ) -> None:
+        """Tests that views which are unchanged since the last deploy (and have no
+        changed ancestors) are skipped without any BigQuery calls, while changed views
+        and their descendants are updated.
+        """
+        dataset = bigquery.dataset.DatasetReference(_PROJECT_ID, _DATASET_NAME)
+
+        mock_view_builders = [
+            SimpleBigQueryViewBuilder(
+                dataset_id=_DATASET_NAME,
+                view_id="my_fake_view",
+                description="my_fake_view description",
+                view_query_template="SELECT NULL LIMIT 0",
+                should_materialize=True,
+            ),
+            SimpleBigQueryViewBuilder(
+                dataset_id=_DATASET_NAME,
+                view_id="my_fake_view_2",
+                description="my_fake_view_2 description",
+                view_query_template="SELECT NULL LIMIT 0",
+                should_materialize=True,
+            ),
+            SimpleBigQueryViewBuilder(
+                dataset_id=_DATASET_NAME,
+                view_id="my_fake_view_3",
+                description="my_fake_view_3 description",
+                view_query_template=f"SELECT * FROM `{{project_id}}.{_DATASET_NAME}.my_fake_view_2`",
+                should_materialize=True,
+            ),
+        ]
+        views = [b.build() for b in mock_view_builders]
+        schema = [bigquery.SchemaField("some_field", "STRING", "REQUIRED")]
+
+        # The first view is unchanged, the second view has a new query.
+        previous_manifest = DeployedViewsManifest(
+            entries={
+                views[0].address: DeployedViewManifestEntry.for_deployed_view(
+                    views[0], schema
+                ),
+                views[1].address: DeployedViewManifestEntry.for_deployed_view(
+                    views[0], schema
+                ),
+                views[2].address: DeployedViewManifestEntry.for_deployed_view(
+                    views[2], schema
+                ),
+            }
+        )
+
+        self.mock_client.dataset_ref_for_id.return_value = dataset
+        self.mock_client.get_table.side_effect = exceptions.NotFound("Not found")
+        self.mock_client.create_or_update_view.return_value = mock.MagicMock(
+            schema=schema
+        )
+
+        manifest = view_update_manager.create_managed_dataset_and_deploy_views_for_view_builders(
+            view_source_table_datasets=VIEW_SOURCE_TABLE_DATASETS,
+            view_builders_to_update=mock_view_builders,
+            historically_managed_datasets_to_clean=None,
+            previously_deployed_views_manifest=previous_manifest,
+        )
+
+        self.mock_client.create_or_update_view.assert_has_calls(
+            [
+                mock.call(views[1], might_exist=True),
+                mock.call(views[2], might_exist=True),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(2, self.mock_client.create_or_update_view.call_count)
+        self.mock_client.materialize_view_to_table.assert_has_calls(
+            [
+                mock.call(view=views[1], use_query_cache=True),
+                mock.call(view=views[2], use_query_cache=True),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(2, self.mock_client.materialize_view_to_table.call_count)
+
+        # The returned manifest reflects the new definitions of all views
+        self.assertEqual({v.address for v in views}, set(manifest.entries))
+        for view in views:
+            self.assertFalse(manifest.view_has_changed(view))
+
+    def test_create_managed_dataset_and_deploy_views_incremental_force_materialize(
+        self,
+    ) -> None:
+        with self.assertRaisesRegex(
+            ValueError, r"Cannot skip unchanged views when force_materialize is set"
+        ):
+            # pylint: disable=protected-access
+            view_update_manager._create_managed_dataset_and_deploy_views(
+                [],
+                bq_region_override=None,
+                force_materialize=True,
+                previously_deployed_views_manifest=DeployedViewsManifest(entries={}),
+            )
+
     def test_create_dataset_and_update_views(self) -> None:
         """Test that create_dataset_and_update_views creates a dataset if necessary, and updates all views."""
         dataset = bigquery.dataset.DatasetReference(_PROJECT_ID, _DATASET_NAME)
@@ -906,8 +1011,20 @@ class TestExecuteUpdateAllManagedViews(unittest.TestCase):
             return_value=GCPEnvironment.PRODUCTION.value,
         )
         self.environment_patcher.start()
+        self.project_id_patcher = mock.patch(
+            "recidiviz.utils.metadata.project_id", return_value="test-project"
+        )
+        self.project_id_patcher.start()
+        self.fake_fs = FakeGCSFileSystem()
+        self.gcsfs_factory_patcher = mock.patch(
+            "recidiviz.big_query.view_update_manager.GcsfsFactory.build",
+            return_value=self.fake_fs,
+        )
+        self.gcsfs_factory_patcher.start()
 
     def tearDown(self) -> None:
+        self.gcsfs_factory_patcher.stop()
+        self.project_id_patcher.stop()
         self.environment_patcher.stop()
         self.all_views_update_success_persister_patcher.stop()
 
@@ -924,8 +1041,15 @@ class TestExecuteUpdateAllManagedViews(unittest.TestCase):
         _mock_bq_client: MagicMock,
         _mock_view_builders: MagicMock,
     ) -> None:
+        mock_create.return_value = DeployedViewsManifest(entries={})
         execute_update_all_managed_views("test-project", None)
         mock_create.assert_called()
+        self.assertEqual(True, mock_create.call_args.kwargs["force_materialize"])
+        self.assertIsNone(
+            mock_create.call_args.kwargs["previously_deployed_views_manifest"]
+        )
+        # The manifest is only read and written by incremental updates
+        self.assertFalse(self.fake_fs.exists(deployed_views_manifest_path(None)))
         self.mock_all_views_update_success_persister.record_success_in_bq.assert_called_with(
             deployed_view_builders=mock.ANY,
             dataset_override_prefix=None,
@@ -945,6 +1069,7 @@ class TestExecuteUpdateAllManagedViews(unittest.TestCase):
         _mock_bq_client: MagicMock,
         _mock_view_builders: MagicMock,
     ) -> None:
+        mock_create.return_value = DeployedViewsManifest(entries={})
         execute_update_all_managed_views("test-project", "test_prefix")
         mock_create.assert_called()
         self.mock_all_views_update_success_persister.record_success_in_bq.assert_called_with(
@@ -952,3 +1077,55 @@ class TestExecuteUpdateAllManagedViews(unittest.TestCase):
             dataset_override_prefix="test_prefix",
             runtime_sec=mock.ANY,
         )
+
+    @mock.patch(
+        "recidiviz.big_query.view_update_manager.deployed_view_builders",
+    )
+    @mock.patch("recidiviz.big_query.view_update_manager.BigQueryClientImpl")
+    @mock.patch(
+        "recidiviz.big_query.view_update_manager.create_managed_dataset_and_deploy_views_for_view_builders"
+    )
+    def test_execute_update_all_managed_views_incremental(
+        self,
+        mock_create: MagicMock,
+        _mock_bq_client: MagicMock,
+        _mock_view_builders: MagicMock,
+    ) -> None:
+        mock_create.return_value = DeployedViewsManifest(entries={})
+
+        # No manifest exists yet, so we fall back to a full update
+        execute_update_all_managed_views("test-project", None, incremental=True)
+        self.assertEqual(True, mock_create.call_args.kwargs["force_materialize"])
+        self.assertIsNone(
+            mock_create.call_args.kwargs["previously_deployed_views_manifest"]
+        )
+
+        # Now that a manifest has been written, the update is incremental
+        deployed_manifest = DeployedViewsManifest(
+            entries={
+                BigQueryAddress(
+                    dataset_id="dataset", table_id="view"
+                ): DeployedViewManifestEntry(
+                    view_query_hash="query_hash",
+                    description_hash="description_hash",
+                    clustering_fields=None,
+                    materialized_address=None,
+                    schema=[],
+                )
+            }
+        )
+        mock_create.return_value = deployed_manifest
+        execute_update_all_managed_views("test-project", None, incremental=True)
+        self.assertEqual(False, mock_create.call_args.kwargs["force_materialize"])
+        self.assertEqual(
+            DeployedViewsManifest(entries={}),
+            mock_create.call_args.kwargs["previously_deployed_views_manifest"],
+        )
+
+        # The stored manifest is replaced by the one for the views just deployed
+        mock_create.return_value = DeployedViewsManifest(entries={})
+        execute_update_all_managed_views("test-project", None, incremental=True)
+        self.assertEqual(
+            deployed_manifest,
+            mock_create.call_args.kwargs["previously_deployed_views_manifest"],
+        )
@@ -0,0 +1,86 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Test the ArimaFitCache object"""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from recidiviz.calculator.modeling.population_projection import arima_fit_cache
+from recidiviz.calculator.modeling.population_projection.arima_fit_cache import (
+    ArimaFitCache,
+)
+
+
+class TestArimaFitCache(unittest.TestCase):
+    """Test the ArimaFitCache reuses fits"""
+
+    def setUp(self) -> None:
+        ArimaFitCache.clear()
+        self.series = np.array([10.0, 12.0, 11.0, 14.0, 15.0, 13.0, 16.0])
+
+    def tearDown(self) -> None:
+        ArimaFitCache.clear()
+
+    def test_fits_reused_in_memory(self) -> None:
+        cache = ArimaFitCache()
+        with patch.object(
+            arima_fit_cache, "fit_arima", wraps=arima_fit_cache.fit_arima
+        ) as mock_fit:
+            fitted_models = cache.fit_all([self.series, self.series[::-1]])
+            self.assertEqual(2, mock_fit.call_count)
+
+            # A second cache with the same series and a duplicate series are not refit
+            self.assertEqual(
+                [fitted_models[0], fitted_models[0], fitted_models[1]],
+                ArimaFitCache().fit_all(
+                    [self.series, self.series.copy(), self.series[::-1]]
+                ),
+            )
+            self.assertEqual(2, mock_fit.call_count)
+
+    def test_fits_reused_from_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            fitted_model = ArimaFitCache(cache_dir).fit(self.series)
+            assert fitted_model is not None
+            self.assertEqual(1, len(os.listdir(cache_dir)))
+
+            ArimaFitCache.clear()
+            with patch.object(arima_fit_cache, "fit_arima") as mock_fit:
+                disk_model = ArimaFitCache(cache_dir).fit(self.series)
+            mock_fit.assert_not_called()
+
+        assert disk_model is not None
+        assert_array_almost_equal(
+            fitted_model.forecast(steps=3), disk_model.forecast(steps=3)
+        )
+
+    def test_parallel_fits_match_serial_fits(self) -> None:
+        series_list = [self.series, self.series[::-1], self.series * 2]
+        serial_models = ArimaFitCache().fit_all(series_list)
+
+        ArimaFitCache.clear()
+        parallel_models = ArimaFitCache().fit_all(series_list, num_processes=2)
+
+        for serial_model, parallel_model in zip(serial_models, parallel_models):
+            assert serial_model is not None and parallel_model is not None
+            assert_array_almost_equal(
+                serial_model.forecast(steps=3), parallel_model.forecast(steps=3)
+            )
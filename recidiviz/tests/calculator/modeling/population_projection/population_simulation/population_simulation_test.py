@@ -310,6 +310,93 @@ class TestPopulationSimulation(unittest.TestCase):
 
         assert_frame_equal(coarse_population_projection, self.macro_projection)
 
+    def test_vectorized_compartments_match_full_compartments(self) -> None:
+        """Assert that the vectorized compartments produce the same projection and outflows"""
+        policy_list = [
+            SparkPolicy(
+                "supervision",
+                "NAR",
+                self.user_inputs.start_time_step + 2,
+                False,
+                TransitionTable.test_non_retroactive_policy,
+            )
+        ]
+        test_data_inputs = SimulationInputData(
+            admissions_data=self.test_admissions_data,
+            transitions_data=self.test_transitions_data,
+            population_data=self.test_population_data,
+            compartments_architecture=self.simulation_architecture,
+            microsim=False,
+            microsim_data=pd.DataFrame(),
+            should_initialize_compartment_populations=False,
+            should_scale_populations_after_step=True,
+            override_cross_flow_function=None,
+        )
+        vectorized_user_inputs = deepcopy(self.user_inputs)
+        vectorized_user_inputs.vectorized_compartments = True
+
+        population_simulation = PopulationSimulationFactory.build_population_simulation(
+            self.user_inputs, policy_list, -5, test_data_inputs
+        )
+        vectorized_population_simulation = (
+            PopulationSimulationFactory.build_population_simulation(
+                vectorized_user_inputs, policy_list, -5, test_data_inputs
+            )
+        )
+
+        assert_frame_equal(
+            population_simulation.simulate_policies(),
+            vectorized_population_simulation.simulate_policies(),
+        )
+        assert_frame_equal(
+            population_simulation.get_outflows(),
+            vectorized_population_simulation.get_outflows(),
+        )
+
+    def test_process_pool_matches_single_process(self) -> None:
+        """Assert that running the sub-simulations in separate processes produces the
+        same projection and outflows"""
+        policy_list = [
+            SparkPolicy(
+                "supervision",
+                "NAR",
+                self.user_inputs.start_time_step + 2,
+                False,
+                TransitionTable.test_non_retroactive_policy,
+            )
+        ]
+        test_data_inputs = SimulationInputData(
+            admissions_data=self.test_admissions_data,
+            transitions_data=self.test_transitions_data,
+            population_data=self.test_population_data,
+            compartments_architecture=self.simulation_architecture,
+            microsim=False,
+            microsim_data=pd.DataFrame(),
+            should_initialize_compartment_populations=False,
+            should_scale_populations_after_step=True,
+            override_cross_flow_function=None,
+        )
+        parallel_user_inputs = deepcopy(self.user_inputs)
+        parallel_user_inputs.num_processes = 2
+
+        population_simulation = PopulationSimulationFactory.build_population_simulation(
+            self.user_inputs, policy_list, -5, test_data_inputs
+        )
+        parallel_population_simulation = (
+            PopulationSimulationFactory.build_population_simulation(
+                parallel_user_inputs, policy_list, -5, test_data_inputs
+            )
+        )
+
+        assert_frame_equal(
+            population_simulation.simulate_policies(),
+            parallel_population_simulation.simulate_policies(),
+        )
+        assert_frame_equal(
+            population_simulation.get_outflows(),
+            parallel_population_simulation.get_outflows(),
+        )
+
     def test_update_attributes_age_recidiviz_schema_matches_example_by_hand(
         self,
     ) -> None:
@@ -0,0 +1,119 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Test the VectorizedCohortTable object"""
+
+import unittest
+
+import pandas as pd
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from recidiviz.calculator.modeling.population_projection.cohort_table import CohortTable
+from recidiviz.calculator.modeling.population_projection.vectorized_cohort_table import (
+    INITIAL_CAPACITY,
+    VectorizedCohortTable,
+)
+
+
+class TestVectorizedCohortTable(unittest.TestCase):
+    """Test the VectorizedCohortTable object matches the CohortTable"""
+
+    @staticmethod
+    def _step_forward(cohort: CohortTable, time_step: int) -> None:
+        """Half of every cohort leaves and a new cohort of 10 starts"""
+        cohort.append_time_step_end_count(cohort.get_latest_population() / 2, time_step)
+        cohort.append_cohort(10, time_step)
+
+    def test_matches_cohort_table(self) -> None:
+        cohort = CohortTable(starting_time_step=2000)
+        vectorized_cohort = VectorizedCohortTable(starting_time_step=2000)
+        # Step past the initial capacity so the matrix has to grow
+        for time_step in range(2000, 2000 + 2 * INITIAL_CAPACITY):
+            self._step_forward(cohort, time_step)
+            self._step_forward(vectorized_cohort, time_step)
+        cohort.scale_cohort_size(2)
+        vectorized_cohort.scale_cohort_size(2)
+
+        assert_frame_equal(
+            cohort.cohort_df, vectorized_cohort.cohort_df, check_names=False
+        )
+        assert_series_equal(
+            cohort.get_latest_population(),
+            vectorized_cohort.get_latest_population(),
+            check_names=False,
+        )
+        assert_series_equal(
+            cohort.get_per_time_step_population(),
+            vectorized_cohort.get_per_time_step_population(),
+            check_names=False,
+        )
+        assert_series_equal(
+            cohort.get_cohort_timeline(2010),
+            vectorized_cohort.get_cohort_timeline(2010),
+            check_names=False,
+        )
+
+    def test_cross_simulation_cohorts_round_trip(self) -> None:
+        vectorized_cohort = VectorizedCohortTable(starting_time_step=2000)
+        for time_step in range(2000, 2005):
+            self._step_forward(vectorized_cohort, time_step)
+        cohort_df = vectorized_cohort.pop_cohorts()
+        self.assertTrue(vectorized_cohort.cohort_df.empty)
+
+        # Drop a cohort in the middle of the table, as a cross flow function might
+        vectorized_cohort.ingest_cross_simulation_cohorts(cohort_df.drop(2002))
+        assert_frame_equal(cohort_df.drop(2002), vectorized_cohort.cohort_df)
+        self.assertEqual(
+            cohort_df.drop(2002)[2004].sum(),
+            vectorized_cohort.get_latest_total_population(),
+        )
+
+        self._step_forward(vectorized_cohort, 2005)
+        self.assertListEqual(
+            [1999, 2000, 2001, 2003, 2004, 2005],
+            list(vectorized_cohort.get_latest_population().index),
+        )
+
+    def test_monotonic_decreasing_size(self) -> None:
+        """Tests that cohort size can only decrease over time"""
+        cohort = VectorizedCohortTable(starting_time_step=2000)
+        cohort.append_time_step_end_count(cohort.get_latest_population(), 2000)
+        cohort.append_cohort(1, 2000)
+
+        with self.assertRaises(ValueError):
+            cohort.append_time_step_end_count(
+                cohort_sizes=pd.Series({2000: 2}),
+                projection_time_step=2001,
+            )
+
+    def test_duplicate_year_data_rejected(self) -> None:
+        """Tests that yearly data added to cohort must be in a new year"""
+        cohort = VectorizedCohortTable(starting_time_step=2000)
+        cohort.append_time_step_end_count(cohort.get_latest_population(), 2000)
+        cohort.append_cohort(1, 2000)
+        with self.assertRaisesRegex(
+            ValueError, "Cannot overwrite cohort for time 2000"
+        ):
+            cohort.append_time_step_end_count(
+                cohort_sizes=pd.Series({2000: 0.5}),
+                projection_time_step=2000,
+            )
+        with self.assertRaisesRegex(
+            ValueError, "Cannot overwrite cohort for time 2000"
+        ):
+            cohort.append_cohort(1, 2000)
+        with self.assertRaisesRegex(ValueError, "outside of CohortTable timeline"):
+            cohort.append_cohort(1, 2001)
@@ -0,0 +1,161 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for the shared GcsfsCsvReaderDelegate implementations."""
+import threading
+import unittest
+from typing import List, Optional
+
+import pandas as pd
+
+from recidiviz.cloud_storage.gcs_file_system import GCSFileSystem
+from recidiviz.cloud_storage.gcsfs_csv_reader import GcsfsCsvReader
+from recidiviz.cloud_storage.gcsfs_csv_reader_delegates import (
+    SplittingGcsfsCsvReaderDelegate,
+)
+from recidiviz.cloud_storage.gcsfs_path import GcsfsFilePath
+from recidiviz.fakes.fake_gcs_file_system import FakeGCSFileSystem
+from recidiviz.tests.ingest import fixtures
+
+
+class _TestSplittingDelegate(SplittingGcsfsCsvReaderDelegate):
+    """Test-only SplittingGcsfsCsvReaderDelegate that writes each chunk unchanged."""
+
+    def __init__(
+        self,
+        path: GcsfsFilePath,
+        fs: GCSFileSystem,
+        max_in_flight_chunks: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            path, fs, include_header=True, max_in_flight_chunks=max_in_flight_chunks
+        )
+        self.ready_chunk_nums: List[int] = []
+
+    def transform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df
+
+    def get_output_path(self, chunk_num: int) -> GcsfsFilePath:
+        return GcsfsFilePath.from_absolute_path(
+            f"gs://temp-bucket/temp_{chunk_num}.csv"
+        )
+
+    def on_chunk_output_ready(self, chunk_num: int, output_path: GcsfsFilePath) -> None:
+        self.ready_chunk_nums.append(chunk_num)
+
+
+class SplittingGcsfsCsvReaderDelegateTest(unittest.TestCase):
+    """Tests for the SplittingGcsfsCsvReaderDelegate."""
+
+    def setUp(self) -> None:
+        self.fake_gcs = FakeGCSFileSystem()
+        self.reader = GcsfsCsvReader(self.fake_gcs)
+
+    def _add_fixture(self, file_name: str) -> GcsfsFilePath:
+        file_path = fixtures.as_filepath(file_name)
+        gcs_path = GcsfsFilePath.from_absolute_path(file_path)
+        self.fake_gcs.test_add_path(gcs_path, file_path)
+        return gcs_path
+
+    def _output_contents(self, delegate: _TestSplittingDelegate) -> List[str]:
+        return [self.fake_gcs.download_as_string(p) for p in delegate.output_paths]
+
+    def test_pipelined_output_matches_serial(self) -> None:
+        gcs_path = self._add_fixture("encoded_utf_8.csv")
+
+        serial_delegate = _TestSplittingDelegate(gcs_path, self.fake_gcs)
+        self.reader.streaming_read(gcs_path, delegate=serial_delegate, chunk_size=1)
+        serial_contents = self._output_contents(serial_delegate)
+
+        pipelined_delegate = _TestSplittingDelegate(
+            gcs_path, self.fake_gcs, max_in_flight_chunks=3
+        )
+        self.reader.streaming_read(gcs_path, delegate=pipelined_delegate, chunk_size=1)
+
+        self.assertEqual(4, len(pipelined_delegate.output_paths))
+        self.assertEqual(serial_delegate.output_paths, pipelined_delegate.output_paths)
+        self.assertEqual(serial_contents, self._output_contents(pipelined_delegate))
+        self.assertEqual(["symbol", "name"], pipelined_delegate.output_columns)
+        self.assertEqual([0, 1, 2, 3], serial_delegate.ready_chunk_nums)
+        self.assertEqual([0, 1, 2, 3], pipelined_delegate.ready_chunk_nums)
+
+    def test_pipelined_chunks_released_in_order(self) -> None:
+        gcs_path = self._add_fixture("encoded_utf_8.csv")
+        chunk_1_uploaded = threading.Event()
+
+        class _SlowFirstChunkDelegate(_TestSplittingDelegate):
+            def transform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+                # Chunk 0 doesn't finish until chunk 1 has been transformed
+                if df.index[0] == 0:
+                    if not chunk_1_uploaded.wait(timeout=10):
+                        raise ValueError("Chunk 1 was not processed in parallel.")
+                elif df.index[0] == 1:
+                    chunk_1_uploaded.set()
+                return df
+
+        delegate = _SlowFirstChunkDelegate(
+            gcs_path, self.fake_gcs, max_in_flight_chunks=2
+        )
+        self.reader.streaming_read(gcs_path, delegate=delegate, chunk_size=1)
+
+        self.assertEqual([0, 1, 2, 3], delegate.ready_chunk_nums)
+        self.assertEqual(
+            [
+                GcsfsFilePath.from_absolute_path(f"gs://temp-bucket/temp_{i}.csv")
+                for i in range(4)
+            ],
+            delegate.output_paths,
+        )
+
+    def test_pipelined_read_with_failure_first(self) -> None:
+        gcs_path = self._add_fixture("encoded_latin_1.csv")
+
+        delegate = _TestSplittingDelegate(
+            gcs_path, self.fake_gcs, max_in_flight_chunks=2
+        )
+        self.reader.streaming_read(gcs_path, delegate=delegate, chunk_size=1)
+
+        self.assertEqual(4, len(delegate.output_paths))
+        self.assertEqual(
+            {gcs_path, *delegate.output_paths}, set(self.fake_gcs.all_paths)
+        )
+
+    def test_pipelined_upload_exception_cleans_up(self) -> None:
+        gcs_path = self._add_fixture("encoded_utf_8.csv")
+
+        class _TestException(ValueError):
+            pass
+
+        class _ExceptionDelegate(_TestSplittingDelegate):
+            def transform_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+                if df.index[0] == 2:
+                    raise _TestException("We crashed processing!")
+                return df
+
+        delegate = _ExceptionDelegate(gcs_path, self.fake_gcs, max_in_flight_chunks=2)
+        with self.assertRaises(_TestException):
+            self.reader.streaming_read(gcs_path, delegate=delegate, chunk_size=1)
+
+        self.assertEqual([], delegate.output_paths)
+        self.assertEqual([gcs_path], self.fake_gcs.all_paths)
+
+    def test_invalid_max_in_flight_chunks(self) -> None:
+        gcs_path = GcsfsFilePath.from_absolute_path("gs://bucket/file.csv")
+        with self.assertRaisesRegex(
+            ValueError,
+            r"Expected max_in_flight_chunks to be a positive number, found \[0\].",
+        ):
+            _ = _TestSplittingDelegate(gcs_path, self.fake_gcs, max_in_flight_chunks=0)
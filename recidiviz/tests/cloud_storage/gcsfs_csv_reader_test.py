@@ -18,6 +18,7 @@
 
 import unittest
 from typing import List, Optional
+from unittest.mock import patch
 
 import pandas as pd
 import pandas.errors
@@ -165,13 +166,57 @@ class GcsfsCsvReaderTest(unittest.TestCase):
         delegate = _TestGcsfsCsvReaderDelegate()
         self.reader.streaming_read(gcs_path, delegate=delegate, chunk_size=1)
 
-        index = COMMON_RAW_FILE_ENCODINGS.index("ISO-8859-1")
-        self.assertEqual(index + 1, len(delegate.encodings_attempted))
+        # The UTF-8 encoding is ruled out by sampling the start of the file, so we
+        # never attempt to read the file with it.
+        self.assertEqual(["ISO-8859-1"], delegate.encodings_attempted)
+        self.assertEqual("ISO-8859-1", delegate.successful_encoding)
+        self.assertEqual(4, len(delegate.dataframes))
         self.assertEqual(
-            COMMON_RAW_FILE_ENCODINGS[: (index + 1)], delegate.encodings_attempted
+            {"ISO-8859-1"}, {encoding for encoding, df in delegate.dataframes}
         )
+        self.assertEqual(0, delegate.decode_errors)
+        self.assertEqual(0, delegate.exceptions)
+
+    @patch(
+        "recidiviz.cloud_storage.read_only_encoding_detecting_stream.ENCODING_SAMPLE_SIZE_BYTES",
+        20,
+    )
+    def test_read_with_failure_after_sample_switches_encoding(self) -> None:
+        file_path = fixtures.as_filepath("encoded_latin_1.csv")
+        gcs_path = GcsfsFilePath.from_absolute_path(file_path)
+        self.fake_gcs.test_add_path(gcs_path, file_path)
+
+        delegate = _TestGcsfsCsvReaderDelegate()
+        self.reader.streaming_read(gcs_path, delegate=delegate, chunk_size=1)
+
+        # The sample is all ASCII so we start with UTF-8, then switch to ISO-8859-1
+        # without restarting the read once we hit a non-UTF-8 character.
+        self.assertEqual(["UTF-8"], delegate.encodings_attempted)
         self.assertEqual("ISO-8859-1", delegate.successful_encoding)
         self.assertEqual(4, len(delegate.dataframes))
+        self.assertEqual(
+            ["?", "+", "\x80", "£"],
+            [df.iloc[0]["symbol"] for _encoding, df in delegate.dataframes],
+        )
+        self.assertEqual(0, delegate.decode_errors)
+        self.assertEqual(0, delegate.exceptions)
+
+    @patch(
+        "recidiviz.cloud_storage.read_only_encoding_detecting_stream.ENCODING_SAMPLE_SIZE_BYTES",
+        20,
+    )
+    def test_read_with_failure_after_non_ascii_restarts(self) -> None:
+        file_path = fixtures.as_filepath("encoded_utf_8_then_latin_1.csv")
+        gcs_path = GcsfsFilePath.from_absolute_path(file_path)
+        self.fake_gcs.test_add_path(gcs_path, file_path)
+
+        delegate = _TestGcsfsCsvReaderDelegate()
+        self.reader.streaming_read(gcs_path, delegate=delegate, chunk_size=1)
+
+        # Non-ASCII text was decoded as UTF-8 before we hit the decode error, so we
+        # must restart the read with ISO-8859-1.
+        self.assertEqual(["UTF-8", "ISO-8859-1"], delegate.encodings_attempted)
+        self.assertEqual("ISO-8859-1", delegate.successful_encoding)
         self.assertEqual(
             {"ISO-8859-1"}, {encoding for encoding, df in delegate.dataframes}
         )
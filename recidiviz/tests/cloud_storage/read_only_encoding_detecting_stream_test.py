@@ -0,0 +1,115 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for ReadOnlyEncodingDetectingStream."""
+import io
+import unittest
+
+from recidiviz.cloud_storage.read_only_encoding_detecting_stream import (
+    ReadOnlyEncodingDetectingStream,
+    is_ascii_compatible_encoding,
+)
+
+_ENCODINGS = ["UTF-8", "ISO-8859-1"]
+
+# Valid UTF-8 up until the last line, which has a latin-1 encoded pound sign
+_ASCII_THEN_LATIN_1 = b"symbol,name\n?,question mark\n\xa3,pound\n"
+_UTF_8_THEN_LATIN_1 = "symbol,name\né,e acute\n".encode("utf-8") + b"\xa3,pound\n"
+
+
+class ReadOnlyEncodingDetectingStreamTest(unittest.TestCase):
+    """Tests for ReadOnlyEncodingDetectingStream."""
+
+    def test_utf_8(self) -> None:
+        contents = "symbol,name\né,e acute\n€,euro\n"
+        stream = ReadOnlyEncodingDetectingStream(
+            io.BytesIO(contents.encode("utf-8")), _ENCODINGS
+        )
+        self.assertEqual("UTF-8", stream.encoding)
+        self.assertEqual(contents, stream.read())
+        self.assertEqual("", stream.read())
+
+    def test_sample_picks_encoding(self) -> None:
+        stream = ReadOnlyEncodingDetectingStream(
+            io.BytesIO(_ASCII_THEN_LATIN_1), _ENCODINGS
+        )
+        self.assertEqual("ISO-8859-1", stream.encoding)
+        self.assertEqual(_ASCII_THEN_LATIN_1.decode("latin-1"), stream.read())
+
+    def test_switch_encoding_mid_stream(self) -> None:
+        stream = ReadOnlyEncodingDetectingStream(
+            io.BytesIO(_ASCII_THEN_LATIN_1), _ENCODINGS, sample_size_bytes=10
+        )
+        self.assertEqual("UTF-8", stream.encoding)
+        self.assertEqual("symbol,name\n", stream.readline())
+        self.assertEqual("?,question mark\n", stream.readline())
+        self.assertEqual("£,pound\n", stream.readline())
+        self.assertEqual("ISO-8859-1", stream.encoding)
+        self.assertEqual("", stream.readline())
+
+    def test_switch_encoding_mid_stream_read_in_pieces(self) -> None:
+        stream = ReadOnlyEncodingDetectingStream(
+            io.BytesIO(_ASCII_THEN_LATIN_1), _ENCODINGS, sample_size_bytes=1
+        )
+        result = ""
+        while block := stream.read(3):
+            result += block
+        self.assertEqual(_ASCII_THEN_LATIN_1.decode("latin-1"), result)
+        self.assertEqual("ISO-8859-1", stream.encoding)
+
+    def test_multi_byte_character_split_across_reads(self) -> None:
+        contents = "aé€b\n"
+        stream = ReadOnlyEncodingDetectingStream(
+            io.BytesIO(contents.encode("utf-8")), _ENCODINGS, sample_size_bytes=2
+        )
+        result = ""
+        while block := stream.read(1):
+            result += block
+        self.assertEqual(contents, result)
+        self.assertEqual("UTF-8", stream.encoding)
+
+    def test_no_switch_after_non_ascii(self) -> None:
+        stream = ReadOnlyEncodingDetectingStream(
+            io.BytesIO(_UTF_8_THEN_LATIN_1), _ENCODINGS, sample_size_bytes=16
+        )
+        self.assertEqual("symbol,name\n", stream.readline())
+        with self.assertRaises(UnicodeDecodeError):
+            stream.read()
+        self.assertEqual("UTF-8", stream.encoding)
+
+    def test_no_encodings_decode_sample(self) -> None:
+        with self.assertRaises(UnicodeDecodeError):
+            _ = ReadOnlyEncodingDetectingStream(
+                io.BytesIO(_ASCII_THEN_LATIN_1), ["UTF-8", "ASCII"]
+            )
+
+    def test_empty(self) -> None:
+        stream = ReadOnlyEncodingDetectingStream(io.BytesIO(b""), _ENCODINGS)
+        self.assertEqual("UTF-8", stream.encoding)
+        self.assertEqual("", stream.read())
+
+    def test_not_ascii_compatible(self) -> None:
+        with self.assertRaisesRegex(
+            ValueError, r"Encoding \[UTF-16\] is not ASCII-compatible."
+        ):
+            _ = ReadOnlyEncodingDetectingStream(io.BytesIO(b""), ["UTF-8", "UTF-16"])
+
+    def test_is_ascii_compatible_encoding(self) -> None:
+        self.assertTrue(is_ascii_compatible_encoding("UTF-8"))
+        self.assertTrue(is_ascii_compatible_encoding("ISO-8859-1"))
+        self.assertTrue(is_ascii_compatible_encoding("WINDOWS-1252"))
+        self.assertFalse(is_ascii_compatible_encoding("UTF-16"))
+        self.assertFalse(is_ascii_compatible_encoding("NOT-AN-ENCODING"))
@@ -19,7 +19,7 @@
 import unittest
 from datetime import date
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import attr
 
@@ -345,6 +345,80 @@ class BuildableAttrTests(unittest.TestCase):
             # Build from dictionary
             _ = FakeBuildableAttrDeluxe.build_from_dictionary(subject_dict)
 
+    def testBuildFromColumns(self) -> None:
+        columns: Dict[str, List[Any]] = {
+            "required_field": ["value", "value_2", "value_3"],
+            "another_required_field": ["another_value"] * 3,
+            "enum_nonnull_field": [FakeEnum.A.value, FakeEnum.B, FakeEnum.A.value],
+            "enum_field": [None, FakeEnum.B.value, None],
+            "date_field": ["1999-01-01", date(2000, 1, 1), "19990101"],
+            "extra_field": [1, 2, 3],
+        }
+
+        subjects = FakeBuildableAttrDeluxe.build_from_columns(columns)
+
+        self.assertEqual(
+            [
+                FakeBuildableAttrDeluxe.build_from_dictionary(
+                    {field: values[i] for field, values in columns.items()}
+                )
+                for i in range(3)
+            ],
+            subjects,
+        )
+        self.assertEqual(
+            FakeBuildableAttrDeluxe(
+                required_field="value_2",
+                another_required_field="another_value",
+                enum_nonnull_field=FakeEnum.B,
+                enum_field=FakeEnum.B,
+                date_field=date(2000, 1, 1),
+            ),
+            subjects[1],
+        )
+
+    def testBuildFromColumns_NoRows(self) -> None:
+        self.assertEqual(
+            [], FakeBuildableAttr.build_from_columns({"required_field": []})
+        )
+
+    def testBuildFromColumns_EmptyColumns(self) -> None:
+        with self.assertRaises(ValueError):
+            _ = FakeBuildableAttr.build_from_columns({})
+
+    def testBuildFromColumns_DifferentLengths(self) -> None:
+        with self.assertRaises(ValueError):
+            _ = FakeBuildableAttr.build_from_columns(
+                {"required_field": ["value"], "field_with_default": [[], []]}
+            )
+
+    def testBuildFromColumns_MissingRequiredArgs(self) -> None:
+        with self.assertRaises(BuilderException):
+            _ = FakeBuildableAttrDeluxe.build_from_columns(
+                {"required_field": ["value"], "another_required_field": ["value"]}
+            )
+
+    def testBuildFromColumns_InvalidForwardRef(self) -> None:
+        with self.assertRaises(ValueError):
+            _ = FakeBuildableAttrDeluxe.build_from_columns(
+                {
+                    "required_field": ["value"],
+                    "another_required_field": ["another_value"],
+                    "enum_nonnull_field": [FakeEnum.A.value],
+                    "field_forward_ref": [FakeBuildableAttr(required_field="value")],
+                }
+            )
+
+    def testBuildFromColumns_WrongEnum(self) -> None:
+        with self.assertRaises(ValueError):
+            _ = FakeBuildableAttrDeluxe.build_from_columns(
+                {
+                    "required_field": ["value"],
+                    "another_required_field": ["another_value"],
+                    "enum_nonnull_field": [InvalidFakeEnum.A],
+                }
+            )
+
 
 class CachedClassStructureReferenceTests(unittest.TestCase):
     """Tests the functionality of the cached _class_structure_reference."""
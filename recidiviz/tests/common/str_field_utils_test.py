@@ -17,6 +17,9 @@
 """Tests for str_field_utils.py"""
 import datetime
 from unittest import TestCase
+from unittest.mock import patch
+
+import dateparser
 
 from recidiviz.common.str_field_utils import (
     NormalizedJSON,
@@ -240,6 +243,45 @@ class TestStrFieldUtils(TestCase):
         with self.assertRaises(ValueError):
             parse_datetime("ABC")
 
+    def test_parseDateTime_fixedFormats_matchDateparser(self) -> None:
+        from_dt = datetime.datetime(2020, 1, 1)
+        settings: "dateparser._Settings" = {
+            "PREFER_DAY_OF_MONTH": "first",
+            "RELATIVE_BASE": from_dt,
+        }
+        for date_string, expect_dateparser_call in [
+            ("5/12/2013", False),
+            ("05/12/2013 13:04:05", False),
+            ("8/21/69", False),
+            ("05-12-2013", False),
+            ("2013/5/12", False),
+            ("2013-5-12", False),
+            ("12-may-2013", False),
+            ("12-MAY-13", False),
+            # Not valid MM/DD/YYYY dates, these are parsed as DD/MM/YYYY by dateparser
+            ("13/05/2013", True),
+            ("12-SEPT-2013", True),
+            # dateparser reads -1200 as a UTC offset
+            ("12-MAY-1200", True),
+        ]:
+            expected = dateparser.parse(
+                date_string, languages=["en"], settings=dict(settings)
+            )
+            with patch.object(
+                dateparser, "parse", wraps=dateparser.parse
+            ) as mock_parse:
+                self.assertEqual(expected, parse_datetime(date_string, from_dt=from_dt))
+            self.assertEqual(expect_dateparser_call, mock_parse.called, date_string)
+
+    def test_parseDateTime_cached(self) -> None:
+        from_dt = datetime.datetime(2020, 1, 1)
+        with patch.object(dateparser, "parse", wraps=dateparser.parse) as mock_parse:
+            parsed = parse_datetime("Feb 3, 2011 4:05", from_dt=from_dt)
+            self.assertEqual(
+                parsed, parse_datetime("Feb 3, 2011 4:05", from_dt=from_dt)
+            )
+        mock_parse.assert_called_once()
+
     def test_parseJSON(self) -> None:
         self.assertEqual("{}", NormalizedJSON().normalized_value)
         self.assertEqual(
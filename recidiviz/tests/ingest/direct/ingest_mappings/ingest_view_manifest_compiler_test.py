@@ -18,9 +18,11 @@
 import csv
 import datetime
 import os
+import tempfile
 import unittest
 from enum import Enum
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, Iterator, List, Optional, Type, Union
+from unittest import mock
 
 from recidiviz.common.constants.enum_parser import EnumParsingError
 from recidiviz.common.constants.states import StateCode
@@ -221,6 +223,15 @@ class FakeSchemaIngestViewManifestCompilerDelegate(IngestViewManifestCompilerDel
         raise ValueError(f"Unexpected test env property: {property_name}")
 
 
+class CachingFakeSchemaIngestViewManifestCompilerDelegate(
+    FakeSchemaIngestViewManifestCompilerDelegate
+):
+    """Fake IngestViewManifestCompilerDelegate whose compiled manifests are cached."""
+
+    def get_compiled_manifest_cache_key(self) -> Optional[str]:
+        return "fake_schema"
+
+
 class FakeIngestViewContentsContext(IngestViewContentsContext):
     """Fake implementation of IngestViewContentsContext for unittests."""
 
@@ -347,6 +358,51 @@ class IngestViewManifestCompilerTest(unittest.TestCase):
         # Assert
         self.assertEqual(expected_output, parsed_output)
 
+    def test_iter_contents_parses_lazily(self) -> None:
+        # Arrange
+        contents_handle = LocalFileContentsHandle(
+            os.path.join(
+                os.path.dirname(ingest_view_files.__file__), "simple_person.csv"
+            ),
+            cleanup_file=False,
+        )
+        rows_read = 0
+
+        def row_iterator() -> Iterator[Dict[str, str]]:
+            nonlocal rows_read
+            for row in csv.DictReader(contents_handle.get_contents_iterator()):
+                rows_read += 1
+                yield row
+
+        # Act
+        entities = self.compiler.compile_manifest(
+            ingest_view_name="simple_person"
+        ).iter_contents(
+            contents_iterator=row_iterator(),
+            context=FakeIngestViewContentsContext(
+                ingest_instance=DirectIngestInstance.SECONDARY,
+                is_production=False,
+                is_staging=False,
+                is_local=False,
+                results_update_datetime=datetime.datetime.now(),
+            ),
+        )
+
+        # Assert
+        self.assertEqual(0, rows_read)
+        self.assertEqual(
+            FakePerson(
+                fake_state_code="US_XX",
+                name="ELAINE BENES",
+                birthdate=datetime.date(1962, 1, 29),
+                external_ids=[],
+            ),
+            next(entities),
+        )
+        self.assertEqual(1, rows_read)
+        self.assertEqual(2, len(list(entities)))
+        self.assertEqual(3, rows_read)
+
     def test_simple_non_person_output(self) -> None:
         # Arrange
         expected_output = [
@@ -2626,3 +2682,79 @@ class IngestViewManifestCompilerTest(unittest.TestCase):
 
         manifest = self.compiler.compile_manifest(ingest_view_name="simple_variables")
         self.assertEqual({FakePerson}, manifest.hydrated_entity_classes())
+
+
+class IngestViewManifestCompilerCacheTest(unittest.TestCase):
+    """Tests for the compiled manifest cache in IngestViewManifestCompiler."""
+
+    def setUp(self) -> None:
+        IngestViewManifestCompiler.clear_cache()
+        self.delegate = CachingFakeSchemaIngestViewManifestCompilerDelegate()
+        self.context = FakeIngestViewContentsContext(
+            ingest_instance=DirectIngestInstance.PRIMARY,
+            is_production=False,
+            is_staging=False,
+            is_local=False,
+            results_update_datetime=datetime.datetime(2023, 1, 1),
+        )
+
+    def tearDown(self) -> None:
+        IngestViewManifestCompiler.clear_cache()
+
+    def _parse_simple_person(
+        self, compiler: IngestViewManifestCompiler
+    ) -> List[Entity]:
+        contents_handle = LocalFileContentsHandle(
+            os.path.join(
+                os.path.dirname(ingest_view_files.__file__), "simple_person.csv"
+            ),
+            cleanup_file=False,
+        )
+        return compiler.compile_manifest(
+            ingest_view_name="simple_person"
+        ).parse_contents(
+            contents_iterator=csv.DictReader(contents_handle.get_contents_iterator()),
+            context=self.context,
+        )
+
+    def test_manifest_compiled_once(self) -> None:
+        with mock.patch.object(
+            YAMLDict, "from_path", wraps=YAMLDict.from_path
+        ) as mock_from_path:
+            manifest = IngestViewManifestCompiler(self.delegate).compile_manifest(
+                ingest_view_name="simple_person"
+            )
+            self.assertIs(
+                manifest,
+                IngestViewManifestCompiler(self.delegate).compile_manifest(
+                    ingest_view_name="simple_person"
+                ),
+            )
+            mock_from_path.assert_called_once()
+
+    def test_manifest_not_cached_without_delegate_cache_key(self) -> None:
+        compiler = IngestViewManifestCompiler(
+            FakeSchemaIngestViewManifestCompilerDelegate()
+        )
+        self.assertIsNot(
+            compiler.compile_manifest(ingest_view_name="simple_person"),
+            compiler.compile_manifest(ingest_view_name="simple_person"),
+        )
+
+    def test_manifest_reused_from_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            expected_output = self._parse_simple_person(
+                IngestViewManifestCompiler(self.delegate, cache_dir=cache_dir)
+            )
+            self.assertEqual(1, len(os.listdir(cache_dir)))
+
+            IngestViewManifestCompiler.clear_cache()
+            with mock.patch.object(
+                YAMLDict, "from_path", wraps=YAMLDict.from_path
+            ) as mock_from_path:
+                parsed_output = self._parse_simple_person(
+                    IngestViewManifestCompiler(self.delegate, cache_dir=cache_dir)
+                )
+            mock_from_path.assert_not_called()
+
+        self.assertEqual(expected_output, parsed_output)
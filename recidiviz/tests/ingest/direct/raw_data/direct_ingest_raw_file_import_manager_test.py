@@ -0,0 +1,104 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for helpers in direct_ingest_raw_file_import_manager.py."""
+import datetime
+import unittest
+
+import pandas as pd
+import pyarrow as pa
+from google.cloud import bigquery
+
+from recidiviz.ingest.direct.raw_data.direct_ingest_raw_file_import_manager import (
+    RawDataStagingFormat,
+    raw_data_df_to_arrow_table,
+)
+
+
+class RawDataStagingFormatTest(unittest.TestCase):
+    """Tests for RawDataStagingFormat."""
+
+    def test_formats(self) -> None:
+        self.assertEqual("csv", RawDataStagingFormat.CSV.file_extension)
+        self.assertEqual(
+            bigquery.SourceFormat.CSV,
+            RawDataStagingFormat.CSV.big_query_source_format,
+        )
+        self.assertEqual("parquet", RawDataStagingFormat.PARQUET.file_extension)
+        self.assertEqual(
+            bigquery.SourceFormat.PARQUET,
+            RawDataStagingFormat.PARQUET.big_query_source_format,
+        )
+
+
+class RawDataDfToArrowTableTest(unittest.TestCase):
+    """Tests for raw_data_df_to_arrow_table()."""
+
+    def test_raw_data_df_to_arrow_table(self) -> None:
+        update_datetime = datetime.datetime(2023, 1, 2, 3, 4, 5, 6)
+        df = pd.DataFrame(
+            {
+                "col_a": ["a", "", "c"],
+                "col_b": ["1", "2", ""],
+                "file_id": [10, 10, 10],
+                "update_datetime": [update_datetime] * 3,
+                "is_deleted": [False] * 3,
+            }
+        )
+        schema = [
+            bigquery.SchemaField("col_a", "STRING", "NULLABLE"),
+            bigquery.SchemaField("col_b", "STRING", "NULLABLE"),
+            bigquery.SchemaField("file_id", "INTEGER", "REQUIRED"),
+            bigquery.SchemaField("update_datetime", "DATETIME", "REQUIRED"),
+            bigquery.SchemaField("is_deleted", "BOOLEAN", "REQUIRED"),
+        ]
+
+        table = raw_data_df_to_arrow_table(df, schema)
+
+        self.assertEqual(
+            pa.schema(
+                [
+                    pa.field("col_a", pa.string(), nullable=True),
+                    pa.field("col_b", pa.string(), nullable=True),
+                    pa.field("file_id", pa.int64(), nullable=False),
+                    pa.field("update_datetime", pa.timestamp("us"), nullable=False),
+                    pa.field("is_deleted", pa.bool_(), nullable=False),
+                ]
+            ),
+            table.schema,
+        )
+        self.assertEqual(
+            {
+                # Empty strings are loaded as nulls, as they would be from a CSV
+                "col_a": ["a", None, "c"],
+                "col_b": ["1", "2", None],
+                "file_id": [10, 10, 10],
+                "update_datetime": [update_datetime] * 3,
+                "is_deleted": [False] * 3,
+            },
+            table.to_pydict(),
+        )
+
+    def test_raw_data_df_to_arrow_table_column_order_from_schema(self) -> None:
+        df = pd.DataFrame({"col_b": ["b"], "col_a": ["a"]})
+        schema = [
+            bigquery.SchemaField("col_a", "STRING", "NULLABLE"),
+            bigquery.SchemaField("col_b", "STRING", "NULLABLE"),
+        ]
+
+        table = raw_data_df_to_arrow_table(df, schema)
+
+        self.assertEqual(["col_a", "col_b"], table.column_names)
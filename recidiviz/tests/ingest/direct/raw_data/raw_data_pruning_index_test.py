@@ -0,0 +1,248 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests for raw_data_pruning_index.py."""
+import datetime
+import unittest
+from typing import Dict
+
+import attr
+import pandas as pd
+import pytz
+
+from recidiviz.cloud_storage.gcsfs_path import GcsfsDirectoryPath
+from recidiviz.fakes.fake_gcs_file_system import FakeGCSFileSystem
+from recidiviz.ingest.direct.raw_data.raw_data_pruning_index import (
+    RawDataPruningDiffer,
+    RawDataPruningIndex,
+    RawDataPruningIndexStore,
+    RowValues,
+    _hash_row,
+)
+from recidiviz.ingest.direct.raw_data.raw_file_configs import (
+    DirectIngestRawFileConfig,
+    RawDataClassification,
+    RawTableColumnFieldType,
+    RawTableColumnInfo,
+)
+
+_DATETIME_1 = datetime.datetime(2023, 1, 1, tzinfo=pytz.UTC)
+_DATETIME_2 = datetime.datetime(2023, 1, 2, tzinfo=pytz.UTC)
+
+
+def _row_hashes(*rows: RowValues) -> Dict[RowValues, str]:
+    return {row[:1]: _hash_row(row) for row in rows}
+
+
+def _column(name: str) -> RawTableColumnInfo:
+    return RawTableColumnInfo(
+        name=name,
+        field_type=RawTableColumnFieldType.STRING,
+        is_pii=False,
+        description=f"{name} description",
+    )
+
+
+class RawDataPruningIndexTest(unittest.TestCase):
+    """Tests for the RawDataPruningIndex, RawDataPruningDiffer and
+    RawDataPruningIndexStore.
+    """
+
+    def setUp(self) -> None:
+        self.raw_file_config = DirectIngestRawFileConfig(
+            file_tag="tagBasic",
+            file_path="path/to/tagBasic.yaml",
+            file_description="file description",
+            data_classification=RawDataClassification.SOURCE,
+            primary_key_cols=["ID"],
+            columns=[_column("ID"), _column("NAME"), _column("CITY")],
+            supplemental_order_by_clause="",
+            encoding="UTF-8",
+            separator=",",
+            custom_line_terminator=None,
+            ignore_quotes=False,
+            always_historical_export=True,
+            no_valid_primary_keys=False,
+            import_chunk_size_rows=10,
+            infer_columns_from_config=False,
+            table_relationships=[],
+        )
+        self.previous_index = RawDataPruningIndex(
+            file_id=1,
+            update_datetime=_DATETIME_1,
+            columns=["ID", "NAME", "CITY"],
+            primary_key_cols=["ID"],
+            row_hashes_by_primary_key=_row_hashes(
+                ("1", "Anna", "Boston"),
+                ("2", "Ben", None),
+                ("3", "Cal", "Denver"),
+            ),
+        )
+
+    def test_diff(self) -> None:
+        differ = RawDataPruningDiffer(
+            raw_file_config=self.raw_file_config, previous_index=self.previous_index
+        )
+        chunk_1 = pd.DataFrame(
+            {
+                # Columns may be ordered / cased differently than in the config
+                "name": ["Anna", "Ben", "Ben"],
+                "ID": ["1", "2", "2"],
+                "CITY": ["Boston", "Austin", "Austin"],
+            }
+        )
+        chunk_2 = pd.DataFrame(
+            {"name": ["Dee"], "ID": ["4"], "CITY": [""]}, index=pd.Index([3])
+        )
+
+        result_1 = differ.diff_chunk(chunk_1)
+        result_2 = differ.diff_chunk(chunk_2)
+
+        # Unchanged row 1 and the duplicate of updated row 2 are pruned
+        self.assertEqual([["Ben", "2", "Austin"]], result_1.values.tolist())
+        # Added rows are kept
+        self.assertIs(chunk_2, result_2)
+        # Row 3 no longer appears in the file
+        deleted_df = differ.deleted_primary_keys_df()
+        self.assertEqual(["ID"], list(deleted_df.columns))
+        self.assertEqual([["3"]], deleted_df.values.tolist())
+
+        self.assertEqual(
+            RawDataPruningIndex(
+                file_id=2,
+                update_datetime=_DATETIME_2,
+                columns=["ID", "NAME", "CITY"],
+                primary_key_cols=["ID"],
+                row_hashes_by_primary_key=_row_hashes(
+                    ("1", "Anna", "Boston"),
+                    ("2", "Ben", "Austin"),
+                    ("4", "Dee", None),
+                ),
+            ),
+            differ.build_index(file_id=2, update_datetime=_DATETIME_2),
+        )
+
+    def test_no_previous_index(self) -> None:
+        differ = RawDataPruningDiffer(
+            raw_file_config=self.raw_file_config, previous_index=None
+        )
+        chunk = pd.DataFrame({"ID": ["1", "1"], "NAME": ["Anna", "Anna"]})
+
+        self.assertIs(chunk, differ.diff_chunk(chunk))
+        with self.assertRaisesRegex(ValueError, "without a previous index"):
+            _ = differ.deleted_primary_keys_df()
+        self.assertEqual(
+            RawDataPruningIndex(
+                file_id=2,
+                update_datetime=_DATETIME_2,
+                columns=["ID", "NAME", "CITY"],
+                primary_key_cols=["ID"],
+                row_hashes_by_primary_key=_row_hashes(("1", "Anna", None)),
+            ),
+            differ.build_index(file_id=2, update_datetime=_DATETIME_2),
+        )
+
+    def test_conflicting_primary_keys(self) -> None:
+        differ = RawDataPruningDiffer(
+            raw_file_config=self.raw_file_config, previous_index=self.previous_index
+        )
+        chunk = pd.DataFrame(
+            {"ID": ["1", "1"], "NAME": ["Anna", "Ava"], "CITY": ["Boston", "Boston"]}
+        )
+
+        self.assertEqual(
+            [["1", "Ava", "Boston"]], differ.diff_chunk(chunk).values.tolist()
+        )
+        self.assertIsNone(differ.build_index(file_id=2, update_datetime=_DATETIME_2))
+
+    def test_empty_file(self) -> None:
+        differ = RawDataPruningDiffer(
+            raw_file_config=self.raw_file_config, previous_index=self.previous_index
+        )
+
+        deleted_df = differ.deleted_primary_keys_df()
+        self.assertEqual(["ID"], list(deleted_df.columns))
+        self.assertTrue(deleted_df.empty)
+        self.assertEqual(
+            self.previous_index,
+            differ.build_index(file_id=2, update_datetime=_DATETIME_2),
+        )
+
+    def test_reset(self) -> None:
+        differ = RawDataPruningDiffer(
+            raw_file_config=self.raw_file_config, previous_index=self.previous_index
+        )
+        _ = differ.diff_chunk(
+            pd.DataFrame({"ID": ["1"], "NAME": ["Ava"], "CITY": ["Boston"]})
+        )
+        differ.reset()
+        _ = differ.diff_chunk(
+            pd.DataFrame({"ID": ["1"], "NAME": ["Anna"], "CITY": ["Boston"]})
+        )
+
+        index = differ.build_index(file_id=2, update_datetime=_DATETIME_2)
+        assert index is not None
+        self.assertEqual(
+            _row_hashes(("1", "Anna", "Boston")), index.row_hashes_by_primary_key
+        )
+
+    def test_missing_column(self) -> None:
+        differ = RawDataPruningDiffer(
+            raw_file_config=self.raw_file_config, previous_index=self.previous_index
+        )
+        with self.assertRaisesRegex(
+            ValueError, r"Found columns missing from file with tag \[tagBasic\]"
+        ):
+            _ = differ.diff_chunk(pd.DataFrame({"ID": ["1"], "NAME": ["Anna"]}))
+
+    def test_can_prune_file(self) -> None:
+        self.assertTrue(
+            self.previous_index.can_prune_file(self.raw_file_config, _DATETIME_2)
+        )
+        self.assertFalse(
+            self.previous_index.can_prune_file(self.raw_file_config, _DATETIME_1)
+        )
+        self.assertFalse(
+            self.previous_index.can_prune_file(
+                attr.evolve(
+                    self.raw_file_config,
+                    columns=[*self.raw_file_config.columns, _column("STATE")],
+                ),
+                _DATETIME_2,
+            )
+        )
+        self.assertFalse(
+            self.previous_index.can_prune_file(
+                attr.evolve(self.raw_file_config, primary_key_cols=["ID", "NAME"]),
+                _DATETIME_2,
+            )
+        )
+
+    def test_store(self) -> None:
+        store = RawDataPruningIndexStore(
+            FakeGCSFileSystem(),
+            GcsfsDirectoryPath.from_absolute_path("gs://bucket/index"),
+        )
+        self.assertIsNone(store.read("tagBasic"))
+
+        store.write("tagBasic", self.previous_index)
+        self.assertEqual(self.previous_index, store.read("tagBasic"))
+        self.assertIsNone(store.read("tagOther"))
+
+        store.delete("tagBasic")
+        self.assertIsNone(store.read("tagBasic"))
+        # Deleting an index that does not exist is a no-op
+        store.delete("tagBasic")
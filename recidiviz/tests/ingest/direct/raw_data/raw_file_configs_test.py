@@ -15,12 +15,17 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """Tests for classes in raw_file_configs.py."""
+import os
+import shutil
+import tempfile
 import unittest
 from typing import Dict
+from unittest import mock
 
 import attr
 
 from recidiviz.common.constants.states import StateCode
+from recidiviz.ingest.direct.raw_data import raw_file_configs
 from recidiviz.ingest.direct.raw_data.raw_file_configs import (
     ColumnEnumValueInfo,
     DirectIngestRawFileConfig,
@@ -36,6 +41,7 @@ from recidiviz.ingest.direct.raw_data.raw_table_relationship_info import (
     RawTableRelationshipInfo,
 )
 from recidiviz.tests.ingest.direct import fake_regions
+from recidiviz.utils.yaml_dict import YAMLDict
 
 
 class TestRawTableColumnInfo(unittest.TestCase):
@@ -1331,3 +1337,55 @@ class TestDirectIngestRegionRawFileConfig(unittest.TestCase):
             },
         )
         self.assertEqual(set(), region_without_parsers.get_datetime_parsers())
+
+
+class TestDirectIngestRegionRawFileConfigCache(unittest.TestCase):
+    """Tests for the process-level cache of parsed raw file configs"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.yaml_config_file_dir = os.path.join(self.temp_dir, "raw_data")
+        shutil.copytree(
+            DirectIngestRegionRawFileConfig(
+                region_code="us_xx", region_module=fake_regions
+            ).yaml_config_file_dir,
+            self.yaml_config_file_dir,
+        )
+        # pylint: disable=protected-access
+        raw_file_configs._RAW_FILE_CONFIGS_BY_REGION.clear()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+        # pylint: disable=protected-access
+        raw_file_configs._RAW_FILE_CONFIGS_BY_REGION.clear()
+
+    def _region_config(self) -> DirectIngestRegionRawFileConfig:
+        return DirectIngestRegionRawFileConfig(
+            region_code="us_xx",
+            region_module=fake_regions,
+            yaml_config_file_dir=self.yaml_config_file_dir,
+        )
+
+    def test_configs_parsed_once(self) -> None:
+        region_config = self._region_config()
+        with mock.patch.object(
+            YAMLDict, "from_path", wraps=YAMLDict.from_path
+        ) as mock_from_path:
+            self.assertEqual(
+                region_config.raw_file_configs, self._region_config().raw_file_configs
+            )
+            mock_from_path.assert_not_called()
+
+    def test_configs_reparsed_when_yaml_modified(self) -> None:
+        region_config = self._region_config()
+        yaml_path = os.path.join(self.yaml_config_file_dir, "us_xx_tagBasicData.yaml")
+        stat = os.stat(yaml_path)
+        os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with mock.patch.object(
+            YAMLDict, "from_path", wraps=YAMLDict.from_path
+        ) as mock_from_path:
+            self.assertEqual(
+                region_config.raw_file_configs, self._region_config().raw_file_configs
+            )
+            mock_from_path.assert_called()
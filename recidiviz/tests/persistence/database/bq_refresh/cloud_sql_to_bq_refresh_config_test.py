@@ -17,6 +17,7 @@
 
 """Tests for cloud_sql_to_bq_export_config.py."""
 
+import datetime
 import string
 import unittest
 from typing import List
@@ -26,6 +27,7 @@ import sqlalchemy
 
 from recidiviz.big_query.big_query_utils import schema_for_sqlalchemy_table
 from recidiviz.cloud_storage.gcsfs_path import GcsfsFilePath
+from recidiviz.common.constants.states import StateCode
 from recidiviz.fakes.fake_gcs_file_system import FakeGCSFileSystem
 from recidiviz.ingest.direct.types.direct_ingest_instance import DirectIngestInstance
 from recidiviz.persistence.database.bq_refresh.cloud_sql_to_bq_refresh_config import (
@@ -182,6 +184,71 @@ region_codes_to_exclude:
                 # Assert that all column types are supported for this table
                 _ = schema_for_sqlalchemy_table(table)
 
+    def test_incremental_refresh_watermark_columns(self) -> None:
+        """Assert that every table refreshed incrementally has its watermark column
+        and a primary key to merge added rows on."""
+        for schema_type in self.enabled_schema_types:
+            config = CloudSqlToBQConfig.for_schema_type(schema_type)
+            for table in config.get_tables_to_export():
+                watermark_column = config.get_incremental_refresh_watermark_column(
+                    table
+                )
+                if watermark_column is None:
+                    continue
+                self.assertIn(watermark_column, table.columns)
+                self.assertTrue(table.primary_key.columns)
+
+    def test_get_incremental_refresh_lower_bound(self) -> None:
+        config = CloudSqlToBQConfig.for_schema_type(SchemaType.OPERATIONS)
+        tables = config.metadata_base.metadata.tables
+        self.assertEqual(
+            datetime.datetime(2023, 1, 2, 2, 4, 5),
+            config.get_incremental_refresh_lower_bound(
+                tables["direct_ingest_instance_status"],
+                datetime.datetime(2023, 1, 2, 3, 4, 5),
+            ),
+        )
+        self.assertEqual(
+            9000,
+            config.get_incremental_refresh_lower_bound(
+                tables["direct_ingest_dataflow_raw_table_upper_bounds"], 10000
+            ),
+        )
+        with self.assertRaisesRegex(
+            ValueError,
+            r"^Table \[direct_ingest_raw_file_metadata\] in schema \[OPERATIONS\] "
+            r"cannot be refreshed incrementally.$",
+        ):
+            config.get_incremental_refresh_lower_bound(
+                tables["direct_ingest_raw_file_metadata"], 10
+            )
+
+    def test_get_single_state_table_federated_export_query_watermark(self) -> None:
+        config = CloudSqlToBQConfig.for_schema_type(SchemaType.OPERATIONS)
+        table = config.metadata_base.metadata.tables[
+            "direct_ingest_dataflow_raw_table_upper_bounds"
+        ]
+        query = config.get_single_state_table_federated_export_query(
+            table, StateCode.US_XX, watermark=10
+        )
+        self.assertTrue(
+            query.endswith(
+                "WHERE region_code IN ('US_XX') AND "
+                "direct_ingest_dataflow_raw_table_upper_bounds.watermark_id > 10"
+            ),
+            query,
+        )
+
+        table = config.metadata_base.metadata.tables["direct_ingest_raw_file_metadata"]
+        with self.assertRaisesRegex(
+            ValueError,
+            r"^Table \[direct_ingest_raw_file_metadata\] in schema \[OPERATIONS\] "
+            r"cannot be refreshed incrementally.$",
+        ):
+            config.get_single_state_table_federated_export_query(
+                table, StateCode.US_XX, watermark=10
+            )
+
     def assertListsDistinctAndEqual(
         self, l1: List[str], l2: List[str], msg_prefix: str
     ) -> None:
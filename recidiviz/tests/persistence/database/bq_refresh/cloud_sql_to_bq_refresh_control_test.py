@@ -171,6 +171,7 @@ class ExecuteCloudSqlToBQRefreshTest(unittest.TestCase):
             schema_type=SchemaType.STATE,
             direct_ingest_instance=DirectIngestInstance.PRIMARY,
             dataset_override_prefix=None,
+            incremental=False,
         )
 
     @mock.patch(f"{REFRESH_CONTROL_PACKAGE_NAME}.federated_bq_schema_refresh")
@@ -16,8 +16,10 @@
 # =============================================================================
 """Tests for federated_cloud_sql_to_bq_refresh.py."""
 
+import datetime
 import importlib
 import unittest
+from typing import Any
 from unittest import mock
 from unittest.mock import create_autospec, patch
 
@@ -296,6 +298,119 @@ class TestFederatedBQSchemaRefresh(unittest.TestCase):
         )
         self.assertEqual(stream_into_table_args[0][2][1].get("schema"), "OPERATIONS")
 
+    @patch(f"{FEDERATED_REFRESH_PACKAGE_NAME}.get_direct_ingest_states_existing_in_env")
+    @patch(
+        f"{FEDERATED_REFRESH_COLLECTOR_PACKAGE_NAME}.get_direct_ingest_states_existing_in_env"
+    )
+    @patch(
+        f"{FEDERATED_REFRESH_PACKAGE_NAME}.CLOUDSQL_REFRESH_DATASETS_THAT_HAVE_EVER_BEEN_MANAGED_BY_SCHEMA",
+        {
+            SchemaType.OPERATIONS: {
+                "operations_v2_cloudsql_connection",
+                "us_xx_operations_regional",
+                "us_ww_operations_regional",
+            }
+        },
+    )
+    def test_federated_cloud_sql_to_bq_refresh_incremental(
+        self,
+        mock_states_fn: mock.MagicMock,
+        mock_states_fn_other: mock.MagicMock,
+    ) -> None:
+        # Arrange
+        def mock_dataset_ref_for_id(dataset_id: str) -> bigquery.DatasetReference:
+            return bigquery.DatasetReference.from_string(
+                dataset_id, default_project=self.mock_project_id
+            )
+
+        def mock_run_query_async(
+            *, query_str: str, use_query_cache: bool
+        ) -> mock.MagicMock:
+            query_job = mock.MagicMock()
+            if "status_timestamp" in query_str:
+                watermark: Any = datetime.datetime(
+                    2023, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+                )
+            else:
+                watermark = 10
+            query_job.__iter__.return_value = [{"watermark": watermark}]
+            return query_job
+
+        state_codes = [StateCode.US_XX, StateCode.US_WW]
+        mock_states_fn.return_value = state_codes
+        mock_states_fn_other.return_value = state_codes
+
+        self.mock_bq_client.dataset_ref_for_id = mock_dataset_ref_for_id
+        self.mock_bq_client.dataset_exists.return_value = True
+        self.mock_bq_client.run_query_async.side_effect = mock_run_query_async
+
+        # Act
+        federated_bq_schema_refresh(SchemaType.OPERATIONS, incremental=True)
+
+        # Assert
+        queries = [
+            c.kwargs["query_str"]
+            for c in self.mock_bq_client.run_query_async.mock_calls
+        ]
+        self.assertCountEqual(
+            [
+                "SELECT MAX(status_timestamp) AS watermark FROM "
+                "`recidiviz-staging.us_xx_operations_regional.direct_ingest_instance_status`",
+                "SELECT MAX(status_timestamp) AS watermark FROM "
+                "`recidiviz-staging.us_ww_operations_regional.direct_ingest_instance_status`",
+                "SELECT MAX(watermark_id) AS watermark FROM "
+                "`recidiviz-staging.us_xx_operations_regional.direct_ingest_dataflow_raw_table_upper_bounds`",
+                "SELECT MAX(watermark_id) AS watermark FROM "
+                "`recidiviz-staging.us_ww_operations_regional.direct_ingest_dataflow_raw_table_upper_bounds`",
+            ],
+            [q for q in queries if q.startswith("SELECT MAX")],
+        )
+        merge_queries = [q for q in queries if q.strip().startswith("MERGE")]
+        self.assertEqual(4, len(merge_queries))
+        expected_merge_query = """
+MERGE `recidiviz-staging.us_xx_operations_regional.direct_ingest_instance_status` materialized
+USING (
+
+SELECT
+    *
+FROM EXTERNAL_QUERY(
+    "recidiviz-staging.us-east2.operations_v2_cloudsql",
+    "SELECT direct_ingest_instance_status.region_code,direct_ingest_instance_status.status_timestamp,CAST(direct_ingest_instance_status.instance as VARCHAR),CAST(direct_ingest_instance_status.status as VARCHAR) FROM direct_ingest_instance_status WHERE region_code IN ('US_XX') AND direct_ingest_instance_status.status_timestamp > '2023-01-02T02:04:05+00:00'"
+)
+) added_rows
+ON materialized.region_code = added_rows.region_code AND materialized.status_timestamp = added_rows.status_timestamp AND materialized.instance = added_rows.instance
+WHEN MATCHED THEN
+  UPDATE SET status = added_rows.status
+WHEN NOT MATCHED THEN
+  INSERT (region_code, status_timestamp, instance, status) VALUES (region_code, status_timestamp, instance, status)"""
+        self.assertIn(expected_merge_query, merge_queries)
+
+        # Tables that cannot be refreshed incrementally are re-materialized in full
+        materialized_tables = {
+            c.kwargs["view"].materialized_address
+            for c in self.mock_bq_client.materialize_view_to_table.mock_calls
+            if not c.kwargs["use_query_cache"]
+        }
+        self.assertIn(
+            BigQueryAddress(
+                dataset_id="us_xx_operations_regional",
+                table_id="direct_ingest_raw_file_metadata",
+            ),
+            materialized_tables,
+        )
+        self.assertNotIn(
+            BigQueryAddress(
+                dataset_id="us_xx_operations_regional",
+                table_id="direct_ingest_instance_status",
+            ),
+            materialized_tables,
+        )
+        self.mock_bq_client.copy_dataset_tables_across_regions.assert_called_with(
+            source_dataset_id="operations_regional",
+            destination_dataset_id="operations",
+            overwrite_destination_tables=True,
+        )
+
     @patch(f"{FEDERATED_REFRESH_PACKAGE_NAME}.get_direct_ingest_states_existing_in_env")
     @patch(
         f"{FEDERATED_REFRESH_COLLECTOR_PACKAGE_NAME}.get_direct_ingest_states_existing_in_env"
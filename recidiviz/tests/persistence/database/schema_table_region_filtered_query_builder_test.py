@@ -17,6 +17,7 @@
 
 """Tests for schema_table_region_filtered_query_builder.py."""
 
+import datetime
 import unittest
 from typing import List
 
@@ -324,6 +325,52 @@ class CloudSqlSchemaTableRegionFilteredQueryBuilderTest(
         )
         self.assertEqual(expected_query, query_builder.full_query())
 
+    def test_full_query_federated_watermark(self) -> None:
+        """Given a watermark it returns a query for the rows added since then."""
+        query_builder = FederatedSchemaTableRegionFilteredQueryBuilder(
+            schema_type=SchemaType.OPERATIONS,
+            table=self.fake_operations_table,
+            columns_to_include=self.mock_operations_columns_to_include,
+            region_code="US_XX",
+            watermark_column="column1",
+            watermark=123,
+        )
+        expected_query = (
+            f"SELECT {self.fake_operations_table.name}.column1,{self.fake_operations_table.name}.region_code "
+            f"FROM {self.fake_operations_table.name} "
+            f"WHERE region_code IN ('US_XX') "
+            f"AND {self.fake_operations_table.name}.column1 > 123"
+        )
+        self.assertEqual(expected_query, query_builder.full_query())
+
+    def test_full_query_federated_datetime_watermark_no_region_code(self) -> None:
+        query_builder = FederatedSchemaTableRegionFilteredQueryBuilder(
+            schema_type=SchemaType.OPERATIONS,
+            table=self.fake_operations_table,
+            columns_to_include=self.mock_operations_columns_to_include,
+            region_code=None,
+            watermark_column="column1",
+            watermark=datetime.datetime(
+                2023, 1, 2, 3, 4, 5, 6, tzinfo=datetime.timezone.utc
+            ),
+        )
+        expected_query = (
+            f"SELECT {self.fake_operations_table.name}.column1,{self.fake_operations_table.name}.region_code "
+            f"FROM {self.fake_operations_table.name} "
+            f"WHERE {self.fake_operations_table.name}.column1 > '2023-01-02T03:04:05.000006+00:00'"
+        )
+        self.assertEqual(expected_query, query_builder.full_query())
+
+    def test_full_query_federated_watermark_no_column(self) -> None:
+        with self.assertRaisesRegex(ValueError, r"^Must provide a watermark_column"):
+            _ = FederatedSchemaTableRegionFilteredQueryBuilder(
+                schema_type=SchemaType.OPERATIONS,
+                table=self.fake_operations_table,
+                columns_to_include=self.mock_operations_columns_to_include,
+                region_code=None,
+                watermark=123,
+            )
+
     def test_full_query_federated_complex_schema(self) -> None:
         """Given a table it returns a full query string."""
         query_builder = FederatedSchemaTableRegionFilteredQueryBuilder(
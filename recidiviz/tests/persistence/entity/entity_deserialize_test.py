@@ -18,6 +18,7 @@
 from enum import Enum
 from typing import Optional
 from unittest import TestCase
+from unittest.mock import patch
 
 import attr
 
@@ -294,3 +295,21 @@ class TestEntityDeserialize(TestCase):
         subclass_entity = MyEntitySubclassFactory.deserialize(subclass_field="1234")
         self.assertIsInstance(subclass_entity, MyEntitySubclass)
         self.assertEqual(1234, subclass_entity.subclass_field)
+
+    def test_entity_deserialize_inspects_class_once(self) -> None:
+        @attr.s(eq=False)
+        class MyOtherEntity(Entity):
+            opt_int: Optional[int] = attr.ib(
+                default=None, validator=attr_validators.is_opt_int
+            )
+
+        with patch.object(attr, "fields_dict", wraps=attr.fields_dict) as mock_fields:
+            entities = [
+                entity_deserialize(
+                    MyOtherEntity, converter_overrides={}, defaults={}, opt_int=str(i)
+                )
+                for i in range(3)
+            ]
+
+        mock_fields.assert_called_once_with(MyOtherEntity)
+        self.assertEqual([0, 1, 2], [entity.opt_int for entity in entities])
@@ -16,12 +16,16 @@
 # =============================================================================
 """Tests for entity_matching_utils.py."""
 from datetime import datetime
+from typing import Optional
 from unittest import TestCase
 
 from recidiviz.common.constants.states import StateCode
+from recidiviz.persistence.entity.core_entity import CoreEntity
 from recidiviz.persistence.entity.entity_utils import CoreEntityFieldIndex
 from recidiviz.persistence.entity.state import entities as state_entities
 from recidiviz.persistence.entity_matching.legacy.entity_matching_utils import (
+    MatchCandidateIndex,
+    MatchKey,
     get_only_match,
 )
 
@@ -60,3 +64,42 @@ class TestEntityMatchingUtils(TestCase):
             ),
             person,
         )
+
+    def test_match_candidate_index(self) -> None:
+        def birthdate_key(person: CoreEntity) -> Optional[MatchKey]:
+            assert isinstance(person, state_entities.StatePerson)
+            if person.birthdate is None:
+                return None
+            return type(person), person.state_code, person.birthdate
+
+        person = state_entities.StatePerson.new_with_defaults(
+            state_code=StateCode.US_XX.value, person_id=1, birthdate=_DATE
+        )
+        person_2 = state_entities.StatePerson.new_with_defaults(
+            state_code=StateCode.US_XX.value, person_id=2, birthdate=_DATE_OTHER
+        )
+        person_3 = state_entities.StatePerson.new_with_defaults(
+            state_code=StateCode.US_XX.value, person_id=3, birthdate=_DATE
+        )
+        index = MatchCandidateIndex([person, person_2, person_3], birthdate_key)
+
+        ing_person = state_entities.StatePerson.new_with_defaults(
+            state_code=StateCode.US_XX.value, birthdate=_DATE
+        )
+        self.assertEqual([person, person_3], index.get_candidates(ing_person))
+
+        ing_person.birthdate = datetime(2000, 1, 1)
+        self.assertEqual([], index.get_candidates(ing_person))
+
+        # Entities without a key, or from another state, are compared to every DB
+        # entity
+        ing_person.birthdate = None
+        self.assertEqual([person, person_2, person_3], index.get_candidates(ing_person))
+        ing_person.birthdate = _DATE
+        ing_person.state_code = StateCode.US_YY.value
+        self.assertEqual([person, person_2, person_3], index.get_candidates(ing_person))
+
+        person_2.birthdate = None
+        index = MatchCandidateIndex([person, person_2, person_3], birthdate_key)
+        ing_person.state_code = StateCode.US_XX.value
+        self.assertEqual([person, person_2, person_3], index.get_candidates(ing_person))
@@ -16,6 +16,7 @@
 # =============================================================================
 """Tests for state_matching_utils.py"""
 import datetime
+from typing import Optional
 
 from recidiviz.common.constants.state.state_charge import StateChargeStatus
 from recidiviz.common.constants.state.state_incarceration_period import (
@@ -36,12 +37,14 @@ from recidiviz.persistence.entity.entity_utils import CoreEntityFieldIndex
 from recidiviz.persistence.entity_matching.legacy.entity_matching_types import (
     EntityTree,
 )
+from recidiviz.persistence.entity_matching.legacy.entity_matching_utils import MatchKey
 from recidiviz.persistence.entity_matching.legacy.state.state_matching_utils import (
     _is_match,
     add_child_to_entity,
     can_atomically_merge_entity,
     generate_child_entity_trees,
     get_all_root_entity_external_ids,
+    get_match_key,
     is_multiple_id_entity,
     merge_flat_fields,
     nonnull_fields_entity_match,
@@ -394,6 +397,48 @@ class TestStateMatchingUtils(BaseStateMatchingUtilsTest):
             )
         )
 
+    def test_getMatchKey(self) -> None:
+        def match_key(entity: DatabaseEntity) -> Optional[MatchKey]:
+            return get_match_key(EntityTree(entity=entity, ancestor_chain=[]))
+
+        charge = schema.StateCharge(
+            state_code=_STATE_CODE, external_id=_EXTERNAL_ID, description="description"
+        )
+        charge_another = schema.StateCharge(
+            state_code=_STATE_CODE,
+            external_id=_EXTERNAL_ID,
+            description="description_another",
+        )
+        self.assertEqual(match_key(charge), match_key(charge_another))
+        charge_another.external_id = _EXTERNAL_ID_2
+        self.assertNotEqual(match_key(charge), match_key(charge_another))
+
+        external_id = schema.StatePersonExternalId(
+            state_code=_STATE_CODE, external_id=_EXTERNAL_ID, id_type=_ID_TYPE
+        )
+        external_id_another = schema.StatePersonExternalId(
+            state_code=_STATE_CODE, external_id=_EXTERNAL_ID, id_type=_ID_TYPE_ANOTHER
+        )
+        self.assertNotEqual(match_key(external_id), match_key(external_id_another))
+
+        alias = schema.StatePersonAlias(state_code=_STATE_CODE, full_name="full_name")
+        alias_another = schema.StatePersonAlias(
+            state_code=_STATE_CODE, full_name="full_name"
+        )
+        self.assertEqual(match_key(alias), match_key(alias_another))
+
+        # Entities matched on multiple external ids or on all flat fields have no key
+        self.assertIsNone(
+            match_key(schema.StatePerson(state_code=_STATE_CODE, full_name="name"))
+        )
+        self.assertIsNone(
+            match_key(
+                schema.StateTaskDeadline(
+                    state_code=_STATE_CODE, task_type=StateTaskType.DRUG_SCREEN
+                )
+            )
+        )
+
     def test_mergeFlatFields_twoDbEntities(self) -> None:
         to_entity = schema.StateIncarcerationSentence(
             state_code=_STATE_CODE,
@@ -42,6 +42,10 @@ from recidiviz.pipelines.dataflow_config import (
 from recidiviz.pipelines.dataflow_orchestration_utils import (
     get_normalization_pipeline_enabled_states,
 )
+from recidiviz.pipelines.ingest.state.incremental_ingest_state import (
+    INCREMENTAL_INGEST_STATE_SCHEMA,
+    INCREMENTAL_INGEST_STATE_TABLE_ID,
+)
 from recidiviz.pipelines.metrics.population_spans.metrics import (
     IncarcerationPopulationSpanMetric,
     SupervisionPopulationSpanMetric,
@@ -716,6 +720,11 @@ class IngestDatasetTableManagerTest(unittest.TestCase):
         )
 
         self.mock_client.create_table_with_schema.assert_called()
+        self.mock_client.create_table_with_schema.assert_any_call(
+            dataset_id="us_xx_dataflow_ingest_view_results_primary",
+            table_id=INCREMENTAL_INGEST_STATE_TABLE_ID,
+            schema_fields=INCREMENTAL_INGEST_STATE_SCHEMA,
+        )
         self.mock_client.update_schema.assert_not_called()
 
     def test_update_state_specific_ingest_view_results_schema_update_table(
@@ -745,4 +754,9 @@ class IngestDatasetTableManagerTest(unittest.TestCase):
             default_table_expiration_ms=None,
         )
         self.mock_client.update_schema.assert_called()
+        self.mock_client.update_schema.assert_any_call(
+            dataset_id="us_xx_dataflow_ingest_view_results_primary",
+            table_id=INCREMENTAL_INGEST_STATE_TABLE_ID,
+            desired_schema_fields=INCREMENTAL_INGEST_STATE_SCHEMA,
+        )
         self.mock_client.create_table_with_schema.assert_not_called()
@@ -17,6 +17,7 @@
 """Helper classes for mocking reading / writing from BigQuery in tests."""
 import abc
 import datetime
+import functools
 import re
 from typing import (
     Any,
@@ -292,7 +293,10 @@ class FakeReadFromBigQueryFactory:
 
         data_dict_query_fn = self._data_dict_query_fn
 
-        def _fake_bq_source_constructor(query: QueryStr) -> FakeReadFromBigQuery:
+        def _fake_bq_source_constructor(
+            query: QueryStr,
+            use_storage_read_api: bool = False,  # pylint: disable=unused-argument
+        ) -> FakeReadFromBigQuery:
             table_values = data_dict_query_fn(
                 expected_dataset,
                 query,
@@ -304,6 +308,53 @@ class FakeReadFromBigQueryFactory:
 
         return _fake_bq_source_constructor
 
+    @staticmethod
+    def create_fake_bq_table_source_constructor(
+        expected_dataset: str,
+        data_dict: DataTablesDict,
+    ) -> Callable[..., FakeReadFromBigQuery]:
+        """Returns a constructor function that can mock the ReadFromBigQueryTable class
+        and will return a FakeReadFromBigQuery of the rows in the data_dict table that
+        match the row restriction, with only the selected fields.
+        """
+
+        def _fake_bq_table_source_constructor(
+            project_id: str,  # pylint: disable=unused-argument
+            dataset_id: str,
+            table_id: str,
+            selected_fields: Optional[List[str]] = None,
+            row_restriction: Optional[str] = None,
+        ) -> FakeReadFromBigQuery:
+            if dataset_id != expected_dataset:
+                raise ValueError(
+                    f"Dataset [{dataset_id}] does not match expected dataset "
+                    f"[{expected_dataset}]."
+                )
+            match = re.fullmatch(
+                r"state_code IN \('(?P<state_code>\w+)'\)"
+                r"( AND (?P<unifying_id_field>\w+) IN \((?P<unifying_ids>[\d, ]+)\))?",
+                row_restriction or "",
+            )
+            if not match:
+                raise ValueError(f"Unexpected row restriction [{row_restriction}].")
+
+            table_values = []
+            for row in data_dict.get(table_id, []):
+                if row["state_code"] != match.group("state_code"):
+                    continue
+                if match.group("unifying_id_field") and str(
+                    row[match.group("unifying_id_field")]
+                ) not in match.group("unifying_ids").split(", "):
+                    continue
+                table_values.append(
+                    {field: row[field] for field in selected_fields}
+                    if selected_fields
+                    else row
+                )
+            return FakeReadFromBigQuery(table_values=table_values)
+
+        return _fake_bq_table_source_constructor
+
     @staticmethod
     def _extractor_utils_data_dict_query_fn(
         expected_dataset: str,
@@ -713,6 +764,28 @@ class FakeWriteOutputToBigQueryWithValidator(FakeWriteToBigQuery):
         )
 
 
+class FakeWriteToBigQueryWithCapture(FakeWriteToBigQuery):
+    """Fake PTransform that stores the rows written to each table in |captured_output|
+    instead of writing them to BQ."""
+
+    # Rows written by the most recently run pipeline, keyed by table address
+    captured_output: Dict[BigQueryAddress, List[Dict[str, Any]]] = {}
+
+    def __init__(self, output_address: BigQueryAddress) -> None:
+        super().__init__(output_table=output_address.table_id)
+        self._output_address = output_address
+
+    def expand(self, input_or_inputs: PCollection) -> Any:
+        assert_that(
+            input_or_inputs,
+            functools.partial(self.capture_output, self._output_address),
+        )
+
+    @staticmethod
+    def capture_output(address: BigQueryAddress, output: ActualOutput) -> None:
+        FakeWriteToBigQueryWithCapture.captured_output[address] = list(output)
+
+
 FakeWriteToBigQueryType = TypeVar("FakeWriteToBigQueryType", bound=FakeWriteToBigQuery)
 
 
@@ -52,6 +52,7 @@ class TestIngestPipelineParameters(unittest.TestCase):
             "materialization_method": "latest",
             "raw_data_upper_bound_dates_json": '{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000","TEST_RAW_DATA_2":"2020-01-01T00:00:00.00000"}',
             "ingest_view_results_only": "False",
+            "incremental": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
@@ -84,6 +85,7 @@ class TestIngestPipelineParameters(unittest.TestCase):
             "materialization_method": "latest",
             "raw_data_upper_bound_dates_json": '{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000"}',
             "ingest_view_results_only": "False",
+            "incremental": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
@@ -113,6 +115,7 @@ class TestIngestPipelineParameters(unittest.TestCase):
             "materialization_method": "latest",
             "raw_data_upper_bound_dates_json": '{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000"}',
             "ingest_view_results_only": "False",
+            "incremental": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
@@ -202,6 +205,7 @@ class TestIngestPipelineParameters(unittest.TestCase):
             "materialization_method": "latest",
             "raw_data_upper_bound_dates_json": '{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000"}',
             "ingest_view_results_only": "False",
+            "incremental": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
@@ -231,6 +235,7 @@ class TestIngestPipelineParameters(unittest.TestCase):
             "materialization_method": "latest",
             "raw_data_upper_bound_dates_json": '{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000"}',
             "ingest_view_results_only": "False",
+            "incremental": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
@@ -260,6 +265,7 @@ class TestIngestPipelineParameters(unittest.TestCase):
             "materialization_method": "original",
             "raw_data_upper_bound_dates_json": '{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000"}',
             "ingest_view_results_only": "False",
+            "incremental": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
@@ -318,6 +324,7 @@ class TestIngestPipelineParameters(unittest.TestCase):
             "materialization_method": "original",
             "raw_data_upper_bound_dates_json": '{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000"}',
             "ingest_view_results_only": "False",
+            "incremental": "False",
             "ingest_views_to_run": "view1 view2",
         }
 
@@ -338,6 +345,89 @@ class TestIngestPipelineParameters(unittest.TestCase):
                 ingest_views_to_run="view1 view2",
             )
 
+    def test_incremental(self) -> None:
+        pipeline_parameters = IngestPipelineParameters(
+            project="recidiviz-456",
+            state_code="US_OZ",
+            pipeline="test_pipeline_name",
+            region="us-west1",
+            job_name="test-job",
+            materialization_method="original",
+            raw_data_upper_bound_dates_json='{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000"}',
+            raw_data_watermarks_json='{"TEST_RAW_DATA":"2019-01-01T00:00:00.000000"}',
+            incremental="True",
+        )
+
+        expected_parameters = {
+            "state_code": "US_OZ",
+            "pipeline": "test_pipeline_name",
+            "output": "us_oz_state_primary",
+            "raw_data_table_input": "us_oz_raw_data",
+            "reference_view_input": "reference_views",
+            "ingest_view_results_output": "us_oz_dataflow_ingest_view_results_primary",
+            "ingest_instance": "PRIMARY",
+            "materialization_method": "original",
+            "raw_data_upper_bound_dates_json": '{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000"}',
+            "raw_data_watermarks_json": '{"TEST_RAW_DATA":"2019-01-01T00:00:00.000000"}',
+            "ingest_view_results_only": "False",
+            "incremental": "True",
+        }
+
+        self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
+        self.assertEqual(
+            {"TEST_RAW_DATA": "2019-01-01T00:00:00.000000"},
+            pipeline_parameters.raw_data_watermarks,
+        )
+
+    def test_incremental_latest_materialization_method(self) -> None:
+        with self.assertRaisesRegex(
+            ValueError, r"^Invalid pipeline parameters for incremental. *"
+        ):
+            _ = IngestPipelineParameters(
+                project="recidiviz-456",
+                state_code="US_OZ",
+                pipeline="test_pipeline_name",
+                region="us-west1",
+                job_name="test-job",
+                materialization_method="latest",
+                raw_data_upper_bound_dates_json='{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000"}',
+                incremental="True",
+            )
+
+    def test_incremental_ingest_views_to_run(self) -> None:
+        with self.assertRaisesRegex(
+            ValueError, r"^Invalid pipeline parameters for incremental. *"
+        ):
+            _ = IngestPipelineParameters(
+                project="recidiviz-456",
+                state_code="US_OZ",
+                pipeline="test_pipeline_name",
+                region="us-west1",
+                job_name="test-job",
+                output="test_output",
+                ingest_view_results_output="test_ingest_view_output",
+                materialization_method="original",
+                raw_data_upper_bound_dates_json='{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000"}',
+                ingest_views_to_run="view1 view2",
+                incremental="True",
+            )
+
+    def test_incremental_ingest_view_results_only(self) -> None:
+        with self.assertRaisesRegex(
+            ValueError, r"^Invalid pipeline parameters for incremental. *"
+        ):
+            _ = IngestPipelineParameters(
+                project="recidiviz-456",
+                state_code="US_OZ",
+                pipeline="test_pipeline_name",
+                region="us-west1",
+                job_name="test-job",
+                materialization_method="original",
+                raw_data_upper_bound_dates_json='{"TEST_RAW_DATA":"2020-01-01T00:00:00.000000"}',
+                ingest_view_results_only="True",
+                incremental="True",
+            )
+
     def test_default_ingest_pipeline_regions_by_state_code_filled_out(self) -> None:
         pipeline_enabled_states = {
             state_code
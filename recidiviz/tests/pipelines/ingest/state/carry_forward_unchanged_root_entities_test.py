@@ -0,0 +1,159 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Testing the PTransforms in carry_forward_unchanged_root_entities.py."""
+from typing import Any, Dict, List
+
+import apache_beam as beam
+from apache_beam.options.pipeline_options import PipelineOptions, SetupOptions
+from apache_beam.pipeline_test import TestPipeline, assert_that, equal_to
+from mock import patch
+
+from recidiviz.pipelines.ingest.state.associate_with_primary_keys import PRIMARY_KEYS
+from recidiviz.pipelines.ingest.state.carry_forward_unchanged_root_entities import (
+    CHANGED_EXTERNAL_IDS,
+    PRIMARY_KEY_CHANGES,
+    ROOT_ENTITIES_BY_PRIMARY_KEY,
+    CarryForwardUnchangedRows,
+    FilterToChangedRootEntities,
+    GetPrimaryKeyChanges,
+)
+from recidiviz.tests.pipelines.ingest.state.test_case import StateIngestPipelineTestCase
+
+PREVIOUS_ROWS_BY_TABLE: Dict[str, List[Dict[str, Any]]] = {
+    "state_person": [
+        {"person_id": 1, "state_code": "US_DD"},
+        {"person_id": 2, "state_code": "US_DD"},
+        {"person_id": 3, "state_code": "US_DD"},
+    ],
+    "state_charge": [
+        {"charge_id": 11, "person_id": 1, "state_code": "US_DD"},
+        {"charge_id": 21, "person_id": 2, "state_code": "US_DD"},
+        {"charge_id": 31, "person_id": 3, "state_code": "US_DD"},
+    ],
+    "state_incarceration_sentence": [
+        {"incarceration_sentence_id": 12, "person_id": 1, "state_code": "US_DD"},
+        {"incarceration_sentence_id": 22, "person_id": 2, "state_code": "US_DD"},
+    ],
+    "state_charge_incarceration_sentence_association": [
+        {"charge_id": 11, "incarceration_sentence_id": 12, "state_code": "US_DD"},
+        {"charge_id": 21, "incarceration_sentence_id": 22, "state_code": "US_DD"},
+    ],
+}
+
+
+def fake_read_from_bigquery(query: str) -> beam.Create:
+    table_name = query.rstrip("`").rsplit(".", 1)[1]
+    return beam.Create(PREVIOUS_ROWS_BY_TABLE[table_name])
+
+
+class TestCarryForwardUnchangedRootEntities(StateIngestPipelineTestCase):
+    """Tests the PTransforms used to carry forward unchanged root entities."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        apache_beam_pipeline_options = PipelineOptions()
+        apache_beam_pipeline_options.view_as(SetupOptions).save_main_session = False
+        self.test_pipeline = TestPipeline(options=apache_beam_pipeline_options)
+
+        self.external_id_1 = ("ID1", "TYPE1")
+        self.external_id_2 = ("ID2", "TYPE2")
+        self.external_id_3 = ("ID3", "TYPE1")
+
+    def test_get_primary_key_changes(self) -> None:
+        primary_keys = self.test_pipeline | "Create primary keys" >> beam.Create(
+            [
+                (self.external_id_1, 1),
+                (self.external_id_2, 1),
+                (self.external_id_3, 2),
+            ]
+        )
+        changed_external_ids = (
+            self.test_pipeline
+            | "Create changed external ids"
+            >> beam.Create([self.external_id_2, self.external_id_2])
+        )
+
+        output = {
+            PRIMARY_KEYS: primary_keys,
+            CHANGED_EXTERNAL_IDS: changed_external_ids,
+        } | GetPrimaryKeyChanges()
+        assert_that(output, equal_to([(1, True), (2, False)]))
+        self.test_pipeline.run()
+
+    def test_filter_to_changed_root_entities(self) -> None:
+        primary_key_changes = (
+            self.test_pipeline
+            | "Create primary key changes" >> beam.Create([(1, True), (2, False)])
+        )
+        root_entities = self.test_pipeline | "Create root entities" >> beam.Create(
+            [(1, "root_entity_1"), (2, "root_entity_2")]
+        )
+
+        output = {
+            PRIMARY_KEY_CHANGES: primary_key_changes,
+            ROOT_ENTITIES_BY_PRIMARY_KEY: root_entities,
+        } | FilterToChangedRootEntities()
+        assert_that(output, equal_to([(1, "root_entity_1")]))
+        self.test_pipeline.run()
+
+    @patch(
+        "recidiviz.pipelines.ingest.state.carry_forward_unchanged_root_entities.ReadFromBigQuery",
+        fake_read_from_bigquery,
+    )
+    def test_carry_forward_unchanged_rows(self) -> None:
+        # Person 3 no longer exists, e.g. because it was merged into another person
+        primary_key_changes = self.test_pipeline | beam.Create([(1, False), (2, True)])
+
+        output = primary_key_changes | CarryForwardUnchangedRows(
+            project_id="test-project",
+            output_dataset="us_dd_state_primary",
+            output_tables=set(PREVIOUS_ROWS_BY_TABLE),
+        )
+
+        for table_name, expected_rows in [
+            ("state_person", [{"person_id": 1, "state_code": "US_DD"}]),
+            (
+                "state_charge",
+                [{"charge_id": 11, "person_id": 1, "state_code": "US_DD"}],
+            ),
+            (
+                "state_incarceration_sentence",
+                [
+                    {
+                        "incarceration_sentence_id": 12,
+                        "person_id": 1,
+                        "state_code": "US_DD",
+                    }
+                ],
+            ),
+            (
+                "state_charge_incarceration_sentence_association",
+                [
+                    {
+                        "charge_id": 11,
+                        "incarceration_sentence_id": 12,
+                        "state_code": "US_DD",
+                    }
+                ],
+            ),
+        ]:
+            assert_that(
+                output[table_name],
+                equal_to(expected_rows),
+                label=f"Check {table_name} rows",
+            )
+        self.test_pipeline.run()
@@ -20,6 +20,9 @@ from apache_beam.options.pipeline_options import PipelineOptions, SetupOptions
 from apache_beam.pipeline_test import TestPipeline, assert_that, equal_to
 
 from recidiviz.pipelines.ingest.state import pipeline
+from recidiviz.pipelines.ingest.state.cluster_root_external_ids import (
+    CombineExternalIdClusters,
+)
 from recidiviz.tests.pipelines.ingest.state.test_case import StateIngestPipelineTestCase
 
 
@@ -116,3 +119,47 @@ class TestClusterExternalIds(StateIngestPipelineTestCase):
         )
         assert_that(output, equal_to(expected_output))
         self.test_pipeline.run()
+
+    def test_combine_external_id_clusters_merge_accumulators(self) -> None:
+        combine_fn = CombineExternalIdClusters()
+        accumulator_1 = combine_fn.create_accumulator()
+        accumulator_2 = combine_fn.create_accumulator()
+        accumulator_3 = combine_fn.create_accumulator()
+
+        # The link between the two chains is only added to the last accumulator
+        for external_id, cluster in [
+            (self.external_id_1, {self.external_id_1, self.external_id_2}),
+            (self.external_id_3, {self.external_id_3, self.external_id_4}),
+            (self.external_id_9, {self.external_id_9}),
+        ]:
+            combine_fn.add_input(accumulator_1, (external_id, cluster))
+        for external_id, cluster in [
+            (self.external_id_2, {self.external_id_1, self.external_id_2}),
+            (self.external_id_4, {self.external_id_3, self.external_id_4}),
+        ]:
+            combine_fn.add_input(accumulator_2, (external_id, cluster))
+        combine_fn.add_input(
+            accumulator_3,
+            (self.external_id_2, {self.external_id_2, self.external_id_3}),
+        )
+
+        output = combine_fn.extract_output(
+            combine_fn.merge_accumulators([accumulator_1, accumulator_2, accumulator_3])
+        )
+
+        cluster = {
+            self.external_id_1,
+            self.external_id_2,
+            self.external_id_3,
+            self.external_id_4,
+        }
+        self.assertEqual(
+            {
+                self.external_id_1: cluster,
+                self.external_id_2: cluster,
+                self.external_id_3: cluster,
+                self.external_id_4: cluster,
+                self.external_id_9: {self.external_id_9},
+            },
+            output,
+        )
@@ -210,6 +210,83 @@ ORDER BY 1;"""
         self.maxDiff = None
         self.assertEqual(result, expected)
 
+    def test_generate_date_bound_tuples_query_new_results_lower_bound(self) -> None:
+        result = pipeline.GenerateIngestViewResults.generate_date_bound_tuples_query(
+            project_id="test-project",
+            state_code=self.region_code(),
+            ingest_instance=self.ingest_instance(),
+            raw_data_tables_to_upperbound_dates={
+                "table1": datetime.fromisoformat("2023-07-05:00:00:00").isoformat(),
+                "table2": datetime.fromisoformat("2023-07-05:00:00:00").isoformat(),
+            },
+            new_results_lower_bound=datetime(2023, 7, 5),
+        )
+        expected = """
+SELECT *
+FROM (
+    SELECT
+        LAG(max_dt_on_date) OVER (
+            ORDER BY update_date
+        ) AS __lower_bound_datetime_exclusive,
+        max_dt_on_date AS __upper_bound_datetime_inclusive,
+    FROM (
+        SELECT
+            update_date AS update_date,
+            MAX(update_datetime) AS max_dt_on_date
+        FROM (
+            SELECT DISTINCT update_datetime, CAST(update_datetime AS DATE) AS update_date
+        FROM `test-project.us_dd_raw_data_secondary.table1` WHERE update_datetime <= '2023-07-05T00:00:00'
+UNION ALL
+        SELECT DISTINCT update_datetime, CAST(update_datetime AS DATE) AS update_date
+        FROM `test-project.us_dd_raw_data_secondary.table2` WHERE update_datetime <= '2023-07-05T00:00:00'
+        )
+        GROUP BY update_date
+    )
+)
+WHERE __upper_bound_datetime_inclusive >= DATETIME "2023-07-05T00:00:00"
+ORDER BY 1;"""
+        self.maxDiff = None
+        self.assertEqual(result, expected)
+
+    def test_generate_date_bound_tuples_query_new_results_lower_bound_latest_method(
+        self,
+    ) -> None:
+        with self.assertRaisesRegex(
+            ValueError, r"^Cannot materialize only new date pairs with the \[latest\]"
+        ):
+            _ = pipeline.GenerateIngestViewResults.generate_date_bound_tuples_query(
+                project_id="test-project",
+                state_code=self.region_code(),
+                ingest_instance=self.ingest_instance(),
+                raw_data_tables_to_upperbound_dates={
+                    "table1": datetime.fromisoformat("2023-07-05:00:00:00").isoformat(),
+                },
+                materialization_method=MaterializationMethod.LATEST,
+                new_results_lower_bound=datetime(2023, 7, 5),
+            )
+
+    def test_kept_previous_results_query(self) -> None:
+        result = pipeline.GenerateIngestViewResults.kept_previous_results_query(
+            previous_results_table="test-project.us_dd_dataflow_ingest_view_results_secondary.ingest_view",
+            new_results_lower_bound=datetime(2023, 7, 5),
+        )
+        expected = """
+SELECT *
+FROM `test-project.us_dd_dataflow_ingest_view_results_secondary.ingest_view`
+WHERE __upper_bound_datetime_inclusive < DATETIME "2023-07-05T00:00:00";"""
+        self.assertEqual(result, expected)
+
+    def test_replaced_previous_results_query(self) -> None:
+        result = pipeline.GenerateIngestViewResults.replaced_previous_results_query(
+            previous_results_table="test-project.us_dd_dataflow_ingest_view_results_secondary.ingest_view",
+            new_results_lower_bound=datetime(2023, 7, 5),
+        )
+        expected = """
+SELECT *
+FROM `test-project.us_dd_dataflow_ingest_view_results_secondary.ingest_view`
+WHERE __upper_bound_datetime_inclusive >= DATETIME "2023-07-05T00:00:00";"""
+        self.assertEqual(result, expected)
+
     def test_generate_date_bound_tuples_query_returns_correct_data(self) -> None:
         date_1 = datetime.fromisoformat("2023-07-01:00:00:00")
         date_2 = datetime.fromisoformat("2023-07-02:00:00:00")
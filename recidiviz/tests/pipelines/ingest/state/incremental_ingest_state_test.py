@@ -0,0 +1,314 @@
+# Recidiviz - a data platform for criminal justice reform
+# Copyright (C) 2023 Recidiviz, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# =============================================================================
+"""Tests the helpers that track the state written by incremental ingest runs."""
+import unittest
+from typing import Any, Dict, List, Set
+from unittest.mock import MagicMock, create_autospec
+
+import apache_beam
+from apache_beam.testing.test_pipeline import TestPipeline
+from apache_beam.testing.util import assert_that, equal_to
+from google.cloud import bigquery
+
+from recidiviz.big_query.big_query_address import BigQueryAddress
+from recidiviz.big_query.big_query_client import BigQueryClient
+from recidiviz.common.constants.states import StateCode
+from recidiviz.ingest.direct.views.direct_ingest_view_query_builder import (
+    DirectIngestViewQueryBuilder,
+)
+from recidiviz.pipelines.ingest.state.incremental_ingest_state import (
+    GetIncrementalIngestStateRow,
+    can_build_on_stored_state,
+    incremental_ingest_state_key,
+    ingest_code_fingerprint,
+)
+from recidiviz.tests.ingest.direct import fake_regions
+from recidiviz.tests.utils.fake_region import fake_region
+
+_RESULTS_ADDRESS = BigQueryAddress(
+    dataset_id="us_dd_dataflow_ingest_view_results_primary", table_id="ingest12"
+)
+_OUTPUT_ADDRESS = BigQueryAddress(
+    dataset_id="us_dd_state_primary", table_id="state_person"
+)
+
+
+def _query_job(rows: List[Dict[str, Any]]) -> MagicMock:
+    query_job = create_autospec(bigquery.QueryJob)
+    query_job.result.return_value = rows
+    return query_job
+
+
+class TestIngestCodeFingerprint(unittest.TestCase):
+    """Tests for ingest_code_fingerprint."""
+
+    def setUp(self) -> None:
+        self.region = fake_region(
+            region_code=StateCode.US_DD.value.lower(),
+            environment="staging",
+            region_module=fake_regions,
+        )
+
+    def _view_builder(self, view_query_template: str) -> DirectIngestViewQueryBuilder:
+        return DirectIngestViewQueryBuilder(
+            ingest_view_name="ingest12",
+            view_query_template=view_query_template,
+            region=StateCode.US_DD.value.lower(),
+            order_by_cols="COL1",
+            region_module=fake_regions,
+        )
+
+    def test_ingest_code_fingerprint(self) -> None:
+        fingerprint = ingest_code_fingerprint(
+            self.region, [self._view_builder("SELECT * FROM {table1}")]
+        )
+        self.assertEqual(
+            fingerprint,
+            ingest_code_fingerprint(
+                self.region, [self._view_builder("SELECT * FROM {table1}")]
+            ),
+        )
+        self.assertNotEqual(
+            fingerprint,
+            ingest_code_fingerprint(
+                self.region,
+                [self._view_builder("SELECT DISTINCT * FROM {table1}")],
+            ),
+        )
+
+
+class TestIncrementalIngestStateKey(unittest.TestCase):
+    """Tests for incremental_ingest_state_key."""
+
+    def setUp(self) -> None:
+        self.mock_client = create_autospec(BigQueryClient)
+        self.mock_client.project_id = "test-project"
+
+    def _state_key(
+        self,
+        raw_data_summary: List[Dict[str, Any]],
+        raw_data_upper_bound_dates: Dict[str, str],
+        code_fingerprint: str = "fingerprint",
+    ) -> str:
+        self.mock_client.run_query_async.return_value = _query_job(raw_data_summary)
+        return incremental_ingest_state_key(
+            self.mock_client,
+            raw_data_dataset="us_dd_raw_data",
+            code_fingerprint=code_fingerprint,
+            raw_data_upper_bound_dates=raw_data_upper_bound_dates,
+        )
+
+    def test_incremental_ingest_state_key(self) -> None:
+        summary = [{"file_tag": "table1", "row_count": 3, "file_id_checksum": 7}]
+        state_key = self._state_key(summary, {"table1": "2023-07-05 00:00:00"})
+
+        self.mock_client.run_query_async.assert_called_once()
+        self.assertIn(
+            "FROM `test-project.us_dd_raw_data.table1`\n"
+            "WHERE update_datetime <= '2023-07-05 00:00:00'",
+            self.mock_client.run_query_async.call_args.kwargs["query_str"],
+        )
+        # Differently formatted upper bound dates result in the same key
+        self.assertEqual(
+            state_key,
+            self._state_key(summary, {"table1": "2023-07-05T00:00:00.000000"}),
+        )
+
+    def test_incremental_ingest_state_key_changes(self) -> None:
+        summary = [{"file_tag": "table1", "row_count": 3, "file_id_checksum": 7}]
+        state_key = self._state_key(summary, {"table1": "2023-07-05 00:00:00"})
+
+        # Raw data below the upper bound date was re-imported
+        self.assertNotEqual(
+            state_key,
+            self._state_key(
+                [{"file_tag": "table1", "row_count": 3, "file_id_checksum": 8}],
+                {"table1": "2023-07-05 00:00:00"},
+            ),
+        )
+        # Raw data below the upper bound date was invalidated
+        self.assertNotEqual(
+            state_key,
+            self._state_key(
+                [{"file_tag": "table1", "row_count": 2, "file_id_checksum": 7}],
+                {"table1": "2023-07-05 00:00:00"},
+            ),
+        )
+        self.assertNotEqual(
+            state_key, self._state_key(summary, {"table1": "2023-07-06 00:00:00"})
+        )
+        self.assertNotEqual(
+            state_key,
+            self._state_key(
+                summary,
+                {"table1": "2023-07-05 00:00:00"},
+                code_fingerprint="changed_fingerprint",
+            ),
+        )
+
+    def test_incremental_ingest_state_key_no_raw_data(self) -> None:
+        _ = self._state_key([], {})
+        self.mock_client.run_query_async.assert_not_called()
+
+
+class TestCanBuildOnStoredState(unittest.TestCase):
+    """Tests for can_build_on_stored_state."""
+
+    def setUp(self) -> None:
+        self.mock_client = create_autospec(BigQueryClient)
+        self.mock_client.project_id = "test-project"
+        self.mock_client.dataset_ref_for_id.side_effect = (
+            lambda dataset_id: bigquery.DatasetReference("test-project", dataset_id)
+        )
+        self.existing_tables: Set[BigQueryAddress] = {
+            BigQueryAddress(
+                dataset_id=_RESULTS_ADDRESS.dataset_id,
+                table_id="incremental_ingest_state",
+            ),
+            _RESULTS_ADDRESS,
+            _OUTPUT_ADDRESS,
+        }
+        self.mock_client.table_exists.side_effect = (
+            lambda dataset_ref, table_id: BigQueryAddress(
+                dataset_id=dataset_ref.dataset_id, table_id=table_id
+            )
+            in self.existing_tables
+        )
+
+    def _can_build_on_stored_state(
+        self,
+        stored_rows: List[Dict[str, Any]],
+        row_counts: List[Dict[str, Any]],
+    ) -> bool:
+        self.mock_client.run_query_async.side_effect = [
+            _query_job(stored_rows),
+            _query_job(row_counts),
+        ]
+        return can_build_on_stored_state(
+            self.mock_client,
+            state_dataset=_RESULTS_ADDRESS.dataset_id,
+            state_key="state_key",
+            table_addresses=[_RESULTS_ADDRESS, _OUTPUT_ADDRESS],
+        )
+
+    @staticmethod
+    def _rows(results_count: int, output_count: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "dataset_id": _RESULTS_ADDRESS.dataset_id,
+                "table_id": _RESULTS_ADDRESS.table_id,
+                "row_count": results_count,
+            },
+            {
+                "dataset_id": _OUTPUT_ADDRESS.dataset_id,
+                "table_id": _OUTPUT_ADDRESS.table_id,
+                "row_count": output_count,
+            },
+        ]
+
+    def test_can_build_on_stored_state(self) -> None:
+        self.assertTrue(
+            self._can_build_on_stored_state(self._rows(3, 2), self._rows(3, 2))
+        )
+        self.assertEqual(
+            [{"state_key", "STRING", "state_key"}],
+            [
+                {parameter.name, parameter.type_, parameter.value}
+                for parameter in self.mock_client.run_query_async.call_args_list[
+                    0
+                ].kwargs["query_parameters"]
+            ],
+        )
+
+    def test_can_build_on_stored_state_missing_table(self) -> None:
+        self.existing_tables.remove(_OUTPUT_ADDRESS)
+        self.assertFalse(
+            self._can_build_on_stored_state(self._rows(3, 2), self._rows(3, 2))
+        )
+        self.mock_client.run_query_async.assert_not_called()
+
+    def test_can_build_on_stored_state_missing_state_table(self) -> None:
+        self.existing_tables = {_RESULTS_ADDRESS, _OUTPUT_ADDRESS}
+        self.assertFalse(
+            self._can_build_on_stored_state(self._rows(3, 2), self._rows(3, 2))
+        )
+        self.mock_client.run_query_async.assert_not_called()
+
+    def test_can_build_on_stored_state_no_stored_state(self) -> None:
+        self.assertFalse(self._can_build_on_stored_state([], self._rows(3, 2)))
+
+    def test_can_build_on_stored_state_missing_stored_table_state(self) -> None:
+        self.assertFalse(
+            self._can_build_on_stored_state(self._rows(3, 2)[:1], self._rows(3, 2))
+        )
+
+    def test_can_build_on_stored_state_row_count_mismatch(self) -> None:
+        self.assertFalse(
+            self._can_build_on_stored_state(self._rows(3, 2), self._rows(4, 2))
+        )
+
+
+class TestGetIncrementalIngestStateRow(unittest.TestCase):
+    """Tests for the GetIncrementalIngestStateRow PTransform."""
+
+    def test_get_incremental_ingest_state_row(self) -> None:
+        test_pipeline = TestPipeline()
+        output = (
+            test_pipeline
+            | apache_beam.Create([{"COL1": "1"}, {"COL1": "2"}])
+            | GetIncrementalIngestStateRow(
+                state_key="state_key", address=_RESULTS_ADDRESS
+            )
+        )
+        assert_that(
+            output,
+            equal_to(
+                [
+                    {
+                        "state_key": "state_key",
+                        "dataset_id": _RESULTS_ADDRESS.dataset_id,
+                        "table_id": _RESULTS_ADDRESS.table_id,
+                        "row_count": 2,
+                    }
+                ]
+            ),
+        )
+        test_pipeline.run()
+
+    def test_get_incremental_ingest_state_row_empty(self) -> None:
+        test_pipeline = TestPipeline()
+        output = (
+            test_pipeline
+            | apache_beam.Create([])
+            | GetIncrementalIngestStateRow(
+                state_key="state_key", address=_RESULTS_ADDRESS
+            )
+        )
+        assert_that(
+            output,
+            equal_to(
+                [
+                    {
+                        "state_key": "state_key",
+                        "dataset_id": _RESULTS_ADDRESS.dataset_id,
+                        "table_id": _RESULTS_ADDRESS.table_id,
+                        "row_count": 0,
+                    }
+                ]
+            ),
+        )
+        test_pipeline.run()
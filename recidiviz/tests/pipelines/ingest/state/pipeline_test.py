@@ -16,19 +16,30 @@
 # =============================================================================
 """Tests the state ingest pipeline."""
 from datetime import date, datetime
-from typing import List
+from typing import Any, List
 
+from mock import patch
+
+from recidiviz.big_query.big_query_address import BigQueryAddress
 from recidiviz.common.constants.state.state_charge import StateChargeStatus
 from recidiviz.common.constants.state.state_incarceration import StateIncarcerationType
 from recidiviz.common.constants.state.state_sentence import StateSentenceStatus
 from recidiviz.common.constants.state.state_task_deadline import StateTaskType
 from recidiviz.persistence.entity.base_entity import RootEntity
 from recidiviz.persistence.entity.state import entities
+from recidiviz.pipelines.ingest.pipeline_parameters import MaterializationMethod
 from recidiviz.pipelines.ingest.state import pipeline
+from recidiviz.pipelines.ingest.state.incremental_ingest_state import (
+    INCREMENTAL_INGEST_STATE_TABLE_ID,
+    can_build_on_stored_state,
+)
 from recidiviz.tests.pipelines.ingest.state.test_case import (
     INGEST_INTEGRATION,
     StateIngestPipelineTestCase,
 )
+from recidiviz.tests.pipelines.utils.run_pipeline_test_utils import (
+    DEFAULT_INGEST_RAW_DATA_UPPER_BOUND_DATES_JSON,
+)
 
 
 class TestStateIngestPipeline(StateIngestPipelineTestCase):
@@ -404,6 +415,101 @@ class TestStateIngestPipeline(StateIngestPipelineTestCase):
             ingest_views_to_run=" ".join(subset_of_ingest_views),
         )
 
+    def test_state_ingest_pipeline_incremental(self) -> None:
+        self.setup_region_raw_data_bq_tables(test_name=INGEST_INTEGRATION)
+        incremental_args = {
+            "materialization_method": MaterializationMethod.ORIGINAL.value,
+            "incremental": True,
+        }
+        can_build_on_stored_state_results: List[bool] = []
+
+        def _can_build_on_stored_state(*args: Any, **kwargs: Any) -> bool:
+            result = can_build_on_stored_state(*args, **kwargs)
+            can_build_on_stored_state_results.append(result)
+            return result
+
+        with patch(
+            "recidiviz.pipelines.ingest.state.pipeline.can_build_on_stored_state",
+            side_effect=_can_build_on_stored_state,
+        ):
+            # Without raw data watermarks there is nothing to build on, so all ingest
+            # view results are processed.
+            full_output = self.run_test_state_pipeline_capturing_output(
+                **incremental_args
+            )
+            self.assertEqual([], can_build_on_stored_state_results)
+            self.assertIn(
+                BigQueryAddress(
+                    dataset_id=self.expected_ingest_view_dataset(),
+                    table_id=INCREMENTAL_INGEST_STATE_TABLE_ID,
+                ),
+                full_output,
+            )
+
+            # Builds on the output of the first run, which is still up to date.
+            incremental_output = self.run_test_state_pipeline_capturing_output(
+                **incremental_args,
+                raw_data_watermarks_json=DEFAULT_INGEST_RAW_DATA_UPPER_BOUND_DATES_JSON,
+            )
+            self.assertEqual([True], can_build_on_stored_state_results)
+            self.assert_same_pipeline_output(full_output, incremental_output)
+
+            # Changing the ingest code invalidates the stored state, so all ingest view
+            # results are processed again.
+            with patch(
+                "recidiviz.pipelines.ingest.state.pipeline.ingest_code_fingerprint",
+                return_value="changed_fingerprint",
+            ):
+                changed_code_output = self.run_test_state_pipeline_capturing_output(
+                    **incremental_args,
+                    raw_data_watermarks_json=DEFAULT_INGEST_RAW_DATA_UPPER_BOUND_DATES_JSON,
+                )
+            self.assertEqual([True, False], can_build_on_stored_state_results)
+            state_address = BigQueryAddress(
+                dataset_id=self.expected_ingest_view_dataset(),
+                table_id=INCREMENTAL_INGEST_STATE_TABLE_ID,
+            )
+            self.assert_same_pipeline_output(
+                {
+                    address: rows
+                    for address, rows in full_output.items()
+                    if address != state_address
+                },
+                {
+                    address: rows
+                    for address, rows in changed_code_output.items()
+                    if address != state_address
+                },
+            )
+
+    def test_new_results_lower_bound(self) -> None:
+        self.assertEqual(
+            datetime(2023, 7, 3),
+            pipeline.new_results_lower_bound(
+                {
+                    "table1": "2023-07-05T00:00:00.000000",
+                    "table2": "2023-07-05T00:00:00.000000",
+                    "table3": None,
+                },
+                {
+                    "table1": "2023-07-03T12:00:00.000000",
+                    "table2": "2023-07-04T00:00:00.000000",
+                },
+            ),
+        )
+
+    def test_new_results_lower_bound_missing_watermark(self) -> None:
+        self.assertEqual(
+            datetime.min,
+            pipeline.new_results_lower_bound(
+                {
+                    "table1": "2023-07-05T00:00:00.000000",
+                    "table2": "2023-07-05T00:00:00.000000",
+                },
+                {"table1": "2023-07-03T12:00:00.000000"},
+            ),
+        )
+
     def test_expected_pipeline_output(self) -> None:
         expected_output_entities = {
             "state_person",
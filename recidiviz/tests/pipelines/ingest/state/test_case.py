@@ -15,10 +15,11 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """A class that represents a test case to be used for testing the ingest pipeline."""
+import json
 import unittest
 from collections import defaultdict
 from copy import deepcopy
-from datetime import datetime
+from datetime import date, datetime
 from types import ModuleType
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, cast
 
@@ -88,6 +89,10 @@ from recidiviz.pipelines.ingest.state.generate_primary_keys import (
     generate_primary_key,
     string_representation,
 )
+from recidiviz.pipelines.ingest.state.incremental_ingest_state import (
+    INCREMENTAL_INGEST_STATE_SCHEMA,
+    INCREMENTAL_INGEST_STATE_TABLE_ID,
+)
 from recidiviz.pipelines.ingest.state.pipeline import StateIngestPipeline
 from recidiviz.pipelines.ingest.state.serialize_entities import (
     serialize_entity_into_json,
@@ -106,6 +111,7 @@ from recidiviz.tests.pipelines.fake_bigquery import (
     FakeReadAllFromBigQueryWithEmulator,
     FakeReadFromBigQueryWithEmulator,
     FakeWriteOutputToBigQueryWithValidator,
+    FakeWriteToBigQueryWithCapture,
 )
 from recidiviz.tests.pipelines.utils.run_pipeline_test_utils import run_test_pipeline
 from recidiviz.tests.utils.fake_region import fake_region
@@ -657,3 +663,119 @@ class StateIngestPipelineTestCase(
             ingest_view_results_only=ingest_view_results_only,
             ingest_views_to_run=ingest_views_to_run,
         )
+
+    def run_test_state_pipeline_capturing_output(
+        self, **additional_pipeline_args: Any
+    ) -> Dict[BigQueryAddress, List[Dict[str, Any]]]:
+        """Runs the state ingest pipeline and returns the rows written to each table.
+        Those rows are also loaded into the BQ emulator, replacing the contents of any
+        existing table, so that later pipeline runs can read them."""
+        FakeWriteToBigQueryWithCapture.captured_output.clear()
+        run_test_pipeline(
+            pipeline_cls=self.pipeline_class(),
+            state_code=self.region_code().value,
+            project_id=BQ_EMULATOR_PROJECT_ID,
+            read_from_bq_constructor=self.create_fake_bq_read_source_constructor,
+            write_to_bq_constructor=self.create_fake_bq_capturing_write_sink,
+            read_all_from_bq_constructor=self.create_fake_bq_read_all_source_constructor,
+            **additional_pipeline_args,
+        )
+        output = dict(FakeWriteToBigQueryWithCapture.captured_output)
+        for address, rows in output.items():
+            if self.bq_client.table_exists(
+                self.bq_client.dataset_ref_for_id(address.dataset_id), address.table_id
+            ):
+                self.bq_client.delete_table(
+                    dataset_id=address.dataset_id, table_id=address.table_id
+                )
+            self.create_mock_table(address, self._schema_for_output_table(address))
+            if rows:
+                self.load_rows_into_table(address, rows)
+        return output
+
+    @staticmethod
+    def create_fake_bq_capturing_write_sink(
+        output_table: str,
+        output_dataset: str,
+        write_disposition: apache_beam.io.BigQueryDisposition,
+    ) -> FakeWriteToBigQueryWithCapture:
+        if write_disposition != apache_beam.io.BigQueryDisposition.WRITE_TRUNCATE:
+            raise ValueError(
+                f"Write disposition [{write_disposition}] does not match expected disposition "
+                f"[{apache_beam.io.BigQueryDisposition.WRITE_TRUNCATE}] writing to table [{output_table}]"
+            )
+        return FakeWriteToBigQueryWithCapture(
+            BigQueryAddress(dataset_id=output_dataset, table_id=output_table)
+        )
+
+    def _schema_for_output_table(
+        self, address: BigQueryAddress
+    ) -> List[bigquery.SchemaField]:
+        if address.table_id == INCREMENTAL_INGEST_STATE_TABLE_ID:
+            return INCREMENTAL_INGEST_STATE_SCHEMA
+        if address.dataset_id == self.expected_ingest_view_dataset():
+            return [
+                bigquery.SchemaField(
+                    column,
+                    field_type=bigquery.enums.SqlTypeNames.STRING.value,
+                    mode="NULLABLE",
+                )
+                for column in self.ingest_view_manifest_collector()
+                .ingest_view_to_manifest[address.table_id]
+                .input_columns
+            ] + ADDITIONAL_SCHEMA_COLUMNS
+        if is_association_table(address.table_id):
+            child_cls, parent_cls = get_database_entities_by_association_table(
+                state_schema, address.table_id
+            )
+            return schema_for_sqlalchemy_table(
+                get_state_database_association_with_names(
+                    child_cls.__name__, parent_cls.__name__
+                ),
+                add_state_code_field=True,
+            )
+        return schema_for_sqlalchemy_table(
+            get_table_class_by_name(address.table_id, list(get_state_table_classes()))
+        )
+
+    def assert_same_pipeline_output(
+        self,
+        expected_output: Dict[BigQueryAddress, List[Dict[str, Any]]],
+        output: Dict[BigQueryAddress, List[Dict[str, Any]]],
+    ) -> None:
+        """Asserts that two pipeline runs wrote the same rows to the same tables,
+        ignoring the materialization time of ingest view results and differences in
+        how dates are represented by rows read back from BigQuery."""
+
+        def _normalize_value(value: Any) -> Any:
+            if isinstance(value, datetime):
+                return value.isoformat()
+            if isinstance(value, date):
+                return datetime.combine(value, datetime.min.time()).isoformat()
+            if isinstance(value, str):
+                try:
+                    return datetime.fromisoformat(value).isoformat()
+                except ValueError:
+                    return value
+            return value
+
+        def _normalize(rows: List[Dict[str, Any]]) -> List[str]:
+            return sorted(
+                json.dumps(
+                    {
+                        column: _normalize_value(value)
+                        for column, value in row.items()
+                        if column != MATERIALIZATION_TIME_COL_NAME
+                    },
+                    sort_keys=True,
+                )
+                for row in rows
+            )
+
+        self.assertEqual(set(expected_output), set(output))
+        for address, expected_rows in expected_output.items():
+            self.assertEqual(
+                _normalize(expected_rows),
+                _normalize(output[address]),
+                f"Unexpected rows in [{address.to_str()}]",
+            )
@@ -56,6 +56,7 @@ class TestMetricsPipelineParameters(unittest.TestCase):
             "calculation_month_count": "36",
             "output": "test_output",
             "ingest_instance": "PRIMARY",
+            "use_storage_read_api": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
@@ -87,6 +88,7 @@ class TestMetricsPipelineParameters(unittest.TestCase):
             "metric_types": "TEST_METRIC",
             "calculation_month_count": "36",
             "ingest_instance": "PRIMARY",
+            "use_storage_read_api": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
@@ -118,6 +120,7 @@ class TestMetricsPipelineParameters(unittest.TestCase):
             "metric_types": "TEST_METRIC",
             "calculation_month_count": "-1",
             "ingest_instance": "PRIMARY",
+            "use_storage_read_api": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
@@ -153,6 +156,7 @@ class TestMetricsPipelineParameters(unittest.TestCase):
             "static_reference_input": STATIC_REFERENCE_TABLES_DATASET,
             "person_filter_ids": "123 12323 324",
             "ingest_instance": "PRIMARY",
+            "use_storage_read_api": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
@@ -188,7 +192,25 @@ class TestMetricsPipelineParameters(unittest.TestCase):
             "calculation_month_count": "36",
             "output": "my_prefix_test_output",
             "ingest_instance": "PRIMARY",
+            "use_storage_read_api": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
         self.assertEqual(pipeline_parameters.job_name, "my-prefix-test-job-test")
+
+    def test_creation_use_storage_read_api(self) -> None:
+        pipeline_parameters = MetricsPipelineParameters(
+            project="recidiviz-456",
+            state_code="US_OZ",
+            pipeline="test_pipeline_name",
+            region="us-west1",
+            job_name="test-job",
+            metric_types="TEST_METRIC",
+            output="test_output",
+            use_storage_read_api="True",
+        )
+
+        self.assertTrue(pipeline_parameters.use_storage_read_api)
+        self.assertEqual(
+            "True", pipeline_parameters.template_parameters["use_storage_read_api"]
+        )
@@ -22,6 +22,7 @@ import unittest
 from collections import defaultdict
 from datetime import date
 from typing import Any, Dict, List, Optional, Sequence, Union
+from unittest import mock
 
 import attr
 from dateutil.relativedelta import relativedelta
@@ -101,6 +102,7 @@ from recidiviz.pipelines.metrics.utils.supervision_case_compliance_manager impor
 from recidiviz.pipelines.normalization.utils.normalization_managers.assessment_normalization_manager import (
     DEFAULT_ASSESSMENT_SCORE_BUCKET,
 )
+from recidiviz.pipelines.utils.assessment_utils import AssessmentIndex
 from recidiviz.pipelines.utils.entity_normalization.normalized_incarceration_period_index import (
     NormalizedIncarcerationPeriodIndex,
 )
@@ -128,6 +130,7 @@ from recidiviz.pipelines.utils.state_utils.us_pa.us_pa_supervision_delegate impo
     UsPaSupervisionDelegate,
 )
 from recidiviz.pipelines.utils.supervision_period_utils import supervising_location_info
+from recidiviz.pipelines.utils.violation_response_utils import ViolationResponseIndex
 from recidiviz.tests.pipelines.utils.entity_normalization.normalization_testing_utils import (
     default_normalized_ip_index_for_tests,
     default_normalized_sp_index_for_tests,
@@ -2765,8 +2768,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_period,
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_reports,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_reports),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -2863,8 +2866,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_period,
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_responses,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_responses),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -2965,8 +2968,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_period,
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_reports,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_reports),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -3045,8 +3048,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_period,
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_reports,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_reports),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -3141,8 +3144,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_period,
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_reports,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_reports),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -3243,8 +3246,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_period,
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_reports,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_reports),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -3345,8 +3348,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_period,
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_reports,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_reports),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -3401,8 +3404,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_period,
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_reports,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_reports),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -3519,8 +3522,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_period,
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_responses,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_responses),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -3531,6 +3534,103 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
 
         self.assertCountEqual(expected_events, supervision_events)
 
+    def test_find_population_events_for_supervision_period_violation_history_once_per_window(
+        self,
+    ) -> None:
+        """Tests that the find_population_events_for_supervision_period function
+        only computes the violation history once for each set of responses in the
+        violation history window, rather than for every day."""
+
+        supervision_period = NormalizedStateSupervisionPeriod.new_with_defaults(
+            supervision_period_id=111,
+            external_id="sp1",
+            state_code="US_XX",
+            start_date=date(2018, 3, 11),
+            termination_date=date(2018, 12, 10),
+            supervision_type=StateSupervisionPeriodSupervisionType.PROBATION,
+        )
+
+        assessment_1 = NormalizedStateAssessment.new_with_defaults(
+            state_code="US_XX",
+            external_id="a1",
+            assessment_type=StateAssessmentType.ORAS_COMMUNITY_SUPERVISION,
+            assessment_score=33,
+            assessment_level=StateAssessmentLevel.HIGH,
+            assessment_date=date(2018, 3, 10),
+            assessment_score_bucket=StateAssessmentLevel.HIGH.value,
+            sequence_num=0,
+        )
+
+        assessment_2 = NormalizedStateAssessment.new_with_defaults(
+            state_code="US_XX",
+            external_id="a2",
+            assessment_type=StateAssessmentType.ORAS_COMMUNITY_SUPERVISION,
+            assessment_score=24,
+            assessment_level=StateAssessmentLevel.MEDIUM,
+            assessment_date=date(2018, 10, 27),
+            assessment_score_bucket=StateAssessmentLevel.MEDIUM.value,
+            sequence_num=1,
+        )
+
+        supervision_sentence = NormalizedStateSupervisionSentence.new_with_defaults(
+            state_code="US_XX",
+            supervision_sentence_id=111,
+            effective_date=date(2017, 1, 1),
+            external_id="ss1",
+            supervision_type=StateSupervisionSentenceSupervisionType.PROBATION,
+            status=StateSentenceStatus.COMPLETED,
+            completion_date=date(2018, 12, 10),
+        )
+
+        supervision_type = StateSupervisionPeriodSupervisionType.PROBATION
+
+        expected_events = expected_population_events(
+            supervision_period,
+            supervision_type,
+            end_date=date(2018, 10, 27),
+            assessment_score=assessment_1.assessment_score,
+            assessment_level=assessment_1.assessment_level,
+            assessment_type=assessment_1.assessment_type,
+            assessment_score_bucket=StateAssessmentLevel.HIGH.value,
+        )
+        expected_events.extend(
+            expected_population_events(
+                attr.evolve(supervision_period, start_date=date(2018, 10, 27)),
+                supervision_type,
+                assessment_score=assessment_2.assessment_score,
+                assessment_level=assessment_2.assessment_level,
+                assessment_type=assessment_2.assessment_type,
+                assessment_score_bucket=StateAssessmentLevel.MEDIUM.value,
+            )
+        )
+
+        with mock.patch(
+            "recidiviz.pipelines.metrics.supervision.identifier.get_violation_and_response_history",
+            wraps=recidiviz.pipelines.metrics.utils.violation_utils.get_violation_and_response_history,
+        ) as mock_violation_history:
+            supervision_events = (
+                self.identifier._find_population_events_for_supervision_period(
+                    self.person,
+                    [supervision_sentence],
+                    [],
+                    supervision_period,
+                    default_normalized_sp_index_for_tests(
+                        supervision_periods=[supervision_period]
+                    ),
+                    default_normalized_ip_index_for_tests(),
+                    AssessmentIndex([assessment_1, assessment_2]),
+                    ViolationResponseIndex([]),
+                    [],
+                    violation_delegate=UsXxViolationDelegate(),
+                    supervision_delegate=UsXxSupervisionDelegate(
+                        DEFAULT_SUPERVISION_LOCATIONS_TO_NAMES_ASSOCIATION_LIST,
+                    ),
+                )
+            )
+
+        self.assertCountEqual(expected_events, supervision_events)
+        self.assertEqual(1, mock_violation_history.call_count)
+
     def test_find_population_events_for_supervision_period_assessment_year_before(
         self,
     ) -> None:
@@ -3603,8 +3703,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_period,
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_responses,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_responses),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -3689,8 +3789,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_periods[1],
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_responses,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_responses),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -3771,8 +3871,8 @@ class TestFindPopulationEventsForSupervisionPeriod(unittest.TestCase):
                 supervision_periods[1],
                 supervision_period_index,
                 incarceration_period_index,
-                assessments,
-                violation_responses,
+                AssessmentIndex(assessments),
+                ViolationResponseIndex(violation_responses),
                 supervision_contacts,
                 violation_delegate=UsXxViolationDelegate(),
                 supervision_delegate=UsXxSupervisionDelegate(
@@ -46,6 +46,7 @@ class TestNormalizationPipelineParameters(unittest.TestCase):
             "pipeline": "test_pipeline_name",
             "output": "test_output",
             "ingest_instance": "PRIMARY",
+            "use_storage_read_api": "False",
             "state_data_input": STATE_BASE_DATASET,
             "reference_view_input": REFERENCE_VIEWS_DATASET,
             "normalized_input": normalized_state_dataset_for_state_code(
@@ -75,6 +76,7 @@ class TestNormalizationPipelineParameters(unittest.TestCase):
                 StateCode("US_OZ")
             ),
             "ingest_instance": "PRIMARY",
+            "use_storage_read_api": "False",
             "state_data_input": STATE_BASE_DATASET,
             "reference_view_input": REFERENCE_VIEWS_DATASET,
         }
@@ -107,6 +109,7 @@ class TestNormalizationPipelineParameters(unittest.TestCase):
             "person_filter_ids": "123 12323 324",
             "output": "my_prefix_test_output",
             "ingest_instance": "PRIMARY",
+            "use_storage_read_api": "False",
         }
 
         self.assertEqual(expected_parameters, pipeline_parameters.template_parameters)
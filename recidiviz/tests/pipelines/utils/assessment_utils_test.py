@@ -303,3 +303,111 @@ class TestFindMostRecentApplicableAssessment(unittest.TestCase):
         )
 
         self.assertEqual(most_recent_assessment, assessment_2)
+
+
+class TestAssessmentIndex(unittest.TestCase):
+    """Tests the AssessmentIndex class."""
+
+    def test_most_recent_applicable_assessment_of_class(self) -> None:
+        assessments = [
+            NormalizedStateAssessment.new_with_defaults(
+                state_code="US_XX",
+                external_id="a1",
+                assessment_type=StateAssessmentType.LSIR,
+                assessment_date=date(2018, 4, 28),
+                assessment_score=17,
+                sequence_num=1,
+            ),
+            NormalizedStateAssessment.new_with_defaults(
+                state_code="US_XX",
+                external_id="a2",
+                assessment_type=StateAssessmentType.LSIR,
+                assessment_date=date(2018, 1, 3),
+                assessment_score=21,
+                sequence_num=0,
+            ),
+            NormalizedStateAssessment.new_with_defaults(
+                state_code="US_XX",
+                external_id="a3",
+                assessment_type=StateAssessmentType.ORAS_COMMUNITY_SUPERVISION,
+                assessment_date=date(2018, 3, 1),
+                assessment_score=12,
+                sequence_num=2,
+            ),
+            NormalizedStateAssessment.new_with_defaults(
+                state_code="US_XX",
+                external_id="a4",
+                assessment_type=StateAssessmentType.LSIR,
+                assessment_date=date(2018, 6, 1),
+                sequence_num=3,
+            ),
+        ]
+
+        assessment_index = assessment_utils.AssessmentIndex(assessments)
+
+        for supervision_delegate in (
+            UsXxSupervisionDelegate([]),
+            TestFindMostRecentApplicableAssessment.LsirOnlySupervisionDelegate([]),
+        ):
+            for cutoff_date in (
+                date(2017, 12, 31),
+                date(2018, 1, 3),
+                date(2018, 3, 1),
+                date(2018, 4, 27),
+                date(2018, 4, 28),
+                date(2018, 6, 1),
+            ):
+                self.assertEqual(
+                    assessment_utils.find_most_recent_applicable_assessment_of_class_for_state(
+                        cutoff_date,
+                        assessments,
+                        StateAssessmentClass.RISK,
+                        supervision_delegate,
+                    ),
+                    assessment_index.most_recent_applicable_assessment_of_class(
+                        cutoff_date,
+                        StateAssessmentClass.RISK,
+                        supervision_delegate,
+                    ),
+                )
+
+    def test_most_recent_applicable_assessment_of_class_no_sequence_num(
+        self,
+    ) -> None:
+        """Assessments without a sequence_num tie, in which case the one that comes
+        first in the list is returned, regardless of date."""
+        assessment_1 = NormalizedStateAssessment.new_with_defaults(
+            state_code="US_XX",
+            external_id="a1",
+            assessment_type=StateAssessmentType.LSIR,
+            assessment_date=date(2018, 4, 28),
+            assessment_score=17,
+        )
+        assessment_2 = NormalizedStateAssessment.new_with_defaults(
+            state_code="US_XX",
+            external_id="a2",
+            assessment_type=StateAssessmentType.LSIR,
+            assessment_date=date(2018, 1, 3),
+            assessment_score=21,
+        )
+
+        assessment_index = assessment_utils.AssessmentIndex(
+            [assessment_1, assessment_2]
+        )
+
+        self.assertEqual(
+            assessment_2,
+            assessment_index.most_recent_applicable_assessment_of_class(
+                date(2018, 4, 27),
+                StateAssessmentClass.RISK,
+                UsXxSupervisionDelegate([]),
+            ),
+        )
+        self.assertEqual(
+            assessment_1,
+            assessment_index.most_recent_applicable_assessment_of_class(
+                date(2018, 4, 28),
+                StateAssessmentClass.RISK,
+                UsXxSupervisionDelegate([]),
+            ),
+        )
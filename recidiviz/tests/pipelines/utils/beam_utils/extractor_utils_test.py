@@ -23,9 +23,11 @@ from typing import List
 
 import apache_beam as beam
 import attr
+import mock
 from apache_beam.testing.test_pipeline import TestPipeline
 from apache_beam.testing.util import assert_that, equal_to
 from mock import patch
+from more_itertools import one
 
 from recidiviz.calculator.query.state.views.reference.persons_to_recent_county_of_residence import (
     PERSONS_TO_RECENT_COUNTY_OF_RESIDENCE_VIEW_NAME,
@@ -1674,6 +1676,153 @@ class TestExtractAssociationValues(unittest.TestCase):
 
             test_pipeline.run()
 
+    def testExtractAssociationValues_StorageReadApi(self):
+        """Tests extracting association values through a query read with the
+        BigQuery Storage Read API when the association table is a separate table."""
+        charge = database_test_utils.generate_test_charge(person_id=123, charge_id=345)
+        incarceration_sentence = (
+            database_test_utils.generate_test_incarceration_sentence(person_id=123)
+        )
+
+        association_table_name = (
+            schema.state_charge_incarceration_sentence_association_table.name
+        )
+
+        data_dict = {
+            incarceration_sentence.__tablename__: [
+                normalized_database_base_dict(incarceration_sentence)
+            ],
+            charge.__tablename__: [normalized_database_base_dict(charge)],
+            association_table_name: [
+                {
+                    "incarceration_sentence_id": incarceration_sentence.incarceration_sentence_id,
+                    "charge_id": charge.charge_id,
+                }
+            ],
+        }
+
+        project = "project"
+        dataset = "state"
+        normalized_dataset = "us_xx_normalized_state"
+
+        fake_bq_source_constructor = mock.Mock(
+            side_effect=self.fake_bq_source_factory.create_fake_bq_source_constructor(
+                dataset, data_dict
+            )
+        )
+        with patch(
+            "recidiviz.pipelines.utils.beam_utils.extractor_utils.ReadFromBigQuery",
+            fake_bq_source_constructor,
+        ):
+            test_pipeline = TestPipeline()
+
+            output = (
+                test_pipeline
+                | "Extract association table entities"
+                >> extractor_utils._ExtractAssociationValues(
+                    project_id=project,
+                    entities_dataset=dataset,
+                    normalized_entities_dataset=normalized_dataset,
+                    root_entity_class=entities.StateIncarcerationSentence,
+                    related_entity_class=entities.StateCharge,
+                    related_id_field=entities.StateCharge.get_class_id_name(),
+                    unifying_id_field=entities.StatePerson.get_class_id_name(),
+                    association_table=association_table_name,
+                    unifying_id_field_filter_set=None,
+                    state_code=charge.state_code,
+                    use_storage_read_api=True,
+                )
+            )
+
+            assert_that(
+                output,
+                ExtractAssertMatchers.validate_extract_relationship_property_values(
+                    unifying_id=charge.person_id,
+                    parent_id=incarceration_sentence.incarceration_sentence_id,
+                    entity_id=charge.charge_id,
+                ),
+                label="Validate StateCharge output",
+            )
+
+            test_pipeline.run()
+
+        self.assertTrue(
+            one(fake_bq_source_constructor.mock_calls).kwargs["use_storage_read_api"]
+        )
+
+    def testExtractAssociationValues_StorageReadApi_EntityTable(self):
+        """Tests extracting association values read directly from the related entity's
+        table with the BigQuery Storage Read API, which renames the unifying id."""
+        violation_response = (
+            database_test_utils.generate_test_supervision_violation_response(
+                person_id=123
+            )
+        )
+        violation = database_test_utils.generate_test_supervision_violation(
+            person_id=123, supervision_violation_responses=[violation_response]
+        )
+        violation_response.supervision_violation_id = violation.supervision_violation_id
+        other_state_violation_response_data = {
+            **normalized_database_base_dict(violation_response),
+            "supervision_violation_response_id": 789,
+            "state_code": "US_YY",
+        }
+
+        data_dict = {
+            violation.__tablename__: [normalized_database_base_dict(violation)],
+            violation_response.__tablename__: [
+                normalized_database_base_dict(violation_response),
+                other_state_violation_response_data,
+            ],
+        }
+
+        project = "project"
+        dataset = "state"
+        normalized_dataset = "us_xx_normalized_state"
+
+        with patch(
+            "recidiviz.pipelines.utils.beam_utils.extractor_utils.ReadFromBigQueryTable",
+            self.fake_bq_source_factory.create_fake_bq_table_source_constructor(
+                dataset, data_dict
+            ),
+        ):
+            test_pipeline = TestPipeline()
+
+            output = (
+                test_pipeline
+                | "Extract association values"
+                >> extractor_utils._ExtractAssociationValues(
+                    project_id=project,
+                    entities_dataset=dataset,
+                    normalized_entities_dataset=normalized_dataset,
+                    root_entity_class=entities.StateSupervisionViolation,
+                    related_entity_class=entities.StateSupervisionViolationResponse,
+                    related_id_field=entities.StateSupervisionViolationResponse.get_class_id_name(),
+                    unifying_id_field=entities.StatePerson.get_class_id_name(),
+                    association_table=violation_response.__tablename__,
+                    unifying_id_field_filter_set=None,
+                    state_code=violation_response.state_code,
+                    use_storage_read_api=True,
+                )
+            )
+
+            assert_that(
+                output,
+                equal_to(
+                    [
+                        (
+                            violation_response.person_id,
+                            (
+                                violation.supervision_violation_id,
+                                violation_response.supervision_violation_response_id,
+                            ),
+                        )
+                    ]
+                ),
+            )
+
+            test_pipeline.run()
+
 
 class TestExtractAllEntitiesOfType(unittest.TestCase):
     """Tests the ExtractAllEntitiesOfType PTransform."""
@@ -1739,6 +1888,71 @@ class TestExtractAllEntitiesOfType(unittest.TestCase):
 
             test_pipeline.run()
 
+    def testExtractAllEntitiesOfType_StorageReadApi(self):
+        """Tests reading entities directly from their table with the BigQuery Storage
+        Read API, filtered by state code and unifying id."""
+        person = remove_relationship_properties(
+            database_test_utils.generate_test_person(
+                person_id=123,
+                state_code="US_XX",
+                incarceration_incidents=[],
+                supervision_violations=[],
+                supervision_contacts=[],
+                incarceration_sentences=[],
+                supervision_sentences=[],
+                incarceration_periods=[],
+                supervision_periods=[],
+            )
+        )
+
+        data_dict = {
+            person.__tablename__: [
+                normalized_database_base_dict(person),
+                {**normalized_database_base_dict(person), "person_id": 456},
+                {
+                    **normalized_database_base_dict(person),
+                    "person_id": 789,
+                    "state_code": "US_YY",
+                },
+            ]
+        }
+
+        output_person_entity = StateSchemaToEntityConverter().convert(person)
+
+        project = "project"
+        dataset = "state"
+        normalized_dataset = "us_xx_normalized_state"
+
+        with patch(
+            "recidiviz.pipelines.utils.beam_utils.extractor_utils.ReadFromBigQueryTable",
+            self.fake_bq_source_factory.create_fake_bq_table_source_constructor(
+                dataset, data_dict
+            ),
+        ):
+            test_pipeline = TestPipeline()
+
+            output = (
+                test_pipeline
+                | "Extract StatePerson Entity"
+                >> extractor_utils._ExtractAllEntitiesOfType(
+                    project_id=project,
+                    entities_dataset=dataset,
+                    normalized_entities_dataset=normalized_dataset,
+                    entity_class=entities.StatePerson,
+                    unifying_id_field=entities.StatePerson.get_class_id_name(),
+                    unifying_id_field_filter_set={123, 789},
+                    state_code=person.state_code,
+                    use_storage_read_api=True,
+                )
+            )
+
+            assert_that(
+                output,
+                equal_to([(output_person_entity.get_id(), output_person_entity)]),
+            )
+
+            test_pipeline.run()
+
     def testExtractAllEntitiesOfType_InvalidUnifyingIdField(self):
         person = remove_relationship_properties(
             database_test_utils.generate_test_person(
@@ -1849,6 +2063,42 @@ class TestShallowHydrateEntity(unittest.TestCase):
 
         test_pipeline.run()
 
+    def testShallowHydrateEntity_BatchWithDifferentColumns(self) -> None:
+        """Tests hydrating a batch of rows where not every row has the same
+        columns."""
+        rows = [
+            normalized_database_base_dict(
+                database_test_utils.generate_test_supervision_violation(
+                    violation_id, []
+                )
+            )
+            for violation_id in (123, 456)
+        ]
+        rows[1].pop("violation_date")
+
+        entity_class = entities.StateSupervisionViolation
+
+        hydrated_entities = list(
+            extractor_utils._ShallowHydrateEntity().process_batch(
+                rows,
+                entity_class=entity_class,
+                unifying_id_field=entity_class.get_class_id_name(),
+            )
+        )
+
+        self.assertEqual(
+            [
+                [
+                    (
+                        row["supervision_violation_id"],
+                        entity_class.build_from_dictionary(row),
+                    )
+                    for row in rows
+                ]
+            ],
+            hydrated_entities,
+        )
+
 
 class ExtractAssertMatchers:
     """Functions to be used by Apache Beam testing `assert_that` functions to
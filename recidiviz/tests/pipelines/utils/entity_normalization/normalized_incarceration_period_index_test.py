@@ -1061,6 +1061,97 @@ class TesIsExcludedFromSupervisionPopulationForRange(unittest.TestCase):
             is_excluded_from_supervision_population=False,
         )
 
+    def test_range_covered_by_later_period_in_month(self) -> None:
+        """The range is covered by the second period, and the first period in the same
+        month ends before the range starts."""
+        incarceration_periods = [
+            NormalizedStateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=111,
+                sequence_num=0,
+                external_id="ip1",
+                state_code="US_XX",
+                admission_date=date(2020, 1, 9),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                specialized_purpose_for_incarceration=StateSpecializedPurposeForIncarceration.GENERAL,
+                release_date=date(2020, 2, 4),
+                release_reason=ReleaseReason.SENTENCE_SERVED,
+            ),
+            NormalizedStateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=222,
+                sequence_num=1,
+                external_id="ip2",
+                state_code="US_XX",
+                admission_date=date(2020, 2, 10),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                specialized_purpose_for_incarceration=StateSpecializedPurposeForIncarceration.GENERAL,
+                release_date=date(2020, 2, 20),
+                release_reason=ReleaseReason.SENTENCE_SERVED,
+            ),
+        ]
+
+        index = default_normalized_ip_index_for_tests(incarceration_periods)
+
+        self.assertTrue(
+            index.is_excluded_from_supervision_population_for_range(
+                DateRange(
+                    lower_bound_inclusive_date=date(2020, 2, 10),
+                    upper_bound_exclusive_date=date(2020, 2, 15),
+                )
+            )
+        )
+        self.assertFalse(
+            index.is_excluded_from_supervision_population_for_range(
+                DateRange(
+                    lower_bound_inclusive_date=date(2020, 2, 3),
+                    upper_bound_exclusive_date=date(2020, 2, 15),
+                )
+            )
+        )
+
+
+class TestWasInIncarcerationPopulationOnDate(unittest.TestCase):
+    """Tests the was_in_incarceration_population_on_date function."""
+
+    def test_was_in_incarceration_population_on_date(self) -> None:
+        incarceration_periods = [
+            NormalizedStateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=111,
+                sequence_num=0,
+                external_id="ip1",
+                state_code="US_XX",
+                admission_date=date(2020, 1, 9),
+                admission_reason=AdmissionReason.NEW_ADMISSION,
+                specialized_purpose_for_incarceration=StateSpecializedPurposeForIncarceration.GENERAL,
+                release_date=date(2020, 2, 4),
+                release_reason=ReleaseReason.TRANSFER,
+            ),
+            NormalizedStateIncarcerationPeriod.new_with_defaults(
+                incarceration_period_id=222,
+                sequence_num=1,
+                external_id="ip2",
+                state_code="US_XX",
+                admission_date=date(2020, 2, 4),
+                admission_reason=AdmissionReason.TRANSFER,
+                specialized_purpose_for_incarceration=StateSpecializedPurposeForIncarceration.GENERAL,
+                release_date=date(2020, 2, 20),
+                release_reason=ReleaseReason.SENTENCE_SERVED,
+            ),
+        ]
+
+        index = default_normalized_ip_index_for_tests(incarceration_periods)
+
+        self.assertFalse(
+            index.was_in_incarceration_population_on_date(date(2020, 1, 8))
+        )
+        self.assertTrue(index.was_in_incarceration_population_on_date(date(2020, 1, 9)))
+        self.assertTrue(index.was_in_incarceration_population_on_date(date(2020, 2, 4)))
+        self.assertTrue(
+            index.was_in_incarceration_population_on_date(date(2020, 2, 19))
+        )
+        self.assertFalse(
+            index.was_in_incarceration_population_on_date(date(2020, 2, 20))
+        )
+
 
 class TestIncarcerationPeriodsThatExcludePersonFromSupervisionPopulation(
     unittest.TestCase
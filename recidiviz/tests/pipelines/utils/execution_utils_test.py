@@ -25,6 +25,7 @@ from recidiviz.pipelines.utils.execution_utils import (
     person_and_kwargs_for_identifier,
     select_all_by_person_query,
     select_query,
+    select_query_row_filter,
 )
 
 
@@ -153,6 +154,27 @@ class TestSelectAllQuery(unittest.TestCase):
             ),
         )
 
+    def test_select_query_row_filter(self) -> None:
+        self.assertEqual(
+            "state_code IN ('US_XX') AND field_name IN (1234, 56)",
+            select_query_row_filter(
+                self.dataset,
+                self.table_id,
+                state_code_filter="US_XX",
+                unifying_id_field="field_name",
+                unifying_id_field_filter_set={1234, 56},
+            ),
+        )
+
+        with self.assertRaises(ValueError):
+            select_query_row_filter(
+                self.dataset,
+                self.table_id,
+                state_code_filter="",
+                unifying_id_field=None,
+                unifying_id_field_filter_set=None,
+            )
+
 
 class TestExtractCountyOfResidenceFromRows(unittest.TestCase):
     """Tests for extract_county_of_residence_from_rows in execution_utils.py."""
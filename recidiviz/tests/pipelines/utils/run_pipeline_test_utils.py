@@ -15,6 +15,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 # =============================================================================
 """Helper that runs a test version of the pipeline in the provided module."""
+from contextlib import ExitStack
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Type
 
 import apache_beam
@@ -54,6 +55,8 @@ from recidiviz.tests.pipelines.fake_bigquery import (
 # TODO(#25244) Remove once dataset configs can be used in various pipeline tests
 FAKE_PIPELINE_TESTS_INPUT_DATASET = "dataset"
 
+DEFAULT_INGEST_RAW_DATA_UPPER_BOUND_DATES_JSON = '{"table1":"2023-07-05T00:00:00.000000","table2":"2023-07-05T00:00:00.000000","table3":"2023-07-05T00:00:00.000000","table4":"2023-07-05T00:00:00.000000","table5":"2023-07-05T00:00:00.000000", "table6":"2023-07-05T00:00:00.000000", "table7":"2023-07-05T00:00:00.000000"}'
+
 
 def pipeline_constructor(project_id: str) -> Callable[[PipelineOptions], Pipeline]:
     def _inner_pipeline_constructor(options: PipelineOptions) -> Pipeline:
@@ -101,11 +104,16 @@ def run_test_pipeline(
     )
 
     if issubclass(pipeline_cls, StateIngestPipeline):
-        read_from_bq_class = "recidiviz.pipelines.ingest.state.generate_ingest_view_results.ReadFromBigQuery"
+        read_from_bq_classes = [
+            "recidiviz.pipelines.ingest.state.generate_ingest_view_results.ReadFromBigQuery",
+            # Only used by incremental runs
+            "recidiviz.pipelines.ingest.state.pipeline.ReadFromBigQuery",
+            "recidiviz.pipelines.ingest.state.carry_forward_unchanged_root_entities.ReadFromBigQuery",
+        ]
     else:
-        read_from_bq_class = (
+        read_from_bq_classes = [
             "recidiviz.pipelines.utils.beam_utils.extractor_utils.ReadFromBigQuery"
-        )
+        ]
 
     if issubclass(pipeline_cls, MetricPipeline):
         write_to_bq_class = (
@@ -125,10 +133,11 @@ def run_test_pipeline(
     else:
         raise ValueError(f"Pipeline class not recognized: {pipeline_cls}")
 
-    with patch(
-        read_from_bq_class,
-        read_from_bq_constructor,
-    ):
+    with ExitStack() as read_from_bq_patches:
+        for read_from_bq_class in read_from_bq_classes:
+            read_from_bq_patches.enter_context(
+                patch(read_from_bq_class, read_from_bq_constructor)
+            )
         with patch(
             "apache_beam.io.ReadAllFromBigQuery",
             read_all_from_bq_constructor
@@ -278,7 +287,7 @@ def default_arg_list_for_pipeline(
         pipeline_args.extend(
             [
                 "--raw_data_upper_bound_dates_json",
-                '{"table1":"2023-07-05T00:00:00.000000","table2":"2023-07-05T00:00:00.000000","table3":"2023-07-05T00:00:00.000000","table4":"2023-07-05T00:00:00.000000","table5":"2023-07-05T00:00:00.000000", "table6":"2023-07-05T00:00:00.000000", "table7":"2023-07-05T00:00:00.000000"}',
+                DEFAULT_INGEST_RAW_DATA_UPPER_BOUND_DATES_JSON,
             ]
         )
         if ingest_view_results_only := additional_pipeline_args.get(
@@ -292,6 +301,18 @@ def default_arg_list_for_pipeline(
             )
         if ingest_views_to_run := additional_pipeline_args.get("ingest_views_to_run"):
             pipeline_args.extend(["--ingest_views_to_run", ingest_views_to_run])
+        if materialization_method := additional_pipeline_args.get(
+            "materialization_method"
+        ):
+            pipeline_args.extend(["--materialization_method", materialization_method])
+        if incremental := additional_pipeline_args.get("incremental"):
+            pipeline_args.extend(["--incremental", str(incremental)])
+        if raw_data_watermarks_json := additional_pipeline_args.get(
+            "raw_data_watermarks_json"
+        ):
+            pipeline_args.extend(
+                ["--raw_data_watermarks_json", raw_data_watermarks_json]
+            )
     else:
         raise ValueError(f"Unexpected Pipeline type: {type(pipeline)}.")
 
@@ -35,6 +35,7 @@ from recidiviz.pipelines.utils.state_utils.templates.us_xx.us_xx_violations_dele
 )
 from recidiviz.pipelines.utils.violation_response_utils import (
     DECISION_SEVERITY_ORDER,
+    ViolationResponseIndex,
     identify_most_severe_response_decision,
     violation_responses_in_window,
 )
@@ -328,6 +329,98 @@ class TestViolationResponsesInWindow(unittest.TestCase):
         self.assertEqual([], responses_in_window)
 
 
+class TestViolationResponseIndex(unittest.TestCase):
+    """Test the ViolationResponseIndex class."""
+
+    def test_responses_in_window(self) -> None:
+        violation_responses = [
+            StateSupervisionViolationResponse.new_with_defaults(
+                state_code="US_XX",
+                external_id="svr1",
+                response_type=StateSupervisionViolationResponseType.VIOLATION_REPORT,
+                response_date=datetime.date(2010, 1, 1),
+            ),
+            StateSupervisionViolationResponse.new_with_defaults(
+                state_code="US_XX",
+                external_id="svr2",
+                response_type=StateSupervisionViolationResponseType.VIOLATION_REPORT,
+                response_date=datetime.date(1998, 2, 1),
+            ),
+            StateSupervisionViolationResponse.new_with_defaults(
+                state_code="US_XX",
+                external_id="svr3",
+                response_type=StateSupervisionViolationResponseType.VIOLATION_REPORT,
+            ),
+            StateSupervisionViolationResponse.new_with_defaults(
+                state_code="US_XX",
+                external_id="svr4",
+                response_type=StateSupervisionViolationResponseType.CITATION,
+                response_date=datetime.date(2010, 1, 1),
+            ),
+            StateSupervisionViolationResponse.new_with_defaults(
+                state_code="US_XX",
+                external_id="svr5",
+                response_type=StateSupervisionViolationResponseType.VIOLATION_REPORT,
+                response_date=datetime.date(2009, 5, 1),
+            ),
+        ]
+
+        violation_response_index = ViolationResponseIndex(violation_responses)
+
+        for upper_bound_exclusive, lower_bound_inclusive in (
+            (datetime.date(2010, 1, 2), datetime.date(2009, 1, 17)),
+            (datetime.date(2010, 1, 1), datetime.date(2009, 1, 17)),
+            (datetime.date(2010, 1, 2), None),
+            (datetime.date(1998, 2, 1), None),
+            (datetime.date(2009, 1, 1), datetime.date(2010, 1, 1)),
+        ):
+            responses_in_window = violation_responses_in_window(
+                violation_responses,
+                upper_bound_exclusive=upper_bound_exclusive,
+                lower_bound_inclusive=lower_bound_inclusive,
+            )
+            self.assertEqual(
+                responses_in_window,
+                violation_response_index.responses_in_window(
+                    upper_bound_exclusive=upper_bound_exclusive,
+                    lower_bound_inclusive=lower_bound_inclusive,
+                ),
+            )
+
+    def test_window_bounds_same_responses(self) -> None:
+        violation_response_index = ViolationResponseIndex(
+            [
+                StateSupervisionViolationResponse.new_with_defaults(
+                    state_code="US_XX",
+                    external_id="svr1",
+                    response_type=StateSupervisionViolationResponseType.VIOLATION_REPORT,
+                    response_date=datetime.date(2010, 1, 1),
+                ),
+            ]
+        )
+
+        self.assertEqual(
+            violation_response_index.window_bounds(
+                upper_bound_exclusive=datetime.date(2010, 1, 2),
+                lower_bound_inclusive=datetime.date(2009, 1, 2),
+            ),
+            violation_response_index.window_bounds(
+                upper_bound_exclusive=datetime.date(2010, 6, 1),
+                lower_bound_inclusive=datetime.date(2009, 6, 1),
+            ),
+        )
+        self.assertNotEqual(
+            violation_response_index.window_bounds(
+                upper_bound_exclusive=datetime.date(2010, 1, 2),
+                lower_bound_inclusive=datetime.date(2009, 1, 2),
+            ),
+            violation_response_index.window_bounds(
+                upper_bound_exclusive=datetime.date(2010, 1, 1),
+                lower_bound_inclusive=datetime.date(2009, 1, 1),
+            ),
+        )
+
+
 class TestIdentifyMostSevereResponseDecision(unittest.TestCase):
     """Tests the identify_most_severe_response_decision function."""
 
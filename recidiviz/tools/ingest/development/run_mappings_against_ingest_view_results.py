@@ -36,6 +36,7 @@ import traceback
 from datetime import datetime
 from typing import Dict, Union
 
+from more_itertools import consume
 from tqdm import tqdm
 
 from recidiviz.big_query.big_query_client import BigQueryClientImpl
@@ -172,16 +173,20 @@ def parse_results(
                 print_entity_tree(result, file=results_file)
             progress.update()
 
-        manifest_compiler.compile_manifest(
-            ingest_view_name=ingest_view_name
-        ).parse_contents(
-            contents_iterator=contents_handle.get_contents_iterator(),
-            result_callable=result_processor,
-            context=IngestViewContentsContextImpl(
-                ingest_instance=ingest_instance,
-                is_dataflow_pipeline=False,
-                results_update_datetime=results_update_datetime,
-            ),
+        # Results are handled by |result_processor|, so stream through the rows
+        # without keeping the parsed entities around.
+        consume(
+            manifest_compiler.compile_manifest(
+                ingest_view_name=ingest_view_name
+            ).iter_contents(
+                contents_iterator=contents_handle.get_contents_iterator(),
+                result_callable=result_processor,
+                context=IngestViewContentsContextImpl(
+                    ingest_instance=ingest_instance,
+                    is_dataflow_pipeline=False,
+                    results_update_datetime=results_update_datetime,
+                ),
+            )
         )
 
         progress.close()